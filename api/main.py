@@ -4,9 +4,10 @@ Separate from forecasting API, focused only on Polymarket prediction market trad
 """
 
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 import logging
+from api.middleware.metrics import RequestMetricsMiddleware
 from api.middleware.session import SessionAuthMiddleware
 from core.camel_runtime import CamelTradingRuntime
 from core.camel_runtime.registries import toolkit_registry
@@ -14,6 +15,16 @@ from api.services.polymarket.config_service import process_config_service
 from api.routers.polymarket.rss_flux import ensure_polymarket_manager
 from api.services.dex import dex_manager_service
 from api.router_registry import get_router_bindings
+from core.clients.event_hub import live_event_hub
+from core.llm.rate_limiter import llm_rate_limiter
+from core.llm.response_cache import llm_response_cache
+from core.pipelines.redis_retention import redis_retention_worker
+from core.pipelines.roi_settlement import roi_settlement_worker
+from core.settings.config import settings
+from core.telemetry.observability import get_prometheus_metrics
+from core.telemetry.profiler import sampling_profiler
+from core.telemetry.tracing import tracer
+from prometheus_client import CONTENT_TYPE_LATEST
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -44,21 +55,42 @@ async def startup_event():
         config = process_config_service.get_config()
         if config.get("active_flux") in {"polymarket_manager", "polymarket_rss_flux"}:
             flux = await ensure_polymarket_manager()
-            if flux.trigger_type == "interval" and not flux._running:
+            if flux.trigger_type in {"interval", "market"} and not flux._running:
                 await flux.start()
-                logger.info("Polymarket Manager started on startup (interval trigger).")
+                logger.info("Polymarket Manager started on startup (%s trigger).", flux.trigger_type)
     except Exception as exc:
         logger.warning("Polymarket Manager startup init failed: %s", exc)
     try:
         await dex_manager_service.auto_start_if_enabled()
     except Exception as exc:
         logger.warning("DEX trader startup init failed: %s", exc)
+    if settings.roi_settlement_enabled:
+        try:
+            await roi_settlement_worker.start()
+        except Exception as exc:
+            logger.warning("ROI settlement worker startup failed: %s", exc)
+    if settings.redis_retention_enabled:
+        try:
+            await redis_retention_worker.start()
+        except Exception as exc:
+            logger.warning("Redis retention worker startup failed: %s", exc)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers started on startup."""
+    await roi_settlement_worker.stop()
+    await redis_retention_worker.stop()
+    await live_event_hub.stop()
 
 # Static assets for Jinja UI
 app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
 
 # Attach session middleware so request.state.session is available
 app.add_middleware(SessionAuthMiddleware)
+if settings.telemetry_metrics_enabled:
+    # Added last so it wraps the whole stack and times every request
+    app.add_middleware(RequestMetricsMiddleware)
 
 
 @app.api_route("/health", methods=["GET", "HEAD"])
@@ -74,6 +106,45 @@ async def health_check():
     )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus exposition endpoint."""
+    return PlainTextResponse(await get_prometheus_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+@app.get("/metrics/traces")
+async def recent_traces(limit: int = 20):
+    """Most recent sampled trader-cycle traces with their spans."""
+    return {"stats": tracer.get_stats(), "traces": tracer.recent(limit=max(0, min(limit, 200)))}
+
+
+@app.get("/metrics/profiles")
+async def recent_profiles(limit: int = 20):
+    """Summaries of recently finished sampling profiles (DEX executions, Polymarket batches)."""
+    return {"stats": sampling_profiler.get_stats(), "profiles": sampling_profiler.recent(limit=max(0, min(limit, 50)))}
+
+
+@app.get("/metrics/profiles/{key}", response_class=PlainTextResponse)
+async def profile_stacks(key: str):
+    """Collapsed stacks of one profile, ready for flamegraph.pl or speedscope."""
+    profile = sampling_profiler.snapshot(key)
+    if profile is None:
+        return PlainTextResponse("profile not found\n", status_code=404)
+    return PlainTextResponse(profile["collapsed"] + "\n")
+
+
+@app.get("/metrics/llm")
+async def llm_metrics():
+    """Shared LLM response cache and admission limiter (queue depth, waits, token window)."""
+    return {"cache": llm_response_cache.get_stats(), "limiter": llm_rate_limiter.get_stats()}
+
+
+@app.get("/metrics/retention")
+async def retention_metrics():
+    """Redis retention worker runs and estimated bytes reclaimed."""
+    return redis_retention_worker.get_metrics()
+
+
 @app.get("/")
 async def root():
     """Root endpoint redirects to UI menu."""
@@ -0,0 +1,51 @@
+"""ASGI middleware recording per-route request latency and status codes."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.telemetry.observability import api_request_duration, api_requests_total
+
+
+class RequestMetricsMiddleware:
+    """Record `api_requests_total` / `api_request_duration` for every HTTP request.
+
+    The endpoint label is the matched route template (e.g. `/api/dex/history/{id}`)
+    so path parameters do not explode label cardinality; unmatched paths are
+    grouped under `unmatched`.
+    """
+
+    def __init__(self, app: ASGIApp, *, exclude_paths: tuple[str, ...] = ("/metrics", "/static")) -> None:
+        self.app = app
+        self.exclude_paths = exclude_paths
+
+    @staticmethod
+    def _route_template(scope: Scope) -> str:
+        route: Any = scope.get("route")
+        path = getattr(route, "path_format", None) or getattr(route, "path", None)
+        return str(path) if path else "unmatched"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope.get("path", "").startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            method = scope.get("method", "GET")
+            endpoint = self._route_template(scope)
+            api_requests_total.labels(method=method, endpoint=endpoint, status_code=str(status_code)).inc()
+            api_request_duration.labels(method=method, endpoint=endpoint).observe(duration)
@@ -69,6 +69,7 @@ class DexControlRequest(BaseModel):
 class DexTriggerRequest(BaseModel):
     mode: Literal["long_study", "fast_decision"] = "long_study"
     reason: str = "manual_trigger"
+    profile: bool = False
 
 
 class DexStatusResponse(BaseModel):
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 
 from api.router_registry.base import RouterBinding
-from api.routers import ui_menu
+from api.routers import live_events, ui_menu
 from api.routers import system_settings as system_settings_router
 
 
@@ -13,4 +13,5 @@ def get_ui_router_bindings() -> Sequence[RouterBinding]:
     return (
         RouterBinding(system_settings_router.router, tags=("System Settings",)),
         RouterBinding(ui_menu.router, tags=("UI Menu",)),
+        RouterBinding(live_events.router, prefix="/api", tags=("Live Events",)),
     )
@@ -1,4 +1,8 @@
-"""DEX router: history endpoints."""
+"""DEX router: history endpoints.
+
+History lives in Redis Streams; pages are newest-first and ``before`` takes
+the ``next_cursor`` of the previous page (a stream id) to fetch older items.
+"""
 
 from __future__ import annotations
 
@@ -12,20 +16,21 @@ dex_trader_service = dex_manager_service
 router = APIRouter()
 
 
+def _page(topic: str, limit: int, before: str | None) -> dict:
+    items, next_cursor = dex_manager_service.page_history(topic, limit=limit, before=before)
+    return {"status": "ok", "count": len(items), "items": items, "next_cursor": next_cursor}
+
+
 @router.get("/history/trades")
-async def list_trades(limit: int = Query(100, ge=1, le=2000)):
-    items = dex_manager_service.list_trade_history(limit=limit)
-    return {"status": "ok", "count": len(items), "items": items}
+async def list_trades(limit: int = Query(100, ge=1, le=2000), before: str | None = Query(None)):
+    return _page(dex_manager_service.TRADE_HISTORY_TOPIC, limit, before)
 
 
 @router.get("/history/cycles")
-async def list_cycles(limit: int = Query(100, ge=1, le=2000)):
-    items = dex_manager_service.list_cycle_history(limit=limit)
-    return {"status": "ok", "count": len(items), "items": items}
+async def list_cycles(limit: int = Query(100, ge=1, le=2000), before: str | None = Query(None)):
+    return _page(dex_manager_service.CYCLE_HISTORY_TOPIC, limit, before)
 
 
 @router.get("/history/tasks")
-async def list_tasks(limit: int = Query(200, ge=1, le=5000)):
-    items = dex_manager_service.list_task_history(limit=limit)
-    return {"status": "ok", "count": len(items), "items": items}
-
+async def list_tasks(limit: int = Query(200, ge=1, le=5000), before: str | None = Query(None)):
+    return _page(dex_manager_service.TASK_HISTORY_TOPIC, limit, before)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 
 from api.models.dex import DexControlRequest, DexStatusResponse, DexTriggerRequest
 from api.services.dex import dex_manager_service
+from core.pipelines.roi_settlement import roi_settlement_worker
 
 # Backward compatibility alias.
 dex_trader_service = dex_manager_service
@@ -36,7 +38,7 @@ async def stop_trader():
 async def trigger_cycle(payload: DexTriggerRequest, wait: bool = Query(default=False)):
     if wait:
         return await dex_manager_service.trigger_cycle_sync(mode=payload.mode, reason=payload.reason)
-    return await dex_manager_service.trigger_cycle(mode=payload.mode, reason=payload.reason)
+    return await dex_manager_service.trigger_cycle(mode=payload.mode, reason=payload.reason, profile=payload.profile)
 
 
 @router.get("/status", response_model=DexStatusResponse)
@@ -59,6 +61,11 @@ async def get_metrics():
     return {"status": "ok", "metrics": dex_manager_service.get_metrics()}
 
 
+@router.get("/roi/settlement")
+async def get_roi_settlement_metrics():
+    return {"status": "ok", "metrics": roi_settlement_worker.get_metrics()}
+
+
 @router.get("/dashboard")
 async def get_dashboard():
     return await dex_manager_service.get_dashboard_snapshot()
@@ -117,3 +124,21 @@ async def list_executions(limit: int = Query(default=50, ge=1, le=500)):
 async def get_execution(execution_id: str):
     item = await dex_manager_service.get_execution(execution_id)
     return {"status": "ok", "item": item}
+
+
+@router.post("/executions/{execution_id}/profile")
+async def enable_execution_profile(execution_id: str):
+    if not await dex_manager_service.enable_execution_profiling(execution_id):
+        raise HTTPException(status_code=409, detail="Execution is not running")
+    return {"status": "ok", "execution_id": execution_id, "profiling": True}
+
+
+@router.get("/executions/{execution_id}/profile")
+async def get_execution_profile(execution_id: str, format: str = Query(default="json", pattern="^(json|collapsed)$")):
+    """Sampled stacks of a profiled execution; ``collapsed`` feeds flamegraph.pl/speedscope."""
+    profile = await dex_manager_service.get_execution_profile(execution_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="No profile for this execution")
+    if format == "collapsed":
+        return PlainTextResponse(profile["collapsed"] + "\n")
+    return {"status": "ok", "item": profile}
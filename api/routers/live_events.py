@@ -0,0 +1,73 @@
+"""Server-sent event stream of event bus topics for live dashboards.
+
+Clients load a snapshot once through the REST routes, then apply deltas from
+``/api/events/stream``. A ``resync`` event means the client fell behind and
+events were dropped, so it should refetch the snapshot.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from core.clients.event_bus import TOPICS, get_topic
+from core.clients.event_hub import Subscription, live_event_hub
+from core.clients.redis_codec import DateTimeEncoder
+from core.settings.config import settings
+
+router = APIRouter()
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    lines = [f"event: {event}"]
+    if data.get("stream_id"):
+        lines.append(f"id: {data['stream_id']}")
+    lines.append(f"data: {json.dumps(data, cls=DateTimeEncoder, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def _event_source(request: Request, subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            batch = await subscription.next_batch(timeout=settings.live_events_heartbeat_seconds)
+            if not batch:
+                yield ": keepalive\n\n"
+                continue
+            # One write per batch; a slow client blocks here and its
+            # subscription coalesces instead of growing.
+            yield "".join(format_sse(topic, event) for topic, event in batch)
+    finally:
+        await live_event_hub.unsubscribe(subscription)
+
+
+@router.get("/events/stream")
+async def stream_events(
+    request: Request,
+    topics: str | None = Query(None, description="Comma-separated topics; all topics when omitted."),
+):
+    names = [name.strip() for name in (topics or "").split(",") if name.strip()]
+    try:
+        for name in names:
+            get_topic(name)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    subscription = await live_event_hub.subscribe(names or None)
+    return StreamingResponse(
+        _event_source(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/events/topics")
+async def list_topics():
+    return {"status": "ok", "items": sorted(TOPICS)}
+
+
+@router.get("/events/stats")
+async def event_stats():
+    return {"status": "ok", "stats": live_event_hub.get_stats()}
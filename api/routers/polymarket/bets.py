@@ -115,14 +115,7 @@ async def get_bet_details(
     
     log.info(f"[BETS API] Getting details for bet {bet_id}")
     
-    # Search for bet in decisions
-    all_decisions = decision_service.list_decisions(limit=500)
-    
-    bet_decision = None
-    for decision in all_decisions:
-        if decision.get("bet_id") == bet_id or decision.get("decision_id") == bet_id:
-            bet_decision = decision
-            break
+    bet_decision = decision_service.find_bet(bet_id)
     
     if not bet_decision:
         raise HTTPException(status_code=404, detail=f"Bet {bet_id} not found")
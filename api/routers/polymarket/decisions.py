@@ -7,17 +7,29 @@ router = APIRouter()
 
 
 @router.get("/decisions")
-async def list_decisions(limit: int = Query(50, ge=1, le=500)):
+async def list_decisions(
+    limit: int = Query(50, ge=1, le=500),
+    before: str | None = Query(None),
+    asset: str | None = Query(None),
+    since: str | None = Query(None),
+):
     """
     Get decision history
     
     Args:
         limit: Number of recent decisions to return
+        before: ``next_cursor`` of the previous page
+        asset: Only decisions indexed under this symbol
+        since: ISO timestamp lower bound
     
     Returns:
         List of agentic decisions with reasoning and outcomes
     """
-    return {"decisions": decision_service.list_decisions(limit=limit), "limit": limit}
+    try:
+        decisions, next_cursor = decision_service.page_decisions(limit=limit, before=before, asset=asset, since=since)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return {"decisions": decisions, "limit": limit, "next_cursor": next_cursor}
 
 
 @router.get("/decisions/{decision_id}")
@@ -50,10 +62,11 @@ async def get_market_decisions(market_id: str, limit: int = Query(20, ge=1, le=2
     Returns:
         Decisions for this market/bet
     """
-    decisions = [
-        d for d in decision_service.list_decisions(limit=limit)
-        if d.get("market_id") == market_id or (bet_id and d.get("bet_id") == bet_id)
-    ]
+    decisions, _ = decision_service.page_decisions(limit=limit, market_id=market_id)
+    if bet_id:
+        bet_decision = decision_service.find_bet(bet_id)
+        if bet_decision and bet_decision not in decisions:
+            decisions.append(bet_decision)
     return {"market_id": market_id, "bet_id": bet_id, "decisions": decisions}
 
 
@@ -4,7 +4,6 @@ from __future__ import annotations
 import asyncio
 import inspect
 import threading
-import json
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional, List
@@ -17,6 +16,7 @@ from api.services.polymarket.config_service import process_config_service
 
 from api.services.polymarket.logging_service import logging_service
 from core.camel_runtime import CamelTradingRuntime
+from core.pipelines.workers import FeedCacheStore
 
 router = APIRouter()
 
@@ -103,16 +103,16 @@ async def get_workforce_status():
 
 @router.get("/rss/cache", response_model=RssCacheResponse)
 async def get_rss_cache():
-    """Read cached Polymarket feed state (JSON file)."""
-    cache_path = Path("logs/polymarket_feed_cache.json")
-    if not cache_path.exists():
+    """Read cached Polymarket feed state (snapshot + append log)."""
+    store = FeedCacheStore(Path("logs/polymarket_feed_cache.json"))
+    if not store.path.exists() and not store.log_path.exists():
         return RssCacheResponse(status="ok", updated_at=None, count=0, markets={})
 
     try:
-        data = json.loads(cache_path.read_text())
-        markets = data.get("markets", {}) if isinstance(data, dict) else {}
-        updated_at = data.get("updated_at") if isinstance(data, dict) else None
-        count = data.get("count") if isinstance(data, dict) else len(markets)
+        data = await asyncio.to_thread(store.read)
+        markets = data["markets"]
+        updated_at = data["updated_at"]
+        count = data["count"]
         payload: Dict[str, Any] = {
             "status": "ok",
             "updated_at": updated_at,
@@ -11,6 +11,7 @@ from typing import Any
 from redis import Redis
 
 from core.camel_tools.wallet_analysis_toolkit import WalletAnalysisToolkit
+from core.clients.event_bus import EventBus
 from core.settings.config import settings
 from core.logging import log
 from core.pipelines.dex.triggers import (
@@ -29,11 +30,11 @@ class DexTraderService:
     """Manages DEX manager lifecycle, persistent config, and dashboard metrics."""
 
     CONFIG_KEY = "dex:config"
-    LOGS_KEY = "dex:logs"
     METRICS_KEY = "dex:metrics"
-    CYCLE_HISTORY_KEY = "dex:cycle_history"
-    TASK_HISTORY_KEY = "dex:task_history"
-    TRADE_HISTORY_KEY = "dex:trade_history"
+    LOGS_TOPIC = "dex.logs"
+    CYCLE_HISTORY_TOPIC = "dex.cycles"
+    TASK_HISTORY_TOPIC = "dex.tasks"
+    TRADE_HISTORY_TOPIC = "dex.trades"
 
     def __init__(self) -> None:
         self._redis = self._init_redis()
@@ -182,31 +183,26 @@ class DexTraderService:
         self._in_memory_logs = self._in_memory_logs[-500:]
         if self._redis:
             try:
-                self._redis.lpush(self.LOGS_KEY, json.dumps(event))
-                self._redis.ltrim(self.LOGS_KEY, 0, 999)
-            except Exception:
-                pass
-            try:
-                self._redis.hincrby(self.METRICS_KEY, "events_total", 1)
+                # Event log, counters and task history go out as one round trip
+                pipe = self._redis.pipeline(transaction=False)
+                self._events.publish(self.LOGS_TOPIC, event, pipe=pipe)
+                pipe.hincrby(self.METRICS_KEY, "events_total", 1)
                 msg = event["message"].lower()
                 if "cycle started" in msg:
-                    self._redis.hincrby(self.METRICS_KEY, "cycles_started", 1)
+                    pipe.hincrby(self.METRICS_KEY, "cycles_started", 1)
                 if "cycle completed" in msg:
-                    self._redis.hincrby(self.METRICS_KEY, "cycles_completed", 1)
-                if "task started" in msg:
-                    self._redis.hincrby(self.METRICS_KEY, "tasks_started", 1)
-                    self._redis.lpush(self.TASK_HISTORY_KEY, json.dumps(event))
-                    self._redis.ltrim(self.TASK_HISTORY_KEY, 0, 1000)
-                if "task completed" in msg:
-                    self._redis.hincrby(self.METRICS_KEY, "tasks_completed", 1)
-                    self._redis.lpush(self.TASK_HISTORY_KEY, json.dumps(event))
-                    self._redis.ltrim(self.TASK_HISTORY_KEY, 0, 1000)
-                if "task failed" in msg:
-                    self._redis.hincrby(self.METRICS_KEY, "tasks_failed", 1)
-                    self._redis.lpush(self.TASK_HISTORY_KEY, json.dumps(event))
-                    self._redis.ltrim(self.TASK_HISTORY_KEY, 0, 1000)
+                    pipe.hincrby(self.METRICS_KEY, "cycles_completed", 1)
+                for marker, counter in (
+                    ("task started", "tasks_started"),
+                    ("task completed", "tasks_completed"),
+                    ("task failed", "tasks_failed"),
+                ):
+                    if marker in msg:
+                        pipe.hincrby(self.METRICS_KEY, counter, 1)
+                        self._events.publish(self.TASK_HISTORY_TOPIC, event, pipe=pipe)
                 if "watchlist notification" in msg:
-                    self._redis.hincrby(self.METRICS_KEY, "watchlist_notifications", 1)
+                    pipe.hincrby(self.METRICS_KEY, "watchlist_notifications", 1)
+                pipe.execute()
             except Exception:
                 pass
 
@@ -273,16 +269,20 @@ class DexTraderService:
         self._record_event("INFO", "DEX manager stopped via API", {})
         return {"status": "ok", "running": False}
 
-    async def trigger_cycle(self, mode: str = "long_study", reason: str = "manual_trigger") -> dict[str, Any]:
+    async def trigger_cycle(
+        self,
+        mode: str = "long_study",
+        reason: str = "manual_trigger",
+        profile: bool = False,
+    ) -> dict[str, Any]:
         trader = await self.ensure_trader()
         review_mode = ReviewMode.FAST_DECISION if mode == ReviewMode.FAST_DECISION.value else ReviewMode.LONG_STUDY
         self._record_event("INFO", "DEX cycle trigger requested", {"mode": review_mode.value, "reason": reason})
-        execution_id = trader.launch_execution(mode=review_mode, reason=reason)
+        execution_id = trader.launch_execution(mode=review_mode, reason=reason, profile=profile)
         if self._redis:
             try:
                 payload = {"timestamp": self._now_iso(), "mode": review_mode.value, "reason": reason, "execution_id": execution_id}
-                self._redis.lpush(self.CYCLE_HISTORY_KEY, json.dumps(payload))
-                self._redis.ltrim(self.CYCLE_HISTORY_KEY, 0, 500)
+                self._events.publish(self.CYCLE_HISTORY_TOPIC, payload)
             except Exception:
                 pass
         return {"status": "accepted", "execution_id": execution_id}
@@ -389,24 +389,21 @@ class DexTraderService:
         self._record_event("INFO", "DEX trigger settings updated", {"trigger": trigger_name, "settings": normalized})
         return self.get_trigger_settings(trigger_name)
 
-    def _read_json_list(self, key: str, limit: int) -> list[dict[str, Any]]:
-        if self._redis:
-            try:
-                rows = self._redis.lrange(key, 0, max(0, limit - 1))
-                items: list[dict[str, Any]] = []
-                for row in rows:
-                    try:
-                        items.append(json.loads(row))
-                    except Exception:
-                        continue
-                return items
-            except Exception:
-                return []
-        return []
+    @property
+    def _events(self) -> EventBus:
+        return EventBus(self._redis)
+
+    def page_history(
+        self, topic: str, limit: int = 100, before: str | None = None
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Newest-first page of a DEX event topic plus the cursor for older items."""
+        if not self._redis:
+            return [], None
+        return self._events.page(topic, limit=limit, before=before)
 
     def list_logs(self, limit: int = 100) -> list[dict[str, Any]]:
         if self._redis:
-            logs = self._read_json_list(self.LOGS_KEY, limit)
+            logs = self._events.latest(self.LOGS_TOPIC, limit)
             if logs:
                 return logs
         return list(reversed(self._in_memory_logs))[:limit]
@@ -415,7 +412,7 @@ class DexTraderService:
         self._in_memory_logs.clear()
         if self._redis:
             try:
-                self._redis.delete(self.LOGS_KEY)
+                self._events.clear(self.LOGS_TOPIC)
             except Exception:
                 pass
 
@@ -469,13 +466,13 @@ class DexTraderService:
         }
 
     def list_trade_history(self, limit: int = 100) -> list[dict[str, Any]]:
-        return self._read_json_list(self.TRADE_HISTORY_KEY, limit)
+        return self.page_history(self.TRADE_HISTORY_TOPIC, limit)[0]
 
     def list_cycle_history(self, limit: int = 100) -> list[dict[str, Any]]:
-        return self._read_json_list(self.CYCLE_HISTORY_KEY, limit)
+        return self.page_history(self.CYCLE_HISTORY_TOPIC, limit)[0]
 
     def list_task_history(self, limit: int = 200) -> list[dict[str, Any]]:
-        return self._read_json_list(self.TASK_HISTORY_KEY, limit)
+        return self.page_history(self.TASK_HISTORY_TOPIC, limit)[0]
 
     async def get_execution(self, execution_id: str) -> dict[str, Any]:
         trader = await self.ensure_trader()
@@ -485,6 +482,14 @@ class DexTraderService:
         trader = await self.ensure_trader()
         return trader.list_executions(limit=limit)
 
+    async def enable_execution_profiling(self, execution_id: str) -> bool:
+        trader = await self.ensure_trader()
+        return trader.enable_execution_profiling(execution_id)
+
+    async def get_execution_profile(self, execution_id: str) -> dict[str, Any] | None:
+        trader = await self.ensure_trader()
+        return trader.get_execution_profile(execution_id)
+
 
 dex_trader_service = DexTraderService()
 dex_manager_service = dex_trader_service
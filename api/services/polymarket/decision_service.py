@@ -1,15 +1,132 @@
-"""In-memory decision and proposal tracking for Polymarket API."""
+"""Decision and proposal tracking for Polymarket API.
+
+Decisions are persisted in SQLite so they survive restarts. Rows are indexed
+by ``decision_id``, insertion sequence (time order), ``market_id``, ``bet_id``
+and by asset symbol: every decision is tagged with its ``asset`` plus the
+words of its ``market_name``, so "last decision mentioning ETH" is a single
+index seek instead of a scan. Pages are newest-first with an opaque sequence
+cursor, and the oldest rows are evicted once ``max_records`` is exceeded.
+
+Proposals are short-lived and stay in a bounded in-memory map.
+"""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import json
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
+from core.clients.redis_codec import DateTimeEncoder
+from core.logging import log
+from core.settings.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    decision_id TEXT NOT NULL UNIQUE,
+    ts TEXT NOT NULL,
+    market_id TEXT,
+    bet_id TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_decisions_ts ON decisions(ts);
+CREATE INDEX IF NOT EXISTS idx_decisions_market ON decisions(market_id, seq);
+CREATE INDEX IF NOT EXISTS idx_decisions_bet ON decisions(bet_id);
+CREATE TABLE IF NOT EXISTS decision_assets (
+    symbol TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (symbol, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_decision_assets_seq ON decision_assets(seq);
+"""
+
+_WORD_RE = re.compile(r"[A-Z0-9]+")
+
+
+def asset_symbols(decision: Dict[str, Any]) -> List[str]:
+    """Symbols a decision is indexed under: its asset plus market name words."""
+    symbols = set(_WORD_RE.findall(str(decision.get("market_name") or "").upper()))
+    asset = str(decision.get("asset") or "").strip().upper()
+    if asset:
+        symbols.add(asset)
+    return sorted(symbols)
+
+
+def utc_timestamp(value: Any) -> str:
+    """Normalize an ISO timestamp (``Z`` suffix, any offset, naive = UTC) to UTC.
+
+    The fixed-width output sorts correctly as text, which the ``ts`` column
+    and the ``since`` filter rely on. Raises ``ValueError`` if unparseable.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value or "").strip()
+        parsed = datetime.fromisoformat(text[:-1] + "+00:00" if text[-1:] in ("Z", "z") else text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
 
 class DecisionService:
-    def __init__(self) -> None:
-        self._proposals: Dict[str, Dict[str, Any]] = {}
-        self._decisions: List[Dict[str, Any]] = []
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_records: Optional[int] = None,
+        max_proposals: int = 1000,
+    ) -> None:
+        self.db_path = db_path or settings.polymarket_decision_db_path
+        self.max_records = int(max_records or settings.polymarket_decision_max_records)
+        self.max_proposals = max(1, int(max_proposals))
+        self._proposals: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning(f"Decision store {self.db_path} unavailable, keeping decisions in memory: {exc}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _rows(rows: Iterable[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        return [json.loads(row[0]) for row in rows]
+
+    def _evict(self, conn: sqlite3.Connection, seq: int) -> None:
+        cutoff = seq - self.max_records
+        if cutoff <= 0:
+            return
+        conn.execute("DELETE FROM decision_assets WHERE seq <= ?", (cutoff,))
+        conn.execute("DELETE FROM decisions WHERE seq <= ?", (cutoff,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Proposals
+    # ------------------------------------------------------------------
 
     def create_proposal(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         proposal_id = str(uuid4())
@@ -19,6 +136,8 @@ class DecisionService:
             **payload,
         }
         self._proposals[proposal_id] = proposal
+        while len(self._proposals) > self.max_proposals:
+            self._proposals.popitem(last=False)
         return proposal
 
     def get_proposal(self, proposal_id: str) -> Optional[Dict[str, Any]]:
@@ -27,23 +146,115 @@ class DecisionService:
     def list_proposals(self, limit: int = 50) -> List[Dict[str, Any]]:
         return list(self._proposals.values())[-limit:]
 
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
     def record_decision(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         decision = {
             "decision_id": str(uuid4()),
             "timestamp": datetime.now(timezone.utc).isoformat(),
             **payload,
         }
-        self._decisions.append(decision)
+        body = json.dumps(decision, cls=DateTimeEncoder)
+        try:
+            ts = utc_timestamp(decision["timestamp"])
+        except ValueError:
+            ts = str(decision["timestamp"])
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO decisions (decision_id, ts, market_id, bet_id, payload) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        str(decision["decision_id"]),
+                        ts,
+                        decision.get("market_id"),
+                        decision.get("bet_id"),
+                        body,
+                    ),
+                )
+                seq = int(cursor.lastrowid)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO decision_assets (symbol, seq) VALUES (?, ?)",
+                    [(symbol, seq) for symbol in asset_symbols(decision)],
+                )
+                self._evict(conn, seq)
         return decision
 
+    def page_decisions(
+        self,
+        limit: int = 50,
+        before: Optional[str] = None,
+        *,
+        market_id: Optional[str] = None,
+        asset: Optional[str] = None,
+        since: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Newest-first page of decisions and the cursor for the next (older) page.
+
+        ``since`` is an ISO timestamp lower bound (inclusive). Raises
+        ``ValueError`` for a malformed ``before`` cursor or ``since``.
+        """
+        limit = max(1, int(limit))
+        clauses: List[str] = []
+        params: List[Any] = []
+        if before:
+            try:
+                before_seq = int(before)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid cursor: {before!r}") from None
+            clauses.append("d.seq < ?")
+            params.append(before_seq)
+        if market_id:
+            clauses.append("d.market_id = ?")
+            params.append(market_id)
+        if since:
+            clauses.append("d.ts >= ?")
+            params.append(utc_timestamp(since))
+        source = "decisions d"
+        if asset:
+            source = "decision_assets a JOIN decisions d ON d.seq = a.seq"
+            clauses.append("a.symbol = ?")
+            params.append(asset.strip().upper())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT d.payload, d.seq FROM {source} {where} ORDER BY d.seq DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        next_cursor = str(rows[-1][1]) if len(rows) == limit else None
+        return self._rows(rows), next_cursor
+
     def list_decisions(self, limit: int = 50) -> List[Dict[str, Any]]:
-        return list(reversed(self._decisions))[:limit]
+        items, _ = self.page_decisions(limit=limit)
+        return items
 
     def get_decision(self, decision_id: str) -> Optional[Dict[str, Any]]:
-        for d in self._decisions:
-            if d.get("decision_id") == decision_id:
-                return d
-        return None
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT payload FROM decisions WHERE decision_id = ?", (decision_id,)
+            ).fetchall()
+        items = self._rows(rows)
+        return items[0] if items else None
+
+    def find_bet(self, bet_id: str) -> Optional[Dict[str, Any]]:
+        """Latest decision for ``bet_id`` (also accepts a decision id)."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT payload FROM decisions WHERE bet_id = ? OR decision_id = ? ORDER BY seq DESC LIMIT 1",
+                (bet_id, bet_id),
+            ).fetchall()
+        items = self._rows(rows)
+        return items[0] if items else None
+
+    def latest_for_asset(self, symbol: str) -> Optional[Dict[str, Any]]:
+        items, _ = self.page_decisions(limit=1, asset=symbol)
+        return items[0] if items else None
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._connect().execute("SELECT COUNT(*) FROM decisions").fetchone()[0])
 
 
 decision_service = DecisionService()
@@ -1,13 +1,23 @@
-"""Simple in-memory logging for Polymarket API."""
+"""Logging for Polymarket API, published to the ``polymarket.logs`` event stream."""
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime, timezone
 
+from core.clients.event_bus import EventBus, get_event_bus
+from core.logging import log
+
 
 class LoggingService:
-    def __init__(self) -> None:
-        self._events: List[Dict[str, Any]] = []
+    TOPIC = "polymarket.logs"
+
+    def __init__(self, max_events: int = 1000) -> None:
+        # In-memory fallback when Redis is unavailable
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+
+    def _event_bus(self) -> Optional[EventBus]:
+        return get_event_bus()
 
     def log_event(self, level: str, message: str, context: Dict[str, Any] | None = None) -> Dict[str, Any]:
         event = {
@@ -17,13 +27,27 @@ class LoggingService:
             "context": context or {},
         }
         self._events.append(event)
+        bus = self._event_bus()
+        if bus is not None:
+            bus.publish(self.TOPIC, event)
         return event
 
     def list_events(self, limit: int = 100) -> List[Dict[str, Any]]:
+        bus = self._event_bus()
+        if bus is not None:
+            events = bus.latest(self.TOPIC, limit)
+            if events:
+                return events
         return list(reversed(self._events))[:limit]
 
     def clear(self) -> None:
         self._events.clear()
+        bus = self._event_bus()
+        if bus is not None:
+            try:
+                bus.clear(self.TOPIC)
+            except Exception as exc:
+                log.debug(f"Failed clearing Polymarket log stream: {exc}")
 
 
 logging_service = LoggingService()
@@ -0,0 +1,33 @@
+"""
+Offline, deterministic benchmarks for the trading pipelines.
+
+Every benchmark runs without network or a Redis server: forecasting and LLM
+calls go through ``core.mocks`` with fixed delays, Redis is fakeredis, and
+HTTP clients (forecasting API, Uniswap subgraph) are served recorded
+responses from ``benchmarks/fixtures``. Random inputs are seeded, so the
+output summary stored with each timing is identical across runs of the same
+commit.
+
+Usage:
+  uv run python -m benchmarks --output bench.json
+  uv run python -m benchmarks --baseline bench.json --only dqn_ranking,pool_spy_index
+  uv run python -m benchmarks --quick --list
+
+``--baseline`` exits non-zero when any median regressed past its threshold.
+"""
+
+from benchmarks.harness import BenchContext, Case, benchmark, compare, registered, run_suite
+
+__all__ = ["BenchContext", "Case", "benchmark", "compare", "load_benchmarks", "registered", "run_suite"]
+
+
+def load_benchmarks() -> None:
+    """Import the benchmark modules so they register themselves."""
+    from benchmarks import (  # noqa: F401
+        bench_feed_cache,
+        bench_forecasting,
+        bench_pool_spy,
+        bench_taskflow,
+        bench_v3_math,
+        bench_watchlist,
+    )
@@ -0,0 +1,72 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from loguru import logger
+
+from benchmarks import compare, load_benchmarks, registered, run_suite
+
+
+def _print_result(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"{name:<26} {result['median_ms']:>10.3f} {result['p95_ms']:>10.3f} "
+        f"{result['min_ms']:>10.3f} {result['iterations']:>6}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the offline pipeline benchmarks.")
+    parser.add_argument("--only", default="", help="Comma-separated benchmark names.")
+    parser.add_argument("--quick", action="store_true", help="Few iterations; for smoke runs, not comparisons.")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for generated inputs and mock services.")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file.")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous JSON result.")
+    parser.add_argument("--threshold", type=float, help="Override every per-benchmark regression threshold.")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit.")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging.")
+    args = parser.parse_args()
+
+    load_benchmarks()
+    if not args.verbose:
+        # Imported modules configure loguru on import; quiet it afterwards
+        logger.remove()
+        logger.add(sys.stderr, level="ERROR")
+    if args.list:
+        for name, spec in sorted(registered().items()):
+            print(f"{name:<26} +{spec.threshold:.0%}  {spec.description}")
+        return 0
+
+    names = [name.strip() for name in args.only.split(",") if name.strip()] or None
+    print(f"{'benchmark':<26} {'median ms':>10} {'p95 ms':>10} {'min ms':>10} {'iters':>6}")
+    try:
+        results = run_suite(names, seed=args.seed, quick=args.quick, on_result=_print_result)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"Results written to {args.output}")
+
+    if not args.baseline:
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    rows = compare(results, baseline, threshold=args.threshold)
+    print(f"\nBaseline {(baseline.get('git') or {}).get('commit') or args.baseline}")
+    for row in rows:
+        if "ratio" not in row:
+            print(f"{row['name']:<26} {row['status']}")
+            continue
+        changed = "  output changed" if row["output_changed"] else ""
+        print(
+            f"{row['name']:<26} {row['baseline_ms']:>10.3f} -> {row['current_ms']:>10.3f} "
+            f"x{row['ratio']:<6} {row['status']}{changed}"
+        )
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
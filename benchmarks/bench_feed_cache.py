@@ -0,0 +1,55 @@
+"""Polymarket feed cache update and persistence benchmark."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from benchmarks.harness import BenchContext, Case, benchmark
+from core.pipelines.polymarket.triggers.market import PolymarketFeedRuntime
+from core.pipelines.workers.feed_store import FeedCacheStore
+
+
+def _markets(ctx: BenchContext, count: int) -> List[Dict[str, Any]]:
+    rng = ctx.rng()
+    return [
+        {
+            "id": f"market-{index}",
+            "title": f"Will asset {index % 97} close above target {index}?",
+            "volume": round(rng.uniform(1e3, 1e7), 2),
+            "liquidity": round(rng.uniform(1e2, 1e6), 2),
+            "outcomes": ["Yes", "No"],
+            "prices": [round(p, 4) for p in (rng.random(), rng.random())],
+            "closed": rng.random() < 0.05,
+        }
+        for index in range(count)
+    ]
+
+
+@benchmark("feed_cache_update", iterations=40, quick_iterations=4)
+def feed_cache_update(ctx: BenchContext) -> Case:
+    """Feed runtime update of a 400-market page plus delta append to the on-disk store."""
+    markets = _markets(ctx, 4000)
+    runtime = PolymarketFeedRuntime(max_cache=2000, threshold=50)
+    # fsync off: the benchmark measures the cache path, not the disk
+    store = FeedCacheStore(ctx.tmp_path / "feed_cache.json", fsync=False)
+    ctx.stack.callback(store.flush)
+    page_size = 400
+    state = {"offset": 0}
+
+    def is_exhausted(market: Dict[str, Any]) -> bool:
+        return bool(market.get("closed"))
+
+    def run() -> Dict[str, Any]:
+        offset = state["offset"]
+        page = markets[offset : offset + page_size]
+        state["offset"] = (offset + page_size // 2) % (len(markets) - page_size)
+        cache = runtime.update(page, is_exhausted)
+        changed, removed = runtime.drain_changes()
+        store.save(cache, changed, removed)
+        return {"cache": len(cache), "changed": len(changed), "removed": len(removed)}
+
+    def summary(output: Dict[str, Any]) -> Dict[str, Any]:
+        store.flush()
+        return {**output, "records_written": store.get_stats()["records_written"]}
+
+    return Case(run=run, summary=summary)
@@ -0,0 +1,110 @@
+"""ForecastingClient DQN fan-out and ranking benchmarks."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import httpx
+
+from benchmarks.harness import BenchContext, Case, benchmark, load_fixture, recorded_http
+from core.clients.forecasting_client import ForecastingClient
+from core.mocks.mock_forecasting_service import MockForecastingService
+from core.utils.dqn_ranking import rank_best_signals, rank_best_vs_worst_signals
+
+MOCK_DELAY_SECONDS = 0.001
+
+
+def _actions_handler(responses: Dict[str, Any]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/tools/get_action_recommendation"):
+            ticker = request.url.params.get("ticker", "")
+        elif "/api/json/action/" in path:
+            ticker = path.rstrip("/").split("/")[-2]
+        else:
+            return httpx.Response(404, json={"detail": f"no recording for {path}"})
+        payload = responses.get(ticker)
+        if payload is None:
+            return httpx.Response(404, json={"detail": f"Ticker {ticker} not enabled"})
+        return httpx.Response(200, json=payload)
+
+    return handler
+
+
+def _fanout_summary(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "records": len(records),
+        "actions": {record["symbol"]: record["action"] for record in records},
+    }
+
+
+@benchmark("forecasting_fanout_http", iterations=20, quick_iterations=3)
+def forecasting_fanout_http(ctx: BenchContext) -> Case:
+    """DQN fan-out over the universe through the HTTP path, served from recorded responses."""
+    fixture = load_fixture("forecasting_actions.json")["responses"]
+    ctx.stack.enter_context(recorded_http(_actions_handler(fixture)))
+    client = ForecastingClient({"mock_mode": False, "api_key": "benchmark", "retry_attempts": 1})
+    tickers = [symbol.split("-")[0] for symbol in fixture]
+
+    async def run() -> List[Dict[str, Any]]:
+        client.cache.clear()
+        client.cache_ttl.clear()
+        return await client.get_dqn_signals_for_universe(tickers, interval="days")
+
+    return Case(run=run, summary=_fanout_summary)
+
+
+@benchmark("forecasting_fanout_mock", iterations=20, quick_iterations=3)
+def forecasting_fanout_mock(ctx: BenchContext) -> Case:
+    """DQN fan-out over the mock forecasting service with a fixed per-call delay."""
+    client = ForecastingClient({"mock_mode": True})
+    client.mock_service = MockForecastingService(
+        {"response_delay": MOCK_DELAY_SECONDS, "rate_limit": 10**9}
+    )
+    tickers = [symbol.split("-")[0] for symbol in client.mock_service.tickers]
+
+    async def run() -> List[Dict[str, Any]]:
+        client.cache.clear()
+        client.cache_ttl.clear()
+        client.mock_service.recommendation_cache.clear()
+        return await client.get_dqn_signals_for_universe(tickers, interval="days")
+
+    return Case(run=run, summary=_fanout_summary)
+
+
+@benchmark("dqn_ranking", iterations=200, quick_iterations=10, threshold=0.4)
+def dqn_ranking(ctx: BenchContext) -> Case:
+    """Best/worst BUY and SELL ranking over a 480-record signal universe."""
+    rng = ctx.rng()
+    base = list(load_fixture("forecasting_actions.json")["responses"].values())
+    records: List[Dict[str, Any]] = []
+    for copy in range(20):
+        for payload in base:
+            q_values = [round(q + rng.uniform(-0.2, 0.2), 4) for q in payload["q_values"]]
+            records.append(
+                {
+                    "base_ticker": f"{payload['ticker'].split('-')[0]}{copy}",
+                    "symbol": f"{payload['ticker']}:{copy}",
+                    "interval": "days",
+                    "action": max(range(3), key=lambda i: q_values[i]),
+                    "action_confidence": payload["action_confidence"],
+                    "q_values": q_values,
+                    "current_price": payload["current_price"],
+                }
+            )
+
+    def run() -> Dict[str, Any]:
+        return {
+            "best": rank_best_signals(records, "both", 20),
+            "best_vs_worst": rank_best_vs_worst_signals(records, "both", 20),
+        }
+
+    def summary(output: Dict[str, Any]) -> Dict[str, Any]:
+        best = output["best"]
+        return {
+            "top_buy": [item["symbol"] for item in best["best_buy"][:5]],
+            "top_sell": [item["symbol"] for item in best["best_sell"][:5]],
+            "worst_buy": [item["symbol"] for item in output["best_vs_worst"]["buy"]["worst"][:5]],
+        }
+
+    return Case(run=run, summary=summary)
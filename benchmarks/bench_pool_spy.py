@@ -0,0 +1,54 @@
+"""PoolSpy discovery and indexing benchmark."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+import fakeredis
+import httpx
+from web3 import Web3
+
+from benchmarks.harness import BenchContext, Case, benchmark, load_fixture, recorded_http
+from core.clients.uviswap.pool_spy import PoolSpy
+
+SYMBOLS = ["WETH", "USDC", "USDT", "DAI", "WBTC", "UNI", "LINK", "ARB", "AAVE", "MKR", "LDO", "CRV"]
+PAIRS = [("WETH", "USDC"), ("USDC", "WETH"), ("WBTC", "WETH"), ("UNI", "USDT"), ("ARB", "DAI"), ("LINK", "CRV")]
+
+
+@benchmark("pool_spy_index", iterations=30, quick_iterations=3)
+def pool_spy_index(ctx: BenchContext) -> Case:
+    """Subgraph fetch (recorded) on first discovery, catalog lookups after, Redis persist and best-pool lookups."""
+    recorded = load_fixture("subgraph_pools.json")["response"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content or b"{}")
+        first = int((query.get("variables") or {}).get("first", 100))
+        return httpx.Response(200, json={"data": {"pools": recorded["data"]["pools"][:first]}})
+
+    ctx.stack.enter_context(recorded_http(handler))
+    redis_client = fakeredis.FakeRedis(decode_responses=True)
+    spy = PoolSpy(Web3(), subgraph_url="https://subgraph.invalid/uniswap-v3", redis_client=redis_client)
+    ctx.stack.callback(spy.stop_refresher)
+    # Lookups after a restart go through Redis rather than the in-memory index
+    cold_spy = PoolSpy(Web3(), redis_client=redis_client)
+
+    def run() -> Dict[str, Any]:
+        discovered = spy.discover_and_index_pools(SYMBOLS, limit=200)
+        best = {f"{a}/{b}": spy.resolve_best_pool(a, b) for a, b in PAIRS}
+        cold = {f"{a}/{b}": cold_spy.resolve_best_pool(a, b) for a, b in PAIRS}
+        return {"discovered": discovered, "best": best, "cold": cold}
+
+    def summary(output: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "pool_count": output["discovered"]["pool_count"],
+            "index_keys": len(output["discovered"]["index_keys"]),
+            "best": {pair: pool.pool_address if pool else None for pair, pool in output["best"].items()},
+            "cold_matches_warm": all(
+                (output["cold"][pair] and output["cold"][pair].pool_address)
+                == (pool and pool.pool_address)
+                for pair, pool in output["best"].items()
+            ),
+        }
+
+    return Case(run=run, summary=summary)
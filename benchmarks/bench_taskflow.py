@@ -0,0 +1,81 @@
+"""TaskFlowHub run benchmark over mock LLM and forecasting services."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict
+
+from benchmarks.harness import BenchContext, Case, benchmark
+from core.mocks.mock_forecasting_service import MockForecastingService
+from core.mocks.mock_llm_service import MockLLMService
+from core.pipelines.tasks.base import TaskFlowHub, TaskFlowSpec
+
+MOCK_DELAY_SECONDS = 0.001
+
+
+class FixedDelayLLMService(MockLLMService):
+    """Mock LLM whose latency is constant instead of 100-500 ms of noise."""
+
+    async def _simulate_api_delay(self) -> None:
+        await asyncio.sleep(MOCK_DELAY_SECONDS)
+
+
+@benchmark("taskflow_hub_run", iterations=30, quick_iterations=3)
+def taskflow_hub_run(ctx: BenchContext) -> Case:
+    """Dependency-ordered TaskFlowHub run of a six-task DEX-style flow."""
+    llm = FixedDelayLLMService()
+    forecasting = MockForecastingService({"response_delay": MOCK_DELAY_SECONDS, "rate_limit": 10**9})
+    tickers = forecasting.tickers[:5]
+
+    async def fetch_signals(context: Dict[str, Any]) -> Dict[str, Any]:
+        forecasting.recommendation_cache.clear()
+        context["signals"] = await asyncio.gather(
+            *(forecasting.get_action_recommendation(ticker, "days") for ticker in tickers)
+        )
+        return {"status": "completed", "count": len(context["signals"])}
+
+    async def news_sentiment(context: Dict[str, Any]) -> Dict[str, Any]:
+        llm.sentiment_cache.clear()
+        results = await asyncio.gather(
+            *(llm.analyze_sentiment(f"{ticker} rallies on strong volume") for ticker in tickers)
+        )
+        context["sentiment"] = [item["sentiment"] for item in results]
+        return {"status": "completed", "count": len(results)}
+
+    async def rank(context: Dict[str, Any]) -> Dict[str, Any]:
+        ordered = sorted(context["signals"], key=lambda item: item["confidence"], reverse=True)
+        context["ranked"] = [item["ticker"] for item in ordered]
+        return {"status": "completed", "top": context["ranked"][:3]}
+
+    async def decide(context: Dict[str, Any]) -> Dict[str, Any]:
+        llm.response_cache.clear()
+        reply = await llm.chat_completion(
+            [{"role": "user", "content": f"Pick one of {', '.join(context['ranked'])}"}]
+        )
+        return {"status": "completed", "choices": len(reply.get("choices") or [])}
+
+    async def report(context: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "completed", "sentiment": context["sentiment"]}
+
+    async def failing(context: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("simulated executor failure")
+
+    hub = TaskFlowHub(pipeline="dex", system_name="benchmark")
+    hub.register_many(
+        [
+            TaskFlowSpec("fetch_signals", "dex", "benchmark", executor=fetch_signals),
+            TaskFlowSpec("news_sentiment", "dex", "benchmark", executor=news_sentiment),
+            TaskFlowSpec("rank", "dex", "benchmark", dependencies=["fetch_signals"], executor=rank),
+            TaskFlowSpec("decide", "dex", "benchmark", dependencies=["rank", "news_sentiment"], executor=decide),
+            TaskFlowSpec("report", "dex", "benchmark", dependencies=["decide"], executor=report),
+            TaskFlowSpec("rebalance", "dex", "benchmark", dependencies=["missing_upstream"], executor=failing),
+        ]
+    )
+
+    async def run() -> Dict[str, Dict[str, Any]]:
+        return await hub.run(trigger_type="manual", context={}, flags={})
+
+    def summary(output: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        return {"statuses": {task_id: result.get("status") for task_id, result in sorted(output.items())}}
+
+    return Case(run=run, summary=summary)
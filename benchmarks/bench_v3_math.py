@@ -0,0 +1,59 @@
+"""Off-chain V3 swap simulation benchmark."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from benchmarks.harness import BenchContext, Case, benchmark
+from core.clients.uviswap.v3_math import Q96, PoolState, SwapResult, TickInfo
+
+TOKEN0 = "0x" + "0a" * 20
+TOKEN1 = "0x" + "0b" * 20
+
+
+@benchmark("v3_swap_simulation", iterations=50, quick_iterations=5)
+def v3_swap_simulation(ctx: BenchContext) -> Case:
+    """Exact-in and exact-out quotes over a 400-position pool, both directions, 40 sizes."""
+    rng = ctx.rng()
+    # A deep position across the loaded words keeps every swap inside them
+    ticks: Dict[int, List[int]] = {-2048 * 60: [10**21, 10**21], 2047 * 60: [10**21, -(10**21)]}
+    liquidity = 10**21
+    for _ in range(400):
+        lower = rng.randrange(-300, 300) * 60
+        upper = lower + rng.randrange(1, 40) * 60
+        amount = rng.randrange(10**15, 10**19)
+        for tick, sign in ((lower, 1), (upper, -1)):
+            gross, net = ticks.get(tick, [0, 0])
+            ticks[tick] = [gross + amount, net + sign * amount]
+        if lower <= 0 < upper:
+            liquidity += amount
+    state = PoolState(
+        address="0x" + "0f" * 20,
+        token0=TOKEN0,
+        token1=TOKEN1,
+        fee=3000,
+        tick_spacing=60,
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=liquidity,
+        ticks={tick: TickInfo(gross, net) for tick, (gross, net) in ticks.items()},
+        word_range=(-8, 7),
+    )
+    sizes = [rng.randrange(10**16, 10**20) for _ in range(40)]
+
+    def run() -> List[SwapResult]:
+        results = []
+        for size in sizes:
+            results.append(state.quote_exact_in(TOKEN0, size))
+            results.append(state.quote_exact_in(TOKEN1, size))
+            results.append(state.quote_exact_out(TOKEN0, size // 10))
+        return results
+
+    def summary(output: List[SwapResult]) -> Dict[str, Any]:
+        return {
+            "quotes": len(output),
+            "amount_out_total": str(sum(result.amount_out for result in output)),
+            "ticks_crossed": sum(result.ticks_crossed for result in output),
+        }
+
+    return Case(run=run, summary=summary)
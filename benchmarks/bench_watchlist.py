@@ -0,0 +1,49 @@
+"""Watchlist trigger evaluation benchmark."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import fakeredis
+
+from benchmarks.harness import BenchContext, Case, benchmark
+from core.camel_tools.watchlist_toolkit import WatchlistToolkit
+
+SYMBOLS = ["ETH", "WBTC", "UNI", "LINK", "ARB", "AAVE", "MKR", "LDO", "CRV", "OP"]
+
+
+@benchmark("watchlist_triggers", iterations=30, quick_iterations=3)
+def watchlist_triggers(ctx: BenchContext) -> Case:
+    """Position and global ROI trigger evaluation over 500 open positions in fakeredis."""
+    rng = ctx.rng()
+    toolkit = WatchlistToolkit(redis_client=fakeredis.FakeRedis(decode_responses=True))
+    for index in range(500):
+        toolkit.add_position(
+            token_symbol=SYMBOLS[index % len(SYMBOLS)],
+            token_address="0x" + f"{index:040x}",
+            quantity=round(rng.uniform(0.1, 50.0), 4),
+            entry_price=round(rng.uniform(1.0, 3000.0), 4),
+            wallet_address="0x" + "b" * 40,
+        )
+    prices = [{symbol: round(rng.uniform(1.0, 3000.0), 4) for symbol in SYMBOLS} for _ in range(8)]
+    state = {"tick": 0}
+
+    def run() -> Dict[str, Any]:
+        for symbol, price in prices[state["tick"] % len(prices)].items():
+            toolkit.update_price(symbol, price)
+        state["tick"] += 1
+        triggers = toolkit.evaluate_triggers()
+        roi = toolkit.evaluate_global_roi_trigger(threshold_pct=0.04, fast_threshold_pct=0.08, enabled=True)
+        return {"triggers": triggers, "roi": roi}
+
+    def summary(output: Dict[str, Any]) -> Dict[str, Any]:
+        kinds: Dict[str, int] = {}
+        for notification in output["triggers"]["notifications"]:
+            kinds[notification["trigger_type"]] = kinds.get(notification["trigger_type"], 0) + 1
+        return {
+            "notifications": output["triggers"]["count"],
+            "by_type": dict(sorted(kinds.items())),
+            "global_roi": round(output["roi"]["global_roi"], 6),
+        }
+
+    return Case(run=run, summary=summary)
@@ -0,0 +1,265 @@
+"""Benchmark registry, timing loop and baseline comparison."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import json
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class Case:
+    """One prepared benchmark: ``run`` is timed, ``summary`` describes its output.
+
+    ``run`` may be sync or async. Its return value from the last iteration is
+    passed to ``summary``, whose result is stored alongside the timings so a
+    change in behaviour shows up next to a change in speed.
+    """
+
+    run: Callable[[], Any]
+    summary: Optional[Callable[[Any], Dict[str, Any]]] = None
+
+
+@dataclass
+class BenchContext:
+    seed: int
+    quick: bool
+    tmp_path: Path
+    stack: contextlib.ExitStack = field(default_factory=contextlib.ExitStack)
+
+    def rng(self) -> random.Random:
+        return random.Random(self.seed)
+
+
+@dataclass
+class BenchmarkSpec:
+    name: str
+    factory: Callable[[BenchContext], Case]
+    iterations: int
+    quick_iterations: int
+    threshold: float
+    description: str
+
+
+_REGISTRY: Dict[str, BenchmarkSpec] = {}
+
+
+def benchmark(
+    name: str,
+    *,
+    iterations: int = 50,
+    quick_iterations: int = 5,
+    threshold: float = 0.25,
+) -> Callable[[Callable[[BenchContext], Case]], Callable[[BenchContext], Case]]:
+    """Register a case factory. ``threshold`` is the allowed median slowdown (0.25 = +25%)."""
+
+    def decorator(factory: Callable[[BenchContext], Case]) -> Callable[[BenchContext], Case]:
+        _REGISTRY[name] = BenchmarkSpec(
+            name=name,
+            factory=factory,
+            iterations=int(iterations),
+            quick_iterations=int(quick_iterations),
+            threshold=float(threshold),
+            description=(inspect.getdoc(factory) or "").split("\n")[0],
+        )
+        return factory
+
+    return decorator
+
+
+def registered() -> Dict[str, BenchmarkSpec]:
+    return dict(_REGISTRY)
+
+
+# ----------------------------------------------------------------------
+# Offline inputs
+# ----------------------------------------------------------------------
+
+
+def load_fixture(name: str) -> Any:
+    return json.loads((FIXTURES_DIR / name).read_text())
+
+
+@contextlib.contextmanager
+def recorded_http(handler: Callable[[httpx.Request], httpx.Response]) -> Iterator[None]:
+    """Route every ``httpx.Client``/``httpx.AsyncClient`` built meanwhile through ``handler``."""
+    transport = httpx.MockTransport(handler)
+    real_client, real_async_client = httpx.Client, httpx.AsyncClient
+
+    class _Client(real_client):  # type: ignore[misc, valid-type]
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            kwargs["transport"] = transport
+            kwargs.pop("http2", None)
+            super().__init__(*args, **kwargs)
+
+    class _AsyncClient(real_async_client):  # type: ignore[misc, valid-type]
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            kwargs["transport"] = transport
+            # The transport replaces the connection pool, so HTTP/2 (and h2) is moot
+            kwargs.pop("http2", None)
+            super().__init__(*args, **kwargs)
+
+    httpx.Client, httpx.AsyncClient = _Client, _AsyncClient  # type: ignore[misc]
+    try:
+        yield
+    finally:
+        httpx.Client, httpx.AsyncClient = real_client, real_async_client  # type: ignore[misc]
+
+
+# ----------------------------------------------------------------------
+# Running
+# ----------------------------------------------------------------------
+
+
+def _git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            ).stdout.strip()
+        )
+        return {"commit": commit or None, "dirty": dirty}
+    except (OSError, subprocess.SubprocessError):
+        return {"commit": None, "dirty": None}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _time_case(case: Case, iterations: int) -> tuple[List[float], Any]:
+    is_async = inspect.iscoroutinefunction(case.run)
+    # Warm-up: imports, lazy connections, first-call caches
+    output = await case.run() if is_async else case.run()
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        output = await case.run() if is_async else case.run()
+        timings.append(time.perf_counter() - started)
+    return timings, output
+
+
+def run_benchmark(spec: BenchmarkSpec, *, seed: int, quick: bool) -> Dict[str, Any]:
+    iterations = spec.quick_iterations if quick else spec.iterations
+    random.seed(seed)
+    with tempfile.TemporaryDirectory(prefix=f"bench-{spec.name}-") as tmp:
+        ctx = BenchContext(seed=seed, quick=quick, tmp_path=Path(tmp))
+        with ctx.stack:
+            case = spec.factory(ctx)
+            timings, output = asyncio.run(_time_case(case, iterations))
+            summary = case.summary(output) if case.summary else {}
+    ms = [value * 1000 for value in timings]
+    return {
+        "description": spec.description,
+        "iterations": iterations,
+        "threshold": spec.threshold,
+        "median_ms": round(statistics.median(ms), 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "min_ms": round(min(ms), 4),
+        "p95_ms": round(_percentile(ms, 95), 4),
+        "summary": summary,
+    }
+
+
+def run_suite(
+    names: Optional[List[str]] = None,
+    *,
+    seed: int = 1234,
+    quick: bool = False,
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    specs = registered()
+    unknown = sorted(set(names or []) - set(specs))
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}. Available: {', '.join(sorted(specs))}")
+    results: Dict[str, Any] = {}
+    for name in sorted(names or specs):
+        results[name] = run_benchmark(specs[name], seed=seed, quick=quick)
+        if on_result:
+            on_result(name, results[name])
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "quick": quick,
+        "benchmarks": results,
+    }
+
+
+# ----------------------------------------------------------------------
+# Comparison
+# ----------------------------------------------------------------------
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    threshold: Optional[float] = None,
+    min_delta_ms: float = 0.05,
+) -> List[Dict[str, Any]]:
+    """Compare medians against ``baseline``.
+
+    A benchmark regresses when its median grows by more than its threshold
+    (``threshold`` overrides every per-benchmark value) and by more than
+    ``min_delta_ms``, so sub-millisecond jitter cannot fail a run. Summaries
+    that differ are reported as ``changed`` output.
+    """
+    rows: List[Dict[str, Any]] = []
+    base_items = baseline.get("benchmarks") or {}
+    current_items = current.get("benchmarks") or {}
+    for name in sorted(set(base_items) | set(current_items)):
+        now, before = current_items.get(name), base_items.get(name)
+        if now is None or before is None:
+            rows.append({"name": name, "status": "missing" if now is None else "new"})
+            continue
+        limit = float(threshold if threshold is not None else now.get("threshold", 0.25))
+        base_ms, current_ms = float(before["median_ms"]), float(now["median_ms"])
+        ratio = current_ms / base_ms if base_ms > 0 else 1.0
+        if ratio > 1 + limit and current_ms - base_ms > min_delta_ms:
+            status = "regression"
+        elif ratio < 1 / (1 + limit) and base_ms - current_ms > min_delta_ms:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "name": name,
+                "status": status,
+                "baseline_ms": base_ms,
+                "current_ms": current_ms,
+                "ratio": round(ratio, 3),
+                "threshold": limit,
+                "output_changed": before.get("summary") != now.get("summary"),
+            }
+        )
+    return rows
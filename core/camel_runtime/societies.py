@@ -861,7 +861,17 @@ class TradingWorkforceSociety:
                 logger.info("✅ Added NewsAPI toolkit to Fact agent")
         except Exception as e:
             logger.debug(f"NewsAPI toolkit not available for fact agent: {e}")
-        
+
+        # Local full-text search over already fetched transcripts, news and research
+        try:
+            from core.camel_tools.content_search_toolkit import ContentSearchToolkit
+            content_search_toolkit = ContentSearchToolkit()
+            await content_search_toolkit.initialize()
+            fact_tools.extend(content_search_toolkit.get_all_tools())
+            logger.info("✅ Added content search toolkit to Fact agent")
+        except Exception as e:
+            logger.debug(f"Content search toolkit not available for fact agent: {e}")
+
         # Native CAMEL toolkits: ThinkingToolkit and TaskPlanningToolkit (only for Fact agent)
         try:
             from camel.toolkits import ThinkingToolkit, TaskPlanningToolkit
@@ -9,6 +9,7 @@ from typing import Any
 from redis import Redis
 
 from core.camel_tools.async_wrapper import CAMEL_TOOLS_AVAILABLE, create_function_tool
+from core.clients.event_bus import EventBus
 from core.settings.config import settings
 from core.logging import log
 
@@ -40,7 +41,7 @@ class AutoEnhancementToolkit:
 
     def generate_feedback(self) -> dict[str, Any]:
         redis_client = self._require_redis()
-        trade_history = redis_client.lrange("dex:trade_history", 0, 300)
+        trade_history = EventBus(redis_client).latest("dex.trades", 301)
         positions = redis_client.hgetall("watchlist:positions")
 
         total_trades = len(trade_history)
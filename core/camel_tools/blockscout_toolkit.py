@@ -4,11 +4,13 @@ Blockscout MCP Toolkit for CAMEL Agents.
 Provides tools for querying on-chain data across 3,000+ EVM-compatible chains.
 Reference: https://www.blog.blockscout.com/how-to-set-up-mcp-ai-onchain-data-block-explorer/
 """
+import time
 from typing import Dict, Any, Annotated
 from pydantic import Field
 from core.logging import log
 from core.settings.config import settings
 from core.clients.blockscout_client import BlockscoutMCPClient, BlockscoutMCPError
+from core.clients.wallet_activity_index import RANKINGS, WalletActivityIndexer
 
 
 # Global toolkit instance
@@ -34,6 +36,7 @@ class BlockscoutMCPToolkit:
             "retry_attempts": 3
         }
         self.blockscout_client = BlockscoutMCPClient(config)
+        self.activity_indexer = WalletActivityIndexer(self.blockscout_client)
         self._initialized = False
     
     async def initialize(self):
@@ -479,3 +482,138 @@ class BlockscoutMCPToolkit:
         compare_wallets.__doc__ = "Compare multiple wallets across balances and activity"
         return compare_wallets
 
+    def get_track_wallets_tool(self):
+        """Get tool for adding wallets to the local activity index."""
+        toolkit_instance = self
+
+        async def track_wallets(
+            addresses: Annotated[str, Field(description="Comma-separated wallet addresses (0x...)")],
+            chain: Annotated[str, Field(description="Chain name (e.g., ethereum, polygon)", default="ethereum")] = "ethereum",
+            label: Annotated[str, Field(description="Optional label for the wallets (e.g., 'whale', 'fund')", default=None)] = None
+        ) -> Dict[str, Any]:
+            """
+            Add wallets to the whale/copy-trading watchlist and index their activity.
+
+            Each wallet keeps a block watermark, so the first call backfills recent
+            transactions and later scans only fetch what is new. Wallets are synced
+            concurrently; one failing wallet does not stop the others.
+
+            Args:
+                addresses: Comma-separated list of wallet addresses in 0x format
+                chain: Chain name (e.g., ethereum, polygon, arbitrum). Default: ethereum
+                label: Optional label stored with the wallets
+
+            Returns:
+                Dict containing:
+                    - success (bool): Whether the operation succeeded
+                    - chain (str): The chain name
+                    - synced (list): Per-wallet sync results (new transfers, last block)
+                    - errors (list): Wallets that failed to sync and why
+                    - error (str): Error message if success is False
+            """
+            try:
+                await toolkit_instance.initialize()
+                indexer = toolkit_instance.activity_indexer
+                wallets = [{"address": addr.strip(), "chain": chain} for addr in addresses.split(",") if addr.strip()]
+                for wallet in wallets:
+                    indexer.index.watch(wallet["address"], chain, label)
+                summary = await indexer.sync_wallets(wallets)
+                return {
+                    "success": not summary["errors"],
+                    "chain": chain,
+                    "synced": summary["synced"],
+                    "errors": summary["errors"]
+                }
+            except BlockscoutMCPError as e:
+                log.error(f"Blockscout MCP error: {e}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "addresses": addresses,
+                    "chain": chain
+                }
+            except Exception as e:
+                log.error(f"Error tracking wallets: {e}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "addresses": addresses,
+                    "chain": chain
+                }
+
+        track_wallets.__name__ = "track_wallets"
+        track_wallets.__doc__ = "Add wallets to the whale watchlist and index their on-chain activity"
+        return track_wallets
+
+    def get_whale_scan_tool(self):
+        """Get tool for ranking watched wallets by indexed flows."""
+        toolkit_instance = self
+
+        async def scan_whales(
+            chain: Annotated[str, Field(description="Chain name (e.g., ethereum, polygon)", default="ethereum")] = "ethereum",
+            token: Annotated[str, Field(description="Optional token symbol to rank on (e.g., PEPE)", default=None)] = None,
+            since_hours: Annotated[int, Field(description="Only count activity from the last N hours (0 = all time)", default=0)] = 0,
+            order_by: Annotated[str, Field(description="Ranking: net_usd, volume_usd, net, volume or transfers", default="net_usd")] = "net_usd",
+            sellers: Annotated[bool, Field(description="Rank biggest net sellers instead of accumulators", default=False)] = False,
+            refresh: Annotated[bool, Field(description="Fetch new transactions for watched wallets first", default=True)] = True,
+            limit: Annotated[int, Field(description="Number of wallets to return", default=10)] = 10
+        ) -> Dict[str, Any]:
+            """
+            Rank watched wallets by token flows from the local activity index.
+
+            With refresh enabled, only transactions newer than each wallet's last seen
+            block are fetched before ranking; the ranking itself is a local query.
+
+            Args:
+                chain: Chain name (e.g., ethereum, polygon, arbitrum). Default: ethereum
+                token: Optional token symbol; None ranks across all tokens
+                since_hours: Only count transfers from the last N hours; 0 uses all-time totals
+                order_by: One of net_usd, volume_usd, net, volume, transfers. Default: net_usd
+                sellers: If True, rank the biggest net sellers first. Default: False
+                refresh: If True, sync watched wallets before ranking. Default: True
+                limit: Maximum number of wallets to return. Default: 10
+
+            Returns:
+                Dict containing:
+                    - success (bool): Whether the operation succeeded
+                    - chain (str): The chain name
+                    - wallets (list): Ranked wallets with net/volume flows, transfer count and label
+                    - sync_errors (list): Wallets that could not be refreshed
+                    - error (str): Error message if success is False
+            """
+            try:
+                if order_by not in RANKINGS:
+                    raise ValueError(f"order_by must be one of {', '.join(RANKINGS)}")
+                indexer = toolkit_instance.activity_indexer
+                sync_errors = []
+                if refresh:
+                    await toolkit_instance.initialize()
+                    sync_errors = (await indexer.sync_watchlist(chain))["errors"]
+                since = time.time() - since_hours * 3600 if since_hours > 0 else None
+                wallets = indexer.index.top_wallets(
+                    chain=chain,
+                    token=token,
+                    since=since,
+                    order_by=order_by,
+                    ascending=sellers,
+                    limit=limit
+                )
+                return {
+                    "success": True,
+                    "chain": chain,
+                    "token": token,
+                    "wallets": wallets,
+                    "sync_errors": sync_errors
+                }
+            except Exception as e:
+                log.error(f"Error scanning whales: {e}")
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "chain": chain,
+                    "wallets": []
+                }
+
+        scan_whales.__name__ = "scan_whales"
+        scan_whales.__doc__ = "Rank watched wallets by indexed token flows"
+        return scan_whales
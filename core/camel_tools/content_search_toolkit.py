@@ -0,0 +1,169 @@
+"""
+Local content search toolkit for CAMEL agents.
+
+Queries the on-disk full-text index that YouTube transcripts, NewsAPI articles
+and research feed items are added to as they are fetched, so agents can search
+what has already been collected without another external call.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from core.clients.content_index import ContentIndex, content_index
+from core.logging import log
+
+try:  # pragma: no cover - optional dependency
+    from camel.toolkits import FunctionTool
+    CAMEL_TOOLS_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    FunctionTool = None  # type: ignore
+    CAMEL_TOOLS_AVAILABLE = False
+
+CONTENT_KINDS = ("news", "research", "transcript")
+
+
+def _split_csv(value: Optional[str]) -> Optional[List[str]]:
+    if not value:
+        return None
+    parts = [part.strip() for part in value.split(",") if part.strip()]
+    return parts or None
+
+
+class ContentSearchToolkit:
+    """Expose the local transcript/news/research index to CAMEL agents."""
+
+    def __init__(self, index: Optional[ContentIndex] = None) -> None:
+        self._index = index or content_index
+
+    async def initialize(self) -> None:
+        if not CAMEL_TOOLS_AVAILABLE:
+            raise ImportError("CAMEL function tools are required for content search toolkit.")
+
+    def search(
+        self,
+        query: str = "",
+        tickers: Optional[str] = None,
+        kinds: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: int = 10,
+    ) -> Dict[str, Any]:
+        kind_list = _split_csv(kinds)
+        if kind_list:
+            unknown = [kind for kind in kind_list if kind not in CONTENT_KINDS]
+            if unknown:
+                return {
+                    "success": False,
+                    "error": f"Unknown kinds {unknown}; expected any of {list(CONTENT_KINDS)}",
+                    "results": [],
+                }
+        ticker_list = _split_csv(tickers)
+        if not (query or "").strip() and not ticker_list:
+            return {"success": False, "error": "Provide a query, tickers, or both", "results": []}
+        try:
+            results = self._index.search(
+                query or "",
+                kinds=kind_list,
+                tickers=ticker_list,
+                since=since,
+                limit=max(1, min(limit, 50)),
+            )
+        except Exception as e:
+            log.error(f"Local content search failed: {e}")
+            return {"success": False, "error": str(e), "results": []}
+        return {
+            "success": True,
+            "query": query,
+            "tickers": ticker_list or [],
+            "count": len(results),
+            "results": results,
+        }
+
+    def get_search_tool(self):
+        """Get tool for searching locally indexed content."""
+        if not CAMEL_TOOLS_AVAILABLE or FunctionTool is None:
+            raise ImportError("CAMEL function tools are not installed.")
+
+        toolkit = self
+
+        async def search_local_content(
+            query: str = "",
+            tickers: Optional[str] = None,
+            kinds: Optional[str] = None,
+            since: Optional[str] = None,
+            limit: int = 10,
+        ) -> Dict[str, Any]:
+            """
+            Search previously fetched YouTube transcripts, news headlines and research papers.
+
+            Args:
+                query: Keywords; wrap exact phrases in double quotes (e.g., '"rate cut" bitcoin')
+                tickers: Comma-separated tickers to filter on (e.g., 'BTC,ETH')
+                kinds: Comma-separated kinds - 'news', 'research', 'transcript' (default: all)
+                since: ISO date lower bound on publication time (e.g., '2025-01-01')
+                limit: Number of results to return (default: 10, max: 50)
+            """
+            return toolkit.search(query=query, tickers=tickers, kinds=kinds, since=since, limit=limit)
+
+        search_local_content.__name__ = "search_local_content"
+        from core.camel_tools.async_wrapper import create_function_tool
+        tool = create_function_tool(search_local_content)
+
+        # OpenAI function schemas don't support 'default' or 'nullable' in properties.
+        schema = {
+            "type": "function",
+            "function": {
+                "name": "search_local_content",
+                "description": (
+                    "Search previously fetched YouTube transcripts, news headlines and research papers "
+                    "without calling external APIs. Results are ranked by relevance and include a snippet.\n\n"
+                    "Args:\n"
+                    "  query: Keywords; wrap exact phrases in double quotes (e.g., '\"rate cut\" bitcoin'). Default: ''\n"
+                    "  tickers: Optional comma-separated tickers to filter on (e.g., 'BTC,ETH'). Default: None\n"
+                    "  kinds: Optional comma-separated kinds - 'news', 'research', 'transcript'. Default: all\n"
+                    "  since: Optional ISO date lower bound on publication time (e.g., '2025-01-01'). Default: None\n"
+                    "  limit: Number of results to return (1-50). Default: 10"
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Keywords; wrap exact phrases in double quotes (e.g., '\"rate cut\" bitcoin'). Default: ''"
+                        },
+                        "tickers": {
+                            "type": "string",
+                            "description": "Optional comma-separated tickers to filter on (e.g., 'BTC,ETH'). Default: None"
+                        },
+                        "kinds": {
+                            "type": "string",
+                            "description": "Optional comma-separated kinds - 'news', 'research', 'transcript'. Default: all"
+                        },
+                        "since": {
+                            "type": "string",
+                            "description": "Optional ISO date lower bound on publication time (e.g., '2025-01-01'). Default: None"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Number of results to return (1-50). Default: 10",
+                        },
+                    },
+                    "required": [],
+                },
+            },
+        }
+
+        tool.openai_tool_schema = schema
+        if hasattr(tool, '_openai_tool_schema'):
+            tool._openai_tool_schema = schema
+        if hasattr(tool, '_schema'):
+            tool._schema = schema
+
+        return tool
+
+    def get_all_tools(self):
+        """Get all tools in this toolkit."""
+        return [self.get_search_tool()]
+
+
+__all__ = ["ContentSearchToolkit"]
@@ -11,6 +11,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
+from core.clients.content_index import content_index
 from core.logging import log
 from core.settings.config import settings
 
@@ -86,6 +87,14 @@ class NewsAPIToolkit:
             log.warning(f"Error caching business sources: {e}")
             self._business_sources = []
 
+    @staticmethod
+    def _index_articles(articles: List[Dict[str, Any]]) -> None:
+        """Keep fetched articles searchable in the local full-text index (best effort)."""
+        try:
+            content_index.add_items("news", articles)
+        except Exception as e:
+            log.debug(f"Content index ingest failed for NewsAPI articles: {e}")
+
     async def get_top_headlines(
         self,
         q: Optional[str] = None,
@@ -124,6 +133,7 @@ class NewsAPIToolkit:
             
             if response and response.get('status') == 'ok':
                 articles = response.get('articles', [])
+                self._index_articles(articles)
                 return {
                     "success": True,
                     "query": q or "top headlines",
@@ -198,6 +208,7 @@ class NewsAPIToolkit:
             
             if response and response.get('status') == 'ok':
                 articles = response.get('articles', [])
+                self._index_articles(articles)
                 return {
                     "success": True,
                     "query": q or "all articles",
@@ -31,6 +31,7 @@ else:
     FunctionToolType = Any
 
 from core.logging import log
+from core.clients.polymarket_catalog import market_catalog
 from core.clients.polymarket_client import PolymarketClient
 
 logger = get_logger(__name__) if CAMEL_TOOLS_AVAILABLE else None
@@ -139,10 +140,15 @@ class PolymarketDataToolkit(BaseToolkit):
         """Search for markets matching query with confidence scoring."""
         async def _search():
             try:
-                markets = await self.client.search_markets(
-                    query=query, 
-                    limit=limit * 2
-                )
+                markets = None
+                # Serve from the local catalog when possible; fall back to Gamma search
+                if isinstance(self.client, PolymarketClient) and await market_catalog.ensure_fresh(self.client):
+                    markets = market_catalog.search(query, limit=limit * 2) or None
+                if markets is None:
+                    markets = await self.client.search_markets(
+                        query=query, 
+                        limit=limit * 2
+                    )
                 
                 results = []
                 for m in markets:
@@ -28,6 +28,7 @@ else:
     FunctionToolType = Any
 
 from core.logging import log
+from core.clients.polymarket_catalog import market_catalog
 from core.clients.polymarket_client import PolymarketClient
 
 logger = get_logger(__name__)
@@ -131,10 +132,19 @@ class EnhancedPolymarketToolkit(BaseToolkit):
                 if not query or len(query) < 1:
                     return {"success": False, "error": "Query required (min 1 char)"}
                 
-                results = await self.client.search_markets(
-                    query=query,
-                    limit=max(1, min(limit, 100))
-                )
+                page_size = max(1, min(limit, 100))
+                results = None
+                if isinstance(self.client, PolymarketClient) and await market_catalog.ensure_fresh(self.client):
+                    hits = market_catalog.search(query, limit=page_size + max(0, offset))
+                    results = hits[max(0, offset):] or None
+                if results is None:
+                    # The remote search has no offset; fetch through the requested page and slice it
+                    start = max(0, offset)
+                    results = await self.client.search_markets(
+                        query=query,
+                        limit=start + page_size
+                    )
+                    results = results[start:start + page_size]
                 normalized = [_normalize_market(m) for m in results]
                 
                 return {
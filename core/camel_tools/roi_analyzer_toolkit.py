@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone, timedelta
 import json
 
+from core.clients.redis_client import queue_capped_push
 from core.logging import log
 
 try:
@@ -24,6 +25,67 @@ except ImportError:  # pragma: no cover - optional dependency
 
 logger = get_logger(__name__)
 
+ROI_RECORD_TTL_SECONDS = 86400 * 30
+ROI_SETTLEMENT_INDEX_KEY = "roi:settlement:due"
+ROI_SETTLEMENT_HORIZON_HOURS = 24
+
+
+def parse_roi_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+async def fetch_ticker_price(forecasting_client: Any, ticker: str) -> Optional[float]:
+    """Return the current price for a ticker (action recommendation, then forecast fallback)."""
+    action_data = await forecasting_client.get_action_recommendation(ticker, "days")
+    price = (action_data or {}).get("current_price")
+    if not price:
+        forecast_data = await forecasting_client.get_stock_forecast(ticker, "days")
+        if forecast_data and forecast_data.get("forecast_timeline"):
+            price = forecast_data["forecast_timeline"][0].get("forecast_price")
+    return float(price) if price else None
+
+
+def compute_strategy_roi(tickers: Dict[str, Dict[str, Any]]) -> Optional[float]:
+    """Allocation-weighted T+1 ROI across settled tickers."""
+    settled = [t for t in tickers.values() if t.get("t1_roi") is not None]
+    total_allocation = sum(t.get("allocation_pct", 0) for t in settled)
+    if total_allocation <= 0:
+        return None
+    return sum(
+        t["t1_roi"] * (t.get("allocation_pct", 0) / total_allocation)
+        for t in settled
+    )
+
+
+def roi_settlement_due_at(timestamp: Optional[str], horizon_hours: int = ROI_SETTLEMENT_HORIZON_HOURS) -> datetime:
+    """T+1 due time for an ROI record registered at ``timestamp``."""
+    registered_at = parse_roi_timestamp(timestamp) or datetime.now(timezone.utc)
+    return registered_at + timedelta(hours=horizon_hours)
+
+
+async def schedule_roi_settlement(
+    redis_client: Any,
+    roi_key: str,
+    timestamp: Optional[str],
+    horizon_hours: int = ROI_SETTLEMENT_HORIZON_HOURS,
+) -> None:
+    """Add an ROI record to the due-time ordered settlement index."""
+    due_at = roi_settlement_due_at(timestamp, horizon_hours)
+    try:
+        if redis_client.redis is None:
+            await redis_client.connect()
+        await redis_client.redis.zadd(ROI_SETTLEMENT_INDEX_KEY, {roi_key: due_at.timestamp()})
+    except Exception as e:
+        log.warning(f"Failed to schedule ROI settlement for {roi_key}: {e}")
+
 
 class ROIAnalyzerToolkit(BaseToolkit):
     r"""A toolkit for analyzing ROI from wallet distributions and updating agent weights.
@@ -68,7 +130,7 @@ class ROIAnalyzerToolkit(BaseToolkit):
         1. Getting wallet distribution from Redis
         2. Fetching current prices (T) for all tickers
         3. Storing ROI record with T prices
-        4. On next cycle or T+1, updates with T+1 prices and calculates ROI
+        4. Scheduling the record for T+1 settlement by ROISettlementWorker
         
         Args:
             strategy: Strategy name (e.g., 'wallet_balancing')
@@ -123,10 +185,8 @@ class ROIAnalyzerToolkit(BaseToolkit):
                                 match="agent_weight:*",
                                 count=200
                             )
-                            for key in batch:
-                                if isinstance(key, bytes):
-                                    key = key.decode()
-                                weight_data = await self.redis.get_json(key)
+                            keys = [key.decode() if isinstance(key, bytes) else key for key in batch]
+                            for key, weight_data in zip(keys, await self.redis.mget_json(keys)):
                                 if weight_data:
                                     agent_name = weight_data.get("agent_name", key.replace("agent_weight:", ""))
                                     agent_weights_dict[agent_name] = weight_data.get("weight", 1.0)
@@ -152,18 +212,9 @@ class ROIAnalyzerToolkit(BaseToolkit):
                         continue
                     
                     try:
-                        # Get current price using action recommendation
-                        action_data = await forecasting_client.get_action_recommendation(ticker, "days")
-                        buy_price = action_data.get("current_price")
-                        
-                        if not buy_price:
-                            # Fallback to forecast
-                            forecast_data = await forecasting_client.get_stock_forecast(ticker, "days")
-                            if forecast_data and forecast_data.get("forecast_timeline"):
-                                buy_price = forecast_data["forecast_timeline"][0].get("forecast_price")
+                        buy_price = await fetch_ticker_price(forecasting_client, ticker)
                         
                         if buy_price:
-                            buy_price = float(buy_price)
                             ticker_data[ticker] = {
                                 "allocation_pct": float(allocation_pct),
                                 "buy_price": buy_price,
@@ -179,76 +230,7 @@ class ROIAnalyzerToolkit(BaseToolkit):
                         log.warning(f"Error fetching price for {ticker}: {e}")
                         continue
                 
-                # Check for previous cycle to update T+1 prices
-                # Get all ROI records for this strategy
-                roi_history_key = f"roi:history:{strategy}:list"
-                existing_cycles = await self.redis.lrange(roi_history_key, 0, -1)
-                
-                # Update T+1 prices for previous cycles (if ~24h has passed)
-                now = datetime.now(timezone.utc)
-                for cycle_id_str in existing_cycles:
-                    if isinstance(cycle_id_str, bytes):
-                        cycle_id_str = cycle_id_str.decode()
-                    
-                    prev_roi_key = f"roi:history:{strategy}:{cycle_id_str}"
-                    prev_roi = await self.redis.get_json(prev_roi_key)
-                    
-                    if prev_roi:
-                        prev_timestamp_str = prev_roi.get("timestamp")
-                        if prev_timestamp_str:
-                            try:
-                                prev_timestamp = datetime.fromisoformat(prev_timestamp_str.replace("Z", "+00:00"))
-                                hours_elapsed = (now - prev_timestamp).total_seconds() / 3600.0
-                                
-                                # If ~24h has passed, update T+1 prices (check between 20-30 hours)
-                                if 20 <= hours_elapsed <= 30 and not prev_roi.get("t1_updated", False):
-                                    updated_tickers = {}
-                                    for ticker, ticker_info in prev_roi.get("tickers", {}).items():
-                                        try:
-                                            action_data = await forecasting_client.get_action_recommendation(ticker, "days")
-                                            t1_price = action_data.get("current_price")
-                                            
-                                            if not t1_price:
-                                                forecast_data = await forecasting_client.get_stock_forecast(ticker, "days")
-                                                if forecast_data and forecast_data.get("forecast_timeline"):
-                                                    t1_price = forecast_data["forecast_timeline"][0].get("forecast_price")
-                                            
-                                            if t1_price and ticker_info.get("buy_price"):
-                                                t1_price = float(t1_price)
-                                                buy_price = float(ticker_info["buy_price"])
-                                                t1_roi = ((t1_price - buy_price) / buy_price) * 100.0
-                                                
-                                                updated_tickers[ticker] = ticker_info.copy()
-                                                updated_tickers[ticker]["t1_price"] = t1_price
-                                                updated_tickers[ticker]["t1_roi"] = t1_roi
-                                                updated_tickers[ticker]["timedelta_hours"] = hours_elapsed
-                                                updated_tickers[ticker]["latest_price"] = t1_price
-                                                updated_tickers[ticker]["latest_roi"] = t1_roi
-                                        
-                                        except Exception as e:
-                                            log.debug(f"Error updating T+1 price for {ticker}: {e}")
-                                            continue
-                                    
-                                    if updated_tickers:
-                                        prev_roi["tickers"] = updated_tickers
-                                        prev_roi["t1_updated"] = True
-                                        
-                                        # Calculate aggregate strategy ROI
-                                        total_allocation = sum(t.get("allocation_pct", 0) for t in updated_tickers.values())
-                                        if total_allocation > 0:
-                                            weighted_roi = sum(
-                                                t.get("t1_roi", 0) * (t.get("allocation_pct", 0) / total_allocation)
-                                                for t in updated_tickers.values()
-                                            )
-                                            prev_roi["strategy_roi"] = weighted_roi
-                                        
-                                        await self.redis.set_json(prev_roi_key, prev_roi, expire=86400 * 30)
-                                        log.info(f"Updated T+1 ROI for cycle {cycle_id_str}")
-                            except (ValueError, AttributeError):
-                                pass
-                
-                # Calculate aggregate strategy ROI for current cycle (initial, will be 0)
-                total_allocation = sum(t.get("allocation_pct", 0) for t in ticker_data.values())
+                # Aggregate strategy ROI for the current cycle starts at 0
                 strategy_roi = 0.0  # No ROI yet, will be calculated at T+1
                 
                 # Get latest advice if available
@@ -267,16 +249,18 @@ class ROIAnalyzerToolkit(BaseToolkit):
                     "t1_updated": False
                 }
                 
-                # Store ROI record
+                # Store the record, append it to the capped history list (last 10
+                # cycles) and index it for T+1 settlement by ROISettlementWorker,
+                # all in one atomic round trip
                 roi_key = f"roi:history:{strategy}:{cycle_id_value}"
-                await self.redis.set_json(roi_key, roi_record, expire=86400 * 30)  # 30 days TTL
-                
-                # Add to history list (FIFO - keep only last 10 cycles)
-                await self.redis.lpush(roi_history_key, cycle_id_value)
-                await self.redis.expire(roi_history_key, 86400 * 30)
-                
-                # Trim to keep only last 10 cycles
-                await self.redis.ltrim(roi_history_key, 0, 9)
+                roi_history_key = f"roi:history:{strategy}:list"
+                async with self.redis.transaction() as pipe:
+                    pipe.set(roi_key, self.redis.encode_value(roi_record), ex=ROI_RECORD_TTL_SECONDS)
+                    queue_capped_push(pipe, roi_history_key, [cycle_id_value], 10, expire=ROI_RECORD_TTL_SECONDS)
+                    pipe.zadd(
+                        ROI_SETTLEMENT_INDEX_KEY,
+                        {roi_key: roi_settlement_due_at(timestamp_str).timestamp()},
+                    )
                 
                 log.info(f"Registered ROI for cycle {cycle_id_value} (strategy: {strategy}, {len(ticker_data)} tickers)")
                 
@@ -427,15 +411,11 @@ class ROIAnalyzerToolkit(BaseToolkit):
                     strategy_rois = []
                     ticker_rois = {}  # Aggregate per-ticker ROI across cycles
                     
-                    for cycle_id_bytes in cycle_ids:
-                        if isinstance(cycle_id_bytes, bytes):
-                            cycle_id_str = cycle_id_bytes.decode()
-                        else:
-                            cycle_id_str = str(cycle_id_bytes)
-                        
-                        roi_key = f"roi:history:{strat}:{cycle_id_str}"
-                        roi_record = await self.redis.get_json(roi_key)
-                        
+                    roi_keys = [
+                        f"roi:history:{strat}:{cid.decode() if isinstance(cid, bytes) else cid}"
+                        for cid in cycle_ids
+                    ]
+                    for roi_record in await self.redis.mget_json(roi_keys):
                         if not roi_record:
                             continue
                         
@@ -80,6 +80,27 @@ class UviSwapToolkit:
             "fee": int(fee),
         }
 
+    def find_best_route(
+        self,
+        token_in_symbol: str,
+        token_out_symbol: str,
+        amount_in: int,
+        token_in: str | None = None,
+        token_out: str | None = None,
+    ) -> dict[str, Any]:
+        try:
+            route = self.client.find_best_route(
+                token_in_symbol=token_in_symbol,
+                token_out_symbol=token_out_symbol,
+                amount_in=int(amount_in),
+                token_in=token_in,
+                token_out=token_out,
+            )
+        except Exception as exc:
+            log.warning(f"Route search failed for {token_in_symbol}/{token_out_symbol}: {exc}")
+            return {"success": False, "error": str(exc)}
+        return {"success": True, **route}
+
     def inspect_pool(self, pool_address: str) -> dict[str, Any]:
         data = self.client.inspect_pool(pool_address)
         return {"success": "error" not in data, "pool": data}
@@ -291,6 +312,24 @@ class UviSwapToolkit:
                 ),
             )
         )
+        tools.append(
+            create_function_tool(
+                self.find_best_route,
+                explicit_schema=self._schema(
+                    "find_best_route",
+                    "Find the best exact-input route across fee tiers (100/500/3000/10000) and one-hop "
+                    "paths via WETH/USDC, with expected output and gas estimate.",
+                    {
+                        "token_in_symbol": {"type": "string", "description": "Input token symbol, e.g. WETH."},
+                        "token_out_symbol": {"type": "string", "description": "Output token symbol, e.g. UNI."},
+                        "amount_in": {"type": "integer", "description": "Input amount in token smallest unit."},
+                        "token_in": {"type": "string", "description": "Optional input token address."},
+                        "token_out": {"type": "string", "description": "Optional output token address."},
+                    },
+                    ["token_in_symbol", "token_out_symbol", "amount_in"],
+                ),
+            )
+        )
         tools.append(
             create_function_tool(
                 self.inspect_pool,
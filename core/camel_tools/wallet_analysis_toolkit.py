@@ -9,6 +9,7 @@ from typing import Any
 from redis import Redis
 
 from core.camel_tools.async_wrapper import CAMEL_TOOLS_AVAILABLE, create_function_tool
+from core.clients.event_bus import EventBus
 from core.settings.config import settings
 from core.logging import log
 
@@ -41,7 +42,7 @@ class WalletAnalysisToolkit:
         redis_client = self._require_redis()
         positions_raw = redis_client.hgetall("watchlist:positions")
         prices = redis_client.hgetall("watchlist:prices")
-        trade_history = redis_client.lrange("dex:trade_history", 0, 199)
+        trade_history = EventBus(redis_client).latest("dex.trades", 200)
 
         open_positions = []
         unrealized_pnl = 0.0
@@ -10,6 +10,7 @@ from typing import Any
 from redis import Redis
 
 from core.camel_tools.async_wrapper import CAMEL_TOOLS_AVAILABLE, create_function_tool
+from core.clients.event_bus import EventBus
 from core.settings.config import settings
 from core.logging import log
 
@@ -21,7 +22,7 @@ class WatchlistToolkit:
         self.redis = redis_client or self._init_redis()
         self.positions_key = "watchlist:positions"
         self.prices_key = "watchlist:prices"
-        self.notifications_key = "watchlist:notifications"
+        self.notifications_topic = "watchlist.notifications"
         self.global_roi_key = "watchlist:global_roi:last"
 
     @staticmethod
@@ -182,12 +183,9 @@ class WatchlistToolkit:
                 "mode": position.get("mode", "fast_decision"),
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
-            redis_client.lpush(self.notifications_key, json.dumps(notification))
+            EventBus(redis_client).publish(self.notifications_topic, notification)
             notifications.append(notification)
 
-        if notifications:
-            redis_client.ltrim(self.notifications_key, 0, 500)
-
         return {"success": True, "count": len(notifications), "notifications": notifications}
 
     def evaluate_global_roi_trigger(
@@ -254,8 +252,7 @@ class WatchlistToolkit:
                 "mode": mode,
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
-            redis_client.lpush(self.notifications_key, json.dumps(notification))
-            redis_client.ltrim(self.notifications_key, 0, 500)
+            EventBus(redis_client).publish(self.notifications_topic, notification)
 
         return {
             "success": True,
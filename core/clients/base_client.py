@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, Callable
 from abc import ABC, abstractmethod
 import httpx
 from core.logging import log
+from core.telemetry.observability import normalize_operation, track_external_call
 
 
 class BaseHTTPClient(ABC):
@@ -21,7 +22,10 @@ class BaseHTTPClient(ABC):
     - Retry logic
     - Error handling
     - Request timeout management
+    - Latency/status metrics per request (`telemetry_service` label)
     """
+
+    telemetry_service = "http"
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -85,11 +89,14 @@ class BaseHTTPClient(ABC):
         """
         client = await self._ensure_client()
         last_error = None
+        operation = f"{method.upper()} {normalize_operation(httpx.URL(url).path)}"
         
         for attempt in range(1, self.retry_attempts + 1):
             try:
-                response = await client.request(method, url, **kwargs)
-                response.raise_for_status()
+                with track_external_call(self.telemetry_service, operation) as call:
+                    response = await client.request(method, url, **kwargs)
+                    call["status"] = str(response.status_code)
+                    response.raise_for_status()
                 return response
             except (httpx.TimeoutException, httpx.RemoteProtocolError, 
                     httpx.ConnectError, httpx.NetworkError) as e:
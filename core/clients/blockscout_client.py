@@ -5,13 +5,41 @@ Provides access to blockchain data across 3,000+ EVM-compatible chains via Block
 Reference: https://www.blog.blockscout.com/how-to-set-up-mcp-ai-onchain-data-block-explorer/
 """
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 import httpx
 from core.logging import log
 from core.settings.config import settings
 
 
+# Seconds a successful MCP tool response stays cached: chain/contract/token
+# metadata barely changes, balances and transaction lists move every block
+TOOL_CACHE_TTLS: Dict[str, float] = {
+    "list_chains": 24 * 3600,
+    "get_contract": 24 * 3600,
+    "get_token": 3600,
+    "get_transaction": 120,
+    "get_transactions": 30,
+    "get_balance": 15,
+}
+DEFAULT_CACHE_TTL = 300.0
+# JSON-RPC errors and isError tool results are only held long enough to absorb a burst
+ERROR_CACHE_TTL = 5.0
+
+
+def _is_error_response(data: Any) -> bool:
+    """True for a JSON-RPC ``error`` body or a ``tools/call`` result flagged ``isError``."""
+    if not isinstance(data, dict):
+        return False
+    if data.get("error") is not None:
+        return True
+    result = data.get("result")
+    return isinstance(result, dict) and bool(result.get("isError"))
+
+
 class BlockscoutMCPError(Exception):
     """Base exception for Blockscout MCP operations."""
     pass
@@ -38,6 +66,9 @@ class BlockscoutMCPClient:
                 - base_url: Blockscout MCP endpoint (default: http://blockscout-mcp:8080 or https://mcp.blockscout.com/mcp)
                 - timeout: Request timeout in seconds (default: 30)
                 - retry_attempts: Number of retry attempts (default: 3)
+                - cache_ttls: Per-tool TTL overrides in seconds (0 disables caching for a tool)
+                - max_cache_entries: Response cache bound (default: BLOCKSCOUT_CACHE_MAX_ENTRIES)
+                - error_cache_ttl: Seconds to cache error responses (default: 5, 0 disables)
         """
         config = config or {}
         # Use proxy if available, otherwise direct endpoint
@@ -52,10 +83,15 @@ class BlockscoutMCPClient:
         # HTTP client
         self.client: Optional[httpx.AsyncClient] = None
         
-        # Cache for frequently accessed data
-        self.cache: Dict[str, Any] = {}
-        self.cache_ttl: Dict[str, datetime] = {}
-        self.default_cache_ttl = timedelta(minutes=5)
+        # LRU response cache keyed by method, endpoint, params and JSON body
+        self.cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.cache_ttls: Dict[str, float] = {**TOOL_CACHE_TTLS, **config.get("cache_ttls", {})}
+        self.default_cache_ttl = float(config.get("default_cache_ttl", DEFAULT_CACHE_TTL))
+        self.error_cache_ttl = float(config.get("error_cache_ttl", ERROR_CACHE_TTL))
+        self.max_cache_entries = int(config.get("max_cache_entries", settings.blockscout_cache_max_entries))
+        # Identical requests already on the wire; later callers await the same task
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._cache_stats = {"hits": 0, "misses": 0, "coalesced": 0, "stores": 0, "evictions": 0}
     
     async def connect(self) -> None:
         """Initialize the HTTP client."""
@@ -85,6 +121,62 @@ class BlockscoutMCPClient:
             self.client = None
             log.info("Blockscout MCP client disconnected")
     
+    @staticmethod
+    def _cache_key(
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]]
+    ) -> str:
+        """Stable digest of everything that selects a response, including the JSON body."""
+        identity = json.dumps(
+            {"method": method.upper(), "endpoint": endpoint, "params": params, "body": json_data},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _cache_ttl_for(self, method: str, json_data: Optional[Dict[str, Any]]) -> float:
+        """TTL for a request; 0 means it is not cached (non-read POSTs, disabled tools)."""
+        if method.upper() == "GET":
+            return self.default_cache_ttl
+        if not json_data or json_data.get("method") != "tools/call":
+            return 0.0
+        tool = (json_data.get("params") or {}).get("name")
+        return float(self.cache_ttls.get(tool, self.default_cache_ttl))
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self.cache[key]
+            return None
+        self.cache.move_to_end(key)
+        return entry[1]
+
+    def _remember(self, key: str, data: Dict[str, Any], ttl: float) -> None:
+        self.cache[key] = (time.monotonic() + ttl, data)
+        self.cache.move_to_end(key)
+        self._cache_stats["stores"] += 1
+        while len(self.cache) > self.max_cache_entries:
+            self.cache.popitem(last=False)
+            self._cache_stats["evictions"] += 1
+
+    def clear_cache(self) -> None:
+        self.cache.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        lookups = self._cache_stats["hits"] + self._cache_stats["coalesced"] + self._cache_stats["misses"]
+        served = self._cache_stats["hits"] + self._cache_stats["coalesced"]
+        return {
+            "entries": len(self.cache),
+            "max_entries": self.max_cache_entries,
+            "inflight": len(self._inflight),
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            **self._cache_stats,
+        }
+
     async def _make_request(
         self,
         method: str,
@@ -95,6 +187,10 @@ class BlockscoutMCPClient:
         """
         Make an HTTP request to Blockscout MCP.
         
+        Read requests (GETs and MCP ``tools/call``) are cached per tool TTL and
+        coalesced: concurrent identical calls share one upstream request.
+        Error responses are kept for at most ``error_cache_ttl`` seconds.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
@@ -107,14 +203,48 @@ class BlockscoutMCPClient:
         if not self.client:
             await self.connect()
         
-        cache_key = f"{method}:{endpoint}:{str(params)}"
+        ttl = self._cache_ttl_for(method, json_data)
+        if ttl <= 0:
+            return await self._send(method, endpoint, params, json_data)
+        
+        cache_key = self._cache_key(method, endpoint, params, json_data)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            self._cache_stats["hits"] += 1
+            log.debug(f"Cache hit for {endpoint}")
+            return cached
         
-        # Check cache
-        if cache_key in self.cache:
-            if datetime.now() < self.cache_ttl.get(cache_key, datetime.min):
-                log.debug(f"Cache hit for {endpoint}")
-                return self.cache[cache_key]
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            self._cache_stats["coalesced"] += 1
+            log.debug(f"Joining in-flight request for {endpoint}")
+            return await asyncio.shield(task)
         
+        self._cache_stats["misses"] += 1
+        task = asyncio.ensure_future(self._send(method, endpoint, params, json_data))
+        self._inflight[cache_key] = task
+        
+        def _settle(done: "asyncio.Task[Dict[str, Any]]") -> None:
+            self._inflight.pop(cache_key, None)
+            if done.cancelled() or done.exception() is not None:
+                return
+            result = done.result()
+            result_ttl = min(ttl, self.error_cache_ttl) if _is_error_response(result) else ttl
+            if result_ttl > 0:
+                self._remember(cache_key, result, result_ttl)
+        
+        task.add_done_callback(_settle)
+        # Shielded so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        json_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Issue the request with retries on 5xx and transport errors."""
         for attempt in range(self.retry_attempts):
             try:
                 response = await self.client.request(
@@ -124,13 +254,7 @@ class BlockscoutMCPClient:
                     json=json_data
                 )
                 response.raise_for_status()
-                data = response.json()
-                
-                # Cache the response
-                self.cache[cache_key] = data
-                self.cache_ttl[cache_key] = datetime.now() + self.default_cache_ttl
-                
-                return data
+                return response.json()
                 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code >= 500 and attempt < self.retry_attempts - 1:
@@ -217,7 +341,9 @@ class BlockscoutMCPClient:
         address: str,
         chain: str = "ethereum",
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        start_block: Optional[int] = None,
+        end_block: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get transaction history for an address.
@@ -227,11 +353,23 @@ class BlockscoutMCPClient:
             chain: Chain name
             limit: Number of transactions to return
             offset: Pagination offset
+            start_block: Optional lowest block to return (used by incremental syncs)
+            end_block: Optional highest block to return (used to backfill skipped ranges)
             
         Returns:
             List of transaction dictionaries
         """
         try:
+            arguments = {
+                "address": address,
+                "chain": chain,
+                "limit": limit,
+                "offset": offset
+            }
+            if start_block is not None:
+                arguments["start_block"] = start_block
+            if end_block is not None:
+                arguments["end_block"] = end_block
             response = await self._make_request(
                 "POST",
                 "/mcp",
@@ -239,12 +377,7 @@ class BlockscoutMCPClient:
                     "method": "tools/call",
                     "params": {
                         "name": "get_transactions",
-                        "arguments": {
-                            "address": address,
-                            "chain": chain,
-                            "limit": limit,
-                            "offset": offset
-                        }
+                        "arguments": arguments
                     }
                 }
             )
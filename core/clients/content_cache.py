@@ -0,0 +1,284 @@
+"""Shared on-disk, content-addressed cache for fetched documents.
+
+Bodies (MCP transcripts, RSS/Atom feeds, proxy pages) are stored once per
+SHA-256 digest, zlib-compressed, in SQLite; ``(namespace, key)`` entries
+point at a digest and carry the HTTP validators (ETag / Last-Modified) and
+an optional expiry. WAL mode lets several worker processes share one file.
+Immutable content (transcripts) is stored without expiry; feeds expire
+after a TTL and are then revalidated with a conditional GET, so an
+unchanged feed costs a 304 instead of a full download. Total stored size
+is bounded by evicting the oldest entries.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from core.logging import log
+from core.settings.config import settings
+from core.telemetry.observability import content_cache_requests_total
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest);
+CREATE INDEX IF NOT EXISTS idx_entries_fetched ON entries(fetched_at);
+"""
+
+_EVICT_BATCH = 64
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    body: bytes
+    digest: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    expires_at: Optional[float]
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or time.time() < self.expires_at
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class ContentCache:
+    def __init__(self, db_path: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        self.db_path = db_path or settings.content_cache_db_path
+        self.max_bytes = int(max_bytes if max_bytes is not None else settings.content_cache_max_mb * 1024 * 1024)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._stats = {"hit": 0, "miss": 0, "stale": 0, "revalidated": 0, "stored": 0, "deduplicated": 0, "evicted": 0}
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning(f"Content cache {self.db_path} unavailable, caching in memory: {exc}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _record(self, namespace: str, result: str) -> None:
+        self._stats[result] += 1
+        content_cache_requests_total.labels(namespace=namespace, result=result).inc()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = int(conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0])
+        while total > self.max_bytes:
+            oldest = conn.execute(
+                "SELECT namespace, key FROM entries ORDER BY fetched_at LIMIT ?", (_EVICT_BATCH,)
+            ).fetchall()
+            if not oldest:
+                break
+            conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", oldest)
+            conn.execute("DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM entries)")
+            self._stats["evicted"] += len(oldest)
+            total = int(conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0])
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def lookup(self, namespace: str, key: str) -> Optional[CacheEntry]:
+        """Entry for ``(namespace, key)`` whether fresh or not; no hit/miss accounting."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT b.data, e.digest, e.etag, e.last_modified, e.fetched_at, e.expires_at "
+                "FROM entries e JOIN blobs b ON b.digest = e.digest WHERE e.namespace = ? AND e.key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        data, digest, etag, last_modified, fetched_at, expires_at = row
+        return CacheEntry(zlib.decompress(data), digest, etag, last_modified, fetched_at, expires_at)
+
+    def get(self, namespace: str, key: str) -> Optional[bytes]:
+        entry = self.lookup(namespace, key)
+        if entry is None:
+            self._record(namespace, "miss")
+            return None
+        if not entry.fresh:
+            self._record(namespace, "stale")
+            return None
+        self._record(namespace, "hit")
+        return entry.body
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        body: bytes,
+        ttl_seconds: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> str:
+        """Store ``body`` under its digest and point ``(namespace, key)`` at it. ``ttl_seconds=None`` never expires."""
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        expires_at = now + float(ttl_seconds) if ttl_seconds is not None else None
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                known = conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+                if known:
+                    self._stats["deduplicated"] += 1
+                else:
+                    data = zlib.compress(body, 6)
+                    conn.execute(
+                        "INSERT INTO blobs (digest, data, size, stored_size) VALUES (?, ?, ?, ?)",
+                        (digest, data, len(body), len(data)),
+                    )
+                previous = conn.execute(
+                    "SELECT digest FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(namespace, key, digest, etag, last_modified, fetched_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (namespace, key, digest, etag, last_modified, now, expires_at),
+                )
+                if previous and previous[0] != digest:
+                    conn.execute(
+                        "DELETE FROM blobs WHERE digest = ? AND NOT EXISTS (SELECT 1 FROM entries WHERE digest = ?)",
+                        (previous[0], previous[0]),
+                    )
+                if not known:
+                    self._evict(conn)
+        self._stats["stored"] += 1
+        return digest
+
+    def revalidate(self, namespace: str, key: str, ttl_seconds: Optional[float] = None) -> None:
+        """Mark an entry fresh again after the origin confirmed it unchanged (HTTP 304)."""
+        now = time.time()
+        expires_at = now + float(ttl_seconds) if ttl_seconds is not None else None
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE entries SET fetched_at = ?, expires_at = ? WHERE namespace = ? AND key = ?",
+                    (now, expires_at, namespace, key),
+                )
+        self._record(namespace, "revalidated")
+
+    def invalidate(self, namespace: str, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                conn.execute("DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM entries)")
+
+    def get_json(self, namespace: str, key: str) -> Optional[Any]:
+        body = self.get(namespace, key)
+        return json.loads(body) if body is not None else None
+
+    def put_json(self, namespace: str, key: str, value: Any, ttl_seconds: Optional[float] = None) -> str:
+        return self.put(namespace, key, json.dumps(value, sort_keys=True).encode(), ttl_seconds=ttl_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, blobs, size, stored = self._connect().execute(
+                "SELECT (SELECT COUNT(*) FROM entries), COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+        lookups = self._stats["hit"] + self._stats["miss"] + self._stats["stale"] + self._stats["revalidated"]
+        served = self._stats["hit"] + self._stats["revalidated"]
+        return {
+            "entries": int(entries),
+            "blobs": int(blobs),
+            "bytes": int(size),
+            "stored_bytes": int(stored),
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            **self._stats,
+        }
+
+
+async def cached_get(
+    client: httpx.AsyncClient,
+    url: str,
+    namespace: str,
+    ttl_seconds: Optional[float] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: float = 20.0,
+    cache: Optional[ContentCache] = None,
+) -> str:
+    """GET ``url`` through the content cache.
+
+    A fresh entry is returned without a request; an expired one is
+    revalidated with If-None-Match / If-Modified-Since. HTTP errors propagate
+    like ``client.get`` + ``raise_for_status``.
+    """
+    cache = cache or content_cache
+    ttl = ttl_seconds if ttl_seconds is not None else settings.research_feed_ttl_seconds
+    entry = cache.lookup(namespace, url)
+    if entry is not None and entry.fresh:
+        cache._record(namespace, "hit")
+        return entry.text
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        if entry.etag:
+            request_headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request_headers["If-Modified-Since"] = entry.last_modified
+    response = await client.get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and entry is not None:
+        cache.revalidate(namespace, url, ttl)
+        return entry.text
+    response.raise_for_status()
+    cache._record(namespace, "stale" if entry is not None else "miss")
+    cache.put(
+        namespace,
+        url,
+        response.content,
+        ttl_seconds=ttl,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return response.text
+
+
+content_cache = ContentCache()
@@ -0,0 +1,420 @@
+"""Local full-text index over fetched transcripts, news and research items.
+
+Documents are ingested as they are fetched (transcript chunks, NewsAPI
+articles, RSS/arXiv/Scholar entries) into SQLite with an FTS5 table over
+title and body, ranked by BM25. Each document is also tagged with the
+tickers it mentions (supported assets, ``$CASHTAGS`` and common coin
+names) in a side table, so "ETH news about ETF flows" is one FTS match
+joined with one index seek. Transcripts are split into ~``CHUNK_WORDS``
+word chunks that keep their start time, so transcript search returns the
+matching passages instead of scanning the whole text per query.
+Publication times (ISO-8601, RFC 822 ``pubDate`` or epoch seconds) are
+stored as UTC ISO-8601 so the ``since`` filter compares them as text.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from core.logging import log
+from core.settings.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    doc_id TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    parent TEXT,
+    source TEXT,
+    title TEXT,
+    url TEXT,
+    published_at TEXT,
+    start REAL,
+    indexed_at REAL NOT NULL,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_documents_kind ON documents(kind, seq);
+CREATE INDEX IF NOT EXISTS idx_documents_parent ON documents(parent);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title, body, tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS document_tickers (
+    ticker TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (ticker, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_document_tickers_seq ON document_tickers(seq);
+"""
+
+CHUNK_WORDS = 80
+# Common names that stand for a ticker in headlines and transcripts
+TICKER_ALIASES = {
+    "BITCOIN": "BTC",
+    "ETHEREUM": "ETH",
+    "ETHER": "ETH",
+    "SOLANA": "SOL",
+    "CARDANO": "ADA",
+    "DOGECOIN": "DOGE",
+}
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_CASHTAG_RE = re.compile(r"\$([A-Za-z]{2,10})\b")
+_QUERY_TERM_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def extract_tickers(text: str, known: Optional[Iterable[str]] = None) -> List[str]:
+    """Tickers mentioned in ``text``: known symbols, ``$CASHTAGS`` and coin names."""
+    known_set = {symbol.upper() for symbol in (known if known is not None else settings.supported_assets)}
+    found = {tag.upper() for tag in _CASHTAG_RE.findall(text or "")}
+    for word in _WORD_RE.findall(text or ""):
+        upper = word.upper()
+        # Bare symbols must be written in capitals ("SOL", not "sol") to avoid matching plain words
+        if word.isupper() and upper in known_set:
+            found.add(upper)
+        elif upper in TICKER_ALIASES:
+            found.add(TICKER_ALIASES[upper])
+    return sorted(found)
+
+
+def normalize_timestamp(value: Any) -> Optional[str]:
+    """UTC ISO-8601 for an ISO, RFC 822 or epoch timestamp (naive means UTC); None if unparseable."""
+    if value is None or value == "":
+        return None
+    try:
+        if isinstance(value, datetime):
+            parsed = value
+        elif isinstance(value, (int, float)):
+            parsed = datetime.fromtimestamp(float(value), tz=timezone.utc)
+        else:
+            text = str(value).strip()
+            try:
+                parsed = datetime.fromisoformat(text[:-1] + "+00:00" if text[-1:] in ("Z", "z") else text)
+            except ValueError:
+                parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+def match_expression(query: str) -> str:
+    """FTS5 MATCH expression for free text: ``"quoted phrases"`` stay phrases, words are ANDed, ``word*`` is a prefix."""
+    terms: List[str] = []
+    for phrase, word in _QUERY_TERM_RE.findall(query or ""):
+        tokens = _WORD_RE.findall(phrase or word)
+        if not tokens:
+            continue
+        term = '"' + " ".join(tokens) + '"'
+        if not phrase and word.endswith("*"):
+            term += "*"
+        terms.append(term)
+    return " ".join(terms)
+
+
+def chunk_transcript(text: str, segments: Sequence[Dict[str, Any]] = (), words: int = CHUNK_WORDS) -> List[Dict[str, Any]]:
+    """Group transcript segments (or plain text) into ~``words``-word chunks that keep their start time."""
+    pieces = [
+        (float(segment.get("start", segment.get("timestamp", 0)) or 0), str(segment.get("text") or ""))
+        for segment in segments
+    ] or [(0.0, text or "")]
+    chunks: List[Dict[str, Any]] = []
+    buffer: List[str] = []
+    start = 0.0
+    for piece_start, piece_text in pieces:
+        for word in piece_text.split():
+            if not buffer:
+                start = piece_start
+            buffer.append(word)
+            if len(buffer) >= words:
+                chunks.append({"start": start, "text": " ".join(buffer)})
+                buffer = []
+    if buffer:
+        chunks.append({"start": start, "text": " ".join(buffer)})
+    return chunks
+
+
+class ContentIndex:
+    def __init__(self, db_path: Optional[str] = None, max_documents: Optional[int] = None) -> None:
+        self.db_path = db_path or settings.content_index_db_path
+        self.max_documents = int(max_documents or settings.content_index_max_documents)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning(f"Content index {self.db_path} unavailable, indexing in memory: {exc}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _delete(self, conn: sqlite3.Connection, seqs: List[int]) -> None:
+        if not seqs:
+            return
+        rows = [(seq,) for seq in seqs]
+        conn.executemany("DELETE FROM documents_fts WHERE rowid = ?", rows)
+        conn.executemany("DELETE FROM document_tickers WHERE seq = ?", rows)
+        conn.executemany("DELETE FROM documents WHERE seq = ?", rows)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Upserts and transcript re-chunks leave gaps in seq, so bound the real row count
+        excess = int(conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]) - self.max_documents
+        if excess <= 0:
+            return
+        stale = [row[0] for row in conn.execute("SELECT seq FROM documents ORDER BY seq LIMIT ?", (excess,))]
+        self._delete(conn, stale)
+
+    @staticmethod
+    def _unchanged(conn: sqlite3.Connection, seq: int, row: tuple, body: str, tickers: set) -> bool:
+        stored = conn.execute(
+            "SELECT d.kind, d.parent, d.source, d.title, d.url, d.published_at, d.start, d.payload, f.body "
+            "FROM documents d JOIN documents_fts f ON f.rowid = d.seq WHERE d.seq = ?",
+            (seq,),
+        ).fetchone()
+        if stored is None or tuple(stored) != (*row, body):
+            return False
+        stored_tickers = {ticker for (ticker,) in conn.execute("SELECT ticker FROM document_tickers WHERE seq = ?", (seq,))}
+        return stored_tickers == tickers
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def add_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """Upsert documents by ``doc_id``; each needs ``doc_id``, ``kind`` and ``title``/``body``.
+
+        Returns how many documents are now indexed from the input; a document
+        whose content is unchanged keeps its row (and its place in eviction order).
+        """
+        count = 0
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                inserted = False
+                for doc in documents:
+                    title = str(doc.get("title") or "")
+                    body = str(doc.get("body") or "")
+                    if not (title or body):
+                        continue
+                    row = (
+                        doc["kind"],
+                        doc.get("parent"),
+                        doc.get("source"),
+                        title,
+                        doc.get("url"),
+                        normalize_timestamp(doc.get("published_at")),
+                        doc.get("start"),
+                        json.dumps(doc["payload"], default=str) if doc.get("payload") is not None else None,
+                    )
+                    tickers = {
+                        ticker.upper() for ticker in set(doc.get("tickers") or ()) | set(extract_tickers(f"{title}\n{body}"))
+                    }
+                    existing = conn.execute("SELECT seq FROM documents WHERE doc_id = ?", (doc["doc_id"],)).fetchone()
+                    if existing:
+                        if self._unchanged(conn, existing[0], row, body, tickers):
+                            count += 1
+                            continue
+                        self._delete(conn, [existing[0]])
+                    cursor = conn.execute(
+                        "INSERT INTO documents (doc_id, kind, parent, source, title, url, published_at, start, payload, indexed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (doc["doc_id"], *row, now),
+                    )
+                    seq = int(cursor.lastrowid)
+                    conn.execute("INSERT INTO documents_fts (rowid, title, body) VALUES (?, ?, ?)", (seq, title, body))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO document_tickers (ticker, seq) VALUES (?, ?)",
+                        [(ticker, seq) for ticker in tickers],
+                    )
+                    inserted = True
+                    count += 1
+                if inserted:
+                    self._evict(conn)
+        return count
+
+    def add_items(self, kind: str, items: Iterable[Dict[str, Any]]) -> int:
+        """Index headline/research items (``title``, ``url``, ``summary``/``description``, ``source``...)."""
+        documents = []
+        for item in items:
+            source = item.get("source")
+            if isinstance(source, dict):  # NewsAPI articles carry {"id", "name"}
+                source = source.get("name") or source.get("id")
+            url = item.get("url") or ""
+            title = item.get("title") or ""
+            doc_key = url or f"{source}:{title}"
+            documents.append(
+                {
+                    "doc_id": f"{kind}:{hashlib.sha1(doc_key.encode()).hexdigest()}",
+                    "kind": kind,
+                    "source": source,
+                    "title": title,
+                    "body": " ".join(
+                        str(item.get(field) or "") for field in ("summary", "description", "content")
+                    ).strip(),
+                    "url": url,
+                    "published_at": next(
+                        (item[key] for key in ("published_at", "publishedAt", "published", "pubDate") if item.get(key)),
+                        None,
+                    ),
+                    "tickers": item.get("tickers"),
+                    "payload": item,
+                }
+            )
+        return self.add_documents(documents)
+
+    def add_transcript(
+        self,
+        video_id: str,
+        title: str,
+        text: str,
+        segments: Sequence[Dict[str, Any]] = (),
+        language: Optional[str] = None,
+    ) -> int:
+        chunks = chunk_transcript(text, segments)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                stale = [row[0] for row in conn.execute("SELECT seq FROM documents WHERE parent = ?", (video_id,))]
+                self._delete(conn, stale)
+        return self.add_documents(
+            {
+                "doc_id": f"transcript:{video_id}:{index}",
+                "kind": "transcript",
+                "parent": video_id,
+                "source": "YouTube",
+                "title": title,
+                "body": chunk["text"],
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+                "start": chunk["start"],
+                "payload": {"video_id": video_id, "chunk": index, "language": language},
+            }
+            for index, chunk in enumerate(chunks)
+        )
+
+    def has_parent(self, parent: str) -> bool:
+        with self._lock:
+            return self._connect().execute("SELECT 1 FROM documents WHERE parent = ? LIMIT 1", (parent,)).fetchone() is not None
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Sequence[str]] = None,
+        tickers: Optional[Sequence[str]] = None,
+        parent: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """BM25-ranked matches (title weighted over body) with a highlighted snippet.
+
+        An empty ``query`` with ``tickers`` returns the newest documents for those tickers.
+        ``since`` is an ISO (or RFC 822) lower bound on ``published_at``; raises
+        ``ValueError`` if it cannot be parsed.
+        """
+        expression = match_expression(query)
+        if not expression and not tickers:
+            return []
+        clauses: List[str] = []
+        params: List[Any] = []
+        if expression:
+            clauses.append("documents_fts MATCH ?")
+            params.append(expression)
+        if kinds:
+            clauses.append(f"d.kind IN ({','.join('?' * len(kinds))})")
+            params.extend(kinds)
+        if parent:
+            clauses.append("d.parent = ?")
+            params.append(parent)
+        if since:
+            since_utc = normalize_timestamp(since)
+            if since_utc is None:
+                raise ValueError(f"Invalid since timestamp: {since!r}")
+            clauses.append("d.published_at >= ?")
+            params.append(since_utc)
+        if tickers:
+            symbols = sorted({ticker.strip().upper() for ticker in tickers if ticker.strip()})
+            clauses.append(
+                f"d.seq IN (SELECT seq FROM document_tickers WHERE ticker IN ({','.join('?' * len(symbols))}))"
+            )
+            params.extend(symbols)
+
+        if expression:
+            source = "documents_fts JOIN documents d ON d.seq = documents_fts.rowid"
+            select = "bm25(documents_fts, 4.0, 1.0), snippet(documents_fts, 1, '[', ']', '...', 16)"
+            order = "1"
+        else:
+            source = "documents d JOIN documents_fts ON documents_fts.rowid = d.seq"
+            select = "0.0, substr(documents_fts.body, 1, 200)"
+            order = "d.seq DESC"
+        sql = (
+            f"SELECT {select}, d.doc_id, d.kind, d.parent, d.source, d.title, d.url, d.published_at, d.start, d.seq "
+            f"FROM {source} WHERE {' AND '.join(clauses)} ORDER BY {order} LIMIT ?"
+        )
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(sql, (*params, max(1, int(limit)))).fetchall()
+            except sqlite3.OperationalError as exc:
+                log.debug(f"Content index query rejected query={query!r}: {exc}")
+                return []
+            ticker_rows = conn.execute(
+                f"SELECT seq, ticker FROM document_tickers WHERE seq IN ({','.join('?' * len(rows))})",
+                [row[-1] for row in rows],
+            ).fetchall() if rows else []
+        tickers_by_seq: Dict[int, List[str]] = {}
+        for seq, ticker in ticker_rows:
+            tickers_by_seq.setdefault(seq, []).append(ticker)
+        return [
+            {
+                "score": round(-float(rank), 4),
+                "snippet": snippet,
+                "doc_id": doc_id,
+                "kind": kind,
+                "parent": parent_id,
+                "source": source_name,
+                "title": title,
+                "url": url,
+                "published_at": published_at,
+                "start": start,
+                "tickers": sorted(tickers_by_seq.get(seq, [])),
+            }
+            for rank, snippet, doc_id, kind, parent_id, source_name, title, url, published_at, start, seq in rows
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._connect().execute("SELECT kind, COUNT(*) FROM documents GROUP BY kind").fetchall()
+        return {"documents": sum(count for _, count in rows), "by_kind": dict(rows)}
+
+
+content_index = ContentIndex()
@@ -0,0 +1,251 @@
+"""
+Redis Streams event bus for history and notification feeds.
+
+Each topic is one capped stream (``XADD ... MAXLEN ~ n``), so producers append
+in O(1) and Redis trims whole macro nodes lazily instead of an LTRIM after
+every push. Routers page through history by stream id with XREVRANGE, and
+workers can consume a topic through a consumer group with at-least-once
+delivery (XREADGROUP + XACK, XAUTOCLAIM for entries left pending by a dead
+consumer).
+
+Topics that used to be LPUSH/LTRIM lists keep their legacy key: reads fall
+back to the old list until the stream has data, so history survives the
+rollout.
+
+Producers without a Redis client of their own publish through
+``get_event_bus()``, a process-wide bus on a lazily connected client.
+"""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.clients.redis_codec import DateTimeEncoder
+from core.logging import log
+from core.settings.config import settings
+
+
+@dataclass(frozen=True)
+class StreamTopic:
+    name: str
+    maxlen: int
+    legacy_key: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"events:{self.name}"
+
+
+TOPICS: Dict[str, StreamTopic] = {
+    topic.name: topic
+    for topic in (
+        StreamTopic("dex.trades", 1000, legacy_key="dex:trade_history"),
+        StreamTopic("dex.tasks", 1000, legacy_key="dex:task_history"),
+        StreamTopic("dex.cycles", 500, legacy_key="dex:cycle_history"),
+        StreamTopic("dex.logs", 1000, legacy_key="dex:logs"),
+        StreamTopic("dex.executions", 500),
+        StreamTopic("watchlist.notifications", 500, legacy_key="watchlist:notifications"),
+        StreamTopic("polymarket.logs", 1000),
+        StreamTopic("polymarket.feed_cache", 500),
+    )
+}
+
+
+def get_topic(name: str) -> StreamTopic:
+    try:
+        return TOPICS[name]
+    except KeyError:
+        raise ValueError(f"Unknown event topic {name!r}; expected one of {sorted(TOPICS)}") from None
+
+
+def encode_event(payload: Dict[str, Any]) -> Dict[str, str]:
+    return {"data": json.dumps(payload, cls=DateTimeEncoder)}
+
+
+def decode_entry(entry_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Turn a stream entry into its payload with ``stream_id`` attached."""
+    raw = fields.get("data") if isinstance(fields, dict) else None
+    try:
+        payload = json.loads(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return {**payload, "stream_id": entry_id}
+
+
+class EventBus:
+    """Publish/read/consume topics on a synchronous ``redis.Redis`` client.
+
+    Publishing is best-effort like the list writes it replaces: failures are
+    logged and swallowed so an event never breaks the caller.
+    """
+
+    def __init__(self, redis_client: Any) -> None:
+        self.redis = redis_client
+
+    def publish(self, topic: str, payload: Dict[str, Any], pipe: Any = None) -> Optional[str]:
+        """Append ``payload`` to ``topic``; queue it on ``pipe`` when given."""
+        spec = get_topic(topic)
+        target = pipe if pipe is not None else self.redis
+        if target is None:
+            return None
+        try:
+            entry_id = target.xadd(spec.key, encode_event(payload), maxlen=spec.maxlen, approximate=True)
+        except Exception as exc:
+            log.debug(f"[event_bus] publish to {topic} failed: {exc}")
+            return None
+        return None if pipe is not None else entry_id
+
+    def page(
+        self,
+        topic: str,
+        *,
+        limit: int = 100,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Newest-first page of events and the cursor for the next (older) page.
+
+        ``before``/``after`` are exclusive stream ids. Without a cursor and with
+        an empty stream, the legacy list is served instead.
+        """
+        spec = get_topic(topic)
+        if self.redis is None or limit <= 0:
+            return [], None
+        try:
+            entries = self.redis.xrevrange(
+                spec.key,
+                max=f"({before}" if before else "+",
+                min=f"({after}" if after else "-",
+                count=limit,
+            )
+        except Exception as exc:
+            log.debug(f"[event_bus] read of {topic} failed: {exc}")
+            entries = []
+        if not entries and not before and not after and spec.legacy_key:
+            return self._legacy(spec, limit), None
+        items = [item for item in (decode_entry(entry_id, fields) for entry_id, fields in entries) if item]
+        next_cursor = entries[-1][0] if len(entries) == limit else None
+        return items, next_cursor
+
+    def latest(self, topic: str, limit: int = 100) -> List[Dict[str, Any]]:
+        items, _ = self.page(topic, limit=limit)
+        return items
+
+    def _legacy(self, spec: StreamTopic, limit: int) -> List[Dict[str, Any]]:
+        try:
+            rows = self.redis.lrange(spec.legacy_key, 0, max(0, limit - 1))
+        except Exception:
+            return []
+        items: List[Dict[str, Any]] = []
+        for row in rows:
+            try:
+                item = json.loads(row)
+            except Exception:
+                continue
+            if isinstance(item, dict):
+                items.append(item)
+        return items
+
+    def clear(self, topic: str) -> None:
+        spec = get_topic(topic)
+        keys = [spec.key] + ([spec.legacy_key] if spec.legacy_key else [])
+        self.redis.delete(*keys)
+
+    # ------------------------------------------------------------------
+    # Consumer groups
+    # ------------------------------------------------------------------
+
+    def ensure_group(self, topic: str, group: str, start_id: str = "$") -> None:
+        """Create ``group`` on ``topic`` (and the stream) if it does not exist."""
+        try:
+            self.redis.xgroup_create(get_topic(topic).key, group, id=start_id, mkstream=True)
+        except Exception as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    def consume(
+        self,
+        topic: str,
+        group: str,
+        consumer: str,
+        *,
+        count: int = 100,
+        block_ms: Optional[int] = None,
+        claim_idle_ms: int = 60000,
+    ) -> List[Dict[str, Any]]:
+        """Read undelivered events, first reclaiming ones stuck with dead consumers.
+
+        Entries stay pending until ``ack`` is called, so a crash before the ack
+        redelivers them.
+        """
+        key = get_topic(topic).key
+        items: List[Dict[str, Any]] = []
+        if claim_idle_ms > 0:
+            claimed = self.redis.xautoclaim(key, group, consumer, min_idle_time=claim_idle_ms, start_id="0-0", count=count)
+            for entry_id, fields in claimed[1] if len(claimed) > 1 else []:
+                item = decode_entry(entry_id, fields)
+                if item:
+                    items.append(item)
+        remaining = count - len(items)
+        if remaining > 0:
+            response = self.redis.xreadgroup(group, consumer, {key: ">"}, count=remaining, block=block_ms)
+            for _, entries in response or []:
+                for entry_id, fields in entries:
+                    item = decode_entry(entry_id, fields)
+                    if item:
+                        items.append(item)
+                    else:
+                        # Undecodable entries would be redelivered forever
+                        self.redis.xack(key, group, entry_id)
+        return items
+
+    def ack(self, topic: str, group: str, *stream_ids: str) -> int:
+        if not stream_ids:
+            return 0
+        return int(self.redis.xack(get_topic(topic).key, group, *stream_ids))
+
+
+_default_bus: Optional[EventBus] = None
+_default_bus_retry_at = 0.0
+_default_bus_backoff = 0.0
+_DEFAULT_BUS_MIN_BACKOFF = 5.0
+_DEFAULT_BUS_MAX_BACKOFF = 300.0
+
+
+def get_event_bus() -> Optional[EventBus]:
+    """Process-wide bus on the configured Redis, or None when it is unreachable.
+
+    A failed connection is retried on a later call after an exponential
+    backoff (5s doubling up to 5 minutes), so a Redis that comes up after
+    the process does is picked up without a restart.
+    """
+    global _default_bus, _default_bus_retry_at, _default_bus_backoff
+    if _default_bus is not None or time.monotonic() < _default_bus_retry_at:
+        return _default_bus
+    try:
+        from redis import Redis
+
+        client = Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            decode_responses=True,
+            socket_connect_timeout=2,
+        )
+        client.ping()
+        _default_bus = EventBus(client)
+        _default_bus_backoff = 0.0
+    except Exception as exc:
+        _default_bus_backoff = min(
+            _DEFAULT_BUS_MAX_BACKOFF, max(_DEFAULT_BUS_MIN_BACKOFF, _default_bus_backoff * 2)
+        )
+        _default_bus_retry_at = time.monotonic() + _default_bus_backoff
+        log.warning(
+            f"[event_bus] Redis unavailable, events will not be published "
+            f"(retrying in {_default_bus_backoff:.0f}s): {exc}"
+        )
+    return _default_bus
@@ -0,0 +1,223 @@
+"""
+In-process fan-out of event bus topics to live subscribers (SSE clients).
+
+One reader task per process tails every topic stream with a blocking XREAD
+and hands entries to the subscriptions that asked for the topic, so Redis
+load is independent of the number of connected dashboards. Each
+subscription buffers at most ``max_pending`` events and coalesces while its
+client is slow:
+
+- ``dex.executions`` state deltas are merged per ``execution_id``;
+- ``polymarket.feed_cache`` deltas are merged into one pending delta;
+- other topics are append-only; when the buffer is full the oldest event is
+  dropped and the client gets a ``resync`` event telling it to refetch.
+
+The reader starts with the first subscriber and stops with the last one.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.clients.event_bus import TOPICS, decode_entry, get_topic
+from core.logging import log
+from core.settings.config import settings
+
+RESYNC_EVENT = "resync"
+
+# Events sharing a value of this field are merged (newer fields win) while pending
+COALESCE_FIELDS: Dict[str, str] = {"dex.executions": "execution_id"}
+# Topics whose pending events are merged into a single delta
+MERGED_TOPICS = frozenset({"polymarket.feed_cache"})
+
+
+def merge_feed_delta(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold two feed cache deltas into one equivalent delta."""
+    newer_removed = set(newer.get("removed") or [])
+    markets = {k: v for k, v in (older.get("markets") or {}).items() if k not in newer_removed}
+    markets.update(newer.get("markets") or {})
+    removed = [k for k in older.get("removed") or [] if k not in markets and k not in newer_removed]
+    removed.extend(newer_removed)
+    return {
+        **newer,
+        "markets": markets,
+        "removed": sorted(set(removed)),
+        "truncated": bool(older.get("truncated") or newer.get("truncated")),
+    }
+
+
+class Subscription:
+    """Bounded, coalescing buffer between the hub and one client."""
+
+    def __init__(self, topics: Iterable[str], max_pending: int) -> None:
+        self.topics = frozenset(topics)
+        self.max_pending = max(1, int(max_pending))
+        self._pending: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._wake = asyncio.Event()
+        self._dropped_since_flush = 0
+        self.stats = {"offered": 0, "delivered": 0, "coalesced": 0, "dropped": 0}
+
+    @staticmethod
+    def _coalesce_key(topic: str, event: Dict[str, Any]) -> str:
+        if topic in MERGED_TOPICS:
+            return ""
+        field = COALESCE_FIELDS.get(topic)
+        if field and event.get(field):
+            return str(event[field])
+        return str(event.get("stream_id", id(event)))
+
+    def offer(self, topic: str, event: Dict[str, Any]) -> None:
+        self.stats["offered"] += 1
+        key = (topic, self._coalesce_key(topic, event))
+        previous = self._pending.get(key)
+        if previous is not None:
+            self._pending[key] = merge_feed_delta(previous, event) if topic in MERGED_TOPICS else {**previous, **event}
+            self.stats["coalesced"] += 1
+        else:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self.stats["dropped"] += 1
+                self._dropped_since_flush += 1
+            self._pending[key] = event
+        self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Everything pending, oldest first; waits up to ``timeout`` for the first event.
+
+        Returns an empty list on timeout so the caller can send a heartbeat.
+        """
+        if not self._pending:
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        batch: List[Tuple[str, Dict[str, Any]]] = [(topic, event) for (topic, _), event in self._pending.items()]
+        self._pending.clear()
+        self.stats["delivered"] += len(batch)
+        if self._dropped_since_flush:
+            batch.insert(0, (RESYNC_EVENT, {"dropped": self._dropped_since_flush}))
+            self._dropped_since_flush = 0
+        return batch
+
+
+class LiveEventHub:
+    """Share one stream reader between all live subscribers."""
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        *,
+        max_pending: Optional[int] = None,
+        block_ms: Optional[int] = None,
+        batch_size: int = 200,
+    ) -> None:
+        self._redis = redis_client
+        self.max_pending = int(max_pending or settings.live_events_max_pending)
+        self.block_ms = int(block_ms if block_ms is not None else settings.live_events_block_ms)
+        self.batch_size = int(batch_size)
+        self._subscriptions: set[Subscription] = set()
+        self._reader: Optional[asyncio.Task] = None
+        self._stats = {"events_read": 0, "reads": 0, "read_errors": 0}
+
+    def _client(self) -> Any:
+        if self._redis is None:
+            from redis.asyncio import Redis
+
+            self._redis = Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                decode_responses=True,
+            )
+        return self._redis
+
+    async def subscribe(self, topics: Optional[Iterable[str]] = None) -> Subscription:
+        names = list(topics) if topics else list(TOPICS)
+        for name in names:
+            get_topic(name)
+        subscription = Subscription(names, self.max_pending)
+        self._subscriptions.add(subscription)
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_loop())
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        if not self._subscriptions:
+            await self.stop()
+
+    async def stop(self) -> None:
+        reader, self._reader = self._reader, None
+        if reader is None:
+            return
+        reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+
+    def dispatch(self, topic: str, event: Dict[str, Any]) -> None:
+        for subscription in list(self._subscriptions):
+            if topic in subscription.topics:
+                subscription.offer(topic, event)
+
+    async def _start_ids(self, client: Any) -> Dict[str, str]:
+        """Current tail of every stream, so nothing published after subscribing is missed."""
+        ids: Dict[str, str] = {}
+        for topic in TOPICS.values():
+            latest = await client.xrevrange(topic.key, count=1)
+            ids[topic.key] = latest[0][0] if latest else "0-0"
+        return ids
+
+    async def _read_loop(self) -> None:
+        client = self._client()
+        topics_by_key = {topic.key: topic.name for topic in TOPICS.values()}
+        last_ids: Optional[Dict[str, str]] = None
+        backoff = 1.0
+        while self._subscriptions:
+            try:
+                if last_ids is None:
+                    last_ids = await self._start_ids(client)
+                response = await client.xread(last_ids, count=self.batch_size, block=self.block_ms)
+                self._stats["reads"] += 1
+                backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._stats["read_errors"] += 1
+                log.warning(f"[event_hub] Stream read failed: {exc}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+                continue
+            for key, entries in response or []:
+                topic = topics_by_key.get(key)
+                if not entries or topic is None:
+                    continue
+                last_ids[key] = entries[-1][0]
+                for entry_id, fields in entries:
+                    event = decode_entry(entry_id, fields)
+                    if event is not None:
+                        self._stats["events_read"] += 1
+                        self.dispatch(topic, event)
+
+    def get_stats(self) -> Dict[str, Any]:
+        totals = {"offered": 0, "delivered": 0, "coalesced": 0, "dropped": 0}
+        for subscription in self._subscriptions:
+            for name in totals:
+                totals[name] += subscription.stats[name]
+        return {
+            "subscribers": len(self._subscriptions),
+            "reader_running": self._reader is not None and not self._reader.done(),
+            "pending": sum(subscription.pending for subscription in self._subscriptions),
+            **self._stats,
+            **totals,
+        }
+
+
+live_event_hub = LiveEventHub()
@@ -11,6 +11,7 @@ from core.logging import log
 from core.mocks.mock_forecasting_service import get_mock_forecasting_service
 from core.clients.guidry_stats_client import guidry_cloud_stats
 from core.models.asset_registry import get_assets, get_symbol
+from core.telemetry.observability import normalize_operation, track_external_call
 
 
 class ForecastingAPIError(Exception):
@@ -442,14 +443,15 @@ class ForecastingClient:
             try:
                 # ✅ Simple HTTP request - event loop isolation is handled by async_wrapper
                 log.debug(f"[ForecastingClient] Executing {method} request (attempt {attempt + 1}/{self.retry_attempts})")
-                if method == "GET":
-                    response = await self.client.get(endpoint, params=params)
-                elif method == "POST":
-                    response = await self.client.post(endpoint, params=params, json=data)
-                else:
-                    raise ForecastingAPIError(f"Unsupported HTTP method: {method}")
-                
-                response.raise_for_status()
+                with track_external_call("forecasting", normalize_operation(endpoint)) as call:
+                    if method == "GET":
+                        response = await self.client.get(endpoint, params=params)
+                    elif method == "POST":
+                        response = await self.client.post(endpoint, params=params, json=data)
+                    else:
+                        raise ForecastingAPIError(f"Unsupported HTTP method: {method}")
+                    call["status"] = str(response.status_code)
+                    response.raise_for_status()
                 duration = perf_counter() - start
                 guidry_cloud_stats.record_success(endpoint, response.status_code, duration)
                 return response.json()
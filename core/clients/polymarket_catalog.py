@@ -0,0 +1,429 @@
+"""
+Local Polymarket market catalog with in-process search indexes.
+
+The catalog mirrors active Gamma markets in memory and answers keyword and
+numeric-range queries locally:
+- Inverted index over tokenized question / event title / slug / tags / category
+- Sorted numeric indexes on liquidity, 24h volume and end date
+
+The remote API is only used by `refresh()`, which pages through Gamma
+`/markets` ordered by `updatedAt` and stops once it reaches markets that are
+already known (incremental refresh). Incremental pages include closed
+markets so they are evicted as soon as they close; a periodic full resync
+(`full_refresh_seconds`) drops anything the deltas missed.
+"""
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from core.logging import log
+from core.settings.config import settings
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    {"a", "an", "and", "at", "be", "by", "for", "in", "is", "of", "on", "or", "the", "to", "will", "with"}
+)
+NUMERIC_FIELDS = ("liquidity", "volume", "end_ts")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens without common stopwords."""
+    return [tok for tok in _TOKEN_RE.findall((text or "").lower()) if tok not in _STOPWORDS]
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None and value != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, (int, float)):
+        return float(value)
+    elif isinstance(value, str) and value:
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def normalize_market(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Project a raw Gamma market onto the catalog record shape."""
+    market_id = raw.get("id") or raw.get("market_id")
+    if not market_id:
+        return None
+    events = raw.get("events") or []
+    event = events[0] if events and isinstance(events[0], dict) else {}
+    tags = [
+        tag.get("label") or tag.get("slug") if isinstance(tag, dict) else str(tag)
+        for tag in (raw.get("tags") or event.get("tags") or [])
+    ]
+    liquidity = _to_float(raw.get("liquidityNum", raw.get("liquidity")))
+    volume_24h = _to_float(raw.get("volume24hr", raw.get("volume_24h")))
+    volume = _to_float(raw.get("volumeNum", raw.get("volume")))
+    end_date = raw.get("endDate") or raw.get("end_date_iso") or raw.get("close_time")
+    return {
+        "id": str(market_id),
+        "slug": raw.get("slug"),
+        "question": raw.get("question") or raw.get("title") or "",
+        "title": event.get("title") or raw.get("title") or raw.get("question") or "",
+        "event_slug": event.get("slug"),
+        "category": raw.get("category") or event.get("category"),
+        "tags": [tag for tag in tags if tag],
+        "active": bool(raw.get("active", True)),
+        "closed": bool(raw.get("closed", False)),
+        "acceptingOrders": raw.get("acceptingOrders"),
+        "endDate": end_date.isoformat() if isinstance(end_date, datetime) else end_date,
+        "updatedAt": raw.get("updatedAt"),
+        "liquidity": liquidity or 0.0,
+        "volume": volume or 0.0,
+        "volume_24h": volume_24h if volume_24h is not None else (volume or 0.0),
+        "spread": _to_float(raw.get("spread")),
+        "bestBid": _to_float(raw.get("bestBid")),
+        "bestAsk": _to_float(raw.get("bestAsk")),
+        "lastTradePrice": _to_float(raw.get("lastTradePrice")),
+        "outcomes": raw.get("outcomes"),
+        "outcomePrices": raw.get("outcomePrices"),
+        "clobTokenIds": raw.get("clobTokenIds"),
+        "conditionId": raw.get("conditionId"),
+        "end_ts": _to_timestamp(end_date),
+    }
+
+
+class PolymarketMarketCatalog:
+    """In-memory market catalog with inverted and numeric indexes.
+
+    Thread-safe: toolkits call into it from worker threads with their own
+    event loops, so all index mutations are guarded by a threading lock.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: int = settings.polymarket_catalog_refresh_seconds,
+        page_size: int = settings.polymarket_catalog_page_size,
+        max_pages: int = settings.polymarket_catalog_max_pages,
+        full_refresh_seconds: int = settings.polymarket_catalog_full_refresh_seconds,
+    ) -> None:
+        self.refresh_seconds = int(refresh_seconds)
+        self.full_refresh_seconds = int(full_refresh_seconds)
+        self.page_size = int(page_size)
+        self.max_pages = int(max_pages)
+        self._markets: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._doc_tokens: Dict[str, Set[str]] = {}
+        self._numeric: Dict[str, List[Tuple[float, str]]] = {name: [] for name in NUMERIC_FIELDS}
+        self._lock = threading.RLock()
+        self._refresh_guard = threading.Lock()
+        self._last_refresh_at: Optional[float] = None
+        self._last_full_refresh_at: Optional[float] = None
+        self._watermark: Optional[str] = None
+        self._stats = {"refreshes": 0, "pages_fetched": 0, "searches": 0, "last_refresh_ms": None}
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _document_tokens(record: Dict[str, Any]) -> Set[str]:
+        parts = [
+            record.get("question") or "",
+            record.get("title") or "",
+            (record.get("slug") or "").replace("-", " "),
+            (record.get("event_slug") or "").replace("-", " "),
+            record.get("category") or "",
+            " ".join(record.get("tags") or []),
+        ]
+        return set(tokenize(" ".join(parts)))
+
+    def _index_remove(self, market_id: str) -> None:
+        record = self._markets.pop(market_id, None)
+        if record is None:
+            return
+        for token in self._doc_tokens.pop(market_id, set()):
+            ids = self._postings.get(token)
+            if ids is not None:
+                ids.discard(market_id)
+                if not ids:
+                    del self._postings[token]
+        for name in NUMERIC_FIELDS:
+            value = record.get(name)
+            if value is None:
+                continue
+            index = self._numeric[name]
+            pos = bisect.bisect_left(index, (float(value), market_id))
+            if pos < len(index) and index[pos] == (float(value), market_id):
+                index.pop(pos)
+
+    def _index_add(self, record: Dict[str, Any]) -> None:
+        market_id = record["id"]
+        self._markets[market_id] = record
+        tokens = self._document_tokens(record)
+        self._doc_tokens[market_id] = tokens
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(market_id)
+        for name in NUMERIC_FIELDS:
+            value = record.get(name)
+            if value is not None:
+                bisect.insort(self._numeric[name], (float(value), market_id))
+
+    def upsert(self, raw_markets: Iterable[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Insert/update markets; closed or inactive markets are evicted.
+
+        Returns the ids that were added, updated or removed.
+        """
+        delta: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+        with self._lock:
+            for raw in raw_markets:
+                if not isinstance(raw, dict):
+                    continue
+                record = normalize_market(raw)
+                if record is None:
+                    continue
+                market_id = record["id"]
+                existing = self._markets.get(market_id)
+                if record["closed"] or not record["active"]:
+                    if existing is not None:
+                        self._index_remove(market_id)
+                        delta["removed"].append(market_id)
+                    continue
+                if existing is not None:
+                    if (
+                        existing.get("updatedAt") == record.get("updatedAt")
+                        and existing.get("volume_24h") == record.get("volume_24h")
+                        and existing.get("liquidity") == record.get("liquidity")
+                    ):
+                        continue
+                    self._index_remove(market_id)
+                    delta["updated"].append(market_id)
+                else:
+                    delta["added"].append(market_id)
+                self._index_add(record)
+        return delta
+
+    def remove(self, market_ids: Iterable[str]) -> List[str]:
+        removed: List[str] = []
+        with self._lock:
+            for market_id in market_ids:
+                if market_id in self._markets:
+                    self._index_remove(market_id)
+                    removed.append(market_id)
+        return removed
+
+    def prune_expired(self, now: Optional[float] = None) -> List[str]:
+        """Drop markets whose end date has passed."""
+        cutoff = time.time() if now is None else now
+        with self._lock:
+            index = self._numeric["end_ts"]
+            expired = [market_id for _, market_id in index[: bisect.bisect_right(index, (cutoff, "￿"))]]
+        return self.remove(expired)
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def _full_refresh_due(self) -> bool:
+        if self.full_refresh_seconds <= 0 or self._last_full_refresh_at is None:
+            return False
+        return (time.time() - self._last_full_refresh_at) >= self.full_refresh_seconds
+
+    def is_stale(self) -> bool:
+        if self._last_refresh_at is None:
+            return True
+        return (time.time() - self._last_refresh_at) >= self.refresh_seconds
+
+    async def refresh(self, client: Any, *, full: bool = False) -> Dict[str, Any]:
+        """Pull new/updated markets from Gamma pagination into the catalog.
+
+        Incremental refreshes stop at the first page that reaches markets
+        updated at or before the previous watermark; their pages include
+        closed markets so those are evicted. A full refresh walks every active
+        page (up to `max_pages`) and evicts markets that were not seen; it also
+        runs when the last full refresh is older than `full_refresh_seconds`.
+        """
+        if not self._refresh_guard.acquire(blocking=False):
+            return {"status": "skipped", "reason": "refresh_in_progress"}
+        started = time.perf_counter()
+        try:
+            full = full or not self._markets or self._full_refresh_due()
+            watermark = None if full else self._watermark
+            seen: Set[str] = set()
+            delta: Dict[str, List[str]] = {"added": [], "updated": [], "removed": []}
+            newest: Optional[str] = self._watermark
+            pages = 0
+            for page in range(max(1, self.max_pages)):
+                batch = await client.fetch_markets_page(
+                    limit=self.page_size, offset=page * self.page_size, include_closed=not full
+                )
+                if not isinstance(batch, list):
+                    raise TypeError(f"unexpected markets page type: {type(batch).__name__}")
+                pages += 1
+                if not batch:
+                    break
+                page_delta = self.upsert(batch)
+                for key in delta:
+                    delta[key].extend(page_delta[key])
+                updated_values = [str(m.get("updatedAt")) for m in batch if isinstance(m, dict) and m.get("updatedAt")]
+                seen.update(str(m.get("id")) for m in batch if isinstance(m, dict) and m.get("id"))
+                if updated_values:
+                    page_max = max(updated_values)
+                    newest = page_max if newest is None or page_max > newest else newest
+                if len(batch) < self.page_size:
+                    break
+                if watermark and updated_values and min(updated_values) <= watermark:
+                    break
+
+            if full and pages < self.max_pages:
+                with self._lock:
+                    missing = [market_id for market_id in self._markets if market_id not in seen]
+                delta["removed"].extend(self.remove(missing))
+            delta["removed"].extend(self.prune_expired())
+
+            now = time.time()
+            self._watermark = newest
+            self._last_refresh_at = now
+            if full:
+                self._last_full_refresh_at = now
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self._stats["refreshes"] += 1
+            self._stats["pages_fetched"] += pages
+            self._stats["last_refresh_ms"] = round(elapsed_ms, 2)
+            log.info(
+                f"[POLYMARKET CATALOG] refresh full={full} pages={pages} added={len(delta['added'])} "
+                f"updated={len(delta['updated'])} removed={len(delta['removed'])} "
+                f"size={len(self._markets)} ({elapsed_ms:.0f}ms)"
+            )
+            return {"status": "ok", "full": full, "pages": pages, **delta}
+        finally:
+            self._refresh_guard.release()
+
+    async def ensure_fresh(self, client: Any) -> bool:
+        """Refresh when stale; returns True when the catalog can serve queries."""
+        if self.is_stale():
+            try:
+                await self.refresh(client)
+            except Exception as exc:
+                log.warning(f"[POLYMARKET CATALOG] refresh failed: {exc}")
+        return bool(self._markets)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _range_ids(self, name: str, low: Optional[float], high: Optional[float]) -> Set[str]:
+        index = self._numeric[name]
+        start = 0 if low is None else bisect.bisect_left(index, (float(low), ""))
+        end = len(index) if high is None else bisect.bisect_right(index, (float(high), "￿"))
+        return {market_id for _, market_id in index[start:end]}
+
+    def get(self, market_id: str) -> Optional[Dict[str, Any]]:
+        record = self._markets.get(str(market_id))
+        return dict(record) if record else None
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        limit: int = 20,
+        min_liquidity: Optional[float] = None,
+        min_volume: Optional[float] = None,
+        end_after: Any = None,
+        end_before: Any = None,
+        sort_by: str = "relevance",
+    ) -> List[Dict[str, Any]]:
+        """Search the catalog by keywords and numeric filters.
+
+        Args:
+            query: Free-text keywords (all tokens must match when possible).
+            limit: Maximum number of results.
+            min_liquidity: Minimum liquidity filter.
+            min_volume: Minimum total (lifetime) volume; ``sort_by="volume"`` ranks by 24h volume instead.
+            end_after: Only markets ending after this datetime/ISO/epoch.
+            end_before: Only markets ending before this datetime/ISO/epoch.
+            sort_by: "relevance", "volume", "liquidity" or "end_date".
+
+        Returns:
+            Copies of matching market records, best first.
+        """
+        limit = max(1, int(limit))
+        self._stats["searches"] += 1
+        with self._lock:
+            candidates: Optional[Set[str]] = None
+            scores: Dict[str, float] = {}
+            tokens = list(dict.fromkeys(tokenize(query)))
+            if tokens:
+                total = max(1, len(self._markets))
+                postings = [(tok, self._postings.get(tok, set())) for tok in tokens]
+                for _, ids in postings:
+                    if not ids:
+                        continue
+                    idf = math.log(1.0 + total / len(ids))
+                    for market_id in ids:
+                        scores[market_id] = scores.get(market_id, 0.0) + idf
+                matched_all = set.intersection(*(ids for _, ids in postings)) if postings else set()
+                candidates = matched_all or set(scores)
+
+            filters = []
+            if min_liquidity is not None:
+                filters.append(self._range_ids("liquidity", min_liquidity, None))
+            if min_volume is not None:
+                filters.append(self._range_ids("volume", min_volume, None))
+            end_low, end_high = _to_timestamp(end_after), _to_timestamp(end_before)
+            if end_low is not None or end_high is not None:
+                filters.append(self._range_ids("end_ts", end_low, end_high))
+            for ids in sorted(filters, key=len):
+                candidates = ids if candidates is None else candidates & ids
+
+            if sort_by in ("volume", "liquidity", "end_date") or (candidates is None and not tokens):
+                field = {"volume": "volume_24h", "liquidity": "liquidity", "end_date": "end_ts"}.get(sort_by, "volume_24h")
+                pool = self._markets.keys() if candidates is None else candidates
+                reverse = sort_by != "end_date"
+                key_fn = lambda market_id: self._markets[market_id].get(field) or 0.0  # noqa: E731
+                picked = (heapq.nlargest if reverse else heapq.nsmallest)(limit, pool, key=key_fn)
+            else:
+                pool = candidates or set()
+                picked = heapq.nlargest(
+                    limit,
+                    pool,
+                    key=lambda market_id: (scores.get(market_id, 0.0), self._markets[market_id].get("volume_24h") or 0.0),
+                )
+            return [dict(self._markets[market_id], match_score=round(scores.get(market_id, 0.0), 4)) for market_id in picked]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "markets": len(self._markets),
+            "tokens": len(self._postings),
+            "watermark": self._watermark,
+            "last_refresh_at": (
+                datetime.fromtimestamp(self._last_refresh_at, timezone.utc).isoformat()
+                if self._last_refresh_at
+                else None
+            ),
+            "last_full_refresh_at": (
+                datetime.fromtimestamp(self._last_full_refresh_at, timezone.utc).isoformat()
+                if self._last_full_refresh_at
+                else None
+            ),
+            **self._stats,
+        }
+
+
+# Shared catalog instance used by toolkits and the Polymarket manager
+market_catalog = PolymarketMarketCatalog()
@@ -20,6 +20,8 @@ from decimal import Decimal, ROUND_DOWN
 from core.logging import log
 from core.settings.config import settings
 from core.models.polymarket import SimpleMarket, SimpleEvent, SimpleMarketQuery, SimpleEventQuery
+from core.telemetry.observability import track_external_call
+from core.telemetry.rpc import InstrumentedHTTPProvider
 
 from web3 import Web3
 from web3.constants import MAX_INT
@@ -171,6 +173,14 @@ ERC1155_APPROVAL_ABI = [
 ]
 
 
+def _endpoint_operation(endpoint: str) -> str:
+    """Metric label for a Gamma/CLOB path: resource name, with ids/slugs collapsed."""
+    parts = [part for part in endpoint.split("?", 1)[0].split("/") if part]
+    if not parts:
+        return "/"
+    return f"/{parts[0]}/{{id}}" if len(parts) > 1 else f"/{parts[0]}"
+
+
 class PolymarketClient:
     """Polymarket client supporting public APIs and authenticated CLOB trading.
     
@@ -211,7 +221,7 @@ class PolymarketClient:
         self.neg_risk_ctf_exchange = os.getenv("POLYMARKET_NEG_RISK_CTF_EXCHANGE", DEFAULT_NEG_RISK_CTF_EXCHANGE)
         self.neg_risk_adapter = os.getenv("POLYMARKET_NEG_RISK_ADAPTER", DEFAULT_NEG_RISK_ADAPTER)
         self.polygon_rpc = os.getenv("POLYGON_RPC_URL", "https://polygon-rpc.com")
-        self.web3 = Web3(Web3.HTTPProvider(self.polygon_rpc)) if WEB3_AVAILABLE else None
+        self.web3 = Web3(InstrumentedHTTPProvider(self.polygon_rpc)) if WEB3_AVAILABLE else None
 
         self.web3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
 
@@ -241,7 +251,7 @@ class PolymarketClient:
         self.host = host or os.getenv("CLOB_API_URL") or CLOB_API_URL
         self._api_creds = self._load_api_creds()
         self.polygon_rpc = "https://polygon-rpc.com"
-        self.w3 = Web3(Web3.HTTPProvider(self.polygon_rpc))
+        self.w3 = Web3(InstrumentedHTTPProvider(self.polygon_rpc))
 
         self.usdc = self.web3.eth.contract(
             address=self.usdc_address, abi=self.erc20_approve
@@ -335,10 +345,11 @@ class PolymarketClient:
         """Fetch from Gamma API."""
         try:
             url = f"{GAMMA_API_URL}{endpoint}"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params or {})
-                response.raise_for_status()
-                return response.json()
+            with track_external_call("polymarket", f"gamma{_endpoint_operation(endpoint)}"):
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.get(url, params=params or {})
+                    response.raise_for_status()
+                    return response.json()
         except Exception as e:
             log.error(f"Gamma API error for {endpoint}: {e}")
             raise
@@ -347,10 +358,11 @@ class PolymarketClient:
         """Fetch from CLOB public API."""
         try:
             url = f"{CLOB_API_URL}{endpoint}"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params or {})
-                response.raise_for_status()
-                return response.json()
+            with track_external_call("polymarket", f"clob{_endpoint_operation(endpoint)}"):
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.get(url, params=params or {})
+                    response.raise_for_status()
+                    return response.json()
         except Exception as e:
             log.error(f"CLOB API error for {endpoint}: {e}")
             raise
@@ -439,6 +451,36 @@ class PolymarketClient:
             log.error(f"Gamma market search failed: {e}")
             raise
     
+    async def fetch_markets_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        order: str = "updatedAt",
+        ascending: bool = False,
+        active_only: bool = True,
+        include_closed: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Fetch one page of raw markets from the Gamma `/markets` listing.
+
+        Used by the local market catalog for refreshes. Incremental refreshes
+        pass ``include_closed=True`` so markets that closed since the last
+        watermark show up and can be evicted.
+        """
+        params: Dict[str, Any] = {
+            "limit": limit,
+            "offset": offset,
+            "order": order,
+            "ascending": "true" if ascending else "false",
+        }
+        if active_only:
+            params["active"] = "true"
+        if not include_closed:
+            params["closed"] = "false"
+        data = await self._fetch_gamma_api("/markets", params)
+        if isinstance(data, dict):
+            data = data.get("data", [])
+        return data if isinstance(data, list) else []
+
     async def get_event_markets(
         self,
         event_slug: Optional[str] = None,
@@ -553,10 +595,11 @@ class PolymarketClient:
         url = f"{GAMMA_API_URL}/events/pagination"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.get(url, params=params)
-                resp.raise_for_status()
-                payload = resp.json()
+            with track_external_call("polymarket", "gamma/events/pagination"):
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    resp = await client.get(url, params=params)
+                    resp.raise_for_status()
+                    payload = resp.json()
         except Exception as e:
             log.error(f"Gamma API error (trending markets): {e}")
             raise
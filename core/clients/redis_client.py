@@ -3,29 +3,73 @@ Redis client for caching, pub/sub, and shared state management.
 """
 import asyncio
 import json
-from datetime import datetime
-from typing import Any, Optional, Dict, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Iterable, Optional, Dict, List, Mapping, Sequence, Union
 import redis.asyncio as aioredis
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+from core.clients.redis_codec import DateTimeEncoder, get_codec, is_envelope, pack, unpack
 from core.settings.config import settings
 from core.logging import log
 
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects."""
-    
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+def queue_capped_push(
+    pipe: Any,
+    key: str,
+    values: Sequence[str],
+    max_length: int,
+    expire: Optional[int] = None,
+    left: bool = True,
+) -> None:
+    """Queue a push + trim (+ expire) on a sync or async pipeline.
+
+    With ``left`` the newest values sit at the head (LPUSH); otherwise at the
+    tail (RPUSH). Either way the list keeps its ``max_length`` newest entries.
+    """
+    if not values:
+        return
+    if left:
+        pipe.lpush(key, *values)
+        pipe.ltrim(key, 0, max_length - 1)
+    else:
+        pipe.rpush(key, *values)
+        pipe.ltrim(key, -max_length, -1)
+    if expire:
+        pipe.expire(key, expire)
+
+
+# Compound operations that need server-side branching. Registered scripts run
+# via EVALSHA and are reloaded transparently after a SCRIPT FLUSH.
+LUA_SCRIPTS: Dict[str, str] = {
+    # INCRBY a counter and start its TTL window only when it was just created
+    "incr_window": """
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value == tonumber(ARGV[1]) then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return value
+""",
+}
 
 
 class RedisClient:
     """Async Redis client wrapper with pub/sub support."""
     
-    def __init__(self):
+    def __init__(self, codec: Optional[str] = None, codec_mode: Optional[str] = None):
         self.redis: Optional[Redis] = None
         self.pubsub = None
+        self._scripts: Dict[str, Any] = {}
+        # Bytes-mode twin of ``self.redis`` used to read enveloped values
+        self._raw: Optional[Redis] = None
+        self._raw_source: Optional[Redis] = None
+        try:
+            self.codec = get_codec(codec or settings.redis_codec)
+        except RuntimeError as e:
+            log.warning(f"{e}; falling back to the json codec")
+            self.codec = get_codec("json")
+        self.codec_mode = codec_mode or settings.redis_codec_mode
+        self.codec_stats: Dict[str, int] = {"legacy_reads": 0, "envelope_reads": 0, "migrated": 0, "migrate_conflicts": 0}
         
     async def connect(self):
         """Establish connection to Redis."""
@@ -120,6 +164,11 @@ class RedisClient:
     
     async def disconnect(self):
         """Close Redis connection."""
+        if self._raw is not None:
+            await self._raw.aclose()
+            await self._raw.connection_pool.disconnect()
+            self._raw = None
+            self._raw_source = None
         if self.redis:
             await self.redis.aclose()  # Use aclose() instead of close() for async Redis
             log.info("Disconnected from Redis")
@@ -189,19 +238,63 @@ class RedisClient:
         except Exception as e:
             log.error(f"Redis SET error for key {key}: {e}")
     
+    def encode_value(self, value: Any) -> Union[str, bytes]:
+        """Serialize a record for storage according to the codec mode."""
+        if self.codec_mode == "legacy":
+            return json.dumps(value, cls=DateTimeEncoder)
+        return pack(value, self.codec)
+
+    def decode_value(self, raw: Union[str, bytes, None]) -> Optional[Any]:
+        """Decode an enveloped or legacy JSON value (raises ``ValueError``)."""
+        value = unpack(raw)
+        if raw is not None:
+            self.codec_stats["envelope_reads" if is_envelope(raw) else "legacy_reads"] += 1
+        return value
+
+    async def _raw_client(self) -> Redis:
+        """Return a ``decode_responses=False`` client sharing the server of ``self.redis``."""
+        client = await self._connected()
+        if self._raw is None or self._raw_source is not client:
+            pool = client.connection_pool
+            kwargs = {**pool.connection_kwargs, "decode_responses": False}
+            self._raw = Redis(connection_pool=pool.__class__(connection_class=pool.connection_class, **kwargs))
+            self._raw_source = client
+        return self._raw
+
+    async def _migrate_legacy(self, client: Redis, legacy: Dict[str, tuple]) -> None:
+        """Rewrite legacy JSON values as envelopes unless they changed meanwhile."""
+        keys = list(legacy)
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                await pipe.watch(*keys)
+                current = await pipe.mget(keys)
+                pipe.multi()
+                for key, now_raw in zip(keys, current):
+                    raw, value = legacy[key]
+                    if now_raw == raw:
+                        pipe.set(key, pack(value, self.codec), keepttl=True)
+                await pipe.execute()
+            self.codec_stats["migrated"] += len(keys)
+        except WatchError:
+            self.codec_stats["migrate_conflicts"] += 1
+        except Exception as e:
+            log.debug(f"Redis codec migration skipped for {len(keys)} keys: {e}")
+
     async def get_json(self, key: str) -> Optional[Dict]:
         """Get JSON value from Redis."""
-        value = await self.get(key)
-        if value:
+        if self.codec_mode == "legacy":
+            raw = await self.get(key)
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return self.decode_value(raw)
+            except ValueError:
                 log.error(f"Failed to decode JSON for key {key}")
-        return None
+                return None
+        values = await self.mget_json([key])
+        return values[0] if values else None
     
     async def set_json(self, key: str, value: Dict, expire: Optional[int] = None):
         """Set JSON value in Redis."""
-        await self.set(key, json.dumps(value, cls=DateTimeEncoder), expire)
+        await self.set(key, self.encode_value(value), expire)
     
     async def delete(self, key: str):
         """Delete key from Redis."""
@@ -349,6 +442,120 @@ class RedisClient:
         except Exception as e:
             log.error(f"Redis LTRIM error for key {key}: {e}")
 
+    # ------------------------------------------------------------------
+    # Batch API: one round trip for multi-step reads and writes
+    # ------------------------------------------------------------------
+
+    async def _connected(self) -> Redis:
+        if self.redis is None:
+            await self.connect()
+        return self.redis
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False) -> AsyncIterator[Pipeline]:
+        """Queue commands and send them in one round trip.
+
+        Commands still queued when the block exits are executed; call
+        ``await pipe.execute()`` inside the block to read results. Nothing is
+        sent if the block raises.
+        """
+        client = await self._connected()
+        pipe = client.pipeline(transaction=transaction)
+        try:
+            yield pipe
+            if len(pipe):
+                await pipe.execute()
+        finally:
+            await pipe.reset()
+
+    def transaction(self):
+        """Like ``pipeline()`` but wrapped in MULTI/EXEC so it applies atomically."""
+        return self.pipeline(transaction=True)
+
+    async def mget_json(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Fetch and decode several JSON values with a single MGET."""
+        if not keys:
+            return []
+        try:
+            # Plain JSON is text, so legacy mode reads through the shared client;
+            # the bytes-mode twin is only needed once envelopes may be on the wire
+            client = await self._connected() if self.codec_mode == "legacy" else await self._raw_client()
+            raw_values = await client.mget(list(keys))
+        except RuntimeError as e:
+            # Event loop closed during shutdown
+            log.debug(f"Redis MGET skipped for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+        except Exception as e:
+            log.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+        decoded: List[Optional[Any]] = []
+        legacy: Dict[str, tuple] = {}
+        for key, raw in zip(keys, raw_values):
+            try:
+                value = self.decode_value(raw)
+            except ValueError:
+                log.error(f"Failed to decode JSON for key {key}")
+                value = None
+            decoded.append(value)
+            if self.codec_mode == "migrate" and raw is not None and isinstance(value, (dict, list)) and not is_envelope(raw):
+                legacy[key] = (raw, value)
+        if legacy:
+            await self._migrate_legacy(client, legacy)
+        return decoded
+
+    async def mset_json(self, mapping: Mapping[str, Any], expire: Optional[int] = None):
+        """Store several JSON values in one round trip (MSET, or pipelined SET EX)."""
+        if not mapping:
+            return
+        encoded = {key: self.encode_value(value) for key, value in mapping.items()}
+        try:
+            if expire is None:
+                client = await self._connected()
+                await client.mset(encoded)
+                return
+            async with self.pipeline() as pipe:
+                for key, value in encoded.items():
+                    pipe.set(key, value, ex=expire)
+        except Exception as e:
+            log.error(f"Redis MSET error for {len(mapping)} keys: {e}")
+
+    async def push_capped(
+        self,
+        key: str,
+        *values: str,
+        max_length: int,
+        expire: Optional[int] = None,
+        left: bool = True,
+    ) -> Optional[int]:
+        """Atomically push values, trim to ``max_length`` and refresh the TTL.
+
+        Returns the list length after the push (before trimming).
+        """
+        if not values:
+            return None
+        try:
+            async with self.transaction() as pipe:
+                queue_capped_push(pipe, key, values, max_length, expire=expire, left=left)
+                results = await pipe.execute()
+            return int(results[0])
+        except Exception as e:
+            log.error(f"Redis capped push error for key {key}: {e}")
+            return None
+
+    async def run_script(self, name: str, keys: Iterable[str] = (), args: Iterable[Any] = ()) -> Any:
+        """Run a named script from ``LUA_SCRIPTS`` (EVALSHA with reload on NOSCRIPT)."""
+        client = await self._connected()
+        script = self._scripts.get(name)
+        if script is None:
+            script = client.register_script(LUA_SCRIPTS[name])
+            self._scripts[name] = script
+        return await script(keys=list(keys), args=list(args), client=client)
+
+    async def incr_window(self, key: str, amount: int = 1, window_seconds: int = 60) -> int:
+        """Increment a fixed-window counter, starting its TTL on first use."""
+        return int(await self.run_script("incr_window", keys=[key], args=[amount, window_seconds]))
+
+
 
 # Global Redis client instance
 redis_client = RedisClient()
@@ -0,0 +1,177 @@
+"""
+Pluggable value codecs for Redis-stored records.
+
+Encoded values carry a small versioned envelope::
+
+    b"\\xc1RC" | version (1 byte) | codec tag (1 byte) | payload
+
+0xC1 is never emitted by msgpack and cannot start a UTF-8 string, so an
+envelope can never be mistaken for a legacy JSON value. Anything without the
+magic prefix is decoded as plain JSON, which keeps every value written before
+the codec layer readable.
+"""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - optional dependency
+    ormsgpack = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+ENVELOPE_MAGIC = b"\xc1RC"
+ENVELOPE_VERSION = 1
+_HEADER_SIZE = len(ENVELOPE_MAGIC) + 2
+
+
+class DateTimeEncoder(json.JSONEncoder):
+    """Custom JSON encoder that handles datetime objects."""
+
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        return super().default(obj)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+class RedisCodec:
+    """Encode/decode Python values to the bytes stored in Redis."""
+
+    name = "base"
+    tag = 0
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, payload: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(RedisCodec):
+    """Standard library JSON (the historical format)."""
+
+    name = "json"
+    tag = 1
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, cls=DateTimeEncoder).encode("utf-8")
+
+    def decode(self, payload: bytes) -> Any:
+        return json.loads(payload)
+
+
+class OrjsonCodec(RedisCodec):
+    """orjson: same JSON text, several times faster to encode and parse."""
+
+    name = "orjson"
+    tag = 2
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError("orjson codec requested but the 'orjson' package is not installed")
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, payload: bytes) -> Any:
+        return orjson.loads(payload)
+
+
+class MsgpackCodec(RedisCodec):
+    """MessagePack via ormsgpack (preferred) or msgpack: smaller payloads."""
+
+    name = "msgpack"
+    tag = 3
+
+    def __init__(self) -> None:
+        if ormsgpack is None and msgpack is None:
+            raise RuntimeError("msgpack codec requested but neither 'ormsgpack' nor 'msgpack' is installed")
+
+    def encode(self, value: Any) -> bytes:
+        if ormsgpack is not None:
+            return ormsgpack.packb(value, default=_default, option=ormsgpack.OPT_NON_STR_KEYS)
+        return msgpack.packb(value, default=_default, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> Any:
+        if ormsgpack is not None:
+            return ormsgpack.unpackb(payload)
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+_CODEC_CLASSES = {cls.name: cls for cls in (JsonCodec, OrjsonCodec, MsgpackCodec)}
+_CODECS_BY_TAG = {cls.tag: cls for cls in _CODEC_CLASSES.values()}
+_instances: Dict[str, RedisCodec] = {}
+
+
+def available_codecs() -> list[str]:
+    """Codec names whose backing library is importable."""
+    names = ["json"]
+    if orjson is not None:
+        names.append("orjson")
+    if ormsgpack is not None or msgpack is not None:
+        names.append("msgpack")
+    return names
+
+
+def get_codec(name: str) -> RedisCodec:
+    """Return the shared codec instance for ``name``."""
+    codec = _instances.get(name)
+    if codec is None:
+        if name not in _CODEC_CLASSES:
+            raise ValueError(f"Unknown Redis codec {name!r}; expected one of {sorted(_CODEC_CLASSES)}")
+        codec = _CODEC_CLASSES[name]()
+        _instances[name] = codec
+    return codec
+
+
+def is_envelope(raw: Union[bytes, str, None]) -> bool:
+    return isinstance(raw, (bytes, bytearray)) and bytes(raw[: len(ENVELOPE_MAGIC)]) == ENVELOPE_MAGIC
+
+
+def pack(value: Any, codec: RedisCodec) -> bytes:
+    """Encode ``value`` with ``codec`` inside a versioned envelope."""
+    return ENVELOPE_MAGIC + bytes((ENVELOPE_VERSION, codec.tag)) + codec.encode(value)
+
+
+def unpack(raw: Union[bytes, str, None]) -> Optional[Any]:
+    """Decode an enveloped or legacy JSON value; raise ``ValueError`` if unreadable."""
+    if raw is None:
+        return None
+    if is_envelope(raw):
+        version, tag = raw[len(ENVELOPE_MAGIC)], raw[len(ENVELOPE_MAGIC) + 1]
+        if version != ENVELOPE_VERSION or tag not in _CODECS_BY_TAG:
+            raise ValueError(f"Unsupported Redis envelope version={version} codec={tag}")
+        try:
+            return get_codec(_CODECS_BY_TAG[tag].name).decode(bytes(raw[_HEADER_SIZE:]))
+        except ValueError:
+            raise
+        except Exception as exc:
+            raise ValueError(str(exc)) from exc
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity that json.dumps may have written
+            pass
+    try:
+        return json.loads(raw)
+    except (TypeError, UnicodeDecodeError) as exc:
+        raise ValueError(str(exc)) from exc
@@ -3,7 +3,10 @@ Shared research/news source fetchers.
 
 These helpers are designed to be resilient best-effort integrations that degrade gracefully
 when external services throttle or fail. All functions accept an httpx.AsyncClient to reuse
-connection pools across agents.
+connection pools across agents. Response bodies go through the shared content cache: within
+``RESEARCH_FEED_TTL_SECONDS`` a feed is served from disk, after that it is revalidated with a
+conditional GET. Parsed items are added to the local full-text index so agents can search
+them later without another fetch.
 """
 from __future__ import annotations
 
@@ -11,12 +14,13 @@ import asyncio
 import html
 import re
 import xml.etree.ElementTree as ET
-from datetime import datetime
 from typing import Dict, Iterable, List, Optional
 from urllib.parse import quote_plus
 
 import httpx
 
+from core.clients.content_cache import cached_get
+from core.clients.content_index import content_index
 from core.settings.config import settings
 from core.logging import log
 
@@ -41,14 +45,13 @@ async def fetch_yahoo_finance_headlines(
         f"?s={quote_plus(joined)}&region=US&lang=en-US"
     )
     try:
-        response = await client.get(url, headers=USER_AGENT_HEADERS, timeout=20.0)
-        response.raise_for_status()
+        body = await cached_get(client, url, "feed:yahoo_finance", headers=USER_AGENT_HEADERS)
     except Exception as exc:
         log.debug("Yahoo Finance feed fetch failed: %s", exc)
         return []
 
     try:
-        root = ET.fromstring(response.text)
+        root = ET.fromstring(body)
     except ET.ParseError as exc:
         log.debug("Yahoo Finance feed parse error: %s", exc)
         return []
@@ -70,7 +73,7 @@ async def fetch_yahoo_finance_headlines(
                 "source_weight": settings.news_source_weights.get("yahoo_finance", 0.1),
             }
         )
-    return items
+    return _indexed("news", items)
 
 
 async def fetch_coin_bureau_updates(
@@ -80,14 +83,13 @@ async def fetch_coin_bureau_updates(
 ) -> List[Dict[str, str]]:
     """Fetch Coin Bureau updates from the YouTube RSS feed."""
     try:
-        response = await client.get(feed_url, headers=USER_AGENT_HEADERS, timeout=20.0)
-        response.raise_for_status()
+        body = await cached_get(client, feed_url, "feed:coin_bureau", headers=USER_AGENT_HEADERS)
     except Exception as exc:
         log.debug("Coin Bureau feed fetch failed: %s", exc)
         return []
 
     try:
-        root = ET.fromstring(response.text)
+        root = ET.fromstring(body)
     except ET.ParseError as exc:
         log.debug("Coin Bureau feed parse error: %s", exc)
         return []
@@ -112,7 +114,7 @@ async def fetch_coin_bureau_updates(
                 "source_weight": settings.news_source_weights.get("coin_bureau", 0.1),
             }
         )
-    return items
+    return _indexed("news", items)
 
 
 async def fetch_arxiv_entries(
@@ -127,14 +129,13 @@ async def fetch_arxiv_entries(
         f"search_query={encoded}&sortBy=submittedDate&max_results={limit}"
     )
     try:
-        response = await client.get(url, timeout=20.0, headers=USER_AGENT_HEADERS)
-        response.raise_for_status()
+        body = await cached_get(client, url, "feed:arxiv", headers=USER_AGENT_HEADERS)
     except Exception as exc:
         log.debug("arXiv feed fetch failed: %s", exc)
         return []
 
     try:
-        root = ET.fromstring(response.text)
+        root = ET.fromstring(body)
     except ET.ParseError as exc:
         log.debug("arXiv feed parse error: %s", exc)
         return []
@@ -158,7 +159,7 @@ async def fetch_arxiv_entries(
                 "source_weight": settings.news_source_weights.get("arxiv", 0.1),
             }
         )
-    return items
+    return _indexed("research", items)
 
 
 async def fetch_google_scholar_entries(
@@ -170,13 +171,12 @@ async def fetch_google_scholar_entries(
     encoded = quote_plus(query)
     url = f"https://r.jina.ai/https://scholar.google.com/scholar?hl=en&q={encoded}"
     try:
-        response = await client.get(url, headers=USER_AGENT_HEADERS, timeout=20.0)
-        response.raise_for_status()
+        body = await cached_get(client, url, "feed:google_scholar", headers=USER_AGENT_HEADERS)
     except Exception as exc:
         log.debug("Google Scholar proxy fetch failed: %s", exc)
         return []
 
-    return _parse_google_scholar_html(response.text, limit)
+    return _indexed("research", _parse_google_scholar_html(body, limit))
 
 
 def _parse_google_scholar_html(html_text: str, limit: int) -> List[Dict[str, str]]:
@@ -211,7 +211,8 @@ def _parse_google_scholar_html(html_text: str, limit: int) -> List[Dict[str, str
                 "title": title,
                 "url": url,
                 "source": "Google Scholar",
-                "published_at": datetime.utcnow().isoformat(),
+                # Result pages carry no publication date; the fetch time would pass any ``since`` filter
+                "published_at": "",
                 "summary": snippet[:400],
                 "source_key": "google_scholar",
                 "source_weight": settings.news_source_weights.get("google_scholar", 0.1),
@@ -220,6 +221,15 @@ def _parse_google_scholar_html(html_text: str, limit: int) -> List[Dict[str, str
     return entries
 
 
+def _indexed(kind: str, items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Add fetched items to the local full-text index (best effort) and return them unchanged."""
+    try:
+        content_index.add_items(kind, items)
+    except Exception as exc:
+        log.debug("Content index ingest failed for %s items: %s", kind, exc)
+    return items
+
+
 def _strip_tags(text: str) -> str:
     cleaned = re.sub(r"<[^>]+>", "", text)
     return html.unescape(cleaned)
@@ -6,11 +6,15 @@ social volume, social dominance, and trending words.
 Reference: https://santiment.net/
 """
 import asyncio
+import re
 import httpx
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta, timezone
 from core.logging import log
 from core.settings.config import settings
+from core.telemetry.observability import track_external_call
+
+_GRAPHQL_FIELD = re.compile(r"\{\s*(\w+)")
 
 
 class SantimentAPIError(Exception):
@@ -100,13 +104,18 @@ class SantimentAPIClient:
         if variables:
             payload["variables"] = variables
         
+        field_match = _GRAPHQL_FIELD.search(query)
+        operation = field_match.group(1) if field_match else "query"
+        
         for attempt in range(self.retry_attempts):
             try:
-                response = await client.post(
-                    self.base_url,
-                    json=payload
-                )
-                response.raise_for_status()
+                with track_external_call("santiment", operation) as call:
+                    response = await client.post(
+                        self.base_url,
+                        json=payload
+                    )
+                    call["status"] = str(response.status_code)
+                    response.raise_for_status()
                 result = response.json()
                 
                 if result.get("errors"):
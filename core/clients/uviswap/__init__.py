@@ -6,6 +6,7 @@ from core.clients.uviswap.client import (
     UviSwapClientError,
     UniswapV4Client,
 )
+from core.clients.uviswap.async_client import AsyncUviSwapClient
 from core.models.chain import ChainConfig
 from core.clients.uviswap.swap import SwapPlan, SwapRequest
 from core.models.uviswap import (
@@ -22,6 +23,7 @@ __all__ = [
     "DEFAULT_PERMIT2",
     "ETHEREUM_MAINNET",
     "ROUTER_ADDRESSES",
+    "AsyncUviSwapClient",
     "ChainConfig",
     "SwapPlan",
     "SwapRequest",
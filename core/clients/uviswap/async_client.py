@@ -0,0 +1,292 @@
+"""AsyncWeb3 variant of the UviSwap client for async pipelines and toolkits.
+
+Every RPC round trip is awaited on one pooled aiohttp session, and
+``build_swap_plan`` issues its independent reads (quote, latest block,
+nonce, priority fee, balance) concurrently. The sync
+:class:`~core.clients.uviswap.client.UviSwapClient` stays the entry point
+for scripts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from eth_account import Account
+from web3 import Web3
+
+from core.clients.uviswap.client import UviSwapClientError, _UviSwapClientBase
+from core.clients.uviswap.gas import AsyncGasManager, build_gas_quote
+from core.clients.uviswap.permit2 import AsyncPermit2Client
+from core.clients.uviswap.pool_spy import AsyncPoolSpy, PoolSpy
+from core.clients.uviswap.quote import AsyncQuoter
+from core.clients.uviswap.routeur import Router
+from core.clients.uviswap.rpc import AsyncRPC
+from core.clients.uviswap.simulation import simulate_transaction_async
+from core.clients.uviswap.swap import SwapPlan, SwapRequest, compute_min_out
+from core.settings.config import (
+    DEFAULT_PERMIT2,
+    ROUTER_ADDRESSES,
+    UNIVERSAL_ROUTER_EXECUTE_ABI,
+    V3_QUOTER_ABI,
+    get_chain_config,
+    settings,
+)
+from core.logging import log
+
+
+class AsyncUviSwapClient(_UviSwapClientBase):
+    """Async universal-router client; build it with ``await AsyncUviSwapClient.create(...)``.
+
+    Use ``async with`` or ``aclose`` on the same event loop to release the
+    RPC session.
+    """
+
+    def __init__(
+        self,
+        rpc: AsyncRPC,
+        account: Any,
+        chain: str | None = None,
+        router_address: str | None = None,
+        quoter_address: str | None = None,
+        pool_manager_address: str | None = None,
+        permit2_address: str | None = None,
+        uniswap_subgraph_url: str | None = None,
+        pool_catalog: PoolSpy | None = None,
+    ) -> None:
+        self.account = account
+        self.address = Web3.to_checksum_address(self.account.address)
+        self.rpc = rpc
+        self.w3 = rpc.w3
+
+        self.chain = self._resolve_chain(chain)
+        self.chain_config = get_chain_config(self.chain)
+        resolved_router = router_address or (
+            self.chain_config.universal_router if self.chain_config else ROUTER_ADDRESSES.get(self.chain)
+        )
+        if not resolved_router:
+            raise UviSwapClientError(f"Unsupported chain '{self.chain}' and no router provided")
+
+        self.router_address = Web3.to_checksum_address(resolved_router)
+        self.router = Router(self.w3.eth.contract(address=self.router_address, abi=UNIVERSAL_ROUTER_EXECUTE_ABI))
+
+        self.quoter = None
+        resolved_quoter = quoter_address or (self.chain_config.quoter if self.chain_config else None)
+        if resolved_quoter:
+            q_contract = self.w3.eth.contract(address=Web3.to_checksum_address(resolved_quoter), abi=V3_QUOTER_ABI)
+            self.quoter = AsyncQuoter(self.w3, q_contract)
+
+        resolved_permit2 = permit2_address or (self.chain_config.permit2 if self.chain_config else DEFAULT_PERMIT2)
+        self.permit2 = AsyncPermit2Client(self.w3, resolved_permit2)
+        self.gas = AsyncGasManager(self.w3)
+        resolved_pool_manager = pool_manager_address or (self.chain_config.pool_manager if self.chain_config else None)
+        # The pool catalog is process-wide state; share the sync client's PoolSpy when both are in use
+        catalog = pool_catalog or PoolSpy(
+            Web3(),
+            resolved_pool_manager,
+            subgraph_url=uniswap_subgraph_url or settings.uniswap_subgraph_url,
+            redis_client=self._init_redis(),
+        )
+        self.pool_spy = AsyncPoolSpy(self.w3, catalog)
+
+        log.info(
+            f"AsyncUviSwapClient initialized chain={self.chain} chain_id={self.rpc.chain_id} "
+            f"wallet={self.address} router={self.router_address}"
+        )
+        self._validate_operation_support()
+
+    @classmethod
+    async def create(
+        cls,
+        private_key: str | None = None,
+        rpc_url: str | None = None,
+        chain: str | None = None,
+        router_address: str | None = None,
+        quoter_address: str | None = None,
+        pool_manager_address: str | None = None,
+        permit2_address: str | None = None,
+        uniswap_subgraph_url: str | None = None,
+        pool_catalog: PoolSpy | None = None,
+    ) -> "AsyncUviSwapClient":
+        resolved_private_key = private_key or settings.private_key
+        if not resolved_private_key:
+            raise UviSwapClientError("Missing private key: provide private_key or set PRIVATE_KEY in .env")
+
+        resolved_rpc = rpc_url or settings.eth_rpc_url
+        if not resolved_rpc:
+            raise UviSwapClientError("Missing RPC URL: provide rpc_url or set ETH_RPC_URL in .env")
+
+        rpc = await AsyncRPC(resolved_rpc).connect()
+        try:
+            return cls(
+                rpc,
+                Account.from_key(resolved_private_key),
+                chain=chain,
+                router_address=router_address,
+                quoter_address=quoter_address,
+                pool_manager_address=pool_manager_address,
+                permit2_address=permit2_address,
+                uniswap_subgraph_url=uniswap_subgraph_url,
+                pool_catalog=pool_catalog,
+            )
+        except Exception:
+            await rpc.close()
+            raise
+
+    async def aclose(self) -> None:
+        await self.rpc.close()
+
+    async def __aenter__(self) -> "AsyncUviSwapClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def quote_exact_in(self, token_in: str, token_out: str, amount_in: int, fee: int = 3_000) -> int:
+        if not self.quoter:
+            raise UviSwapClientError(
+                f"Quoter not configured for chain={self.chain}. "
+                "Pass quoter_address to client or register chain quoter in core/models/chain.py."
+            )
+        amount_out = await self.quoter.quote_exact_in(token_in, token_out, amount_in, fee=fee)
+        log.debug(
+            f"Quote token_in={token_in} token_out={token_out} "
+            f"amount_in={amount_in} amount_out={amount_out}"
+        )
+        return amount_out
+
+    async def discover_trade_pools(self, symbols: list[str], limit: int = 100) -> dict[str, Any]:
+        data = await self.pool_spy.discover_and_index_pools(symbols=symbols, limit=limit)
+        log.info(f"Discovered {data.get('pool_count', 0)} pools for symbols={symbols}")
+        return data
+
+    async def resolve_trade_pool(self, token_in_symbol: str, token_out_symbol: str) -> dict[str, Any]:
+        pool = await self.pool_spy.resolve_best_pool(token_in_symbol, token_out_symbol)
+        if not pool and not await self.pool_spy.is_known_missing(token_in_symbol, token_out_symbol):
+            discovered = await self.discover_trade_pools(symbols=[token_in_symbol, token_out_symbol], limit=100)
+            pool = await self.pool_spy.resolve_best_pool(token_in_symbol, token_out_symbol)
+            if not pool and not discovered.get("error"):
+                await self.pool_spy.mark_missing(token_in_symbol, token_out_symbol)
+        if not pool:
+            return {
+                "success": False,
+                "error": f"No pool found for {token_in_symbol}/{token_out_symbol}",
+            }
+        return {
+            "success": True,
+            "pool": pool.model_dump(),
+        }
+
+    async def inspect_pool(self, pool_address: str) -> dict[str, Any]:
+        return await self.pool_spy.inspect_with_fallback(pool_address)
+
+    async def _expected_out(self, request: SwapRequest) -> int:
+        if not self.quoter:
+            return 0
+        return await self.quote_exact_in(
+            token_in=request.token_in,
+            token_out=request.token_out,
+            amount_in=request.amount_in,
+            fee=request.fee,
+        )
+
+    async def build_swap_plan(
+        self,
+        request: SwapRequest,
+        commands: bytes,
+        inputs: list[bytes],
+        deadline_seconds: int = 300,
+        simulate: bool = True,
+    ) -> SwapPlan:
+        # Independent reads go out together; the latest block feeds both the deadline and the base fee
+        expected_out, block, nonce, priority_fee, balance = await asyncio.gather(
+            self._expected_out(request),
+            self.w3.eth.get_block("latest"),
+            self.rpc.nonce(self.address),
+            self.gas.priority_fee(),
+            self.w3.eth.get_balance(self.address),
+        )
+        min_out = compute_min_out(expected_out=expected_out, slippage_bps=request.slippage_bps)
+
+        gas_quote = build_gas_quote(block, priority_fee, request.estimated_gas_limit)
+        if int(balance) < gas_quote.max_cost:
+            raise UviSwapClientError("Insufficient native token balance for gas")
+
+        deadline = int(block["timestamp"]) + int(deadline_seconds)
+        calldata = self.router.encode_execute(commands=commands, inputs=inputs, deadline=deadline)
+        tx = self.router.build_swap_tx(
+            sender=self.address,
+            calldata=calldata,
+            nonce=nonce,
+            gas_params=gas_quote.to_tx_params(),
+            value=request.value,
+            chain_id=self.rpc.chain_id,
+        )
+
+        sim_ok = True
+        sim_result: Any = None
+        if simulate:
+            sim = await simulate_transaction_async(self.rpc, tx)
+            sim_ok = bool(sim.ok)
+            sim_result = sim.result
+
+        plan = SwapPlan(
+            request=request,
+            expected_out=expected_out,
+            min_out=min_out,
+            nonce=nonce,
+            calldata=calldata,
+            tx=tx,
+            simulation_ok=sim_ok,
+            simulation_result=sim_result,
+        )
+
+        log.info(
+            f"Built swap plan token_in={request.token_in} token_out={request.token_out} "
+            f"amount_in={request.amount_in} min_out={min_out} sim_ok={sim_ok}"
+        )
+        return plan
+
+    async def execute_plan(self, plan: SwapPlan, require_simulation_success: bool = True) -> str:
+        if require_simulation_success and not plan.simulation_ok:
+            raise UviSwapClientError(f"Simulation failed: {plan.simulation_result}")
+
+        signed = self.w3.eth.account.sign_transaction(plan.tx, private_key=self.account.key)
+        raw_tx = getattr(signed, "rawTransaction", None) or getattr(signed, "raw_transaction", None)
+        if raw_tx is None:
+            raise UviSwapClientError("Signed transaction has no raw payload")
+        tx_hash = await self.rpc.send_raw(raw_tx)
+        tx_hex = tx_hash.hex()
+
+        log.info(f"Broadcasted swap tx hash={tx_hex} nonce={plan.nonce}")
+        explorer_url = self.get_explorer_tx_url(tx_hex)
+        if explorer_url:
+            log.info(f"Swap tx explorer url={explorer_url}")
+        return tx_hex
+
+    async def approve_permit2_if_needed(self, token: str, min_allowance: int | None = None) -> str | None:
+        needs_approval = await self.permit2.needs_erc20_approval(
+            owner=self.address,
+            token=token,
+            min_allowance=min_allowance,
+        )
+        if not needs_approval:
+            return None
+
+        nonce, gas_quote = await asyncio.gather(self.rpc.nonce(self.address), self.gas.aggressive_fast(80_000))
+        tx = await self.permit2.build_erc20_approve_tx(
+            token=token,
+            owner=self.address,
+            nonce=nonce,
+            gas_params=gas_quote.to_tx_params(),
+            chain_id=self.rpc.chain_id,
+        )
+
+        signed = self.w3.eth.account.sign_transaction(tx, private_key=self.account.key)
+        raw_tx = getattr(signed, "rawTransaction", None) or getattr(signed, "raw_transaction", None)
+        if raw_tx is None:
+            raise UviSwapClientError("Signed approval transaction has no raw payload")
+        tx_hash = await self.rpc.send_raw(raw_tx)
+        tx_hex = tx_hash.hex()
+        log.info(f"Broadcasted Permit2 ERC20 approval tx hash={tx_hex} token={token}")
+        return tx_hex
@@ -17,7 +17,9 @@ from core.clients.uviswap.gas import GasManager
 from core.models.uviswap import MarketContextModel
 from core.clients.uviswap.permit2 import Permit2Client
 from core.clients.uviswap.pool_spy import PoolSpy
+from core.clients.uviswap.pool_state import V3PoolStateCache, V3PoolStateLoader
 from core.clients.uviswap.quote import Quoter
+from core.clients.uviswap.route_search import RouteFinder, RouteSearchError
 from core.clients.uviswap.routeur import Router
 from core.clients.uviswap.rpc import RPC
 from core.clients.uviswap.simulation import simulate_transaction
@@ -40,7 +42,63 @@ class UviSwapClientError(Exception):
     """Raised for UviSwap client failures."""
 
 
-class UviSwapClient:
+class _UviSwapClientBase:
+    """Chain resolution, Redis and explorer helpers shared by the sync and async clients."""
+
+    rpc: Any
+    chain: str
+    chain_config: Any
+    quoter: Any
+    address: str
+
+    def _resolve_chain(self, chain: str | None) -> str:
+        if chain:
+            return chain.strip().lower()
+        inferred = CHAIN_BY_ID.get(self.rpc.chain_id)
+        if inferred:
+            log.info(f"Inferred chain from chain_id chain_id={self.rpc.chain_id} chain={inferred}")
+            return inferred
+        log.warning(f"Unsupported chain_id={self.rpc.chain_id}; defaulting chain=ethereum")
+        return "ethereum"
+
+    def _init_redis(self):
+        try:
+            client = Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                decode_responses=True,
+            )
+            client.ping()
+            return client
+        except Exception as exc:
+            log.warning(f"UviSwapClient Redis unavailable: {exc}")
+            return None
+
+    def _validate_operation_support(self) -> None:
+        if not self.chain_config:
+            log.warning(f"No chain config registered for chain={self.chain}; feature validation is limited")
+            return
+        if not self.chain_config.pool_manager:
+            log.warning(f"No pool_manager configured for chain={self.chain}; pool discovery may be limited")
+        if not self.chain_config.quoter and not self.quoter:
+            log.warning(f"No quoter configured for chain={self.chain}; quoting APIs will be disabled")
+        if not self.chain_config.explorer_base_url:
+            log.warning(f"No explorer configured for chain={self.chain}; explorer URLs will be unavailable")
+
+    def get_explorer_tx_url(self, tx_hash: str) -> str | None:
+        if not self.chain_config:
+            return None
+        return self.chain_config.explorer_tx_url(tx_hash)
+
+    def get_explorer_address_url(self, address: str | None = None) -> str | None:
+        if not self.chain_config:
+            return None
+        target_address = address or self.address
+        return self.chain_config.explorer_address_url(target_address)
+
+
+class UviSwapClient(_UviSwapClientBase):
     """Production-safe Uniswap universal-router client."""
 
     def __init__(
@@ -104,6 +162,17 @@ class UviSwapClient:
             subgraph_url=uniswap_subgraph_url or settings.uniswap_subgraph_url,
             redis_client=self._redis,
         )
+        self.pool_states = V3PoolStateCache(V3PoolStateLoader(self.w3))
+        self.route_finder = (
+            RouteFinder(
+                self.w3,
+                self.quoter.contract,
+                self.pool_spy,
+                pool_states=self.pool_states if settings.uviswap_local_quotes_enabled else None,
+            )
+            if self.quoter
+            else None
+        )
         self.polywhaler_url = polywhaler_url or settings.polywhaler_market_data_url or DEFAULT_POLYWHALER_URL
 
         log.info(
@@ -112,52 +181,6 @@ class UviSwapClient:
         )
         self._validate_operation_support()
 
-    def _resolve_chain(self, chain: str | None) -> str:
-        if chain:
-            return chain.strip().lower()
-        inferred = CHAIN_BY_ID.get(self.rpc.chain_id)
-        if inferred:
-            log.info(f"Inferred chain from chain_id chain_id={self.rpc.chain_id} chain={inferred}")
-            return inferred
-        log.warning(f"Unsupported chain_id={self.rpc.chain_id}; defaulting chain=ethereum")
-        return "ethereum"
-
-    def _init_redis(self):
-        try:
-            client = Redis(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                db=settings.redis_db,
-                decode_responses=True,
-            )
-            client.ping()
-            return client
-        except Exception as exc:
-            log.warning(f"UviSwapClient Redis unavailable: {exc}")
-            return None
-
-    def _validate_operation_support(self) -> None:
-        if not self.chain_config:
-            log.warning(f"No chain config registered for chain={self.chain}; feature validation is limited")
-            return
-        if not self.chain_config.pool_manager:
-            log.warning(f"No pool_manager configured for chain={self.chain}; pool discovery may be limited")
-        if not self.chain_config.quoter and not self.quoter:
-            log.warning(f"No quoter configured for chain={self.chain}; quoting APIs will be disabled")
-        if not self.chain_config.explorer_base_url:
-            log.warning(f"No explorer configured for chain={self.chain}; explorer URLs will be unavailable")
-
-    def get_explorer_tx_url(self, tx_hash: str) -> str | None:
-        if not self.chain_config:
-            return None
-        return self.chain_config.explorer_tx_url(tx_hash)
-
-    def get_explorer_address_url(self, address: str | None = None) -> str | None:
-        if not self.chain_config:
-            return None
-        target_address = address or self.address
-        return self.chain_config.explorer_address_url(target_address)
-
     def quote_exact_in(self, token_in: str, token_out: str, amount_in: int, fee: int = 3_000) -> int:
         if not self.quoter:
             raise UviSwapClientError(
@@ -171,6 +194,45 @@ class UviSwapClient:
         )
         return amount_out
 
+    def find_best_route(
+        self,
+        token_in_symbol: str,
+        token_out_symbol: str,
+        amount_in: int,
+        token_in: str | None = None,
+        token_out: str | None = None,
+    ) -> dict[str, Any]:
+        if not self.route_finder:
+            raise UviSwapClientError(f"Quoter not configured for chain={self.chain}; route search is unavailable")
+        try:
+            route = self.route_finder.find_best_route(
+                token_in_symbol=token_in_symbol,
+                token_out_symbol=token_out_symbol,
+                amount_in=int(amount_in),
+                token_in=token_in,
+                token_out=token_out,
+            )
+        except RouteSearchError as exc:
+            raise UviSwapClientError(str(exc)) from exc
+        best = route["best"]
+        log.info(
+            f"Best route {best['route']} amount_in={amount_in} amount_out={best['amount_out']} "
+            f"gas_estimate={best['gas_estimate']} candidates={route['candidates']}"
+        )
+        return route
+
+    def simulate_pool_swap(
+        self,
+        pool_address: str,
+        token_in: str,
+        amount: int,
+        exact_in: bool = True,
+    ) -> dict[str, Any]:
+        """Quote a single V3 pool locally from cached state (no quoter call)."""
+        state = self.pool_states.get(pool_address)
+        result = state.quote_exact_in(token_in, amount) if exact_in else state.quote_exact_out(token_in, amount)
+        return {"pool": state.address, "block": state.block, "exact_in": exact_in, **result.to_dict()}
+
     def discover_trade_pools(self, symbols: list[str], limit: int = 100) -> dict[str, Any]:
         if not self.chain_config or not self.chain_config.pool_manager:
             log.warning(
@@ -183,9 +245,13 @@ class UviSwapClient:
 
     def resolve_trade_pool(self, token_in_symbol: str, token_out_symbol: str) -> dict[str, Any]:
         pool = self.pool_spy.resolve_best_pool(token_in_symbol=token_in_symbol, token_out_symbol=token_out_symbol)
-        if not pool:
-            self.discover_trade_pools(symbols=[token_in_symbol, token_out_symbol], limit=100)
+        if not pool and not self.pool_spy.is_known_missing(token_in_symbol, token_out_symbol):
+            # Targeted discovery for just this pair; a miss is cached so retries stay local,
+            # but only when the subgraph actually answered
+            discovered = self.discover_trade_pools(symbols=[token_in_symbol, token_out_symbol], limit=100)
             pool = self.pool_spy.resolve_best_pool(token_in_symbol=token_in_symbol, token_out_symbol=token_out_symbol)
+            if not pool and not discovered.get("error"):
+                self.pool_spy.mark_missing(token_in_symbol, token_out_symbol)
         if not pool:
             return {
                 "success": False,
@@ -212,12 +278,7 @@ class UviSwapClient:
         try:
             from api.services.polymarket.decision_service import decision_service
 
-            symbol = token_symbol.upper()
-            for decision in decision_service.list_decisions(limit=500):
-                market_name = str(decision.get("market_name", "")).upper()
-                asset = str(decision.get("asset", "")).upper()
-                if symbol == asset or symbol in market_name:
-                    return decision
+            return decision_service.latest_for_asset(token_symbol)
         except Exception as exc:
             log.debug(f"Polymarket decision lookup unavailable: {exc}")
         return None
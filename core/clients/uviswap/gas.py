@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
+DEFAULT_PRIORITY_FEE = 1_500_000_000
+
 
 @dataclass(frozen=True)
 class GasQuote:
@@ -20,6 +23,22 @@ class GasQuote:
             "type": self.tx_type,
         }
 
+    @property
+    def max_cost(self) -> int:
+        return int(self.gas) * int(self.max_fee_per_gas)
+
+
+def build_gas_quote(block: dict, priority_fee: int, gas_limit: int, multiplier: float = 1.15) -> GasQuote:
+    """Boost the node's priority fee and cap the max fee off the latest base fee."""
+    base_fee = int(block.get("baseFeePerGas", 0) or 0)
+    boosted_priority = max(int(priority_fee * multiplier), 1)
+    max_fee = max(int(base_fee * multiplier + boosted_priority), boosted_priority)
+    return GasQuote(
+        gas=int(gas_limit),
+        max_priority_fee_per_gas=boosted_priority,
+        max_fee_per_gas=max_fee,
+    )
+
 
 class GasManager:
     def __init__(self, w3) -> None:
@@ -27,23 +46,35 @@ class GasManager:
 
     def aggressive_fast(self, gas_limit: int, multiplier: float = 1.15) -> GasQuote:
         block = self.w3.eth.get_block("latest")
-        base_fee = int(block.get("baseFeePerGas", 0) or 0)
 
         try:
             priority = int(self.w3.eth.max_priority_fee)
         except Exception:
-            priority = 1_500_000_000
+            priority = DEFAULT_PRIORITY_FEE
 
-        boosted_priority = max(int(priority * multiplier), 1)
-        max_fee = max(int(base_fee * multiplier + boosted_priority), boosted_priority)
-
-        return GasQuote(
-            gas=int(gas_limit),
-            max_priority_fee_per_gas=boosted_priority,
-            max_fee_per_gas=max_fee,
-        )
+        return build_gas_quote(block, priority, gas_limit, multiplier)
 
     def has_balance_for_gas(self, sender: str, gas_quote: GasQuote) -> bool:
         balance = int(self.w3.eth.get_balance(sender))
-        estimated = int(gas_quote.gas) * int(gas_quote.max_fee_per_gas)
-        return balance >= estimated
+        return balance >= gas_quote.max_cost
+
+
+class AsyncGasManager:
+    """AsyncWeb3 counterpart of :class:`GasManager`; block and priority fee are read concurrently."""
+
+    def __init__(self, w3) -> None:
+        self.w3 = w3
+
+    async def priority_fee(self) -> int:
+        try:
+            return int(await self.w3.eth.max_priority_fee)
+        except Exception:
+            return DEFAULT_PRIORITY_FEE
+
+    async def aggressive_fast(self, gas_limit: int, multiplier: float = 1.15) -> GasQuote:
+        block, priority = await asyncio.gather(self.w3.eth.get_block("latest"), self.priority_fee())
+        return build_gas_quote(block, priority, gas_limit, multiplier)
+
+    async def has_balance_for_gas(self, sender: str, gas_quote: GasQuote) -> bool:
+        balance = int(await self.w3.eth.get_balance(sender))
+        return balance >= gas_quote.max_cost
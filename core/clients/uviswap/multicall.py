@@ -0,0 +1,38 @@
+"""Multicall3 batching for read-only contract calls."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from web3 import Web3
+
+from core.settings.config import MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+
+def encode_call(contract: Any, fn_name: str, args: list[Any]) -> bytes:
+    """ABI-encoded calldata for ``contract.fn_name(*args)`` across web3 versions."""
+    if hasattr(contract, "encode_abi"):
+        data = contract.encode_abi(fn_name, args=args)
+    else:
+        data = contract.encodeABI(fn_name=fn_name, args=args)
+    return bytes.fromhex(data.removeprefix("0x")) if isinstance(data, str) else bytes(data)
+
+
+class Multicall:
+    """Thin wrapper over Multicall3 ``aggregate3``."""
+
+    def __init__(self, w3: Web3, address: str = MULTICALL3_ADDRESS) -> None:
+        self.contract = w3.eth.contract(address=Web3.to_checksum_address(address), abi=MULTICALL3_ABI)
+
+    def aggregate(
+        self,
+        calls: list[tuple[str, bytes]],
+        allow_failure: bool = True,
+        block_identifier: int | str = "latest",
+    ) -> list[tuple[bool, bytes]]:
+        """Run ``(target, calldata)`` calls in one ``eth_call``; returns ``(success, return_data)`` per call."""
+        if not calls:
+            return []
+        payload = [(target, allow_failure, data) for target, data in calls]
+        results = self.contract.functions.aggregate3(payload).call(block_identifier=block_identifier)
+        return [(bool(success), bytes(data)) for success, data in results]
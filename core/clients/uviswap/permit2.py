@@ -111,3 +111,55 @@ class Permit2Client:
         if chain_id is not None:
             tx["chainId"] = int(chain_id)
         return tx
+
+
+class AsyncPermit2Client:
+    """AsyncWeb3 counterpart of :class:`Permit2Client`."""
+
+    def __init__(self, w3, permit2_address: str) -> None:
+        self.w3 = w3
+        self.address = Web3.to_checksum_address(permit2_address)
+        self.contract = self.w3.eth.contract(address=self.address, abi=PERMIT2_ABI)
+
+    async def get_allowance(self, owner: str, token: str, spender: str) -> Permit2Allowance:
+        try:
+            amount, expiration, nonce = await self.contract.functions.allowance(
+                Web3.to_checksum_address(owner),
+                Web3.to_checksum_address(token),
+                Web3.to_checksum_address(spender),
+            ).call()
+            return Permit2Allowance(amount=int(amount), expiration=int(expiration), nonce=int(nonce))
+        except Exception as exc:
+            raise Permit2Error(f"Failed to read Permit2 allowance: {exc}") from exc
+
+    async def needs_erc20_approval(self, owner: str, token: str, min_allowance: int | None = None) -> bool:
+        token_contract = self.w3.eth.contract(address=Web3.to_checksum_address(token), abi=ERC20_APPROVE_ABI)
+        current_allowance = int(await token_contract.functions.allowance(
+            Web3.to_checksum_address(owner),
+            self.address,
+        ).call())
+
+        threshold = int(min_allowance) if min_allowance is not None else (2**200)
+        return current_allowance < threshold
+
+    async def build_erc20_approve_tx(
+        self,
+        token: str,
+        owner: str,
+        nonce: int,
+        gas_params: dict[str, int],
+        amount: int | None = None,
+        chain_id: int | None = None,
+    ) -> dict[str, int | str]:
+        token_contract = self.w3.eth.contract(address=Web3.to_checksum_address(token), abi=ERC20_APPROVE_ABI)
+        max_amount = int(amount) if amount is not None else (2**256 - 1)
+        params: dict[str, int | str] = {
+            "from": Web3.to_checksum_address(owner),
+            "nonce": int(nonce),
+            "value": 0,
+            **gas_params,
+        }
+        if chain_id is not None:
+            # Known chain id spares build_transaction an eth_chainId round trip
+            params["chainId"] = int(chain_id)
+        return await token_contract.functions.approve(self.address, max_amount).build_transaction(params)
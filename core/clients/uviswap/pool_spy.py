@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import json
+import threading
+import time
 from typing import Any
 
 import httpx
@@ -11,6 +14,7 @@ from web3 import Web3
 
 from core.models.uviswap import PoolModel, PoolSelectionModel
 from core.logging import log
+from core.settings.config import settings
 
 
 V3_POOL_ABI = [
@@ -34,11 +38,99 @@ V3_POOL_ABI = [
     {"inputs": [], "name": "token1", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"},
     {"inputs": [], "name": "fee", "outputs": [{"internalType": "uint24", "name": "", "type": "uint24"}], "stateMutability": "view", "type": "function"},
     {"inputs": [], "name": "tickSpacing", "outputs": [{"internalType": "int24", "name": "", "type": "int24"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [{"internalType": "int16", "name": "wordPosition", "type": "int16"}], "name": "tickBitmap", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"},
+    {
+        "inputs": [{"internalType": "int24", "name": "tick", "type": "int24"}],
+        "name": "ticks",
+        "outputs": [
+            {"internalType": "uint128", "name": "liquidityGross", "type": "uint128"},
+            {"internalType": "int128", "name": "liquidityNet", "type": "int128"},
+            {"internalType": "uint256", "name": "feeGrowthOutside0X128", "type": "uint256"},
+            {"internalType": "uint256", "name": "feeGrowthOutside1X128", "type": "uint256"},
+            {"internalType": "int56", "name": "tickCumulativeOutside", "type": "int56"},
+            {"internalType": "uint160", "name": "secondsPerLiquidityOutsideX128", "type": "uint160"},
+            {"internalType": "uint32", "name": "secondsOutside", "type": "uint32"},
+            {"internalType": "bool", "name": "initialized", "type": "bool"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "sender", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "recipient", "type": "address"},
+            {"indexed": False, "internalType": "int256", "name": "amount0", "type": "int256"},
+            {"indexed": False, "internalType": "int256", "name": "amount1", "type": "int256"},
+            {"indexed": False, "internalType": "uint160", "name": "sqrtPriceX96", "type": "uint160"},
+            {"indexed": False, "internalType": "uint128", "name": "liquidity", "type": "uint128"},
+            {"indexed": False, "internalType": "int24", "name": "tick", "type": "int24"},
+        ],
+        "name": "Swap",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": False, "internalType": "address", "name": "sender", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
+            {"indexed": True, "internalType": "int24", "name": "tickLower", "type": "int24"},
+            {"indexed": True, "internalType": "int24", "name": "tickUpper", "type": "int24"},
+            {"indexed": False, "internalType": "uint128", "name": "amount", "type": "uint128"},
+            {"indexed": False, "internalType": "uint256", "name": "amount0", "type": "uint256"},
+            {"indexed": False, "internalType": "uint256", "name": "amount1", "type": "uint256"},
+        ],
+        "name": "Mint",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "owner", "type": "address"},
+            {"indexed": True, "internalType": "int24", "name": "tickLower", "type": "int24"},
+            {"indexed": True, "internalType": "int24", "name": "tickUpper", "type": "int24"},
+            {"indexed": False, "internalType": "uint128", "name": "amount", "type": "uint128"},
+            {"indexed": False, "internalType": "uint256", "name": "amount0", "type": "uint256"},
+            {"indexed": False, "internalType": "uint256", "name": "amount1", "type": "uint256"},
+        ],
+        "name": "Burn",
+        "type": "event",
+    },
 ]
 
 
+POOL_FIELDS = """
+                id
+                createdAtTimestamp
+                createdAtBlockNumber
+                txCount
+                volumeUSD
+                totalValueLockedUSD
+                feeTier
+                token0 { id symbol }
+                token1 { id symbol }
+"""
+# Both tokens of a pool must be among the tracked symbols
+SYMBOL_FILTER = """
+                  and: [
+                    { token0_: { symbol_in: $symbols } },
+                    { token1_: { symbol_in: $symbols } }
+                  ]
+"""
+DELTA_PAGE_SIZE = 1_000
+
+
 class PoolSpy:
-    """Read-only pool inspection + discovery utility."""
+    """Read-only pool inspection + discovery utility.
+
+    Discovered pools are kept in an incremental catalog keyed by pool id.
+    ``discover_and_index_pools`` only queries the subgraph for symbol sets it
+    has not covered yet; ``refresh`` pulls pools created after the catalog's
+    block watermark and re-reads TVL/volume of known pools, and can run on a
+    background thread (``start_refresher``). Index keys are written to Redis
+    in one pipeline with a TTL, and pairs with no pool are negatively cached
+    so trade-path lookups never trigger repeated rediscovery.
+    """
 
     def __init__(
         self,
@@ -47,6 +139,9 @@ class PoolSpy:
         subgraph_url: str | None = None,
         redis_client: Any | None = None,
         timeout_seconds: float = 15.0,
+        refresh_seconds: float | None = None,
+        index_ttl_seconds: int | None = None,
+        missing_ttl_seconds: int | None = None,
     ) -> None:
         self.w3 = w3
         self.pool_manager_address = (
@@ -57,9 +152,33 @@ class PoolSpy:
         self.subgraph_url = subgraph_url
         self.redis_client = redis_client
         self.timeout_seconds = timeout_seconds
+        self.refresh_seconds = float(
+            refresh_seconds if refresh_seconds is not None else settings.uviswap_pool_refresh_seconds
+        )
+        self.index_ttl_seconds = int(
+            index_ttl_seconds if index_ttl_seconds is not None else settings.uviswap_pool_index_ttl_seconds
+        )
+        self.missing_ttl_seconds = int(
+            missing_ttl_seconds if missing_ttl_seconds is not None else settings.uviswap_pool_missing_ttl_seconds
+        )
         self._pool_index: dict[str, list[PoolSelectionModel]] = {}
+        self._pools: dict[str, PoolModel] = {}
+        self._key_members: dict[str, set[str]] = {}
+        self._tracked_symbols: set[str] = set()
+        self._covered: dict[frozenset[str], float] = {}
+        self._missing: dict[str, float] = {}
+        self._watermark = 0
+        self._last_refresh: float | None = None
+        self._lock = threading.RLock()
+        self._refresh_guard = threading.Lock()
+        self._refresher: threading.Thread | None = None
+        self._stop_refresher = threading.Event()
+        self._catalog_loaded = False
+        self._stats = {"fetches": 0, "refreshes": 0, "new_pools": 0, "updated_pools": 0, "missing_hits": 0}
         self._redis_pair_prefix = "uviswap:pools:pair:"
         self._redis_symbol_prefix = "uviswap:pools:symbol:"
+        self._redis_missing_prefix = "uviswap:pools:missing:"
+        self._redis_catalog_key = "uviswap:pools:catalog"
 
     def inspect_v3_pool(self, pool_address: str) -> dict[str, Any]:
         pool = self.w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=V3_POOL_ABI)
@@ -91,7 +210,17 @@ class PoolSpy:
                 "error": str(exc),
             }
 
+    def _query_pools(self, query: str, variables: dict[str, Any]) -> list[PoolModel]:
+        with httpx.Client(timeout=self.timeout_seconds) as client:
+            response = client.post(self.subgraph_url, json={"query": query, "variables": variables})
+            response.raise_for_status()
+            payload = response.json()
+        self._stats["fetches"] += 1
+        raw_pools = (payload.get("data") or {}).get("pools") or []
+        return [PoolModel.model_validate(pool) for pool in raw_pools]
+
     def fetch_pools(self, symbols: list[str], limit: int = 100) -> list[PoolModel]:
+        """Top pools between ``symbols`` by TVL; subgraph errors propagate to the caller."""
         if not self.subgraph_url:
             log.warning("PoolSpy subgraph_url not configured; returning empty pool list")
             return []
@@ -100,46 +229,47 @@ class PoolSpy:
         if not normalized_symbols:
             return []
 
-        graphql_query = {
-            "query": """
-            query PoolsBySymbols($symbols: [String!], $first: Int!) {
+        query = f"""
+            query PoolsBySymbols($symbols: [String!], $first: Int!) {{
               pools(
                 first: $first,
                 orderBy: totalValueLockedUSD,
                 orderDirection: desc,
-                where: {
-                  and: [
-                    { token0_: { symbol_in: $symbols } },
-                    { token1_: { symbol_in: $symbols } }
-                  ]
-                }
-              ) {
-                id
-                createdAtTimestamp
-                createdAtBlockNumber
-                txCount
-                volumeUSD
-                totalValueLockedUSD
-                token0 { id symbol }
-                token1 { id symbol }
-              }
-            }
-            """,
-            "variables": {"symbols": normalized_symbols, "first": int(limit)},
-        }
+                where: {{{SYMBOL_FILTER}                }}
+              ) {{{POOL_FIELDS}              }}
+            }}
+            """
+        return self._query_pools(query, {"symbols": normalized_symbols, "first": int(limit)})
 
-        try:
-            with httpx.Client(timeout=self.timeout_seconds) as client:
-                response = client.post(self.subgraph_url, json=graphql_query)
-                response.raise_for_status()
-                payload = response.json()
-
-            raw_pools = (payload.get("data") or {}).get("pools") or []
-            pools = [PoolModel.model_validate(pool) for pool in raw_pools]
-            return pools
-        except Exception as exc:
-            log.warning(f"PoolSpy fetch_pools failed: {exc}")
-            return []
+    def fetch_new_pools(self, symbols: list[str], since_block: int) -> list[PoolModel]:
+        """Pools between ``symbols`` created after ``since_block``, oldest first."""
+        query = f"""
+            query NewPools($symbols: [String!], $since: BigInt!, $first: Int!) {{
+              pools(
+                first: $first,
+                orderBy: createdAtBlockNumber,
+                orderDirection: asc,
+                where: {{
+                  createdAtBlockNumber_gt: $since,{SYMBOL_FILTER}                }}
+              ) {{{POOL_FIELDS}              }}
+            }}
+            """
+        return self._query_pools(
+            query, {"symbols": sorted(symbols), "since": str(int(since_block)), "first": DELTA_PAGE_SIZE}
+        )
+
+    def fetch_pools_by_id(self, pool_ids: list[str]) -> list[PoolModel]:
+        """Current TVL/volume for already-known pools, in pages of ``DELTA_PAGE_SIZE``."""
+        query = f"""
+            query PoolsById($ids: [ID!], $first: Int!) {{
+              pools(first: $first, where: {{ id_in: $ids }}) {{{POOL_FIELDS}              }}
+            }}
+            """
+        pools: list[PoolModel] = []
+        for start in range(0, len(pool_ids), DELTA_PAGE_SIZE):
+            page = pool_ids[start : start + DELTA_PAGE_SIZE]
+            pools.extend(self._query_pools(query, {"ids": page, "first": len(page)}))
+        return pools
 
     @staticmethod
     def format_pool_report(pools: list[PoolModel]) -> str:
@@ -159,64 +289,94 @@ class PoolSpy:
             )
         return output
 
-    def build_pool_index(self, pools: list[PoolModel]) -> dict[str, list[PoolSelectionModel]]:
-        index: dict[str, list[PoolSelectionModel]] = {}
+    @staticmethod
+    def _selection(pool: PoolModel) -> PoolSelectionModel:
+        return PoolSelectionModel(
+            pair=pool.pair_symbol,
+            pool_address=pool.id,
+            token0_symbol=pool.token0.symbol.upper(),
+            token0_address=pool.token0.id,
+            token1_symbol=pool.token1.symbol.upper(),
+            token1_address=pool.token1.id,
+            tvl_usd=float(pool.totalValueLockedUSD),
+            volume_usd=float(pool.volumeUSD),
+            tx_count=int(pool.txCount),
+            created_at=pool.created_at_iso,
+            fee_tier=pool.feeTier,
+        )
 
-        for pool in pools:
-            selection = PoolSelectionModel(
-                pair=pool.pair_symbol,
-                pool_address=pool.id,
-                token0_symbol=pool.token0.symbol.upper(),
-                token0_address=pool.token0.id,
-                token1_symbol=pool.token1.symbol.upper(),
-                token1_address=pool.token1.id,
-                tvl_usd=float(pool.totalValueLockedUSD),
-                volume_usd=float(pool.volumeUSD),
-                tx_count=int(pool.txCount),
-                created_at=pool.created_at_iso,
-            )
+    @staticmethod
+    def _index_keys(selection: PoolSelectionModel) -> set[str]:
+        return {
+            f"{selection.token0_symbol}/{selection.token1_symbol}",
+            f"{selection.token1_symbol}/{selection.token0_symbol}",
+            selection.token0_symbol,
+            selection.token1_symbol,
+        }
 
-            keys = {
-                pool.pair_symbol,
-                f"{selection.token1_symbol}/{selection.token0_symbol}",
-                selection.token0_symbol,
-                selection.token1_symbol,
-            }
-            for key in keys:
-                index.setdefault(key, []).append(selection)
+    @staticmethod
+    def _missing_key(token_a_symbol: str, token_b_symbol: str) -> str:
+        return "/".join(sorted((token_a_symbol.upper(), token_b_symbol.upper())))
 
-        for key in index:
-            index[key].sort(key=lambda x: (x.tvl_usd, x.volume_usd, x.tx_count), reverse=True)
+    def build_pool_index(self, pools: list[PoolModel]) -> dict[str, list[PoolSelectionModel]]:
+        """Merge ``pools`` into the catalog and persist the index keys they touch."""
+        self.upsert_pools(pools)
+        return self._pool_index
+
+    def upsert_pools(self, pools: list[PoolModel]) -> set[str]:
+        """Insert or update pools by id; returns the index keys that changed."""
+        changed: set[str] = set()
+        with self._lock:
+            selections: dict[str, PoolSelectionModel] = {}
+            for pool in pools:
+                pool_id = pool.id.lower()
+                previous = self._pools.get(pool_id)
+                if previous is not None and previous == pool:
+                    continue
+                self._pools[pool_id] = pool
+                self._watermark = max(self._watermark, int(pool.createdAtBlockNumber))
+                selection = self._selection(pool)
+                selections[pool_id] = selection
+                for key in self._index_keys(selection):
+                    self._key_members.setdefault(key, set()).add(pool_id)
+                    changed.add(key)
+                self._missing.pop(self._missing_key(selection.token0_symbol, selection.token1_symbol), None)
 
-        self._pool_index = index
+            for key in changed:
+                by_id = {item.pool_address.lower(): item for item in self._pool_index.get(key, [])}
+                by_id.update({pool_id: selections[pool_id] for pool_id in self._key_members[key] if pool_id in selections})
+                self._pool_index[key] = sorted(
+                    by_id.values(), key=lambda x: (x.tvl_usd, x.volume_usd, x.tx_count), reverse=True
+                )
+            index = {key: self._pool_index[key] for key in changed}
         self._persist_pool_index(index)
-        return index
+        return changed
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._redis_pair_prefix}{key}" if "/" in key else f"{self._redis_symbol_prefix}{key}"
 
     def _persist_pool_index(self, index: dict[str, list[PoolSelectionModel]]) -> None:
-        if not self.redis_client:
+        if not self.redis_client or not index:
             return
         try:
+            pipe = self.redis_client.pipeline(transaction=False)
             for key, selections in index.items():
                 payload = json.dumps([item.model_dump() for item in selections])
-                redis_key = (
-                    f"{self._redis_pair_prefix}{key}"
-                    if "/" in key
-                    else f"{self._redis_symbol_prefix}{key}"
-                )
-                self.redis_client.set(redis_key, payload)
+                pipe.set(self._redis_key(key), payload, ex=self.index_ttl_seconds)
+            pairs = {key for key in index if "/" in key}
+            if pairs:
+                pipe.delete(*(f"{self._redis_missing_prefix}{self._missing_key(*key.split('/', 1))}" for key in pairs))
+            catalog = {"symbols": sorted(self._tracked_symbols), "watermark": self._watermark}
+            pipe.set(self._redis_catalog_key, json.dumps(catalog), ex=self.index_ttl_seconds)
+            pipe.execute()
         except Exception as exc:
             log.warning(f"Failed to persist pool index to Redis: {exc}")
 
     def _load_index_candidates_from_redis(self, key: str) -> list[PoolSelectionModel]:
         if not self.redis_client:
             return []
-        redis_key = (
-            f"{self._redis_pair_prefix}{key}"
-            if "/" in key
-            else f"{self._redis_symbol_prefix}{key}"
-        )
         try:
-            raw = self.redis_client.get(redis_key)
+            raw = self.redis_client.get(self._redis_key(key))
             if not raw:
                 return []
             data = json.loads(raw)
@@ -225,16 +385,189 @@ class PoolSpy:
             log.debug(f"Failed loading pool candidates from Redis for key={key}: {exc}")
             return []
 
+    def _load_catalog_from_redis(self) -> None:
+        """Seed tracked symbols and the block watermark persisted by a previous process."""
+        if self._catalog_loaded:
+            return
+        self._catalog_loaded = True
+        if not self.redis_client:
+            return
+        try:
+            raw = self.redis_client.get(self._redis_catalog_key)
+            catalog = json.loads(raw) if raw else {}
+        except Exception as exc:
+            log.debug(f"Failed loading pool catalog from Redis: {exc}")
+            return
+        symbols = {str(symbol).upper() for symbol in catalog.get("symbols") or []}
+        with self._lock:
+            for symbol in symbols:
+                for selection in self._load_index_candidates_from_redis(symbol):
+                    pool_id = selection.pool_address.lower()
+                    for key in self._index_keys(selection):
+                        members = self._key_members.setdefault(key, set())
+                        if pool_id not in members:
+                            members.add(pool_id)
+                            self._pool_index.setdefault(key, []).append(selection)
+            for key in self._pool_index:
+                self._pool_index[key].sort(key=lambda x: (x.tvl_usd, x.volume_usd, x.tx_count), reverse=True)
+            self._tracked_symbols |= symbols
+            self._watermark = max(self._watermark, int(catalog.get("watermark") or 0))
+        if symbols:
+            log.info(f"[POOL CATALOG] Restored {len(symbols)} symbols from Redis watermark={self._watermark}")
+
+    def _catalog_view(self, symbols: set[str], limit: int) -> list[PoolModel]:
+        """Catalog pools whose tokens are both in ``symbols``, most liquid first (the subgraph's order)."""
+        with self._lock:
+            pools = [
+                pool
+                for pool in self._pools.values()
+                if pool.token0.symbol.upper() in symbols and pool.token1.symbol.upper() in symbols
+            ]
+        pools.sort(key=lambda pool: float(pool.totalValueLockedUSD), reverse=True)
+        return pools[: int(limit)]
+
     def discover_and_index_pools(self, symbols: list[str], limit: int = 100) -> dict[str, Any]:
-        pools = self.fetch_pools(symbols=symbols, limit=limit)
-        index = self.build_pool_index(pools)
+        self._load_catalog_from_redis()
+        requested = frozenset(s.upper() for s in symbols if s)
+        covered_at = self._covered.get(requested)
+        fresh = covered_at is not None and (
+            self._refresher is not None or time.monotonic() - covered_at <= self.refresh_seconds
+        )
+        error = None
+        if not fresh and requested:
+            try:
+                fetched = self.fetch_pools(symbols=sorted(requested), limit=limit)
+            except Exception as exc:
+                # Left uncovered so the next call asks the subgraph again
+                log.warning(f"PoolSpy pool discovery failed for {sorted(requested)}: {exc}")
+                error = str(exc)
+            else:
+                with self._lock:
+                    self._tracked_symbols |= requested
+                self.upsert_pools(fetched)
+                self._covered[requested] = time.monotonic()
+                self.start_refresher()
+        pools = self._catalog_view(set(requested), limit)
         return {
             "pools": [pool.model_dump() for pool in pools],
             "pool_count": len(pools),
-            "index_keys": sorted(index.keys()),
+            "index_keys": sorted(self._pool_index.keys()),
             "formatted": self.format_pool_report(pools),
+            "error": error,
         }
 
+    def refresh(self) -> dict[str, Any]:
+        """Apply subgraph deltas: new pools past the watermark, then current TVL of known pools."""
+        if not self.subgraph_url or not self._tracked_symbols:
+            return {"skipped": True}
+        if not self._refresh_guard.acquire(blocking=False):
+            return {"skipped": True, "reason": "refresh already running"}
+        try:
+            started = time.perf_counter()
+            with self._lock:
+                symbols = sorted(self._tracked_symbols)
+                since = self._watermark
+                known = sorted({pool_id for members in self._key_members.values() for pool_id in members})
+            new_pools = [pool for pool in self.fetch_new_pools(symbols, since) if pool.id.lower() not in self._pools]
+            updated = self.fetch_pools_by_id(known)
+            changed = self.upsert_pools(new_pools + updated)
+            self._last_refresh = time.monotonic()
+            self._stats["refreshes"] += 1
+            self._stats["new_pools"] += len(new_pools)
+            self._stats["updated_pools"] += len(updated)
+            result = {
+                "new_pools": len(new_pools),
+                "updated_pools": len(updated),
+                "changed_keys": len(changed),
+                "watermark": self._watermark,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+            log.info(f"[POOL CATALOG] Refresh {result}")
+            return result
+        finally:
+            self._refresh_guard.release()
+
+    def _run_refresher(self) -> None:
+        while not self._stop_refresher.wait(self.refresh_seconds):
+            try:
+                self.refresh()
+            except Exception as exc:
+                log.warning(f"[POOL CATALOG] Background refresh failed: {exc}")
+
+    def start_refresher(self) -> bool:
+        """Start the background delta refresher (no-op without a subgraph or interval)."""
+        if self._refresher is not None or not self.subgraph_url or self.refresh_seconds <= 0:
+            return False
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(target=self._run_refresher, name="pool-catalog-refresher", daemon=True)
+        self._refresher.start()
+        return True
+
+    def stop_refresher(self) -> None:
+        thread, self._refresher = self._refresher, None
+        if thread is not None:
+            self._stop_refresher.set()
+            thread.join(timeout=self.timeout_seconds)
+
+    def mark_missing(self, token_a_symbol: str, token_b_symbol: str) -> None:
+        """Remember that no pool exists for the pair (either order) for ``missing_ttl_seconds``."""
+        key = self._missing_key(token_a_symbol, token_b_symbol)
+        self._missing[key] = time.monotonic() + self.missing_ttl_seconds
+        if self.redis_client:
+            try:
+                self.redis_client.set(f"{self._redis_missing_prefix}{key}", "1", ex=self.missing_ttl_seconds)
+            except Exception as exc:
+                log.debug(f"Failed to cache missing pool pair {key}: {exc}")
+
+    def is_known_missing(self, token_a_symbol: str, token_b_symbol: str) -> bool:
+        key = self._missing_key(token_a_symbol, token_b_symbol)
+        expires = self._missing.get(key)
+        if expires is not None:
+            if expires > time.monotonic():
+                self._stats["missing_hits"] += 1
+                return True
+            self._missing.pop(key, None)
+        if not self.redis_client:
+            return False
+        try:
+            ttl = self.redis_client.ttl(f"{self._redis_missing_prefix}{key}")
+        except Exception:
+            return False
+        if ttl is None or ttl <= 0:
+            return False
+        self._missing[key] = time.monotonic() + ttl
+        self._stats["missing_hits"] += 1
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "pools": len(self._pools),
+            "index_keys": len(self._pool_index),
+            "tracked_symbols": len(self._tracked_symbols),
+            "watermark": self._watermark,
+            "missing_pairs": len(self._missing),
+            "refresher_running": self._refresher is not None,
+            "last_refresh_age_seconds": (
+                round(time.monotonic() - self._last_refresh, 1) if self._last_refresh is not None else None
+            ),
+            **self._stats,
+        }
+
+    def pair_pools(self, token_a_symbol: str, token_b_symbol: str) -> list[PoolSelectionModel]:
+        """All indexed pools for a symbol pair, best first (either token order)."""
+        pair = f"{token_a_symbol.upper()}/{token_b_symbol.upper()}"
+        return self._pool_index.get(pair) or self._load_index_candidates_from_redis(pair)
+
+    def token_address(self, symbol: str) -> str | None:
+        """Token address for ``symbol`` as recorded by the most liquid indexed pool."""
+        key = symbol.upper()
+        for selection in self._pool_index.get(key) or self._load_index_candidates_from_redis(key):
+            if selection.token0_symbol == key:
+                return selection.token0_address
+            if selection.token1_symbol == key:
+                return selection.token1_address
+        return None
+
     def resolve_best_pool(self, token_in_symbol: str, token_out_symbol: str) -> PoolSelectionModel | None:
         pair = f"{token_in_symbol.upper()}/{token_out_symbol.upper()}"
         candidates = self._pool_index.get(pair)
@@ -251,3 +584,59 @@ class PoolSpy:
             return candidates[0]
 
         return None
+
+
+class AsyncPoolSpy:
+    """AsyncWeb3 pool inspection over a shared :class:`PoolSpy` catalog.
+
+    On-chain reads for one pool run concurrently; catalog discovery and
+    lookups (httpx subgraph + sync Redis) run in a worker thread so they
+    never block the event loop.
+    """
+
+    def __init__(self, w3, catalog: PoolSpy) -> None:
+        self.w3 = w3
+        self.catalog = catalog
+
+    async def inspect_v3_pool(self, pool_address: str) -> dict[str, Any]:
+        pool = self.w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=V3_POOL_ABI)
+        slot0, liquidity, token0, token1, fee, tick_spacing = await asyncio.gather(
+            pool.functions.slot0().call(),
+            pool.functions.liquidity().call(),
+            pool.functions.token0().call(),
+            pool.functions.token1().call(),
+            pool.functions.fee().call(),
+            pool.functions.tickSpacing().call(),
+        )
+        return {
+            "pool": str(pool.address),
+            "token0": str(token0),
+            "token1": str(token1),
+            "fee": int(fee),
+            "tick_spacing": int(tick_spacing),
+            "sqrt_price_x96": int(slot0[0]),
+            "tick": int(slot0[1]),
+            "liquidity": int(liquidity),
+        }
+
+    async def inspect_with_fallback(self, pool_address: str) -> dict[str, Any]:
+        try:
+            return await self.inspect_v3_pool(pool_address)
+        except Exception as exc:
+            log.warning(f"PoolSpy failed to inspect pool {pool_address}: {exc}")
+            return {
+                "pool": pool_address,
+                "error": str(exc),
+            }
+
+    async def discover_and_index_pools(self, symbols: list[str], limit: int = 100) -> dict[str, Any]:
+        return await asyncio.to_thread(self.catalog.discover_and_index_pools, symbols, limit)
+
+    async def resolve_best_pool(self, token_in_symbol: str, token_out_symbol: str) -> PoolSelectionModel | None:
+        return await asyncio.to_thread(self.catalog.resolve_best_pool, token_in_symbol, token_out_symbol)
+
+    async def is_known_missing(self, token_a_symbol: str, token_b_symbol: str) -> bool:
+        return await asyncio.to_thread(self.catalog.is_known_missing, token_a_symbol, token_b_symbol)
+
+    async def mark_missing(self, token_a_symbol: str, token_b_symbol: str) -> None:
+        await asyncio.to_thread(self.catalog.mark_missing, token_a_symbol, token_b_symbol)
@@ -0,0 +1,198 @@
+"""Load and refresh V3 pool state for off-chain swap simulation.
+
+``V3PoolStateLoader.load`` reads slot0/liquidity/fee/tokens, the tick-bitmap
+words around the current tick and every initialized tick in them through
+Multicall3, pinned to one block (three ``eth_call`` round trips per pool).
+``refresh`` replays Swap/Mint/Burn logs since that block instead of
+reloading, falling back to a full load when the gap is too large.
+``V3PoolStateCache`` keeps one state per pool and refreshes it once it is
+older than ``max_age_seconds``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import threading
+import time
+from typing import Any
+
+from eth_abi import decode
+from web3 import Web3
+
+from core.clients.uviswap.multicall import Multicall, encode_call
+from core.clients.uviswap.pool_spy import V3_POOL_ABI
+from core.clients.uviswap.v3_math import PoolState, TickInfo
+from core.logging import log
+from core.settings.config import MULTICALL3_ADDRESS, settings
+
+SWAP_TOPIC = Web3.keccak(text="Swap(address,address,int256,int256,uint160,uint128,int24)")
+MINT_TOPIC = Web3.keccak(text="Mint(address,address,int24,int24,uint128,uint256,uint256)")
+BURN_TOPIC = Web3.keccak(text="Burn(address,int24,int24,uint128,uint256,uint256)")
+TICK_OUTPUT_TYPES = ["uint128", "int128", "uint256", "uint256", "int56", "uint160", "uint32", "bool"]
+MIN_WORD, MAX_WORD = -(1 << 15), (1 << 15) - 1
+
+
+class PoolStateError(Exception):
+    """Raised when pool state cannot be read."""
+
+
+class V3PoolStateLoader:
+    """Batch-read V3 pool state and keep it current from pool logs."""
+
+    def __init__(
+        self,
+        w3: Web3,
+        multicall_address: str = MULTICALL3_ADDRESS,
+        word_radius: int | None = None,
+        max_replay_blocks: int = 2_000,
+    ) -> None:
+        self.w3 = w3
+        self.multicall = Multicall(w3, multicall_address)
+        self.word_radius = int(word_radius if word_radius is not None else settings.uviswap_pool_state_word_radius)
+        self.max_replay_blocks = int(max_replay_blocks)
+
+    def _pool(self, pool_address: str) -> Any:
+        return self.w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=V3_POOL_ABI)
+
+    def _read(self, pool: Any, calls: list[tuple[str, list[Any], list[str]]], block: int) -> list[tuple[Any, ...]]:
+        try:
+            results = self.multicall.aggregate(
+                [(pool.address, encode_call(pool, fn_name, args)) for fn_name, args, _ in calls],
+                allow_failure=False,
+                block_identifier=block,
+            )
+        except Exception as exc:
+            raise PoolStateError(f"pool state read failed for {pool.address}: {exc}") from exc
+        return [decode(types, data) for (_, _, types), (_, data) in zip(calls, results)]
+
+    def load(self, pool_address: str, block: int | None = None) -> PoolState:
+        pool = self._pool(pool_address)
+        block = int(block if block is not None else self.w3.eth.block_number)
+        slot0, liquidity, fee, spacing, token0, token1 = self._read(
+            pool,
+            [
+                ("slot0", [], ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]),
+                ("liquidity", [], ["uint128"]),
+                ("fee", [], ["uint24"]),
+                ("tickSpacing", [], ["int24"]),
+                ("token0", [], ["address"]),
+                ("token1", [], ["address"]),
+            ],
+            block,
+        )
+        tick, tick_spacing = int(slot0[1]), int(spacing[0])
+        center = (tick // tick_spacing) >> 8
+        words = list(range(max(MIN_WORD, center - self.word_radius), min(MAX_WORD, center + self.word_radius) + 1))
+        bitmaps = self._read(pool, [("tickBitmap", [word], ["uint256"]) for word in words], block)
+
+        initialized = [
+            ((word << 8) + bit) * tick_spacing
+            for word, (bitmap,) in zip(words, bitmaps)
+            for bit in range(256)
+            if bitmap >> bit & 1
+        ]
+        tick_rows = self._read(pool, [("ticks", [t], TICK_OUTPUT_TYPES) for t in initialized], block) if initialized else []
+        state = PoolState(
+            address=str(pool.address),
+            token0=str(token0[0]),
+            token1=str(token1[0]),
+            fee=int(fee[0]),
+            tick_spacing=tick_spacing,
+            sqrt_price_x96=int(slot0[0]),
+            tick=tick,
+            liquidity=int(liquidity[0]),
+            ticks={t: TickInfo(int(row[0]), int(row[1])) for t, row in zip(initialized, tick_rows)},
+            word_range=(words[0], words[-1]),
+            block=block,
+        )
+        log.debug(
+            f"Loaded pool state {state.address} block={block} tick={tick} "
+            f"words={state.word_range} initialized_ticks={len(state.ticks)}"
+        )
+        return state
+
+    def refresh(self, state: PoolState, to_block: int | None = None) -> PoolState:
+        """Replay Swap/Mint/Burn logs after ``state.block`` (reloads when the gap is too large)."""
+        to_block = int(to_block if to_block is not None else self.w3.eth.block_number)
+        if to_block <= state.block:
+            return state
+        if to_block - state.block > self.max_replay_blocks:
+            return self.load(state.address, to_block)
+
+        # Replay onto a copy so concurrent simulations keep a consistent snapshot
+        state = replace(state, ticks=dict(state.ticks))
+        pool = self._pool(state.address)
+        logs = self.w3.eth.get_logs(
+            {
+                "address": pool.address,
+                "fromBlock": state.block + 1,
+                "toBlock": to_block,
+                "topics": [[Web3.to_hex(topic) for topic in (SWAP_TOPIC, MINT_TOPIC, BURN_TOPIC)]],
+            }
+        )
+        for entry in sorted(logs, key=lambda item: (item["blockNumber"], item["logIndex"])):
+            topic = bytes(entry["topics"][0])
+            if topic == SWAP_TOPIC:
+                args = pool.events.Swap().process_log(entry)["args"]
+                state.apply_swap(args["sqrtPriceX96"], args["liquidity"], args["tick"])
+            elif topic == MINT_TOPIC:
+                args = pool.events.Mint().process_log(entry)["args"]
+                state.apply_liquidity(args["tickLower"], args["tickUpper"], int(args["amount"]))
+            elif topic == BURN_TOPIC:
+                args = pool.events.Burn().process_log(entry)["args"]
+                state.apply_liquidity(args["tickLower"], args["tickUpper"], -int(args["amount"]))
+        # A swap can move the price out of the loaded words; reload around the new tick
+        word = (state.tick // state.tick_spacing) >> 8
+        if not state.word_range[0] < word < state.word_range[1]:
+            return self.load(state.address, to_block)
+        state.block = to_block
+        return state
+
+
+class V3PoolStateCache:
+    """Per-pool state cache refreshed from logs once older than ``max_age_seconds``."""
+
+    def __init__(self, loader: V3PoolStateLoader, max_age_seconds: float | None = None) -> None:
+        self.loader = loader
+        self.max_age_seconds = float(
+            max_age_seconds if max_age_seconds is not None else settings.uviswap_pool_state_max_age_seconds
+        )
+        self._states: dict[str, tuple[float, PoolState]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "refreshes": 0, "errors": 0}
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, pool_address: str) -> PoolState:
+        key = pool_address.lower()
+        with self._lock_for(key):
+            cached = self._states.get(key)
+            now = time.monotonic()
+            if cached and now - cached[0] <= self.max_age_seconds:
+                self._stats["hits"] += 1
+                return cached[1]
+            try:
+                if cached:
+                    state = self.loader.refresh(cached[1])
+                    self._stats["refreshes"] += 1
+                else:
+                    state = self.loader.load(pool_address)
+                    self._stats["loads"] += 1
+            except Exception:
+                self._stats["errors"] += 1
+                self._states.pop(key, None)
+                raise
+            self._states[key] = (now, state)
+            return state
+
+    def put(self, state: PoolState) -> None:
+        self._states[state.address.lower()] = (time.monotonic(), state)
+
+    def invalidate(self, pool_address: str) -> None:
+        self._states.pop(pool_address.lower(), None)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {"pools": len(self._states), "max_age_seconds": self.max_age_seconds, **self._stats}
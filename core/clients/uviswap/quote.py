@@ -25,3 +25,23 @@ class Quoter:
             return int(amount_out)
         except Exception as exc:
             raise QuoteError(f"quote_exact_in failed: {exc}") from exc
+
+
+class AsyncQuoter:
+    """AsyncWeb3 counterpart of :class:`Quoter` (``quoter_contract`` from ``AsyncWeb3.eth.contract``)."""
+
+    def __init__(self, w3, quoter_contract) -> None:
+        self.w3 = w3
+        self.contract = quoter_contract
+
+    async def quote_exact_in(self, token_in: str, token_out: str, amount_in: int, fee: int = 3_000) -> int:
+        try:
+            amount_out = await self.contract.functions.quoteExactInputSingle(
+                Web3.to_checksum_address(token_in),
+                Web3.to_checksum_address(token_out),
+                int(amount_in),
+                int(fee),
+            ).call()
+            return int(amount_out)
+        except Exception as exc:
+            raise QuoteError(f"quote_exact_in failed: {exc}") from exc
@@ -0,0 +1,265 @@
+"""Best exact-input route search across V3 fee tiers and one-hop paths."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from eth_abi import decode
+from web3 import Web3
+
+from core.clients.uviswap.multicall import Multicall, encode_call
+from core.clients.uviswap.pool_spy import PoolSpy
+from core.clients.uviswap.pool_state import V3PoolStateCache
+from core.logging import log
+from core.settings.config import MULTICALL3_ADDRESS
+
+FEE_TIERS: tuple[int, ...] = (100, 500, 3_000, 10_000)
+DEFAULT_INTERMEDIATES: tuple[str, ...] = ("WETH", "USDC")
+MULTICALL_BATCH_SIZE = 40
+# Approximate router gas for one swap step and for each extra hop
+SWAP_BASE_GAS = 120_000
+SWAP_HOP_GAS = 80_000
+
+
+class RouteSearchError(Exception):
+    """Raised when no route can be quoted for a pair."""
+
+
+@dataclass(frozen=True)
+class RouteCandidate:
+    tokens: tuple[str, ...]
+    symbols: tuple[str, ...]
+    fees: tuple[int, ...]
+
+    @property
+    def hops(self) -> int:
+        return len(self.fees)
+
+    @property
+    def gas_estimate(self) -> int:
+        return SWAP_BASE_GAS + SWAP_HOP_GAS * (self.hops - 1)
+
+    def encode_path(self) -> bytes:
+        """Packed V3 path: token (20 bytes) + fee (3 bytes) + token ..."""
+        path = bytes.fromhex(self.tokens[0].removeprefix("0x"))
+        for fee, token in zip(self.fees, self.tokens[1:]):
+            path += int(fee).to_bytes(3, "big") + bytes.fromhex(token.removeprefix("0x"))
+        return path
+
+    def describe(self) -> str:
+        parts = [self.symbols[0]]
+        for fee, symbol in zip(self.fees, self.symbols[1:]):
+            parts.append(f"-({fee})-> {symbol}")
+        return " ".join(parts)
+
+
+@dataclass(frozen=True)
+class RouteQuote:
+    candidate: RouteCandidate
+    amount_out: int
+    error: str | None = None
+    source: str = "quoter"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.amount_out > 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "route": self.candidate.describe(),
+            "path": list(self.candidate.tokens),
+            "symbols": list(self.candidate.symbols),
+            "fees": list(self.candidate.fees),
+            "hops": self.candidate.hops,
+            "amount_out": self.amount_out,
+            "gas_estimate": self.candidate.gas_estimate,
+            "source": self.source,
+            "error": self.error,
+        }
+
+
+class RouteFinder:
+    """Enumerate candidate routes from the PoolSpy index and quote them in Multicall batches.
+
+    Direct routes are tried on every fee tier the index knows for the pair
+    (all of ``fee_tiers`` when the pair is not indexed or has no fee data).
+    One-hop routes go through each intermediate whose legs are both indexed.
+    With ``pool_states`` set, candidates whose pools are indexed with a fee
+    tier are simulated locally from cached pool state first. The rest are
+    packed into Multicall3 ``aggregate3`` batches with ``allowFailure`` so
+    missing pools only fail their own call; batches run concurrently, and if
+    Multicall itself fails the calls fall back to individual quoter calls.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        quoter_contract: Any,
+        pool_spy: PoolSpy,
+        multicall_address: str = MULTICALL3_ADDRESS,
+        fee_tiers: tuple[int, ...] = FEE_TIERS,
+        intermediates: tuple[str, ...] = DEFAULT_INTERMEDIATES,
+        batch_size: int = MULTICALL_BATCH_SIZE,
+        max_workers: int = 4,
+        pool_states: V3PoolStateCache | None = None,
+    ) -> None:
+        self.w3 = w3
+        self.quoter = quoter_contract
+        self.pool_spy = pool_spy
+        self.multicall = Multicall(w3, multicall_address)
+        self.fee_tiers = tuple(fee_tiers)
+        self.intermediates = tuple(symbol.upper() for symbol in intermediates)
+        self.batch_size = max(1, int(batch_size))
+        self.max_workers = max(1, int(max_workers))
+        self.pool_states = pool_states
+
+    def _leg_fees(self, symbol_a: str, symbol_b: str, required: bool) -> list[int]:
+        pools = self.pool_spy.pair_pools(symbol_a, symbol_b)
+        if not pools:
+            return list(self.fee_tiers) if not required else []
+        known = sorted({int(pool.fee_tier) for pool in pools if pool.fee_tier})
+        return known or list(self.fee_tiers)
+
+    def _address(self, symbol: str, explicit: str | None) -> str | None:
+        address = explicit or self.pool_spy.token_address(symbol)
+        return Web3.to_checksum_address(address) if address else None
+
+    def candidates(
+        self,
+        token_in_symbol: str,
+        token_out_symbol: str,
+        token_in: str | None = None,
+        token_out: str | None = None,
+    ) -> list[RouteCandidate]:
+        symbol_in, symbol_out = token_in_symbol.upper(), token_out_symbol.upper()
+        address_in = self._address(symbol_in, token_in)
+        address_out = self._address(symbol_out, token_out)
+        if not address_in or not address_out:
+            raise RouteSearchError(
+                f"Unknown token address for {symbol_in if not address_in else symbol_out}; "
+                "pass the address or discover pools for the symbol first"
+            )
+
+        routes = [
+            RouteCandidate((address_in, address_out), (symbol_in, symbol_out), (fee,))
+            for fee in self._leg_fees(symbol_in, symbol_out, required=False)
+        ]
+        for middle in self.intermediates:
+            if middle in (symbol_in, symbol_out):
+                continue
+            address_mid = self._address(middle, None)
+            if not address_mid:
+                continue
+            first_fees = self._leg_fees(symbol_in, middle, required=True)
+            second_fees = self._leg_fees(middle, symbol_out, required=True)
+            routes.extend(
+                RouteCandidate((address_in, address_mid, address_out), (symbol_in, middle, symbol_out), (fee_a, fee_b))
+                for fee_a in first_fees
+                for fee_b in second_fees
+            )
+        return routes
+
+    def _quote_call(self, candidate: RouteCandidate, amount_in: int) -> tuple[str, list[Any]]:
+        if candidate.hops == 1:
+            return "quoteExactInputSingle", [candidate.tokens[0], candidate.tokens[1], int(amount_in), candidate.fees[0]]
+        return "quoteExactInput", [candidate.encode_path(), int(amount_in)]
+
+    def _quote_batch(self, batch: list[RouteCandidate], amount_in: int) -> list[RouteQuote]:
+        calls = [(self.quoter.address, encode_call(self.quoter, *self._quote_call(candidate, amount_in))) for candidate in batch]
+        try:
+            results = self.multicall.aggregate(calls)
+        except Exception as exc:
+            log.debug(f"Multicall quote batch failed, quoting {len(batch)} routes individually: {exc}")
+            return [self._quote_single(candidate, amount_in) for candidate in batch]
+
+        quotes = []
+        for candidate, (success, data) in zip(batch, results):
+            if not success or len(data) < 32:
+                quotes.append(RouteQuote(candidate, 0, "quote reverted"))
+                continue
+            quotes.append(RouteQuote(candidate, int(decode(["uint256"], bytes(data)[:32])[0])))
+        return quotes
+
+    def _quote_single(self, candidate: RouteCandidate, amount_in: int) -> RouteQuote:
+        fn_name, args = self._quote_call(candidate, amount_in)
+        try:
+            return RouteQuote(candidate, int(getattr(self.quoter.functions, fn_name)(*args).call()))
+        except Exception as exc:
+            return RouteQuote(candidate, 0, str(exc))
+
+    def _pool_address(self, symbol_a: str, symbol_b: str, fee: int) -> str | None:
+        for pool in self.pool_spy.pair_pools(symbol_a, symbol_b):
+            if pool.fee_tier == fee:
+                return pool.pool_address
+        return None
+
+    def _simulate(self, candidate: RouteCandidate, amount_in: int) -> RouteQuote | None:
+        """Local quote from cached pool state, or None when any leg needs the quoter."""
+        amount = int(amount_in)
+        legs = zip(candidate.tokens, candidate.symbols, candidate.symbols[1:], candidate.fees)
+        for token_in, symbol_in, symbol_out, fee in legs:
+            pool_address = self._pool_address(symbol_in, symbol_out, fee)
+            if not pool_address:
+                return None
+            try:
+                result = self.pool_states.get(pool_address).quote_exact_in(token_in, amount)
+            except Exception as exc:
+                log.debug(f"Local quote unavailable for {candidate.describe()}: {exc}")
+                return None
+            if result.amount_in != amount:
+                # Partial fill at the price limit; let the quoter report it
+                return None
+            amount = result.amount_out
+        return RouteQuote(candidate, amount, source="local")
+
+    def quote_routes(self, candidates: list[RouteCandidate], amount_in: int) -> list[RouteQuote]:
+        local: dict[int, RouteQuote] = {}
+        if self.pool_states is not None:
+            for index, candidate in enumerate(candidates):
+                quote = self._simulate(candidate, amount_in)
+                if quote is not None:
+                    local[index] = quote
+        remote = [candidate for index, candidate in enumerate(candidates) if index not in local]
+        batches = [remote[i : i + self.batch_size] for i in range(0, len(remote), self.batch_size)]
+        if len(batches) <= 1:
+            quoted = self._quote_batch(batches[0], amount_in) if batches else []
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+                results = pool.map(lambda batch: self._quote_batch(batch, amount_in), batches)
+                quoted = [quote for batch_quotes in results for quote in batch_quotes]
+        remote_quotes = iter(quoted)
+        return [local[index] if index in local else next(remote_quotes) for index in range(len(candidates))]
+
+    def find_best_route(
+        self,
+        token_in_symbol: str,
+        token_out_symbol: str,
+        amount_in: int,
+        token_in: str | None = None,
+        token_out: str | None = None,
+    ) -> dict[str, Any]:
+        candidates = self.candidates(token_in_symbol, token_out_symbol, token_in=token_in, token_out=token_out)
+        quotes = self.quote_routes(candidates, int(amount_in))
+        ranked = sorted(
+            (quote for quote in quotes if quote.ok),
+            key=lambda quote: (quote.amount_out, -quote.candidate.hops),
+            reverse=True,
+        )
+        if not ranked:
+            raise RouteSearchError(
+                f"No quotable route for {token_in_symbol}/{token_out_symbol} across {len(candidates)} candidates"
+            )
+        best = ranked[0]
+        log.debug(
+            f"Best route {best.candidate.describe()} amount_in={amount_in} amount_out={best.amount_out} "
+            f"quoted={len(quotes)} ok={len(ranked)}"
+        )
+        return {
+            "amount_in": int(amount_in),
+            "best": best.to_dict(),
+            "alternatives": [quote.to_dict() for quote in ranked[1:5]],
+            "candidates": len(candidates),
+            "quoted": len(ranked),
+        }
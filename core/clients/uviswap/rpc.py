@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
-from web3 import Web3
+import aiohttp
+from web3 import AsyncWeb3, Web3
+
+from core.settings.config import settings
+from core.telemetry.rpc import InstrumentedAsyncHTTPProvider, InstrumentedHTTPProvider
 
 
 class RPCError(Exception):
@@ -23,7 +28,7 @@ class RPC:
 
     def __init__(self, url: str) -> None:
         self.url = url
-        self.w3 = Web3(Web3.HTTPProvider(url))
+        self.w3 = Web3(InstrumentedHTTPProvider(url))
         if not self.w3.is_connected():
             raise RPCError(f"RPC connection failed for url={url}")
 
@@ -54,3 +59,77 @@ class RPC:
             return self.w3.eth.send_raw_transaction(raw_tx)
         except Exception as exc:
             raise RPCError(f"Failed to send raw transaction: {exc}") from exc
+
+
+class AsyncRPC:
+    """AsyncWeb3 counterpart of :class:`RPC`.
+
+    All requests share one aiohttp session with a bounded connection pool
+    and a per-request timeout. The session belongs to the event loop that
+    ran ``connect``; call ``close`` on that loop when done.
+    """
+
+    def __init__(self, url: str, timeout_seconds: float | None = None, pool_size: int | None = None) -> None:
+        self.url = url
+        self.timeout_seconds = float(
+            timeout_seconds if timeout_seconds is not None else settings.uviswap_rpc_timeout_seconds
+        )
+        self.pool_size = int(pool_size if pool_size is not None else settings.uviswap_rpc_pool_size)
+        # Request caching keeps chain-id validation on eth_call from costing a round trip each time
+        self.provider = InstrumentedAsyncHTTPProvider(
+            url,
+            request_kwargs={"timeout": aiohttp.ClientTimeout(total=self.timeout_seconds)},
+            cache_allowed_requests=True,
+        )
+        self.w3 = AsyncWeb3(self.provider)
+        self._session: aiohttp.ClientSession | None = None
+        self._chain_id: int | None = None
+
+    async def connect(self) -> "AsyncRPC":
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+            await self.provider.cache_async_session(self._session)
+        try:
+            if not await self.w3.is_connected():
+                raise RPCError(f"RPC connection failed for url={self.url}")
+            self._chain_id = int(await self.w3.eth.chain_id)
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    @property
+    def chain_id(self) -> int:
+        if self._chain_id is None:
+            raise RPCError("AsyncRPC is not connected; await connect() first")
+        return self._chain_id
+
+    async def network_info(self) -> RPCNetworkInfo:
+        chain_id, block_number = await asyncio.gather(self.w3.eth.chain_id, self.w3.eth.block_number)
+        return RPCNetworkInfo(chain_id=int(chain_id), block_number=int(block_number))
+
+    async def nonce(self, address: str) -> int:
+        try:
+            return int(await self.w3.eth.get_transaction_count(address, "pending"))
+        except Exception as exc:
+            raise RPCError(f"Failed to fetch nonce for {address}: {exc}") from exc
+
+    async def simulate(self, tx: dict[str, Any]) -> bytes:
+        try:
+            return await self.w3.eth.call(tx)
+        except Exception as exc:
+            raise RPCError(f"Simulation failed: {exc}") from exc
+
+    async def send_raw(self, raw_tx: bytes):
+        try:
+            return await self.w3.eth.send_raw_transaction(raw_tx)
+        except Exception as exc:
+            raise RPCError(f"Failed to send raw transaction: {exc}") from exc
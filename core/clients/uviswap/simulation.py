@@ -18,3 +18,11 @@ def simulate_transaction(rpc, tx: dict[str, Any]) -> SimulationResult:
         return SimulationResult(ok=True, result=result)
     except Exception as exc:
         return SimulationResult(ok=False, result=str(exc))
+
+
+async def simulate_transaction_async(rpc, tx: dict[str, Any]) -> SimulationResult:
+    try:
+        result = await rpc.simulate(tx)
+        return SimulationResult(ok=True, result=result)
+    except Exception as exc:
+        return SimulationResult(ok=False, result=str(exc))
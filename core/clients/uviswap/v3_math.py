@@ -0,0 +1,377 @@
+"""Off-chain Uniswap V3 swap math over cached pool state.
+
+Integer ports of ``TickMath``, ``SqrtPriceMath``, ``SwapMath`` and the
+``UniswapV3Pool.swap`` loop, so amounts match the on-chain quoter to the wei
+as long as the cached tick state is current. Tick-bitmap word boundaries are
+reproduced because the pool splits swap steps on them, which affects rounding.
+
+``PoolState`` only knows the initialized ticks inside its loaded bitmap
+words; a swap that walks past them raises ``PoolStateRangeError`` so callers
+can fall back to the quoter instead of returning a wrong amount.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+import math
+from typing import Any
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+Q96 = 1 << 96
+MAX_UINT256 = (1 << 256) - 1
+FEE_DENOMINATOR = 1_000_000
+
+_TICK_RATIOS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+class V3MathError(Exception):
+    """Raised when an input is outside the range the pool contract accepts."""
+
+
+class PoolStateRangeError(V3MathError):
+    """Raised when a swap needs tick data outside the loaded bitmap words."""
+
+
+def _mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    return -((-a * b) // denominator)
+
+
+def _div_rounding_up(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+@lru_cache(maxsize=65_536)
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    abs_tick = abs(int(tick))
+    if abs_tick > MAX_TICK:
+        raise V3MathError(f"tick {tick} out of range")
+    ratio = 0xFFFCB933BD6FAD37AA2D162D1A594001 if abs_tick & 0x1 else 1 << 128
+    for bit, factor in _TICK_RATIOS:
+        if abs_tick & bit:
+            ratio = (ratio * factor) >> 128
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """Greatest tick whose sqrt ratio is <= ``sqrt_price_x96``."""
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise V3MathError(f"sqrt price {sqrt_price_x96} out of range")
+    estimate = math.floor(2 * math.log(sqrt_price_x96 / Q96) / math.log(1.0001))
+    tick = max(MIN_TICK, min(MAX_TICK, estimate))
+    while tick > MIN_TICK and get_sqrt_ratio_at_tick(tick) > sqrt_price_x96:
+        tick -= 1
+    while tick < MAX_TICK and get_sqrt_ratio_at_tick(tick + 1) <= sqrt_price_x96:
+        tick += 1
+    return tick
+
+
+def get_amount0_delta(sqrt_a: int, sqrt_b: int, liquidity: int, round_up: bool) -> int:
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_b - sqrt_a
+    if round_up:
+        return _div_rounding_up(_mul_div_rounding_up(numerator1, numerator2, sqrt_b), sqrt_a)
+    return (numerator1 * numerator2 // sqrt_b) // sqrt_a
+
+
+def get_amount1_delta(sqrt_a: int, sqrt_b: int, liquidity: int, round_up: bool) -> int:
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+    if round_up:
+        return _mul_div_rounding_up(liquidity, sqrt_b - sqrt_a, Q96)
+    return liquidity * (sqrt_b - sqrt_a) // Q96
+
+
+def _next_sqrt_price_from_amount0(sqrt_price: int, liquidity: int, amount: int, add: bool) -> int:
+    if amount == 0:
+        return sqrt_price
+    numerator1 = liquidity << 96
+    product = amount * sqrt_price
+    if add:
+        if product <= MAX_UINT256 and numerator1 + product <= MAX_UINT256:
+            return _mul_div_rounding_up(numerator1, sqrt_price, numerator1 + product)
+        return _div_rounding_up(numerator1, numerator1 // sqrt_price + amount)
+    if product > MAX_UINT256 or numerator1 <= product:
+        raise V3MathError("insufficient token0 liquidity for requested output")
+    return _mul_div_rounding_up(numerator1, sqrt_price, numerator1 - product)
+
+
+def _next_sqrt_price_from_amount1(sqrt_price: int, liquidity: int, amount: int, add: bool) -> int:
+    if add:
+        return sqrt_price + (amount << 96) // liquidity
+    quotient = _div_rounding_up(amount << 96, liquidity)
+    if sqrt_price <= quotient:
+        raise V3MathError("insufficient token1 liquidity for requested output")
+    return sqrt_price - quotient
+
+
+def compute_swap_step(
+    sqrt_current: int,
+    sqrt_target: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> tuple[int, int, int, int]:
+    """``SwapMath.computeSwapStep``: (sqrt_next, amount_in, amount_out, fee_amount)."""
+    zero_for_one = sqrt_current >= sqrt_target
+    exact_in = amount_remaining >= 0
+    amount_in = amount_out = 0
+
+    if exact_in:
+        remaining_less_fee = amount_remaining * (FEE_DENOMINATOR - fee_pips) // FEE_DENOMINATOR
+        amount_in = (
+            get_amount0_delta(sqrt_target, sqrt_current, liquidity, True)
+            if zero_for_one
+            else get_amount1_delta(sqrt_current, sqrt_target, liquidity, True)
+        )
+        if remaining_less_fee >= amount_in:
+            sqrt_next = sqrt_target
+        elif zero_for_one:
+            sqrt_next = _next_sqrt_price_from_amount0(sqrt_current, liquidity, remaining_less_fee, True)
+        else:
+            sqrt_next = _next_sqrt_price_from_amount1(sqrt_current, liquidity, remaining_less_fee, True)
+    else:
+        amount_out = (
+            get_amount1_delta(sqrt_target, sqrt_current, liquidity, False)
+            if zero_for_one
+            else get_amount0_delta(sqrt_current, sqrt_target, liquidity, False)
+        )
+        if -amount_remaining >= amount_out:
+            sqrt_next = sqrt_target
+        elif zero_for_one:
+            sqrt_next = _next_sqrt_price_from_amount1(sqrt_current, liquidity, -amount_remaining, False)
+        else:
+            sqrt_next = _next_sqrt_price_from_amount0(sqrt_current, liquidity, -amount_remaining, False)
+
+    reached_target = sqrt_target == sqrt_next
+    if zero_for_one:
+        if not (reached_target and exact_in):
+            amount_in = get_amount0_delta(sqrt_next, sqrt_current, liquidity, True)
+        if not (reached_target and not exact_in):
+            amount_out = get_amount1_delta(sqrt_next, sqrt_current, liquidity, False)
+    else:
+        if not (reached_target and exact_in):
+            amount_in = get_amount1_delta(sqrt_current, sqrt_next, liquidity, True)
+        if not (reached_target and not exact_in):
+            amount_out = get_amount0_delta(sqrt_current, sqrt_next, liquidity, False)
+
+    if not exact_in and amount_out > -amount_remaining:
+        amount_out = -amount_remaining
+    if exact_in and sqrt_next != sqrt_target:
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = _mul_div_rounding_up(amount_in, fee_pips, FEE_DENOMINATOR - fee_pips)
+    return sqrt_next, amount_in, amount_out, fee_amount
+
+
+@dataclass(frozen=True)
+class TickInfo:
+    liquidity_gross: int
+    liquidity_net: int
+
+
+@dataclass(frozen=True)
+class SwapResult:
+    amount_in: int
+    amount_out: int
+    fee_amount: int
+    sqrt_price_x96_after: int
+    tick_after: int
+    ticks_crossed: int
+    price_impact: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "amount_in": self.amount_in,
+            "amount_out": self.amount_out,
+            "fee_amount": self.fee_amount,
+            "sqrt_price_x96_after": self.sqrt_price_x96_after,
+            "tick_after": self.tick_after,
+            "ticks_crossed": self.ticks_crossed,
+            "price_impact": self.price_impact,
+        }
+
+
+@dataclass
+class PoolState:
+    """Swap-relevant state of one V3 pool at ``block``."""
+
+    address: str
+    token0: str
+    token1: str
+    fee: int
+    tick_spacing: int
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    ticks: dict[int, TickInfo] = field(default_factory=dict)
+    # Inclusive range of tick-bitmap words whose initialized ticks are known
+    word_range: tuple[int, int] = (0, -1)
+    block: int = 0
+    _compressed: list[int] | None = field(default=None, repr=False, compare=False)
+
+    def _initialized(self) -> list[int]:
+        if self._compressed is None:
+            self._compressed = sorted(tick // self.tick_spacing for tick in self.ticks)
+        return self._compressed
+
+    def _next_initialized_tick(self, tick: int, lte: bool) -> tuple[int, bool]:
+        """``TickBitmap.nextInitializedTickWithinOneWord`` over the cached ticks."""
+        compressed = tick // self.tick_spacing
+        if not lte:
+            compressed += 1
+        word = compressed >> 8
+        if not self.word_range[0] <= word <= self.word_range[1]:
+            raise PoolStateRangeError(f"pool {self.address} tick bitmap word {word} not loaded")
+        initialized = self._initialized()
+        if lte:
+            index = bisect_right(initialized, compressed) - 1
+            if index >= 0 and initialized[index] >= word << 8:
+                return initialized[index] * self.tick_spacing, True
+            return (word << 8) * self.tick_spacing, False
+        index = bisect_left(initialized, compressed)
+        if index < len(initialized) and initialized[index] <= (word << 8) + 255:
+            return initialized[index] * self.tick_spacing, True
+        return ((word << 8) + 255) * self.tick_spacing, False
+
+    def spot_price(self, zero_for_one: bool) -> float:
+        """Output tokens per input token at the current price, before fees."""
+        price = (self.sqrt_price_x96 / Q96) ** 2
+        return price if zero_for_one else 1 / price
+
+    def swap(self, zero_for_one: bool, amount_specified: int, sqrt_price_limit_x96: int | None = None) -> SwapResult:
+        """Simulate ``UniswapV3Pool.swap``; positive amounts are exact input, negative exact output."""
+        if amount_specified == 0:
+            raise V3MathError("amount_specified must be non-zero")
+        limit = sqrt_price_limit_x96 or (MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1)
+        if zero_for_one and not MIN_SQRT_RATIO < limit < self.sqrt_price_x96:
+            raise V3MathError("sqrt price limit must be below the current price")
+        if not zero_for_one and not self.sqrt_price_x96 < limit < MAX_SQRT_RATIO:
+            raise V3MathError("sqrt price limit must be above the current price")
+
+        exact_input = amount_specified > 0
+        remaining = amount_specified
+        calculated = 0
+        fees = 0
+        crossed = 0
+        sqrt_price, tick, liquidity = self.sqrt_price_x96, self.tick, self.liquidity
+
+        while remaining != 0 and sqrt_price != limit:
+            start = sqrt_price
+            tick_next, initialized = self._next_initialized_tick(tick, zero_for_one)
+            tick_next = max(MIN_TICK, min(MAX_TICK, tick_next))
+            sqrt_next = get_sqrt_ratio_at_tick(tick_next)
+            past_limit = sqrt_next < limit if zero_for_one else sqrt_next > limit
+            sqrt_price, step_in, step_out, step_fee = compute_swap_step(
+                sqrt_price, limit if past_limit else sqrt_next, liquidity, remaining, self.fee
+            )
+            fees += step_fee
+            if exact_input:
+                remaining -= step_in + step_fee
+                calculated -= step_out
+            else:
+                remaining += step_out
+                calculated += step_in + step_fee
+
+            if sqrt_price == sqrt_next:
+                if initialized:
+                    net = self.ticks[tick_next].liquidity_net
+                    liquidity += -net if zero_for_one else net
+                    crossed += 1
+                tick = tick_next - 1 if zero_for_one else tick_next
+            elif sqrt_price != start:
+                tick = get_tick_at_sqrt_ratio(sqrt_price)
+
+        if exact_input:
+            amount_in, amount_out = amount_specified - remaining, -calculated
+        else:
+            amount_in, amount_out = calculated, -(amount_specified - remaining)
+        spot = self.spot_price(zero_for_one)
+        impact = 1 - (amount_out / amount_in) / spot if amount_in and spot else 0.0
+        return SwapResult(
+            amount_in=amount_in,
+            amount_out=amount_out,
+            fee_amount=fees,
+            sqrt_price_x96_after=sqrt_price,
+            tick_after=tick,
+            ticks_crossed=crossed,
+            price_impact=max(0.0, impact),
+        )
+
+    def _zero_for_one(self, token_in: str) -> bool:
+        token = token_in.lower()
+        if token == self.token0.lower():
+            return True
+        if token == self.token1.lower():
+            return False
+        raise V3MathError(f"token {token_in} is not in pool {self.address}")
+
+    def quote_exact_in(self, token_in: str, amount_in: int) -> SwapResult:
+        return self.swap(self._zero_for_one(token_in), int(amount_in))
+
+    def quote_exact_out(self, token_in: str, amount_out: int) -> SwapResult:
+        return self.swap(self._zero_for_one(token_in), -int(amount_out))
+
+    def max_amount_in_for_impact(self, token_in: str, max_impact_bps: int, upper_bound: int) -> int:
+        """Largest exact input up to ``upper_bound`` whose price impact stays within ``max_impact_bps``."""
+        limit = max_impact_bps / 10_000
+        low, high = 0, int(upper_bound)
+        while low < high:
+            mid = (low + high + 1) // 2
+            try:
+                fits = self.quote_exact_in(token_in, mid).price_impact <= limit
+            except PoolStateRangeError:
+                fits = False
+            if fits:
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    # ------------------------------------------------------------------
+    # Event replay
+    # ------------------------------------------------------------------
+
+    def apply_swap(self, sqrt_price_x96: int, liquidity: int, tick: int) -> None:
+        self.sqrt_price_x96, self.liquidity, self.tick = int(sqrt_price_x96), int(liquidity), int(tick)
+
+    def apply_liquidity(self, tick_lower: int, tick_upper: int, amount: int) -> None:
+        """Apply a Mint (positive ``amount``) or Burn (negative ``amount``)."""
+        for tick, sign in ((tick_lower, 1), (tick_upper, -1)):
+            info = self.ticks.get(tick, TickInfo(0, 0))
+            gross = info.liquidity_gross + amount
+            if gross <= 0:
+                self.ticks.pop(tick, None)
+            else:
+                self.ticks[tick] = TickInfo(gross, info.liquidity_net + sign * amount)
+        self._compressed = None
+        if tick_lower <= self.tick < tick_upper:
+            self.liquidity += amount
@@ -0,0 +1,549 @@
+"""Incremental local index of on-chain activity for a watchlist of wallets.
+
+Whale and copy-trading scans used to page through Blockscout
+``get_transactions`` with ``limit/offset`` on every run. Here each watched
+wallet keeps a block watermark; :class:`WalletActivityIndexer` fetches
+only transactions past it and stops paging as soon as it reaches blocks
+it has already seen. When a run hits its page budget before reaching the
+watermark, the skipped block range is remembered and backfilled on later
+runs. Transfers are stored one row per (wallet, tx, log
+index) in SQLite, indexed by wallet/token/time, and per-wallet, per-token
+flow totals are updated as new rows land, so "who accumulated the most
+PEPE this week" is a local query.
+"""
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.logging import log
+from core.settings.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wallets (
+    chain TEXT NOT NULL,
+    address TEXT NOT NULL,
+    label TEXT,
+    last_block INTEGER NOT NULL DEFAULT 0,
+    backfill_from INTEGER,
+    backfill_to INTEGER,
+    synced_at REAL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (chain, address)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS transfers (
+    chain TEXT NOT NULL,
+    address TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    block INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    direction INTEGER NOT NULL,
+    counterparty TEXT,
+    token TEXT NOT NULL,
+    amount REAL NOT NULL,
+    value_usd REAL NOT NULL,
+    PRIMARY KEY (chain, address, tx_hash, log_index)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_transfers_wallet_token_ts ON transfers(chain, address, token, ts);
+CREATE INDEX IF NOT EXISTS idx_transfers_token_ts ON transfers(chain, token, ts);
+CREATE TABLE IF NOT EXISTS flows (
+    chain TEXT NOT NULL,
+    address TEXT NOT NULL,
+    token TEXT NOT NULL,
+    inflow REAL NOT NULL,
+    outflow REAL NOT NULL,
+    inflow_usd REAL NOT NULL,
+    outflow_usd REAL NOT NULL,
+    transfers INTEGER NOT NULL,
+    first_ts INTEGER NOT NULL,
+    last_ts INTEGER NOT NULL,
+    PRIMARY KEY (chain, address, token)
+) WITHOUT ROWID;
+"""
+
+_FLOW_UPSERT = """
+INSERT INTO flows (chain, address, token, inflow, outflow, inflow_usd, outflow_usd, transfers, first_ts, last_ts)
+VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+ON CONFLICT (chain, address, token) DO UPDATE SET
+    inflow = inflow + excluded.inflow,
+    outflow = outflow + excluded.outflow,
+    inflow_usd = inflow_usd + excluded.inflow_usd,
+    outflow_usd = outflow_usd + excluded.outflow_usd,
+    transfers = transfers + 1,
+    first_ts = MIN(first_ts, excluded.first_ts),
+    last_ts = MAX(last_ts, excluded.last_ts)
+"""
+
+NATIVE_SYMBOLS = {
+    "ethereum": "ETH",
+    "base": "ETH",
+    "arbitrum": "ETH",
+    "optimism": "ETH",
+    "polygon": "POL",
+    "bsc": "BNB",
+    "gnosis": "XDAI",
+    "avalanche": "AVAX",
+}
+RANKINGS = ("net_usd", "volume_usd", "net", "volume", "transfers")
+
+
+def _address_of(value: Any) -> Optional[str]:
+    if isinstance(value, dict):  # Blockscout returns {"hash": ..., "name": ...} for parties
+        value = value.get("hash") or value.get("address")
+    return str(value).lower() if value else None
+
+
+def _block_of(tx: Dict[str, Any]) -> int:
+    block = tx.get("block_number", tx.get("block", tx.get("blockNumber")))
+    try:
+        return int(block)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _timestamp(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value)
+    if text.isdigit():
+        return int(text)
+    try:
+        return int(datetime.fromisoformat(text.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return 0
+
+
+def normalize_transfer(address: str, tx: Dict[str, Any], native_symbol: str = "ETH") -> Optional[Dict[str, Any]]:
+    """Flatten a Blockscout transaction or token transfer into a signed row for ``address``.
+
+    Returns ``None`` when the wallet is neither sender nor recipient, the
+    entry has no hash/block, or it moves nothing (a zero-value call with no
+    USD value). Self-transfers get direction 0 so they add to no flow.
+    """
+    wallet = address.lower()
+    tx_hash = tx.get("hash") or tx.get("tx_hash") or tx.get("transaction_hash")
+    block = _block_of(tx)
+    if not tx_hash or not block:
+        return None
+    sender, recipient = _address_of(tx.get("from")), _address_of(tx.get("to"))
+    if sender == wallet and recipient == wallet:
+        direction, counterparty = 0, wallet
+    elif sender == wallet:
+        direction, counterparty = -1, recipient
+    elif recipient == wallet:
+        direction, counterparty = 1, sender
+    else:
+        return None
+
+    token = tx.get("token") if isinstance(tx.get("token"), dict) else {}
+    total = tx.get("total") if isinstance(tx.get("total"), dict) else {}
+    symbol = str(token.get("symbol") or tx.get("token_symbol") or native_symbol).upper()
+    raw_value = total.get("value", tx.get("value", 0))
+    decimals = total.get("decimals", token.get("decimals", tx.get("token_decimals", 18)))
+    try:
+        amount = float(raw_value or 0) / 10 ** int(decimals or 0)
+    except (TypeError, ValueError):
+        amount = 0.0
+    value_usd = tx.get("value_usd")
+    if amount == 0 and not value_usd:
+        # Contract calls carry no native value; indexing them would only inflate transfer counts
+        return None
+    if value_usd is None:
+        rate = token.get("exchange_rate", tx.get("exchange_rate"))
+        value_usd = amount * float(rate) if rate else 0.0
+    return {
+        "tx_hash": str(tx_hash).lower(),
+        "log_index": int(tx.get("log_index") or 0),
+        "block": block,
+        "ts": _timestamp(tx.get("timestamp")),
+        "direction": direction,
+        "counterparty": counterparty,
+        "token": symbol,
+        "amount": amount,
+        "value_usd": float(value_usd or 0.0),
+    }
+
+
+class WalletActivityIndex:
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path or settings.wallet_activity_db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            if self.db_path != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5.0)
+        except (OSError, sqlite3.Error) as exc:
+            log.warning(f"Wallet activity index {self.db_path} unavailable, indexing in memory: {exc}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Watchlist
+    # ------------------------------------------------------------------
+
+    def watch(self, address: str, chain: str = "ethereum", label: Optional[str] = None) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO wallets (chain, address, label, added_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (chain, address) DO UPDATE SET label = COALESCE(excluded.label, label)",
+                    (chain, address.lower(), label, time.time()),
+                )
+
+    def unwatch(self, address: str, chain: str = "ethereum") -> bool:
+        """Drop a wallet together with its transfers and flow totals."""
+        key = (chain, address.lower())
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                removed = conn.execute("DELETE FROM wallets WHERE chain = ? AND address = ?", key).rowcount
+                conn.execute("DELETE FROM transfers WHERE chain = ? AND address = ?", key)
+                conn.execute("DELETE FROM flows WHERE chain = ? AND address = ?", key)
+        return bool(removed)
+
+    def watchlist(self, chain: Optional[str] = None) -> List[Dict[str, Any]]:
+        sql = "SELECT chain, address, label, last_block, synced_at FROM wallets"
+        args: tuple = ()
+        if chain:
+            sql += " WHERE chain = ?"
+            args = (chain,)
+        with self._lock:
+            rows = self._connect().execute(sql + " ORDER BY added_at", args).fetchall()
+        return [dict(row) for row in rows]
+
+    def last_block(self, address: str, chain: str = "ethereum") -> int:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT last_block FROM wallets WHERE chain = ? AND address = ?", (chain, address.lower())
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def backfill_range(self, address: str, chain: str = "ethereum") -> Optional[Tuple[int, int]]:
+        """Block range ``(after, until]`` a sync skipped and still has to fetch, if any."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT backfill_from, backfill_to FROM wallets WHERE chain = ? AND address = ?",
+                (chain, address.lower()),
+            ).fetchone()
+        if not row or row[1] is None:
+            return None
+        return int(row[0]), int(row[1])
+
+    def set_backfill_range(self, address: str, chain: str, block_range: Optional[Tuple[int, int]]) -> None:
+        after, until = block_range if block_range else (None, None)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE wallets SET backfill_from = ?, backfill_to = ? WHERE chain = ? AND address = ?",
+                    (after, until, chain, address.lower()),
+                )
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def ingest(self, address: str, chain: str, transactions: Iterable[Dict[str, Any]]) -> int:
+        """Store new transfers for ``address`` and fold them into its flow totals.
+
+        Already indexed transfers are ignored, so overlapping pages are safe.
+        The wallet's watermark moves to the highest block seen; gaps below it
+        are tracked separately with :meth:`set_backfill_range`. Returns the
+        number of new transfers.
+        """
+        wallet = address.lower()
+        native = NATIVE_SYMBOLS.get(chain, "ETH")
+        transactions = list(transactions)
+        top_block = max((_block_of(tx) for tx in transactions), default=0)
+        rows = [row for row in (normalize_transfer(wallet, tx, native) for tx in transactions) if row]
+        added = 0
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO wallets (chain, address, added_at) VALUES (?, ?, ?)", (chain, wallet, now)
+                )
+                for row in rows:
+                    inserted = conn.execute(
+                        "INSERT OR IGNORE INTO transfers "
+                        "(chain, address, tx_hash, log_index, block, ts, direction, counterparty, token, amount, value_usd) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            chain,
+                            wallet,
+                            row["tx_hash"],
+                            row["log_index"],
+                            row["block"],
+                            row["ts"],
+                            row["direction"],
+                            row["counterparty"],
+                            row["token"],
+                            row["amount"],
+                            row["value_usd"],
+                        ),
+                    ).rowcount
+                    if not inserted:
+                        continue
+                    incoming, outgoing = row["direction"] > 0, row["direction"] < 0
+                    conn.execute(
+                        _FLOW_UPSERT,
+                        (
+                            chain,
+                            wallet,
+                            row["token"],
+                            row["amount"] if incoming else 0.0,
+                            row["amount"] if outgoing else 0.0,
+                            row["value_usd"] if incoming else 0.0,
+                            row["value_usd"] if outgoing else 0.0,
+                            row["ts"],
+                            row["ts"],
+                        ),
+                    )
+                    added += 1
+                conn.execute(
+                    "UPDATE wallets SET last_block = MAX(last_block, ?), synced_at = ? WHERE chain = ? AND address = ?",
+                    (top_block, now, chain, wallet),
+                )
+        return added
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def flows(self, address: str, chain: str = "ethereum", token: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per-token flow totals for a wallet, largest USD volume first."""
+        sql = (
+            "SELECT token, inflow, outflow, inflow - outflow AS net, inflow_usd, outflow_usd, "
+            "inflow_usd - outflow_usd AS net_usd, transfers, first_ts, last_ts "
+            "FROM flows WHERE chain = ? AND address = ?"
+        )
+        args: List[Any] = [chain, address.lower()]
+        if token:
+            sql += " AND token = ?"
+            args.append(token.upper())
+        with self._lock:
+            rows = self._connect().execute(sql + " ORDER BY inflow_usd + outflow_usd DESC, token", args).fetchall()
+        return [dict(row) for row in rows]
+
+    def transfers(
+        self,
+        address: str,
+        chain: str = "ethereum",
+        token: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Most recent indexed transfers for a wallet; ``since`` is a unix timestamp."""
+        sql = (
+            "SELECT tx_hash, log_index, block, ts, direction, counterparty, token, amount, value_usd "
+            "FROM transfers WHERE chain = ? AND address = ?"
+        )
+        args: List[Any] = [chain, address.lower()]
+        if token:
+            sql += " AND token = ?"
+            args.append(token.upper())
+        if since is not None:
+            sql += " AND ts >= ?"
+            args.append(int(since))
+        sql += " ORDER BY ts DESC, block DESC, log_index DESC LIMIT ?"
+        args.append(int(limit))
+        with self._lock:
+            rows = self._connect().execute(sql, args).fetchall()
+        return [dict(row) for row in rows]
+
+    def top_wallets(
+        self,
+        chain: str = "ethereum",
+        token: Optional[str] = None,
+        since: Optional[float] = None,
+        order_by: str = "net_usd",
+        ascending: bool = False,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Rank watched wallets by flow; all-time totals come from ``flows``, windows from ``transfers``.
+
+        ``order_by`` is one of :data:`RANKINGS`; ``ascending=True`` surfaces
+        the biggest net sellers instead of accumulators.
+        """
+        if order_by not in RANKINGS:
+            raise ValueError(f"order_by must be one of {RANKINGS}, got {order_by!r}")
+        if since is None:
+            sql = (
+                "SELECT f.address, SUM(f.inflow - f.outflow) AS net, SUM(f.inflow + f.outflow) AS volume, "
+                "SUM(f.inflow_usd - f.outflow_usd) AS net_usd, SUM(f.inflow_usd + f.outflow_usd) AS volume_usd, "
+                "SUM(f.transfers) AS transfers, MAX(f.last_ts) AS last_ts FROM flows f WHERE f.chain = ?"
+            )
+            args: List[Any] = [chain]
+            if token:
+                sql += " AND f.token = ?"
+                args.append(token.upper())
+            sql += " GROUP BY f.address"
+        else:
+            sql = (
+                "SELECT t.address, SUM(t.direction * t.amount) AS net, SUM(ABS(t.direction) * t.amount) AS volume, "
+                "SUM(t.direction * t.value_usd) AS net_usd, SUM(ABS(t.direction) * t.value_usd) AS volume_usd, "
+                "COUNT(*) AS transfers, MAX(t.ts) AS last_ts FROM transfers t WHERE t.chain = ? AND t.ts >= ?"
+            )
+            args = [chain, int(since)]
+            if token:
+                sql += " AND t.token = ?"
+                args.append(token.upper())
+            sql += " GROUP BY t.address"
+        sql = (
+            f"SELECT r.*, w.label FROM ({sql}) r LEFT JOIN wallets w ON w.chain = ? AND w.address = r.address "
+            f"ORDER BY r.{order_by} {'ASC' if ascending else 'DESC'}, r.address LIMIT ?"
+        )
+        args += [chain, int(limit)]
+        with self._lock:
+            rows = self._connect().execute(sql, args).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            wallets, transfers, tokens = self._connect().execute(
+                "SELECT (SELECT COUNT(*) FROM wallets), (SELECT COUNT(*) FROM transfers), "
+                "(SELECT COUNT(DISTINCT token) FROM flows)"
+            ).fetchone()
+        return {"wallets": int(wallets), "transfers": int(transfers), "tokens": int(tokens)}
+
+
+class WalletActivityIndexer:
+    """Keeps :class:`WalletActivityIndex` current from a ``BlockscoutMCPClient``."""
+
+    def __init__(
+        self,
+        client: Any,
+        index: Optional[WalletActivityIndex] = None,
+        page_size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        self.client = client
+        self.index = index or wallet_activity_index
+        self.page_size = int(page_size or settings.wallet_activity_page_size)
+        self.max_pages = int(max_pages or settings.wallet_activity_max_pages)
+        self.concurrency = max(1, int(concurrency or settings.wallet_activity_sync_concurrency))
+
+    async def _fetch_range(
+        self, address: str, chain: str, after: int, until: Optional[int], max_pages: int
+    ) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """Page newest first through blocks ``(after, until]``; returns (transactions, pages, complete)."""
+        fetched: List[Dict[str, Any]] = []
+        for page in range(max_pages):
+            batch = await self.client.get_transaction_history(
+                address,
+                chain,
+                limit=self.page_size,
+                offset=page * self.page_size,
+                start_block=after + 1 if after else None,
+                end_block=until,
+            )
+            fresh = [tx for tx in batch if _block_of(tx) > after and (until is None or _block_of(tx) <= until)]
+            fetched.extend(fresh)
+            if len(batch) < self.page_size or len(fresh) < len(batch):
+                return fetched, page + 1, True
+        return fetched, max_pages, False
+
+    async def sync_wallet(self, address: str, chain: str = "ethereum") -> Dict[str, Any]:
+        """Fetch transactions newer than the wallet's watermark and index them.
+
+        Pages are read newest first and paging stops at the first page that
+        reaches the watermark (or comes back short). A first sync backfills
+        at most ``max_pages`` pages. If an incremental sync runs out of pages
+        first, the blocks between the watermark and the oldest one fetched are
+        recorded and filled in by later syncs with whatever page budget is left.
+        """
+        watermark = self.index.last_block(address, chain)
+        backfill = self.index.backfill_range(address, chain)
+        fetched, pages, complete = await self._fetch_range(address, chain, watermark, None, self.max_pages)
+        if not complete and watermark:
+            oldest = min(_block_of(tx) for tx in fetched)
+            # An older gap is still open, so widen it rather than track two
+            backfill = (backfill[0] if backfill else watermark, oldest)
+            log.warning(
+                f"Wallet {address} on {chain} has more than {self.max_pages * self.page_size} transactions "
+                f"since block {watermark}; blocks {watermark + 1}-{oldest} will be backfilled on later syncs"
+            )
+            # Record the gap before ingest moves the watermark past it
+            self.index.set_backfill_range(address, chain, backfill)
+        elif backfill and pages < self.max_pages:
+            older, used, done = await self._fetch_range(address, chain, backfill[0], backfill[1], self.max_pages - pages)
+            fetched.extend(older)
+            pages += used
+            if done:
+                backfill = None
+            elif older:
+                backfill = (backfill[0], min(_block_of(tx) for tx in older))
+        added = self.index.ingest(address, chain, fetched)
+        # Shrink or clear the gap only once the rows that closed it are stored
+        self.index.set_backfill_range(address, chain, backfill)
+        return {
+            "address": address.lower(),
+            "chain": chain,
+            "pages": pages,
+            "fetched": len(fetched),
+            "new_transfers": added,
+            "last_block": self.index.last_block(address, chain),
+            "backfill_range": list(backfill) if backfill else None,
+        }
+
+    async def sync_watchlist(self, chain: Optional[str] = None) -> Dict[str, Any]:
+        """Sync every watched wallet (optionally one chain) with bounded concurrency."""
+        return await self.sync_wallets(self.index.watchlist(chain))
+
+    async def sync_wallets(self, wallets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sync ``{"address", "chain"}`` wallets, at most ``concurrency`` at a time; failures are collected."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _sync(wallet: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.sync_wallet(wallet["address"], wallet["chain"])
+
+        results = await asyncio.gather(*[_sync(wallet) for wallet in wallets], return_exceptions=True)
+        synced: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        for wallet, result in zip(wallets, results):
+            if isinstance(result, BaseException):
+                log.warning(f"Wallet activity sync failed for {wallet['address']} on {wallet['chain']}: {result}")
+                errors.append({"address": wallet["address"], "chain": wallet["chain"], "error": str(result)})
+            else:
+                synced.append(result)
+        return {
+            "wallets": len(wallets),
+            "synced": synced,
+            "errors": errors,
+            "new_transfers": sum(result["new_transfers"] for result in synced),
+        }
+
+
+wallet_activity_index = WalletActivityIndex()
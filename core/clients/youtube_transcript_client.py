@@ -8,7 +8,8 @@ import asyncio
 import json
 import subprocess
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from core.clients.content_cache import ContentCache, content_cache
+from core.clients.content_index import ContentIndex, content_index
 from core.logging import log
 from core.settings.config import settings
 
@@ -18,6 +19,20 @@ class YouTubeTranscriptMCPError(Exception):
     pass
 
 
+def _has_transcript(call_result: Dict[str, Any]) -> bool:
+    """True if a tools/call result carries transcript text (not an error or empty body)."""
+    if call_result.get("isError"):
+        return False
+    for item in call_result.get("content") or []:
+        text = item.get("text", "") if isinstance(item, dict) else ""
+        if text.startswith("# "):
+            # "# Title\n\nTranscript..." - a title alone is not a transcript
+            text = text.split("\n", 2)[2] if text.count("\n") >= 2 else ""
+        if text.strip():
+            return True
+    return False
+
+
 class YouTubeTranscriptMCPClient:
     """
     Client for interacting with YouTube Transcript MCP server.
@@ -38,6 +53,9 @@ class YouTubeTranscriptMCPClient:
                 - args: MCP command arguments (default: ["-y", "@sinco-lab/mcp-youtube-transcript"])
                 - timeout: Request timeout in seconds (default: 60)
                 - retry_attempts: Number of retry attempts (default: 3)
+                - error_cache_ttl: Seconds to cache error/empty results (default: 300)
+                - cache: ContentCache for tool results (default: shared on-disk cache)
+                - index: ContentIndex transcripts are added to (default: shared local index)
         """
         config = config or {}
         self.command = config.get(
@@ -65,10 +83,13 @@ class YouTubeTranscriptMCPClient:
         self.retry_attempts = config.get("retry_attempts", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
         
-        # Cache for frequently accessed data
-        self.cache: Dict[str, Any] = {}
-        self.cache_ttl: Dict[str, datetime] = {}
-        self.default_cache_ttl = timedelta(hours=24)  # Transcripts don't change
+        # Transcripts are immutable: successful tool results go to the shared
+        # on-disk cache without expiry, so restarts and other workers reuse them.
+        # Errors and empty transcripts (captions may be added later) expire quickly.
+        self.error_cache_ttl = float(config.get("error_cache_ttl", 300.0))
+        self.cache: ContentCache = config.get("cache") or content_cache
+        self.cache_namespace = "mcp:youtube_transcript"
+        self.index: ContentIndex = config.get("index") or content_index
     
     async def _invoke_mcp_tool(
         self,
@@ -96,10 +117,10 @@ class YouTubeTranscriptMCPClient:
         cache_key = f"{tool_name}:{json.dumps(arguments, sort_keys=True)}"
         
         # Check cache
-        if cache_key in self.cache:
-            if datetime.now() < self.cache_ttl.get(cache_key, datetime.min):
-                log.debug(f"Cache hit for {tool_name}")
-                return self.cache[cache_key]
+        cached = self.cache.get_json(self.cache_namespace, cache_key)
+        if cached is not None:
+            log.debug(f"Cache hit for {tool_name}")
+            return cached
         
         for attempt in range(self.retry_attempts):
             process = None
@@ -211,8 +232,8 @@ class YouTubeTranscriptMCPClient:
                     raise YouTubeTranscriptMCPError(f"No valid response from MCP server. Available tools: {available_tools}")
                 
                 # Cache the response
-                self.cache[cache_key] = call_result
-                self.cache_ttl[cache_key] = datetime.now() + self.default_cache_ttl
+                ttl = None if _has_transcript(call_result) else self.error_cache_ttl
+                self.cache.put_json(self.cache_namespace, cache_key, call_result, ttl_seconds=ttl)
                 
                 return call_result
                 
@@ -316,10 +337,12 @@ class YouTubeTranscriptMCPClient:
                         "duration": metadata.get("totalDuration", 0)
                     }]
                 
+                detected_language = metadata.get("language", language or "en")
+                self._index_transcript(video_id, title, transcript_text, segments, detected_language)
                 return {
                     "transcript": transcript_text,
                     "title": title,
-                    "language": metadata.get("language", language or "en"),
+                    "language": detected_language,
                     "segments": segments,
                     "duration": metadata.get("totalDuration", 0),
                     "metadata": metadata
@@ -331,54 +354,60 @@ class YouTubeTranscriptMCPClient:
             log.error(f"Error getting transcript for video {video_id}: {e}")
             raise YouTubeTranscriptMCPError(f"Failed to get transcript: {e}")
     
+    def _index_transcript(
+        self,
+        video_id: str,
+        title: str,
+        transcript_text: str,
+        segments: List[Dict[str, Any]],
+        language: Optional[str],
+    ) -> None:
+        """Add the transcript to the local full-text index once per video (best effort)."""
+        try:
+            if transcript_text and not self.index.has_parent(video_id):
+                self.index.add_transcript(video_id, title, transcript_text, segments, language)
+        except Exception as e:
+            log.debug(f"Transcript indexing failed for video {video_id}: {e}")
+
     async def search_transcript(
         self,
         video_id: str,
         query: str,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        limit: int = 20
     ) -> List[Dict[str, Any]]:
         """
         Search for keywords in a video transcript.
         
-        Note: The MCP server doesn't have a search function, so we get the full
-        transcript and search locally for matching segments.
+        Note: The MCP server doesn't have a search function. The transcript is
+        fetched (or served from cache) once, chunked into the local full-text
+        index, and queries run against that index ranked by relevance.
+        Quoted text is matched as a phrase; other words must all appear.
         
         Args:
             video_id: YouTube video ID
             query: Search query/keywords
             language: Optional language code
+            limit: Maximum number of matching passages
             
         Returns:
-            List of matching segments with timestamps and context
+            List of matching passages with start time, snippet context and score
         """
         try:
-            # Get full transcript first
-            transcript_result = await self.get_transcript(video_id, language)
-            
-            # Extract transcript text and segments from result
-            transcript_text = transcript_result.get("transcript", "")
-            segments = transcript_result.get("segments", [])
-            
-            if not segments and transcript_text:
-                # If we only have text, create segments from it
-                # This is a fallback - ideally segments should be in the result
-                return [{"text": transcript_text, "query": query, "matches": []}]
+            if not self.index.has_parent(video_id):
+                # Fetching the transcript indexes it
+                await self.get_transcript(video_id, language)
             
-            # Search for query in segments
-            query_lower = query.lower()
-            matches = []
-            
-            for segment in segments:
-                segment_text = segment.get("text", "").lower()
-                if query_lower in segment_text:
-                    matches.append({
-                        "text": segment.get("text", ""),
-                        "start": segment.get("start", segment.get("timestamp", 0)),
-                        "duration": segment.get("duration", 0),
-                        "context": segment.get("text", "")
-                    })
-            
-            return matches
+            return [
+                {
+                    "text": hit["snippet"],
+                    "start": hit["start"] or 0,
+                    "duration": 0,
+                    "context": hit["snippet"],
+                    "score": hit["score"],
+                }
+                for hit in self.index.search(query, kinds=["transcript"], parent=video_id, limit=limit)
+            ]
         except Exception as e:
             log.error(f"Error searching transcript for video {video_id}: {e}")
             raise YouTubeTranscriptMCPError(f"Failed to search transcript: {e}")
@@ -1,7 +1,14 @@
 """LLM helper utilities."""
 
 from .camel_client import CamelLLMClient, CamelLLMError
-
-__all__ = ["CamelLLMClient", "CamelLLMError"]
-
-
+from .rate_limiter import LLMRateLimiter, llm_rate_limiter
+from .response_cache import LLMResponseCache, llm_response_cache
+
+__all__ = [
+    "CamelLLMClient",
+    "CamelLLMError",
+    "LLMRateLimiter",
+    "LLMResponseCache",
+    "llm_rate_limiter",
+    "llm_response_cache",
+]
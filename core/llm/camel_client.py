@@ -4,16 +4,25 @@ Asynchronous helper for invoking CAMEL-backed LLMs.
 Wraps CAMEL's `ChatAgent` so async agent code can request completions without
 depending on the synchronous API directly.  The client uses OpenAI models by
 default (falling back to whichever model name is supplied).
+
+Agents are pooled per system prompt and reset between completions instead of
+being rebuilt for every call, identical requests are answered from the shared
+response cache, and every model call goes through the global rate limiter.
 """
 
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Deque, Dict, Optional
 
+from core.llm.rate_limiter import LLMRateLimiter, estimate_tokens, llm_rate_limiter
+from core.llm.response_cache import LLMResponseCache, cache_key, llm_response_cache
 from core.logging import log
 from core.models.camel_models import CamelModelFactory
+from core.settings.config import settings
 
 try:  # optional dependency during tests
     from openai import AuthenticationError  # type: ignore
@@ -45,6 +54,52 @@ class _CamelLLMConfig:
     user_role: str = "User"
 
 
+class _AgentPool:
+    """Idle agents keyed by system prompt, reset before reuse."""
+
+    def __init__(self, max_idle_per_prompt: int, max_prompts: int = 64) -> None:
+        self.max_idle_per_prompt = max(0, int(max_idle_per_prompt))
+        self.max_prompts = max(1, int(max_prompts))
+        self._idle: "OrderedDict[str, Deque[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0}
+
+    def acquire(self, system_prompt: str, create: Callable[[], Any]) -> Any:
+        with self._lock:
+            idle = self._idle.get(system_prompt)
+            if idle:
+                self._idle.move_to_end(system_prompt)
+                self.stats["reused"] += 1
+                return idle.pop()
+        self.stats["created"] += 1
+        return create()
+
+    def release(self, system_prompt: str, agent: Any) -> None:
+        reset = getattr(agent, "reset", None)
+        if self.max_idle_per_prompt == 0 or not callable(reset):
+            return
+        try:
+            # Drops the previous exchange; the system message is kept
+            reset()
+        except Exception as exc:
+            self.stats["discarded"] += 1
+            log.debug(f"Discarding CAMEL agent that failed to reset: {exc}")
+            return
+        with self._lock:
+            idle = self._idle.setdefault(system_prompt, deque())
+            self._idle.move_to_end(system_prompt)
+            if len(idle) < self.max_idle_per_prompt:
+                idle.append(agent)
+            while len(self._idle) > self.max_prompts:
+                self._idle.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            idle = sum(len(agents) for agents in self._idle.values())
+            prompts = len(self._idle)
+        return {"prompts": prompts, "idle": idle, **self.stats}
+
+
 class CamelLLMClient:
     """Async wrapper around CAMEL ChatAgent for single-turn completions."""
 
@@ -55,6 +110,9 @@ class CamelLLMClient:
         system_role: str = "LLM System",
         user_role: str = "User",
         agent_factory: Optional[Callable[[object], object]] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
+        pool_size: Optional[int] = None,
     ) -> None:
         if CAMEL_IMPORT_ERROR is not None:
             raise CamelLLMError("CAMEL is not installed") from CAMEL_IMPORT_ERROR
@@ -75,6 +133,12 @@ class CamelLLMClient:
             raise CamelLLMError(f"Failed to create CAMEL model: {exc}") from exc
 
         self._agent_factory = agent_factory or self._default_agent_factory
+        self._cache = response_cache or llm_response_cache
+        self._limiter = rate_limiter or llm_rate_limiter
+        self._pool = _AgentPool(settings.llm_agent_pool_size if pool_size is None else pool_size)
+        self._model_label = str(
+            self._config.model_name or getattr(self._model, "model_type", None) or "default"
+        )
 
     async def generate(
         self,
@@ -83,6 +147,7 @@ class CamelLLMClient:
         *,
         max_retries: int = 3,
         retry_delay: float = 0.8,
+        use_cache: bool = True,
     ) -> str:
         """
         Execute a single-turn completion.
@@ -92,6 +157,7 @@ class CamelLLMClient:
             user_prompt: Content for the user message.
             max_retries: Number of retry attempts on transient errors.
             retry_delay: Initial delay (seconds) between retries.
+            use_cache: Serve and store byte-identical requests from the response cache.
 
         Returns:
             Raw string content returned by the model.
@@ -99,16 +165,28 @@ class CamelLLMClient:
         if not system_prompt or not user_prompt:
             raise CamelLLMError("Prompts must be non-empty")
 
+        key = cache_key(self._model_label, self._config.temperature, system_prompt, user_prompt)
+        if use_cache:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return cached
+
         attempt_delay = retry_delay
         last_error: Optional[BaseException] = None
+        prompt_tokens = estimate_tokens(system_prompt, user_prompt)
 
         for attempt in range(1, max_retries + 1):
             try:
-                return await asyncio.to_thread(
-                    self._invoke,
-                    system_prompt,
-                    user_prompt,
-                )
+                async with self._limiter.slot(prompt_tokens):
+                    content = await asyncio.to_thread(
+                        self._invoke,
+                        system_prompt,
+                        user_prompt,
+                    )
+                await self._limiter.charge(estimate_tokens(content))
+                if use_cache:
+                    await self._cache.set(key, content)
+                return content
             except AuthenticationError as exc:  # pragma: no cover - external service
                 raise CamelLLMError(
                     "OpenAI authentication failed. Verify the OPENAI_API_KEY environment variable."
@@ -128,6 +206,13 @@ class CamelLLMClient:
 
         raise CamelLLMError(f"CAMEL completion failed: {last_error}") from last_error
 
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "agent_pool": self._pool.get_stats(),
+            "cache": self._cache.get_stats(),
+            "limiter": self._limiter.get_stats(),
+        }
+
     # ------------------------------------------------------------------ #
     # Internals                                                          #
     # ------------------------------------------------------------------ #
@@ -141,17 +226,21 @@ class CamelLLMClient:
         if ChatAgent is None or BaseMessage is None:  # pragma: no cover
             raise CamelLLMError("CAMEL ChatAgent unavailable")
 
-        system_message = BaseMessage.make_assistant_message(
-            role_name=self._config.system_role,
-            content=system_prompt,
-        )
-        agent = self._agent_factory(system_message)
+        def _create() -> object:
+            system_message = BaseMessage.make_assistant_message(
+                role_name=self._config.system_role,
+                content=system_prompt,
+            )
+            return self._agent_factory(system_message)
 
+        agent = self._pool.acquire(system_prompt, _create)
         user_message = BaseMessage.make_user_message(
             role_name=self._config.user_role,
             content=user_prompt,
         )
+        # A failed step leaves the agent in an unknown state; it is not pooled
         response = agent.step(user_message)
+        self._pool.release(system_prompt, agent)
 
         content = ""
         if response is None:
@@ -0,0 +1,201 @@
+"""
+Process-wide admission control for LLM completions.
+
+Two limits apply before a completion is sent:
+
+- ``max_concurrency`` in-flight calls (0 disables);
+- ``tokens_per_minute`` over a fixed one-minute window (0 disables). Prompt
+  tokens are reserved up front and completion tokens are charged afterwards.
+  With a connected ``RedisClient`` the window is the shared ``incr_window``
+  counter, so the budget holds across workers; otherwise it is local.
+
+Tool calls run on short-lived event loops, so waiting uses thread-safe
+primitives and short sleeps instead of loop-bound asyncio locks. Queue depth
+and wait times are exposed through ``get_stats``.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from core.logging import log
+from core.settings.config import settings
+
+WINDOW_SECONDS = 60
+REDIS_PREFIX = "llm:tokens:"
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for budgeting."""
+    return max(1, sum(len(text or "") for text in texts) // 4)
+
+
+class LLMRateLimiter:
+    """Concurrency and token-rate limiter shared by LLM clients."""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        redis_client: Any = None,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.max_concurrency = int(
+            max_concurrency if max_concurrency is not None else settings.llm_max_concurrency
+        )
+        self.tokens_per_minute = int(
+            tokens_per_minute if tokens_per_minute is not None else settings.llm_tokens_per_minute
+        )
+        self.poll_interval = float(poll_interval)
+        self._redis = redis_client
+        self._slots = threading.Semaphore(self.max_concurrency) if self.max_concurrency > 0 else None
+        self._lock = threading.Lock()
+        self._window = 0
+        self._window_tokens = 0
+        self._active = 0
+        self._waiting = 0
+        self._stats = {
+            "acquired": 0,
+            "max_waiting": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+            "token_waits": 0,
+            "tokens_reserved": 0,
+            "tokens_charged": 0,
+            "redis_errors": 0,
+        }
+
+    def _redis_client(self) -> Any:
+        if self._redis is None:
+            from core.clients.redis_client import redis_client
+
+            self._redis = redis_client
+        return self._redis if getattr(self._redis, "redis", None) is not None else None
+
+    # ------------------------------------------------------------------
+    # Token window
+    # ------------------------------------------------------------------
+
+    def _reserve_local(self, window: int, tokens: int) -> bool:
+        with self._lock:
+            if window != self._window:
+                self._window, self._window_tokens = window, 0
+            # A single oversized request still runs in an otherwise empty window
+            if self._window_tokens and self._window_tokens + tokens > self.tokens_per_minute:
+                return False
+            self._window_tokens += tokens
+            return True
+
+    async def _reserve_shared(self, client: Any, window: int, tokens: int) -> Optional[bool]:
+        key = f"{REDIS_PREFIX}{window}"
+        try:
+            used = await client.incr_window(key, tokens, WINDOW_SECONDS * 2)
+            if used - tokens < self.tokens_per_minute:
+                return True
+            await client.redis.decrby(key, tokens)
+            return False
+        except Exception as exc:
+            self._stats["redis_errors"] += 1
+            log.debug(f"LLM token window unavailable in Redis, using local window: {exc}")
+            return None
+
+    async def _reserve_tokens(self, tokens: int) -> None:
+        if self.tokens_per_minute <= 0:
+            return
+        waited = False
+        while True:
+            now = time.time()
+            window = int(now // WINDOW_SECONDS)
+            client = self._redis_client()
+            reserved = await self._reserve_shared(client, window, tokens) if client is not None else None
+            if reserved is None:
+                reserved = self._reserve_local(window, tokens)
+            if reserved:
+                self._stats["tokens_reserved"] += tokens
+                return
+            if not waited:
+                self._stats["token_waits"] += 1
+                waited = True
+            await asyncio.sleep(min(1.0, (window + 1) * WINDOW_SECONDS - now + 0.01))
+
+    async def charge(self, tokens: int) -> None:
+        """Count tokens spent after admission (completion output)."""
+        if self.tokens_per_minute <= 0 or tokens <= 0:
+            return
+        self._stats["tokens_charged"] += tokens
+        window = int(time.time() // WINDOW_SECONDS)
+        client = self._redis_client()
+        if client is not None:
+            try:
+                await client.incr_window(f"{REDIS_PREFIX}{window}", tokens, WINDOW_SECONDS * 2)
+                return
+            except Exception as exc:
+                self._stats["redis_errors"] += 1
+                log.debug(f"LLM token charge fell back to local window: {exc}")
+        with self._lock:
+            if window != self._window:
+                self._window, self._window_tokens = window, 0
+            self._window_tokens += tokens
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    async def _acquire_slot(self) -> None:
+        if self._slots is None:
+            return
+        while not self._slots.acquire(blocking=False):
+            await asyncio.sleep(self.poll_interval)
+
+    def _release_slot(self) -> None:
+        if self._slots is not None:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0) -> AsyncIterator[None]:
+        """Hold one concurrency slot and reserve ``estimated_tokens`` for the call."""
+        started = time.monotonic()
+        with self._lock:
+            self._waiting += 1
+            self._stats["max_waiting"] = max(self._stats["max_waiting"], self._waiting)
+        try:
+            await self._acquire_slot()
+            try:
+                await self._reserve_tokens(int(estimated_tokens))
+            except BaseException:
+                self._release_slot()
+                raise
+        finally:
+            with self._lock:
+                self._waiting -= 1
+        wait_ms = (time.monotonic() - started) * 1000
+        with self._lock:
+            self._active += 1
+            self._stats["acquired"] += 1
+            self._stats["total_wait_ms"] += wait_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+            self._release_slot()
+
+    def get_stats(self) -> Dict[str, Any]:
+        acquired = self._stats["acquired"]
+        return {
+            "max_concurrency": self.max_concurrency,
+            "tokens_per_minute": self.tokens_per_minute,
+            "active": self._active,
+            "waiting": self._waiting,
+            "window_tokens": self._window_tokens,
+            **{k: round(v, 2) if isinstance(v, float) else v for k, v in self._stats.items()},
+            "avg_wait_ms": round(self._stats["total_wait_ms"] / acquired, 2) if acquired else 0.0,
+        }
+
+
+# Global limiter shared by every CamelLLMClient
+llm_rate_limiter = LLMRateLimiter()
@@ -0,0 +1,135 @@
+"""
+Exact-match cache for single-turn LLM completions.
+
+Entries are keyed by model, temperature and the SHA-256 of the system and
+user prompts, so only byte-identical requests hit. A bounded in-memory LRU
+answers first; when a connected ``RedisClient`` is supplied the entry is also
+shared across processes under ``llm:response:<key>`` with the same TTL.
+Redis errors never fail a completion, they only cost a cache miss.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core.logging import log
+from core.settings.config import settings
+
+REDIS_PREFIX = "llm:response:"
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+    identity = f"{model}|{temperature:.3f}|{_digest(system_prompt)}|{_digest(user_prompt)}"
+    return _digest(identity)
+
+
+class LLMResponseCache:
+    """TTL + LRU bounded completion cache with optional Redis sharing."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        redis_client: Any = None,
+    ) -> None:
+        self.max_entries = int(max_entries if max_entries is not None else settings.llm_response_cache_max_entries)
+        self.ttl_seconds = int(ttl_seconds if ttl_seconds is not None else settings.llm_response_cache_ttl_seconds)
+        self._redis = redis_client
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "redis_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "redis_errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def _redis_client(self) -> Any:
+        if self._redis is None:
+            if not settings.llm_response_cache_redis_enabled:
+                return None
+            from core.clients.redis_client import redis_client
+
+            self._redis = redis_client
+        # Only reuse an established connection; never connect from a completion
+        return self._redis if getattr(self._redis, "redis", None) is not None else None
+
+    def _remember(self, key: str, content: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    async def get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1]
+                del self._entries[key]
+        client = self._redis_client()
+        if client is not None:
+            try:
+                payload = await client.get_json(f"{REDIS_PREFIX}{key}")
+            except Exception as exc:
+                self._stats["redis_errors"] += 1
+                log.debug(f"LLM response cache Redis read failed: {exc}")
+                payload = None
+            if isinstance(payload, dict) and payload.get("content"):
+                content = str(payload["content"])
+                remaining = float(payload.get("expires_at", 0)) - time.time()
+                if remaining > 0:
+                    self._remember(key, content, now + remaining)
+                    self._stats["redis_hits"] += 1
+                    return content
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, key: str, content: str) -> None:
+        if not self.enabled or not content:
+            return
+        self._remember(key, content, time.monotonic() + self.ttl_seconds)
+        self._stats["stores"] += 1
+        client = self._redis_client()
+        if client is None:
+            return
+        try:
+            await client.set_json(
+                f"{REDIS_PREFIX}{key}",
+                {"content": content, "expires_at": time.time() + self.ttl_seconds},
+                expire=self.ttl_seconds,
+            )
+        except Exception as exc:
+            self._stats["redis_errors"] += 1
+            log.debug(f"LLM response cache Redis write failed: {exc}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["redis_hits"] + self._stats["misses"]
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round((self._stats["hits"] + self._stats["redis_hits"]) / lookups, 4) if lookups else 0.0,
+            **self._stats,
+        }
+
+
+# Global cache shared by every CamelLLMClient
+llm_response_cache = LLMResponseCache()
@@ -26,6 +26,7 @@ class PoolModel(BaseModel):
     txCount: int | str
     volumeUSD: float
     totalValueLockedUSD: float
+    feeTier: int | None = None
 
     @property
     def pair_symbol(self) -> str:
@@ -49,6 +50,7 @@ class PoolSelectionModel(BaseModel):
     volume_usd: float
     tx_count: int
     created_at: str
+    fee_tier: int | None = None
 
 
 class PolywhalerAssetModel(BaseModel):
@@ -2,12 +2,14 @@
 
 from .types import DexTraderConfig, ReviewMode
 from .execution_tracker import ExecutionTracker
+from .context_compaction import ContextCompactor
 from .watchlist_worker import WatchlistWorker
 
 __all__ = [
     "ReviewMode",
     "DexTraderConfig",
     "ExecutionTracker",
+    "ContextCompactor",
     "WatchlistWorker",
 ]
 
@@ -0,0 +1,185 @@
+"""
+Token-budgeted prompt context for DEX workforce tasks.
+
+Tasks hand their payloads (wallet state, trade history, earlier stage
+results) to ``ContextCompactor.compose`` as named sections in priority
+order. The prompt is rendered as compact JSON per section and, while it is
+over ``budget_tokens``, sections are shrunk level by level, lowest priority
+first:
+
+1. lists cut to 10 items, strings to 300 characters, nesting to 6 levels;
+2. 3 items, 120 characters, 3 levels;
+3. 1 item, 60 characters, 1 level;
+4. the section is replaced by an omission note (never the first section).
+
+Within one prompt, a repeated sub-structure (e.g. the wallet state nested in
+both the wallet review and the position update) is written once and later
+occurrences become ``<same as section.path>``. Each pipeline execution gets
+its own compactor; across its tasks, rendered sections are memoised by
+content hash, so a payload passed to several stages is serialised and shrunk
+once and reads identically in each.
+Every compose call returns a report with the prompt tokens per section.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.logging import log
+
+# (max list items, max string chars, max nesting depth) per compaction level
+LEVELS: Tuple[Optional[Tuple[int, int, int]], ...] = (None, (10, 300, 6), (3, 120, 3), (1, 60, 1))
+OMITTED_LEVEL = len(LEVELS)
+# Sub-structures shorter than this are cheaper to repeat than to reference
+MIN_REF_CHARS = 120
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str, separators=(",", ":"), sort_keys=True)
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def build_token_counter() -> Callable[[str], int]:
+    """``OpenAITokenCounter`` when its encoding is available, else a 4-chars/token estimate."""
+    try:
+        from camel.types import ModelType
+        from camel.utils import OpenAITokenCounter
+
+        counter = OpenAITokenCounter(ModelType.GPT_4O_MINI)
+        counter.count_tokens_from_messages([{"role": "user", "content": "probe"}])
+    except Exception as exc:
+        log.debug(f"OpenAITokenCounter unavailable, estimating prompt tokens: {exc}")
+        return _estimate_tokens
+
+    def _count(text: str) -> int:
+        return int(counter.count_tokens_from_messages([{"role": "user", "content": text}]))
+
+    return _count
+
+
+def _shrink(value: Any, max_items: int, max_chars: int, depth: int) -> Any:
+    if isinstance(value, str):
+        return value if len(value) <= max_chars else f"{value[:max_chars]}…"
+    if isinstance(value, dict):
+        if depth <= 0:
+            return f"{{…{len(value)} keys}}"
+        return {str(k): _shrink(v, max_items, max_chars, depth - 1) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        if depth <= 0:
+            return f"[…{len(value)} items]"
+        items = [_shrink(v, max_items, max_chars, depth - 1) for v in list(value)[:max_items]]
+        if len(value) > max_items:
+            items.append(f"…(+{len(value) - max_items} more)")
+        return items
+    return value
+
+
+def compact_json(value: Any, max_chars: int) -> str:
+    """JSON for ``value`` within ``max_chars``, shrinking structure before cutting text."""
+    text = json.dumps(value, default=str)
+    for limits in LEVELS[1:]:
+        if len(text) <= max_chars:
+            return text
+        text = json.dumps(_shrink(value, *limits), default=str)
+    return text if len(text) <= max_chars else f"{text[:max_chars]}...(truncated)"
+
+
+def _dedupe(value: Any, path: str, seen: Dict[str, str]) -> Any:
+    """Replace sub-structures already written earlier in the prompt by a reference."""
+    if not isinstance(value, (dict, list, tuple)):
+        return value
+    text = _dumps(value)
+    if len(text) >= MIN_REF_CHARS:
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        if digest in seen:
+            return f"<same as {seen[digest]}>"
+        seen[digest] = path
+    if isinstance(value, dict):
+        return {str(k): _dedupe(v, f"{path}.{k}", seen) for k, v in value.items()}
+    return [_dedupe(v, f"{path}[{i}]", seen) for i, v in enumerate(value)]
+
+
+class ContextCompactor:
+    """Render task payload sections within a prompt token budget."""
+
+    def __init__(self, budget_tokens: int, count_tokens: Optional[Callable[[str], int]] = None) -> None:
+        self.budget_tokens = int(budget_tokens)
+        self._count_tokens = count_tokens
+        self._rendered: Dict[Tuple[str, int], Tuple[str, int]] = {}
+        self._sent: Dict[str, str] = {}
+        self._reports: List[Dict[str, Any]] = []
+
+    def count(self, text: str) -> int:
+        if self._count_tokens is None:
+            self._count_tokens = build_token_counter()
+        return self._count_tokens(text)
+
+    def reports(self) -> List[Dict[str, Any]]:
+        return list(self._reports)
+
+    def _render(self, name: str, value: Any, level: int) -> Tuple[str, int]:
+        if level >= OMITTED_LEVEL:
+            text = f"## {name}\n(omitted to fit the context budget)"
+            return text, self.count(text)
+        body = value if isinstance(value, str) else _dumps(value)
+        key = (hashlib.sha1(f"{name}\n{body}".encode("utf-8")).hexdigest(), level)
+        cached = self._rendered.get(key)
+        if cached is not None:
+            return cached
+        limits = LEVELS[level]
+        if limits is not None:
+            shrunk = _shrink(value, *limits)
+            body = shrunk if isinstance(shrunk, str) else _dumps(shrunk)
+        text = f"## {name}\n{body}"
+        rendered = (text, self.count(text))
+        self._rendered[key] = rendered
+        return rendered
+
+    def compose(self, task_type: str, header: str, sections: Sequence[Tuple[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """Prompt text for ``header`` plus ``sections`` (highest priority first) and its token report."""
+        seen: Dict[str, str] = {}
+        values = [(name, _dedupe(value, name, seen)) for name, value in sections]
+        shared = []
+        for name, value in sections:
+            digest = hashlib.sha1(_dumps(value).encode("utf-8")).hexdigest()
+            if digest in self._sent and self._sent[digest] != task_type:
+                shared.append(name)
+            self._sent.setdefault(digest, task_type)
+
+        header_tokens = self.count(header)
+        levels = [0] * len(values)
+        rendered = [self._render(name, value, 0) for name, value in values]
+
+        def total() -> int:
+            return header_tokens + sum(tokens for _, tokens in rendered)
+
+        for level in range(1, OMITTED_LEVEL + 1):
+            if total() <= self.budget_tokens:
+                break
+            for index in range(len(values) - 1, -1, -1):
+                if level == OMITTED_LEVEL and index == 0:
+                    continue
+                name, value = values[index]
+                levels[index] = level
+                rendered[index] = self._render(name, value, level)
+                if total() <= self.budget_tokens:
+                    break
+
+        content = "\n\n".join([header, *(text for text, _ in rendered)])
+        report = {
+            "task_type": task_type,
+            "prompt_tokens": total(),
+            "budget_tokens": self.budget_tokens,
+            "over_budget": total() > self.budget_tokens,
+            "sections": {
+                name: {"tokens": tokens, "level": level}
+                for (name, _), (_, tokens), level in zip(values, rendered, levels)
+            },
+            "shared_sections": shared,
+        }
+        self._reports.append(report)
+        return content, report
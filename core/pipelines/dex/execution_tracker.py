@@ -3,21 +3,58 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable
 from uuid import uuid4
 
+from core.logging import log
 from core.pipelines.dex.types import ReviewMode
+from core.telemetry.profiler import SamplingProfiler, sampling_profiler
+
+# Fields kept out of change notifications; subscribers fetch them on demand
+_BULKY_FIELDS = frozenset({"result", "profile"})
 
 
 class ExecutionTracker:
-    """Track queued/running/completed pipeline executions."""
+    """Track queued/running/completed pipeline executions.
+
+    ``on_change`` receives a compact delta after every update (the fields that
+    changed plus id, status and timestamp; bulky fields such as the result
+    summary are left for ``get_status``), e.g. to publish it for live
+    dashboards. Executions can be run under the
+    sampling profiler (at launch or while running); the collapsed stacks are
+    kept with the execution and a summary lands in its state.
+    """
 
-    def __init__(self, summarize_payload: Callable[[dict[str, Any], int], str]) -> None:
+    def __init__(
+        self,
+        summarize_payload: Callable[[dict[str, Any], int], str],
+        on_change: Callable[[dict[str, Any]], None] | None = None,
+        profiler: SamplingProfiler | None = None,
+        max_profiles: int = 50,
+    ) -> None:
         self._tasks: dict[str, asyncio.Task] = {}
         self._state: dict[str, dict[str, Any]] = {}
         self._order: list[str] = []
         self._summarize_payload = summarize_payload
+        self._on_change = on_change
+        self._profiler = profiler or sampling_profiler
+        self._profiles: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._max_profiles = int(max_profiles)
+
+    def _notify(self, state: dict[str, Any], changes: dict[str, Any] | None = None) -> None:
+        if self._on_change is None:
+            return
+        source = state if changes is None else changes
+        delta = {key: value for key, value in source.items() if key not in _BULKY_FIELDS}
+        for key in ("execution_id", "status", "updated_at"):
+            if key in state:
+                delta[key] = state[key]
+        try:
+            self._on_change(delta)
+        except Exception as exc:
+            log.debug(f"Execution change hook failed: {exc}")
 
     @staticmethod
     def _now_iso() -> str:
@@ -28,12 +65,14 @@ class ExecutionTracker:
         state.update(updates)
         state["updated_at"] = self._now_iso()
         self._state[execution_id] = state
+        self._notify(state, updates)
 
     def launch(
         self,
         mode: ReviewMode,
         reason: str,
         run_fn: Callable[[str], Awaitable[dict[str, Any]]],
+        profile: bool = False,
     ) -> str:
         execution_id = str(uuid4())
         now = self._now_iso()
@@ -47,9 +86,11 @@ class ExecutionTracker:
         }
         self._order.insert(0, execution_id)
         self._order = self._order[:500]
+        self._notify(self._state[execution_id])
 
         async def _runner() -> None:
-            self.set_state(execution_id, status="running")
+            profiling = (profile or self._profiler.should_sample()) and self._profiler.start(execution_id)
+            self.set_state(execution_id, status="running", profiling=bool(profiling))
             try:
                 result = await run_fn(execution_id)
                 self.set_state(
@@ -61,10 +102,42 @@ class ExecutionTracker:
                 self.set_state(execution_id, status="failed", error=str(exc))
             finally:
                 self._tasks.pop(execution_id, None)
+                self._finish_profile(execution_id)
 
         self._tasks[execution_id] = asyncio.create_task(_runner())
         return execution_id
 
+    def enable_profiling(self, execution_id: str) -> bool:
+        """Start profiling a running execution; False if it is not running."""
+        task = self._tasks.get(execution_id)
+        if task is None or task.done():
+            return False
+        if not self._profiler.is_active(execution_id):
+            self._profiler.start(execution_id, task=task)
+        self.set_state(execution_id, profiling=True)
+        return True
+
+    def _finish_profile(self, execution_id: str) -> None:
+        result = self._profiler.stop(execution_id)
+        if result is None:
+            return
+        self._profiles[execution_id] = result
+        while len(self._profiles) > self._max_profiles:
+            self._profiles.popitem(last=False)
+        self.set_state(
+            execution_id,
+            profiling=False,
+            profile={key: result[key] for key in ("samples", "duration_s", "top")},
+        )
+
+    def get_profile(self, execution_id: str) -> dict[str, Any] | None:
+        """Profile of a finished execution, or the partial one of a running execution."""
+        if execution_id in self._profiles:
+            return self._profiles[execution_id]
+        if self._profiler.is_active(execution_id):
+            return self._profiler.snapshot(execution_id)
+        return None
+
     def get_status(self, execution_id: str) -> dict[str, Any]:
         return self._state.get(execution_id, {"execution_id": execution_id, "status": "not_found"})
 
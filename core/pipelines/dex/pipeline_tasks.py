@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from core.settings.config import settings
+from core.pipelines.dex.context_compaction import ContextCompactor
 from core.pipelines.dex.types import ReviewMode
 from core.pipelines.tasks import BasePipelineTask
 
@@ -38,6 +39,10 @@ class DexCyclePipelineTask(BasePipelineTask):
     }
 
     async def execute(self, context: dict[str, object]) -> dict[str, object]:
+        with self.runtime._execution_context_scope() as context_compactor:
+            return await self._execute(context, context_compactor)
+
+    async def _execute(self, context: dict[str, object], context_compactor: ContextCompactor) -> dict[str, object]:
         runtime = self.runtime
         mode = context["mode"]
         reason = str(context["reason"])
@@ -223,6 +228,7 @@ class DexCyclePipelineTask(BasePipelineTask):
             "position_update": position_update,
             "enhancement": enhancement,
             "strategy_hint": strategy_hint,
+            "context": context_compactor.reports(),
         }
         runtime._emit("INFO", "DEX cycle completed", {"mode": mode.value, "reason": reason, "started_at": started_at.isoformat()})
         if execution_id:
@@ -244,6 +250,10 @@ class DexWatchlistReviewPipelineTask(BasePipelineTask):
     }
 
     async def execute(self, context: dict[str, object]) -> dict[str, object]:
+        with self.runtime._execution_context_scope():
+            return await self._execute(context)
+
+    async def _execute(self, context: dict[str, object]) -> dict[str, object]:
         runtime = self.runtime
         notification: dict[str, Any] = context["notification"]  # type: ignore[assignment]
 
@@ -258,11 +268,10 @@ class DexWatchlistReviewPipelineTask(BasePipelineTask):
             reason="watchlist_review_only",
         )
         task = runtime._build_task(
-            content=(
-                "Review the triggered position and update watchlist state without full trade pipeline.\n"
-                f"Notification: {notification}\n"
-                f"Wallet feedback: {wallet_feedback}\n"
-                f"Position update: {position_update}"
+            content=runtime._compose_task_content(
+                "watchlist_review",
+                "Review the triggered position and update watchlist state without full trade pipeline.",
+                [("notification", notification), ("wallet_feedback", wallet_feedback), ("position_update", position_update)],
             ),
             task_type="watchlist_review",
             additional_info={
@@ -26,5 +26,6 @@ class DexTraderConfig:
     token_exploration_limit: int = settings.dex_trader_token_exploration_limit
     wallet_review_cache_seconds: int = settings.dex_wallet_review_cache_seconds
     strategy_hint_interval_hours: int = settings.dex_strategy_hint_interval_hours
+    context_token_budget: int = settings.dex_context_token_budget
     auto_enhancement_enabled: bool = settings.auto_enhancement_enabled
 
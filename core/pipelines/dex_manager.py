@@ -10,9 +10,11 @@ Provides a DEX-focused orchestration layer with:
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from camel.tasks import Task
 from camel.societies.workforce import Workforce
@@ -21,14 +23,19 @@ from core.camel_tools.auto_enhancement_toolkit import AutoEnhancementToolkit
 from core.camel_tools.uviswap_toolkit import UviSwapToolkit
 from core.camel_tools.wallet_analysis_toolkit import WalletAnalysisToolkit
 from core.camel_tools.watchlist_toolkit import WatchlistToolkit
+from core.clients.event_bus import EventBus
 from core.logging import log
 from core.pipelines.dex import DexTraderConfig, ExecutionTracker, ReviewMode
+from core.pipelines.dex.context_compaction import ContextCompactor, build_token_counter, compact_json
 from core.pipelines.dex.task_flows import build_dex_pipeline_tasks
 from core.pipelines.dex.trigger_flows import build_dex_trigger_flows
 from core.pipelines.dex.triggers.interval import DexCycleIntervalRuntime
 from core.pipelines.dex.triggers.watchlist import DexWatchlistRuntime
 from core.pipelines.manager_base import TaskFlowManagerMixin
 
+# Prompt compactor of the pipeline execution running in the current asyncio task
+_execution_context: ContextVar[ContextCompactor | None] = ContextVar("dex_execution_context", default=None)
+
 
 class DexManager(TaskFlowManagerMixin):
     """DEX manager orchestration with strategy cycle + watchlist parallel worker."""
@@ -62,7 +69,9 @@ class DexManager(TaskFlowManagerMixin):
         self._wallet_review_cache_at: dict[str, datetime] = {}
         self._strategy_hint_cache: dict[str, Any] | None = None
         self._strategy_hint_at: datetime | None = None
-        self._execution_tracker = ExecutionTracker(self._summarize_payload)
+        self._execution_tracker = ExecutionTracker(self._summarize_payload, on_change=self._publish_execution)
+        self._token_counter: Callable[[str], int] | None = None
+        self._context_reports: deque[dict[str, Any]] = deque(maxlen=20)
         self.pipeline = "dex"
         self.system_name = "dex_manager"
         self._init_task_flow_registry(build_dex_pipeline_tasks(self))
@@ -99,14 +108,23 @@ class DexManager(TaskFlowManagerMixin):
             resolved_workforce = await runtime.get_workforce()
         return cls(workforce=resolved_workforce, config=config, event_logger=event_logger)
 
+    def _publish_execution(self, state: dict[str, Any]) -> None:
+        EventBus(getattr(self.watchlist_toolkit, "redis", None)).publish("dex.executions", state)
+
     def _set_execution_state(self, execution_id: str, **updates: Any) -> None:
         self._execution_tracker.set_state(execution_id, **updates)
 
-    def launch_execution(self, mode: ReviewMode, reason: str) -> str:
+    def launch_execution(self, mode: ReviewMode, reason: str, profile: bool = False) -> str:
         async def _run_with_execution_id(execution_id: str) -> dict[str, Any]:
             return await self.run_trader_cycle(mode=mode, reason=reason, execution_id=execution_id)
 
-        return self._execution_tracker.launch(mode=mode, reason=reason, run_fn=_run_with_execution_id)
+        return self._execution_tracker.launch(mode=mode, reason=reason, run_fn=_run_with_execution_id, profile=profile)
+
+    def enable_execution_profiling(self, execution_id: str) -> bool:
+        return self._execution_tracker.enable_profiling(execution_id)
+
+    def get_execution_profile(self, execution_id: str) -> dict[str, Any] | None:
+        return self._execution_tracker.get_profile(execution_id)
 
     def get_execution_status(self, execution_id: str) -> dict[str, Any]:
         return self._execution_tracker.get_status(execution_id)
@@ -197,8 +215,37 @@ class DexManager(TaskFlowManagerMixin):
 
     @staticmethod
     def _summarize_payload(payload: dict[str, Any], max_len: int = 1500) -> str:
-        text = json.dumps(payload, default=str)
-        return text if len(text) <= max_len else f"{text[:max_len]}...(truncated)"
+        return compact_json(payload, max_len)
+
+    def _new_context(self) -> ContextCompactor:
+        if self._token_counter is None:
+            self._token_counter = build_token_counter()
+        return ContextCompactor(self.config.context_token_budget, count_tokens=self._token_counter)
+
+    @contextmanager
+    def _execution_context_scope(self) -> Iterator[ContextCompactor]:
+        """Give the enclosed pipeline execution its own prompt compactor.
+
+        The compactor lives in a context variable, which asyncio copies per
+        task, so concurrent executions never see each other's sections or reports.
+        The previous value is restored on exit.
+        """
+        compactor = self._new_context()
+        token = _execution_context.set(compactor)
+        try:
+            yield compactor
+        finally:
+            _execution_context.reset(token)
+
+    def _compose_task_content(self, task_type: str, header: str, sections: list[tuple[str, Any]]) -> str:
+        # Outside a pipeline execution nothing is memoised across calls
+        compactor = _execution_context.get() or self._new_context()
+        content, report = compactor.compose(task_type, header, sections)
+        self._context_reports.append(report)
+        self._emit("INFO", "DEX task context", report)
+        if report["over_budget"]:
+            log.debug(f"DEX task context over budget type={task_type} tokens={report['prompt_tokens']}")
+        return content
 
     def _build_task(
         self,
@@ -237,18 +284,7 @@ class DexManager(TaskFlowManagerMixin):
         redis_client = self.watchlist_toolkit.redis
         if not redis_client:
             return []
-        try:
-            raw_items = redis_client.lrange("dex:trade_history", 0, max(0, limit - 1))
-            trades: list[dict[str, Any]] = []
-            for raw in raw_items:
-                try:
-                    trades.append(json.loads(raw))
-                except Exception:
-                    continue
-            return trades
-        except Exception as exc:
-            log.debug(f"Unable to load recent trade history: {exc}")
-            return []
+        return EventBus(redis_client).latest("dex.trades", limit)
 
     async def run_trader_cycle(self, mode: ReviewMode, reason: str, execution_id: str | None = None) -> dict[str, Any]:
         return await self.run_trigger_flow("cycle", mode=mode, reason=reason, execution_id=execution_id)
@@ -271,7 +307,7 @@ class DexManager(TaskFlowManagerMixin):
             "markets_context_hint": "Use token exploration with liquidity/tvl/volume metrics and pool mapping.",
         }
         task = self._build_task(
-            content=f"Token exploration stage: {payload}",
+            content=self._compose_task_content("token_exploration", "Token exploration stage.", [("request", payload)]),
             task_type="token_exploration",
             parent=parent,
             dependencies=dependencies,
@@ -289,10 +325,12 @@ class DexManager(TaskFlowManagerMixin):
         additional_info: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "news_sentiment",
                 "News and sentiment stage. Use recent token candidates from exploration, "
                 "news signals, and polymarket review with price context before trend analysis.\n"
-                f"mode={mode.value} exploration={exploration}"
+                f"mode={mode.value}",
+                [("exploration", exploration)],
             ),
             task_type="news_sentiment",
             parent=parent,
@@ -312,10 +350,12 @@ class DexManager(TaskFlowManagerMixin):
         additional_info: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "trend_analysis",
                 "Trend analysis stage. Analyze candidate tokens with market structure, momentum, "
                 "and timing.\n"
-                f"mode={mode.value} exploration={exploration} news_sentiment={news_sentiment}"
+                f"mode={mode.value}",
+                [("exploration", exploration), ("news_sentiment", news_sentiment)],
             ),
             task_type="trend_analysis",
             parent=parent,
@@ -337,10 +377,12 @@ class DexManager(TaskFlowManagerMixin):
         additional_info: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "decision_gateway",
                 "Decision gateway stage. Fuse token exploration + news/sentiment + trend + wallet feedback. "
                 "Choose execute/skip and register risk controls for selected positions.\n"
-                f"mode={mode.value} exploration={exploration} news={news_sentiment} trend={trend} wallet={wallet_feedback}"
+                f"mode={mode.value}",
+                [("trend", trend), ("wallet", wallet_feedback), ("news", news_sentiment), ("exploration", exploration)],
             ),
             task_type="decision_gateway",
             parent=parent,
@@ -394,10 +436,11 @@ class DexManager(TaskFlowManagerMixin):
         global_wallet = self.wallet_toolkit.get_global_wallet_state(wallet_address=wallet_address)
         recent_trades = self._get_recent_trade_history(limit=20)
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "wallet_review",
                 "Wallet review task. Analyze wallet exposure, open positions, and risk state.\n"
-                f"mode={mode.value} reason={reason} wallet_feedback={wallet_feedback} "
-                f"global_wallet={global_wallet} recent_trades={recent_trades}"
+                f"mode={mode.value} reason={reason}",
+                [("wallet_feedback", wallet_feedback), ("global_wallet", global_wallet), ("recent_trades", recent_trades)],
             ),
             task_type="wallet_review",
             parent=parent,
@@ -427,9 +470,11 @@ class DexManager(TaskFlowManagerMixin):
     ) -> dict[str, Any]:
         global_wallet_state = self.wallet_toolkit.get_global_wallet_state(wallet_address=wallet_address)
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "position_update_review",
                 "Review current positions and update watchlist/exit plans as needed based on wallet ROI and token exposure.\n"
-                f"mode={mode.value} reason={reason} global_wallet_state={global_wallet_state}"
+                f"mode={mode.value} reason={reason}",
+                [("global_wallet_state", global_wallet_state)],
             ),
             task_type="position_update_review",
             parent=parent,
@@ -452,9 +497,11 @@ class DexManager(TaskFlowManagerMixin):
 
         feedback = self.enhancement_toolkit.generate_feedback()
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "auto_enhancement",
                 "Auto enhancement task. Review trade history and wallet outcomes to improve next cycle.\n"
-                f"mode={mode.value} reason={reason} feedback={feedback}"
+                f"mode={mode.value} reason={reason}",
+                [("feedback", feedback)],
             ),
             task_type="auto_enhancement",
             parent=parent,
@@ -485,7 +532,8 @@ class DexManager(TaskFlowManagerMixin):
 
         recent_trades = self._get_recent_trade_history(limit=50)
         task = self._build_task(
-            content=(
+            content=self._compose_task_content(
+                "strategy_hint",
                 "Future trade process hint task.\n"
                 "Provide a concise strategy memo covering:\n"
                 "1) which strategy profile should lead next cycles,\n"
@@ -493,12 +541,14 @@ class DexManager(TaskFlowManagerMixin):
                 "3) current global crypto market feeling/regime (alt season, bullish, neutral, risk-off),\n"
                 "4) what was done wrong recently,\n"
                 "5) concrete improvements for the next decision cycles.\n"
-                f"mode={mode.value} reason={reason}\n"
-                f"wallet_review={wallet_review}\n"
-                f"position_update={position_update}\n"
-                f"decision={decision}\n"
-                f"enhancement={enhancement}\n"
-                f"recent_trades={recent_trades}"
+                f"mode={mode.value} reason={reason}",
+                [
+                    ("decision", decision),
+                    ("wallet_review", wallet_review),
+                    ("position_update", position_update),
+                    ("enhancement", enhancement),
+                    ("recent_trades", recent_trades),
+                ],
             ),
             task_type="strategy_hint",
             parent=parent,
@@ -544,8 +594,7 @@ class DexManager(TaskFlowManagerMixin):
         if not self.watchlist_toolkit.redis:
             return
         try:
-            self.watchlist_toolkit.redis.lpush("dex:trade_history", json.dumps(payload))
-            self.watchlist_toolkit.redis.ltrim("dex:trade_history", 0, 1000)
+            EventBus(self.watchlist_toolkit.redis).publish("dex.trades", payload)
         except Exception as exc:
             log.debug(f"Failed recording dex trade history: {exc}")
 
@@ -581,6 +630,13 @@ class DexManager(TaskFlowManagerMixin):
             "strategy_hint_interval_hours": self.config.strategy_hint_interval_hours,
             "last_strategy_hint_at": self._strategy_hint_at.isoformat() if self._strategy_hint_at else None,
             "auto_enhancement_enabled": self.config.auto_enhancement_enabled,
+            "context": {
+                "budget_tokens": self.config.context_token_budget,
+                "last_tasks": [
+                    {key: report[key] for key in ("task_type", "prompt_tokens", "over_budget", "shared_sections")}
+                    for report in self._context_reports
+                ],
+            },
             "workers": workers,
             "task_flows": self._task_flow_hub.list_flows(flags=self._task_flow_flags),
             "trigger_flows": self.list_trigger_flows(),
@@ -7,6 +7,7 @@ from typing import Any, Protocol
 
 from core.pipelines.triggers import BaseTriggerFlow
 from core.pipelines.tasks import BasePipelineTask, TaskFlowHub
+from core.telemetry.tracing import tracer
 
 
 class PipelineManager(Protocol):
@@ -67,7 +68,15 @@ class TaskFlowManagerMixin:
 
         started_at = datetime.now(timezone.utc)
         try:
-            result = await flow.resolve(**kwargs)
+            # One (sampled) trace per trader cycle; task flows and outbound calls nest under it
+            with tracer.trace(
+                f"{self.pipeline}.{trigger_id}",
+                system_name=self.system_name,
+                trigger_id=trigger_id,
+            ) as trace_attrs:
+                result = await flow.resolve(**kwargs)
+                if trace_attrs is not None and isinstance(result, dict):
+                    trace_attrs["result_status"] = result.get("status")
             if isinstance(result, dict):
                 payload = dict(result)
             else:
@@ -0,0 +1,157 @@
+"""Columnar market batches for vectorized Polymarket filtering and scoring."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+
+@lru_cache(maxsize=16384)
+def _parse_close_ts(value: str) -> float:
+    """Parse an ISO close time to epoch seconds (memoized across scans)."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return float("nan")
+    if parsed.tzinfo is None:
+        return float("nan")
+    return parsed.timestamp()
+
+
+def _close_ts(value: Any) -> float:
+    if isinstance(value, str):
+        return _parse_close_ts(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.timestamp()
+    return float("nan")
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return float("nan")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _liquidity_score(market: dict[str, Any]) -> float:
+    """0-100 depth score; catalog records only carry USD liquidity.
+
+    USD liquidity maps onto the score logarithmically: $100 scores 40 (the
+    default floor) and $100k or more scores 100.
+    """
+    if "liquidity_score" in market:
+        return _as_float(market.get("liquidity_score"))
+    liquidity = _as_float(market.get("liquidity"))
+    if np.isnan(liquidity) or liquidity < 0:
+        return float("nan")
+    return min(100.0, 20.0 * float(np.log10(1.0 + liquidity)))
+
+
+def _spread_pct(market: dict[str, Any]) -> float:
+    """Bid-ask spread in percentage points; catalog records carry it as a 0-1 price."""
+    if "bid_ask_spread" in market:
+        return _as_float(market.get("bid_ask_spread"))
+    spread = market.get("spread")
+    if spread is None and market.get("bestBid") is not None and market.get("bestAsk") is not None:
+        spread = _as_float(market["bestAsk"]) - _as_float(market["bestBid"])
+    return _as_float(spread) * 100.0 if spread is not None else 1.0
+
+
+def _market_close_ts(market: dict[str, Any]) -> float:
+    if market.get("close_time") is not None:
+        return _close_ts(market["close_time"])
+    if market.get("end_ts") is not None:
+        return _as_float(market["end_ts"])
+    return _close_ts(market.get("endDate"))
+
+
+@dataclass
+class MarketBatch:
+    """Column arrays extracted once from a list of market dicts.
+
+    Missing or malformed values become NaN so they fail every mask, mirroring
+    the per-market skip behaviour of the original loop. Both scanner records
+    (``liquidity_score``/``bid_ask_spread``/``close_time``) and market catalog
+    records (``liquidity``/``spread``/``endDate``/``end_ts``) are accepted.
+    """
+
+    markets: list[dict[str, Any]]
+    volume_24h: np.ndarray
+    liquidity: np.ndarray
+    spread: np.ndarray
+    close_ts: np.ndarray
+
+    @classmethod
+    def from_markets(cls, markets: list[dict[str, Any]]) -> "MarketBatch":
+        size = len(markets)
+        volume = np.empty(size, dtype=np.float64)
+        liquidity = np.empty(size, dtype=np.float64)
+        spread = np.empty(size, dtype=np.float64)
+        close_ts = np.empty(size, dtype=np.float64)
+        for idx, market in enumerate(markets):
+            volume[idx] = _as_float(market.get("volume_24h", 0))
+            liquidity[idx] = _liquidity_score(market)
+            spread[idx] = _spread_pct(market)
+            close_ts[idx] = _market_close_ts(market)
+        return cls(markets, volume, liquidity, spread, close_ts)
+
+    def hours_to_close(self, now: datetime | None = None) -> np.ndarray:
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        return (self.close_ts - now_ts) / 3600.0
+
+    def scores(self) -> np.ndarray:
+        return (self.volume_24h / 1000.0) + (self.liquidity / 10.0) - (self.spread / 2.0)
+
+
+def select_top_markets(
+    markets: list[dict[str, Any]],
+    *,
+    limit: int = 20,
+    min_volume: float = 100.0,
+    min_liquidity: float = 40.0,
+    max_spread: float = 5.0,
+    min_hours_to_close: float = 1.0,
+    max_hours_to_close: float = 240.0,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Apply opportunity filters and return the top-scoring markets.
+
+    Filtering is done with boolean masks over the batch columns and the
+    top-k is selected with ``argpartition`` so cost grows linearly with the
+    batch size instead of requiring a full sort.
+    """
+    if not markets or limit <= 0:
+        return []
+    batch = MarketBatch.from_markets(markets)
+    hours = batch.hours_to_close(now)
+    with np.errstate(invalid="ignore"):
+        mask = (
+            (batch.volume_24h >= min_volume)
+            & (batch.liquidity >= min_liquidity)
+            & (batch.spread <= max_spread)
+            & (hours >= min_hours_to_close)
+            & (hours <= max_hours_to_close)
+        )
+    candidates = np.flatnonzero(mask)
+    if candidates.size == 0:
+        return []
+    scores = batch.scores()[candidates]
+    if candidates.size > limit:
+        # k-th best score via argpartition; keep every row tied with it so the
+        # cut below matches a stable sort
+        kth = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+        top = np.flatnonzero(scores >= kth)
+    else:
+        top = np.arange(candidates.size)
+    # Highest score first; ties keep input order like a stable sort
+    order = top[np.lexsort((candidates[top], -scores[top]))][:limit]
+    return [
+        {**markets[int(candidates[pos])], "filter_score": float(scores[pos])}
+        for pos in order
+    ]
@@ -21,6 +21,7 @@ class PolymarketBatchTriggerFlow(BaseTriggerFlow):
             "trigger_type": {"type": "string"},
             "verify_positions": {"type": "boolean"},
             "enforce_limits": {"type": "boolean"},
+            "markets": {"type": "array"},
         },
     }
 
@@ -29,6 +30,8 @@ class PolymarketBatchTriggerFlow(BaseTriggerFlow):
         trigger_type = str(kwargs.get("trigger_type", "interval"))
         verify_positions = bool(kwargs.get("verify_positions", True))
         enforce_limits = bool(kwargs.get("enforce_limits", True))
+        # Market deltas pushed by the event trigger; skips the fetch when provided
+        provided_markets = kwargs.get("markets")
 
         if runtime._scan_lock.locked():
             return {
@@ -81,7 +84,10 @@ class PolymarketBatchTriggerFlow(BaseTriggerFlow):
                 if verify_positions:
                     await runtime._refresh_active_positions()
 
-                markets = await runtime._fetch_latest_markets()
+                if provided_markets is not None:
+                    markets = list(provided_markets)
+                else:
+                    markets = await runtime._fetch_latest_markets()
                 if not markets:
                     log.debug("[POLYMARKET MANAGER] No markets found in scan")
                     return {"batch_id": batch_id, "markets_found": 0, "analyzed": 0}
@@ -106,6 +112,11 @@ class PolymarketBatchTriggerFlow(BaseTriggerFlow):
                 else:
                     filtered = markets[: runtime.batch_size]
                 if not filtered:
+                    if use_cache:
+                        # Reviewed and rejected: clear them so a met threshold does not refire the same batch
+                        runtime._feed_runtime.mark_processed([m["data"] for m in pending_markets])
+                        runtime._feed_cache = runtime._feed_runtime.cache
+                        runtime._save_cache()
                     return {
                         "batch_id": batch_id,
                         "timestamp": datetime.now(timezone.utc).isoformat(),
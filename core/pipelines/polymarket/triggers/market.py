@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
 
 from pydantic import BaseModel, Field
 
-from core.pipelines.workers import FeedCacheThresholdWorker
+from core.pipelines.workers import FeedCacheThresholdWorker, IntervalWorker
 from core.pipelines.trigger_registry import TriggerSpec, trigger_registry
 
 
@@ -100,8 +101,52 @@ class PolymarketFeedRuntime:
     def pending_items(self) -> list[dict[str, Any]]:
         return self._worker.pending_items()
 
+    def drain_changes(self) -> tuple[dict[str, dict[str, Any]], set[str]]:
+        return self._worker.drain_changes()
+
     def ready(self) -> bool:
         return self._worker.ready()
 
     def mark_processed(self, processed_items: list[dict[str, Any]]) -> None:
         self._worker.mark_processed(processed_items)
+
+
+class PolymarketMarketEventRuntime:
+    """Delta-driven market trigger: poll catalog changes, fire on threshold."""
+
+    def __init__(self, callback: Callable[[], Awaitable[Any]], poll_seconds: int) -> None:
+        self._worker = IntervalWorker(
+            callback=callback,
+            interval_seconds=max(5, int(poll_seconds)),
+            name="polymarket_market_events",
+            min_interval_seconds=5,
+        )
+        self.deltas_total = 0
+        self.batches_fired = 0
+        self.last_delta_at: str | None = None
+        self.last_fired_at: str | None = None
+
+    @property
+    def poll_seconds(self) -> int:
+        return int(self._worker.interval_seconds)
+
+    def record_delta(self, count: int) -> None:
+        if count:
+            self.deltas_total += int(count)
+            self.last_delta_at = datetime.now(timezone.utc).isoformat()
+
+    def record_fired(self) -> None:
+        self.batches_fired += 1
+        self.last_fired_at = datetime.now(timezone.utc).isoformat()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "poll_seconds": self.poll_seconds,
+            "deltas_total": self.deltas_total,
+            "batches_fired": self.batches_fired,
+            "last_delta_at": self.last_delta_at,
+            "last_fired_at": self.last_fired_at,
+        }
+
+    async def run_loop(self, is_running: Callable[[], bool]) -> None:
+        await self._worker.run_loop(is_running=is_running)
@@ -17,22 +17,28 @@ Pure CAMEL Workforce + Task decomposition with Polymarket MCP tools.
 from __future__ import annotations
 
 import asyncio
-import json
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
+from uuid import uuid4
 from enum import Enum
 
 from camel.tasks import Task
 from camel.societies.workforce import Workforce
 
+from core.clients.event_bus import get_event_bus
+from core.clients.polymarket_catalog import market_catalog
 from core.clients.polymarket_client import PolymarketClient
 from core.logging import log
 from core.pipelines.manager_base import TaskFlowManagerMixin
+from core.pipelines.polymarket.market_batch import select_top_markets
 from core.pipelines.polymarket.task_flows import build_polymarket_pipeline_tasks
 from core.pipelines.polymarket.trigger_flows import build_polymarket_trigger_flows
 from core.pipelines.polymarket.triggers.interval import PolymarketIntervalRuntime
-from core.pipelines.polymarket.triggers.market import PolymarketFeedRuntime
+from core.pipelines.polymarket.triggers.market import PolymarketFeedRuntime, PolymarketMarketEventRuntime
+from core.pipelines.workers import FeedCacheStore
+from core.settings.config import settings
+from core.telemetry.profiler import sampling_profiler
 
 
 class MarketFilterCriteria(Enum):
@@ -114,6 +120,7 @@ class PolymarketManager(TaskFlowManagerMixin):
         self.interval_hours = self.config.interval_hours
         self._running = False
         self._scan_task: Optional[asyncio.Task] = None
+        self._market_event_task: Optional[asyncio.Task] = None
         self._last_scan_cursor = None
         self._active_positions: Dict[str, Dict[str, Any]] = {}
         self.review_threshold = self.config.review_threshold
@@ -139,6 +146,11 @@ class PolymarketManager(TaskFlowManagerMixin):
             max_cache=self.max_cache,
             threshold=self.review_threshold,
         )
+        self._market_event_runtime = PolymarketMarketEventRuntime(
+            callback=self._market_event_tick,
+            poll_seconds=settings.polymarket_market_event_poll_seconds,
+        )
+        self._feed_store = FeedCacheStore(self.cache_path)
         self._load_cache()
 
     @classmethod
@@ -163,31 +175,41 @@ class PolymarketManager(TaskFlowManagerMixin):
         )
 
     def _load_cache(self) -> None:
-        """Load cached Polymarket feed state from disk."""
+        """Load cached Polymarket feed state (snapshot + append log) from disk."""
         try:
-            if self.cache_path.exists():
-                data = json.loads(self.cache_path.read_text())
-                self._feed_cache = data.get("markets", {}) if isinstance(data, dict) else {}
-            else:
-                self._feed_cache = {}
-            self._feed_runtime.load(self._feed_cache)
+            self._feed_runtime.load(self._feed_store.load())
         except Exception as exc:
             log.warning(f"[POLYMARKET RSS FLUX] Failed to load cache: {exc}")
-            self._feed_cache = {}
             self._feed_runtime.load({})
+        self._feed_cache = self._feed_runtime.cache
 
     def _save_cache(self) -> None:
-        """Persist cached Polymarket feed state to disk."""
+        """Queue changed feed entries for background persistence."""
         try:
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            payload = {
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "count": len(self._feed_cache),
-                "markets": self._feed_cache,
-            }
-            self.cache_path.write_text(json.dumps(payload, indent=2))
+            changed, removed = self._feed_runtime.drain_changes()
+            self._feed_store.save(self._feed_cache, changed, removed)
         except Exception as exc:
             log.warning(f"[POLYMARKET RSS FLUX] Failed to save cache: {exc}")
+            return
+        if changed or removed:
+            self._publish_feed_delta(changed, removed)
+
+    def _publish_feed_delta(self, changed: Dict[str, Dict[str, Any]], removed: set[str]) -> None:
+        """Push the changed feed entries to live dashboards (capped per event)."""
+        bus = get_event_bus()
+        if bus is None:
+            return
+        limit = 100
+        bus.publish(
+            "polymarket.feed_cache",
+            {
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "count": len(self._feed_cache),
+                "markets": dict(list(changed.items())[:limit]),
+                "removed": sorted(removed)[:limit],
+                "truncated": len(changed) > limit or len(removed) > limit,
+            },
+        )
 
     def _is_exhausted(self, market: Dict[str, Any]) -> bool:
         """Check if a market is exhausted (closed/expired or already active)."""
@@ -227,16 +249,24 @@ class PolymarketManager(TaskFlowManagerMixin):
         # Launch background scanning task
         self._interval_runtime.update_scan_interval(self.scan_interval)
         self._scan_task = asyncio.create_task(self._interval_runtime.run_loop(is_running=lambda: self._running))
+        self._market_event_task = asyncio.create_task(
+            self._market_event_runtime.run_loop(is_running=lambda: self._running)
+        )
 
     async def stop(self) -> None:
         """Graceful shutdown of market scanning."""
         self._running = False
-        if self._scan_task:
-            self._scan_task.cancel()
+        for task in (self._scan_task, self._market_event_task):
+            if not task:
+                continue
+            task.cancel()
             try:
-                await self._scan_task
+                await task
             except asyncio.CancelledError:
                 pass
+        self._scan_task = None
+        self._market_event_task = None
+        await asyncio.to_thread(self._feed_store.flush)
         log.info("[POLYMARKET RSS FLUX] Market scanning stopped")
 
     async def _interval_scan_tick(self) -> None:
@@ -244,6 +274,46 @@ class PolymarketManager(TaskFlowManagerMixin):
             return
         await self.process_market_batch(trigger_type="interval", verify_positions=True, enforce_limits=True)
 
+    async def _market_event_tick(self) -> None:
+        if self.trigger_type != "market":
+            return
+        await self.process_market_deltas()
+
+    async def process_market_deltas(self) -> Dict[str, Any]:
+        """Pull catalog deltas and fire the batch once the review threshold is met.
+
+        New/changed markets (catalog diff on id + updatedAt/volume/liquidity)
+        accumulate in the feed cache; unchanged polls cost one Gamma page and
+        never reach the workforce.
+        """
+        if not isinstance(self.polymarket_client, PolymarketClient):
+            return {"status": "skipped", "reason": "catalog_unavailable"}
+        try:
+            delta = await market_catalog.refresh(self.polymarket_client)
+        except Exception as exc:
+            log.warning(f"[POLYMARKET RSS FLUX] Catalog delta refresh failed: {exc}")
+            return {"status": "error", "error": str(exc)}
+
+        changed_ids = list(delta.get("added", [])) + list(delta.get("updated", []))
+        markets = [market for market in (market_catalog.get(mid) for mid in changed_ids) if market]
+        self._market_event_runtime.record_delta(len(markets))
+        if not markets:
+            self._feed_runtime.update_limits(max_cache=self.max_cache, threshold=self.review_threshold)
+            if not self._feed_runtime.ready():
+                return {"status": "idle", "deltas": 0, "pending_review": len(self._feed_cache)}
+            # Threshold was reached earlier but the batch could not run (e.g. scan in progress)
+            markets = [entry["data"] for entry in self._feed_runtime.pending_items()]
+
+        result = await self.process_market_batch(
+            trigger_type="market",
+            verify_positions=True,
+            enforce_limits=True,
+            markets=markets,
+        )
+        if isinstance(result, dict) and "opportunities_filtered" in result:
+            self._market_event_runtime.record_fired()
+        return result
+
     async def _refresh_active_positions(self) -> None:
         """Refresh active positions from the Polymarket client when available."""
         if not hasattr(self.polymarket_client, "get_open_positions"):
@@ -282,19 +352,30 @@ class PolymarketManager(TaskFlowManagerMixin):
         trigger_type: str = "interval",
         verify_positions: bool = True,
         enforce_limits: bool = True,
+        markets: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {}
+        if markets is not None:
+            kwargs["markets"] = markets
         return await self.run_trigger_flow(
             "market_batch",
             trigger_type=trigger_type,
             verify_positions=verify_positions,
             enforce_limits=enforce_limits,
+            **kwargs,
         )
 
     async def _fetch_latest_markets(self) -> List[Dict[str, Any]]:
-        """Fetch the latest markets directly from Polymarket API."""
+        """Fetch the latest markets, preferring the local market catalog."""
         if not self.polymarket_client:
             return []
         try:
+            if isinstance(self.polymarket_client, PolymarketClient) and await market_catalog.ensure_fresh(
+                self.polymarket_client
+            ):
+                markets = market_catalog.search(limit=self.batch_size, sort_by="volume")
+                if markets:
+                    return markets
             markets = await self.polymarket_client.search_markets(
                 query="",
                 limit=self.batch_size,
@@ -317,48 +398,8 @@ class PolymarketManager(TaskFlowManagerMixin):
         Returns:
             Filtered list of promising markets
         """
-        filtered = []
-        now = datetime.now(timezone.utc)
-
-        for market in markets:
-            try:
-                # Extract market metrics
-                volume_24h = market.get("volume_24h", 0)
-                liquidity = market.get("liquidity_score", 0)  # 0-100
-                bid_ask_spread = market.get("bid_ask_spread", 1.0)  # percentage
-                close_time = market.get("close_time")
-
-                # Parse close_time if string
-                if isinstance(close_time, str):
-                    close_time = datetime.fromisoformat(close_time.replace("Z", "+00:00"))
-
-                # Calculate time to close
-                time_to_close = (close_time - now).total_seconds() / 3600 if close_time else 0
-
-                # Apply filters
-                if volume_24h < 100:  # Minimum volume threshold
-                    continue
-                if liquidity < 40:  # Minimum liquidity (orderbook depth)
-                    continue
-                if bid_ask_spread > 5:  # Too wide spread
-                    continue
-                if time_to_close < 1 or time_to_close > 240:  # Between 1 hour and 10 days
-                    continue
-
-                # Market passed filters
-                filtered.append({
-                    **market,
-                    "filter_score": (volume_24h / 1000) + (liquidity / 10) - (bid_ask_spread / 2),
-                })
-
-            except Exception as exc:
-                log.debug(f"[POLYMARKET RSS FLUX] Filter error for market: {exc}")
-                continue
-
-        # Sort by opportunity score (highest first)
-        filtered.sort(key=lambda m: m.get("filter_score", 0), reverse=True)
-
-        return filtered[:20]  # Limit to top 20 opportunities per scan
+        # Columnar masks + argpartition top-k; limit to top 20 opportunities per scan
+        return select_top_markets(markets, limit=20)
 
     async def _run_batch_task(
         self,
@@ -366,17 +407,27 @@ class PolymarketManager(TaskFlowManagerMixin):
         trigger_type: str,
         enforce_limits: bool,
     ) -> Dict[str, Any]:
-        """Backward-compatible entrypoint; delegates to registered batch pipeline task."""
-        flow_results = await self._task_flow_hub.run(
-            trigger_type=trigger_type,
-            context={
-                "markets": markets,
-                "trigger_type": trigger_type,
-                "enforce_limits": enforce_limits,
-            },
-            flags=self._task_flow_flags,
-            selected_task_ids=["batch_orchestration"],
-        )
+        """Backward-compatible entrypoint; delegates to registered batch pipeline task.
+
+        A sampled fraction of batches runs under the sampling profiler
+        (``TELEMETRY_PROFILE_SAMPLE_RATE``); see ``/metrics/profiles``.
+        """
+        profile_key = f"polymarket-batch:{uuid4().hex[:12]}"
+        profiling = sampling_profiler.should_sample() and sampling_profiler.start(profile_key)
+        try:
+            flow_results = await self._task_flow_hub.run(
+                trigger_type=trigger_type,
+                context={
+                    "markets": markets,
+                    "trigger_type": trigger_type,
+                    "enforce_limits": enforce_limits,
+                },
+                flags=self._task_flow_flags,
+                selected_task_ids=["batch_orchestration"],
+            )
+        finally:
+            if profiling:
+                sampling_profiler.stop(profile_key)
         result = flow_results.get("batch_orchestration", {})
         return result if isinstance(result, dict) else {"status": "failed", "error": "batch_orchestration_failed"}
 
@@ -438,6 +489,14 @@ class PolymarketManager(TaskFlowManagerMixin):
                 "threshold": int(self.review_threshold),
                 "cache_size": len(self._feed_cache),
             },
+            {
+                "worker_name": "market_events",
+                "pipeline": "polymarket",
+                "system_name": self.system_name,
+                "enabled": self.trigger_type == "market",
+                "running": bool(self._running and self.trigger_type == "market"),
+                **self._market_event_runtime.stats(),
+            },
         ]
         return {
             "pipeline": "polymarket",
@@ -0,0 +1,439 @@
+"""Policy-driven Redis retention worker.
+
+Each ``RetentionPolicy`` targets a key pattern and declares how much of the
+matching keys to keep: a maximum list/zset/stream length, a maximum entry
+age and a TTL applied to keys that have none. Keys are discovered with SCAN
+(literal keys skip the scan), inspected with one pipelined TYPE/TTL round
+trip per batch and trimmed with pipelined LTRIM/ZREMRANGE*/XTRIM/EXPIRE. A
+per-second key budget throttles the sweep so it can run inside the API
+process without hurting live latency. Bytes reclaimed are estimated from
+``MEMORY USAGE`` on a random sample of the modified keys.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from core.clients.redis_client import RedisClient, get_redis_client
+from core.logging import log
+from core.pipelines.workers import IntervalWorker
+from core.settings.config import settings
+
+_GLOB_CHARS = set("*?[")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Retention rules for keys matching ``pattern``.
+
+    ``newest`` names the list end holding the most recent entries (``head`` for
+    LPUSH writers, ``tail`` for RPUSH writers). List entries are aged through
+    ``timestamp_field`` of their JSON payload; zset scores are taken as epoch
+    seconds and streams are aged by entry id.
+    """
+
+    pattern: str
+    max_length: int | None = None
+    max_age_seconds: int | None = None
+    ttl_seconds: int | None = None
+    newest: str = "head"
+    timestamp_field: str = "timestamp"
+
+    def __post_init__(self) -> None:
+        if self.newest not in {"head", "tail"}:
+            raise ValueError(f"newest must be 'head' or 'tail', got {self.newest!r}")
+
+    @property
+    def is_literal(self) -> bool:
+        return not (_GLOB_CHARS & set(self.pattern))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RetentionPolicy:
+        return cls(
+            pattern=str(data["pattern"]),
+            max_length=data.get("max_length"),
+            max_age_seconds=data.get("max_age_seconds"),
+            ttl_seconds=data.get("ttl_seconds"),
+            newest=str(data.get("newest", "head")),
+            timestamp_field=str(data.get("timestamp_field", "timestamp")),
+        )
+
+
+def default_retention_policies(days_to_keep: int = 30) -> list[RetentionPolicy]:
+    """Policies matching the caps the writers already apply, plus age limits."""
+    max_age = int(days_to_keep) * 86400
+    memory_limit = int(settings.memory_prune_limit)
+    return [
+        # RedisLogSink RPUSHes and keeps the tail
+        RetentionPolicy(
+            "logs:*", max_length=1000, max_age_seconds=max_age, newest="tail"
+        ),
+        RetentionPolicy("memory:signals", max_length=memory_limit),
+        RetentionPolicy("memory:news", max_length=memory_limit),
+        RetentionPolicy("memory:trades", max_length=memory_limit),
+        RetentionPolicy("orchestrator:agent_weights_history", max_length=30),
+        RetentionPolicy("security:events", max_length=1000, max_age_seconds=max_age),
+        RetentionPolicy("security:alerts", max_length=500, max_age_seconds=max_age),
+        # Event bus streams are capped by MAXLEN on write; age them out too
+        RetentionPolicy("events:*", max_age_seconds=max_age),
+    ]
+
+
+def _entry_timestamp(raw: Any, field: str) -> float | None:
+    try:
+        data = json.loads(raw)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    value = data.get(field)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=UTC)
+        return parsed.timestamp()
+    return None
+
+
+class RedisRetentionEngine:
+    """Apply retention policies to Redis with bounded, pipelined work."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient | None = None,
+        policies: Iterable[RetentionPolicy] | None = None,
+        *,
+        scan_count: int = 500,
+        max_keys_per_second: float = 500.0,
+        memory_sample_rate: float = 0.05,
+        age_page_size: int = 100,
+        max_age_pages: int = 20,
+    ) -> None:
+        self.redis = redis_client
+        self.policies = (
+            list(policies) if policies is not None else default_retention_policies()
+        )
+        self.scan_count = max(1, int(scan_count))
+        self.max_keys_per_second = float(max_keys_per_second)
+        self.memory_sample_rate = max(0.0, min(1.0, float(memory_sample_rate)))
+        self.age_page_size = max(1, int(age_page_size))
+        self.max_age_pages = max(1, int(max_age_pages))
+        self._memory_usage_supported = True
+
+    async def _client(self):
+        if self.redis is None:
+            self.redis = await get_redis_client()
+        elif self.redis.redis is None:
+            await self.redis.connect()
+        return self.redis.redis
+
+    async def _iter_batches(self, client, policy: RetentionPolicy):
+        if policy.is_literal:
+            yield [policy.pattern]
+            return
+        cursor = 0
+        while True:
+            cursor, keys = await client.scan(
+                cursor=cursor, match=policy.pattern, count=self.scan_count
+            )
+            if keys:
+                yield list(keys)
+            if int(cursor) == 0:
+                break
+
+    async def _throttle(self, processed: int, started: float) -> None:
+        if self.max_keys_per_second <= 0 or processed <= 0:
+            return
+        budget = processed / self.max_keys_per_second
+        remaining = budget - (time.perf_counter() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    async def _memory_usage(self, client, keys: list[str]) -> dict[str, int]:
+        if not keys or not self._memory_usage_supported:
+            return {}
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.memory_usage(key)
+        results = await pipe.execute(raise_on_error=False)
+        usage: dict[str, int] = {}
+        for key, value in zip(keys, results, strict=True):
+            if isinstance(value, Exception):
+                if "unknown command" in str(value).lower():
+                    self._memory_usage_supported = False
+                    return {}
+                continue
+            usage[key] = int(value or 0)
+        return usage
+
+    async def _count_expired(
+        self,
+        client,
+        key: str,
+        policy: RetentionPolicy,
+        first_page: list[Any],
+        cutoff: float,
+    ) -> int:
+        """Count contiguous expired entries from the oldest end of a list."""
+        page = first_page
+        expired = 0
+        for page_index in range(self.max_age_pages):
+            # Pages are fetched oldest-first for tail-newest lists, so walk
+            # head-newest pages from their end
+            entries = page if policy.newest == "tail" else list(reversed(page))
+            for raw in entries:
+                ts = _entry_timestamp(raw, policy.timestamp_field)
+                if ts is None or ts >= cutoff:
+                    return expired
+                expired += 1
+            if len(page) < self.age_page_size or page_index + 1 >= self.max_age_pages:
+                return expired
+            start = expired
+            end = expired + self.age_page_size - 1
+            if policy.newest == "tail":
+                page = await client.lrange(key, start, end)
+            else:
+                page = await client.lrange(key, -(end + 1), -(start + 1))
+            if not page:
+                return expired
+        return expired
+
+    def _oldest_page_range(self, policy: RetentionPolicy) -> tuple[int, int]:
+        if policy.newest == "tail":
+            return 0, self.age_page_size - 1
+        return -self.age_page_size, -1
+
+    async def _apply_batch(
+        self,
+        client,
+        policy: RetentionPolicy,
+        keys: list[str],
+        report: dict[str, Any],
+        now: float,
+    ) -> None:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.ttl(key)
+        meta = await pipe.execute()
+        types = [str(value) for value in meta[0::2]]
+        ttls = [int(value) for value in meta[1::2]]
+        lists = [
+            key for key, key_type in zip(keys, types, strict=True) if key_type == "list"
+        ]
+        lengths: dict[str, int] = {}
+        if lists:
+            pipe = client.pipeline(transaction=False)
+            for key in lists:
+                pipe.llen(key)
+            lengths = {
+                key: int(size)
+                for key, size in zip(lists, await pipe.execute(), strict=True)
+            }
+
+        cutoff = now - policy.max_age_seconds if policy.max_age_seconds else None
+        oldest_pages: dict[str, list[Any]] = {}
+        if cutoff is not None and lists:
+            start, end = self._oldest_page_range(policy)
+            pipe = client.pipeline(transaction=False)
+            for key in lists:
+                pipe.lrange(key, start, end)
+            oldest_pages = dict(zip(lists, await pipe.execute(), strict=True))
+
+        touched: list[str] = []
+        writes = client.pipeline(transaction=False)
+        for key, key_type, ttl in zip(keys, types, ttls, strict=True):
+            if key_type == "none":
+                continue
+            report["keys_scanned"] += 1
+            changed = False
+            if key_type == "list":
+                length = lengths.get(key, 0)
+                expired = 0
+                if cutoff is not None:
+                    expired = await self._count_expired(
+                        client, key, policy, oldest_pages.get(key) or [], cutoff
+                    )
+                keep = length - expired
+                if policy.max_length is not None:
+                    keep = min(keep, int(policy.max_length))
+                keep = max(0, keep)
+                if keep < length:
+                    if keep == 0:
+                        writes.delete(key)
+                    elif policy.newest == "head":
+                        writes.ltrim(key, 0, keep - 1)
+                    else:
+                        writes.ltrim(key, -keep, -1)
+                    changed = True
+                    report["entries_removed"] += length - keep
+                report["entries_expired"] += expired
+            elif key_type == "zset":
+                if cutoff is not None:
+                    writes.zremrangebyscore(key, "-inf", f"({cutoff}")
+                    changed = True
+                if policy.max_length is not None:
+                    writes.zremrangebyrank(key, 0, -(policy.max_length + 1))
+                    changed = True
+            elif key_type == "stream":
+                # Stream ids start with the entry's millisecond timestamp
+                if cutoff is not None:
+                    writes.xtrim(key, minid=f"{int(cutoff * 1000)}-0", approximate=True)
+                    changed = True
+                if policy.max_length is not None:
+                    writes.xtrim(key, maxlen=int(policy.max_length), approximate=True)
+                    changed = True
+            if policy.ttl_seconds and ttl == -1:
+                writes.expire(key, int(policy.ttl_seconds))
+                report["ttls_set"] += 1
+            if changed:
+                touched.append(key)
+
+        sampled = [key for key in touched if random.random() < self.memory_sample_rate]
+        before = await self._memory_usage(client, sampled)
+        if len(writes):
+            await writes.execute()
+            report["commands"] += len(writes)
+        report["keys_trimmed"] += len(touched)
+        if before:
+            after = await self._memory_usage(client, list(before))
+            delta = sum(
+                max(0, size - after.get(key, 0)) for key, size in before.items()
+            )
+            report["sampled_keys"] += len(before)
+            report["sampled_bytes_reclaimed"] += delta
+            # Scale the sample back up to the trimmed population of this batch
+            report["estimated_bytes_reclaimed"] += int(
+                delta * len(touched) / len(before)
+            )
+
+    async def run_once(self) -> dict[str, Any]:
+        client = await self._client()
+        now = datetime.now(UTC).timestamp()
+        started = time.perf_counter()
+        report: dict[str, Any] = {
+            "policies": len(self.policies),
+            "keys_scanned": 0,
+            "keys_trimmed": 0,
+            "entries_removed": 0,
+            "entries_expired": 0,
+            "ttls_set": 0,
+            "commands": 0,
+            "sampled_keys": 0,
+            "sampled_bytes_reclaimed": 0,
+            "estimated_bytes_reclaimed": 0,
+        }
+        for policy in self.policies:
+            try:
+                async for keys in self._iter_batches(client, policy):
+                    batch_started = time.perf_counter()
+                    await self._apply_batch(client, policy, keys, report, now)
+                    await self._throttle(len(keys), batch_started)
+            except Exception as exc:
+                log.warning(f"[redis_retention] policy {policy.pattern} failed: {exc}")
+        report["memory_usage_supported"] = self._memory_usage_supported
+        report["duration_seconds"] = round(time.perf_counter() - started, 3)
+        return report
+
+
+class RedisRetentionWorker:
+    """Run the retention engine periodically inside the API process."""
+
+    def __init__(
+        self,
+        engine: RedisRetentionEngine | None = None,
+        *,
+        interval_seconds: int = settings.redis_retention_interval_seconds,
+    ) -> None:
+        self.engine = engine or RedisRetentionEngine(
+            policies=[
+                RetentionPolicy.from_dict(item)
+                for item in settings.redis_retention_policies
+            ]
+            or None,
+            max_keys_per_second=settings.redis_retention_max_keys_per_second,
+            memory_sample_rate=settings.redis_retention_memory_sample_rate,
+        )
+        self._worker = IntervalWorker(
+            callback=self.run_once,
+            interval_seconds=max(60, int(interval_seconds)),
+            name="redis_retention",
+            min_interval_seconds=60,
+        )
+        self._running = False
+        self._task: asyncio.Task | None = None
+        self._metrics: dict[str, Any] = {
+            "runs": 0,
+            "keys_trimmed_total": 0,
+            "entries_expired_total": 0,
+            "estimated_bytes_reclaimed_total": 0,
+            "last_run_at": None,
+            "last_report": None,
+        }
+
+    async def run_once(self) -> dict[str, Any]:
+        report = await self.engine.run_once()
+        self._metrics["runs"] += 1
+        self._metrics["keys_trimmed_total"] += report["keys_trimmed"]
+        self._metrics["entries_expired_total"] += report["entries_expired"]
+        self._metrics["estimated_bytes_reclaimed_total"] += report[
+            "estimated_bytes_reclaimed"
+        ]
+        self._metrics["last_run_at"] = datetime.now(UTC).isoformat()
+        self._metrics["last_report"] = report
+        if report["keys_trimmed"] or report["ttls_set"]:
+            log.info(
+                f"[redis_retention] trimmed={report['keys_trimmed']} expired_entries={report['entries_expired']} "
+                f"ttls_set={report['ttls_set']} est_bytes_reclaimed={report['estimated_bytes_reclaimed']}"
+            )
+        return report
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            "worker_name": "redis_retention",
+            "running": self._running,
+            "interval_seconds": int(self._worker.interval_seconds),
+            "policies": [policy.pattern for policy in self.engine.policies],
+            **self._metrics,
+        }
+
+    async def run_loop(self, is_running: Callable[[], bool]) -> None:
+        await self._worker.run_loop(is_running=is_running)
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(
+            self.run_loop(is_running=lambda: self._running)
+        )
+        log.info(
+            f"Redis retention worker started interval={self._worker.interval_seconds}s"
+        )
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        log.info("Redis retention worker stopped")
+
+
+# Global retention worker instance
+redis_retention_worker = RedisRetentionWorker()
@@ -0,0 +1,255 @@
+"""Scheduled T+1 ROI settlement worker.
+
+ROI records registered by ``ROIAnalyzerToolkit.register_cycle_roi`` are added to
+a Redis sorted set scored by their T+1 due time. This worker periodically pulls
+due records from that index, fetches each ticker price once for the whole batch,
+and writes all settled records back in a single pipeline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from core.camel_tools.roi_analyzer_toolkit import (
+    ROI_RECORD_TTL_SECONDS,
+    ROI_SETTLEMENT_INDEX_KEY,
+    compute_strategy_roi,
+    fetch_ticker_price,
+    parse_roi_timestamp,
+)
+from core.clients.redis_client import RedisClient, get_redis_client
+from core.logging import log
+from core.pipelines.workers import IntervalWorker
+from core.settings.config import settings
+from core.telemetry.observability import (
+    roi_settlement_lag,
+    roi_settlement_pending,
+    roi_settlements_total,
+)
+
+
+class ROISettlementWorker:
+    """Settle due ROI records with T+1 prices on a fixed interval."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient | None = None,
+        forecasting_client: Any = None,
+        *,
+        interval_seconds: int = settings.roi_settlement_interval_seconds,
+        max_delay_hours: int = settings.roi_settlement_max_delay_hours,
+        batch_size: int = 200,
+        max_concurrency: int = 8,
+    ) -> None:
+        self.redis = redis_client
+        self.forecasting_client = forecasting_client
+        self.max_delay_hours = int(max_delay_hours)
+        self.batch_size = int(batch_size)
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._worker = IntervalWorker(
+            callback=self.run_once,
+            interval_seconds=max(30, int(interval_seconds)),
+            name="roi_settlement",
+            min_interval_seconds=30,
+        )
+        self._running = False
+        self._task: asyncio.Task | None = None
+        self._metrics: dict[str, Any] = {
+            "runs": 0,
+            "settled_total": 0,
+            "expired_total": 0,
+            "missing_total": 0,
+            "last_run_at": None,
+            "last_batch_size": 0,
+            "last_lag_seconds": None,
+            "max_lag_seconds": None,
+            "avg_lag_seconds": None,
+            "pending_due": 0,
+            "pending_total": 0,
+            "oldest_due_lag_seconds": None,
+        }
+
+    async def _ensure_clients(self) -> None:
+        if self.redis is None:
+            self.redis = await get_redis_client()
+        elif self.redis.redis is None:
+            await self.redis.connect()
+        if self.forecasting_client is None:
+            from core.clients.forecasting_client import ForecastingClient
+
+            self.forecasting_client = ForecastingClient({
+                "base_url": settings.mcp_api_url,
+                "api_key": settings.mcp_api_key,
+                "timeout": 30.0,
+            })
+            await self.forecasting_client.connect()
+
+    async def _fetch_prices(self, tickers: set[str]) -> dict[str, float]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _fetch(ticker: str) -> tuple[str, float | None]:
+            async with semaphore:
+                try:
+                    return ticker, await fetch_ticker_price(self.forecasting_client, ticker)
+                except Exception as exc:
+                    log.debug(f"[roi_settlement] price fetch failed for {ticker}: {exc}")
+                    return ticker, None
+
+        results = await asyncio.gather(*(_fetch(ticker) for ticker in sorted(tickers)))
+        return {ticker: price for ticker, price in results if price}
+
+    @staticmethod
+    def _settle_record(
+        record: dict[str, Any],
+        prices: dict[str, float],
+        now: datetime,
+    ) -> bool:
+        registered_at = parse_roi_timestamp(record.get("timestamp"))
+        hours_elapsed = (now - registered_at).total_seconds() / 3600.0 if registered_at else None
+        settled_any = False
+        for ticker, ticker_info in record.get("tickers", {}).items():
+            t1_price = prices.get(ticker)
+            buy_price = ticker_info.get("buy_price")
+            if not t1_price or not buy_price:
+                continue
+            t1_roi = ((t1_price - float(buy_price)) / float(buy_price)) * 100.0
+            ticker_info.update(
+                t1_price=t1_price,
+                t1_roi=t1_roi,
+                timedelta_hours=hours_elapsed,
+                latest_price=t1_price,
+                latest_roi=t1_roi,
+            )
+            settled_any = True
+        if not settled_any:
+            return False
+        strategy_roi = compute_strategy_roi(record.get("tickers", {}))
+        if strategy_roi is not None:
+            record["strategy_roi"] = strategy_roi
+        record["t1_updated"] = True
+        record["t1_settled_at"] = now.isoformat()
+        return True
+
+    def _record_lag(self, lag_seconds: float) -> None:
+        roi_settlement_lag.observe(lag_seconds)
+        settled = int(self._metrics["settled_total"])
+        previous_avg = self._metrics["avg_lag_seconds"] or 0.0
+        self._metrics["avg_lag_seconds"] = previous_avg + (lag_seconds - previous_avg) / max(1, settled)
+        self._metrics["last_lag_seconds"] = lag_seconds
+        self._metrics["max_lag_seconds"] = max(self._metrics["max_lag_seconds"] or 0.0, lag_seconds)
+
+    async def run_once(self) -> dict[str, Any]:
+        """Settle every ROI record whose T+1 due time has passed."""
+        await self._ensure_clients()
+        client = self.redis.redis
+        now = datetime.now(timezone.utc)
+        due = await client.zrangebyscore(
+            ROI_SETTLEMENT_INDEX_KEY,
+            "-inf",
+            now.timestamp(),
+            start=0,
+            num=self.batch_size,
+            withscores=True,
+        )
+        summary = {"due": len(due), "settled": 0, "deferred": 0, "expired": 0, "missing": 0}
+        if due:
+            decoded = await self.redis.mget_json([key for key, _ in due])
+            records: list[tuple[str, float, dict[str, Any] | None]] = []
+            tickers: set[str] = set()
+            for (key, due_score), record in zip(due, decoded):
+                if record is not None and not isinstance(record, dict):
+                    log.warning(f"[roi_settlement] invalid ROI record at {key}")
+                    record = None
+                if record and not record.get("t1_updated"):
+                    tickers.update(record.get("tickers", {}).keys())
+                records.append((key, float(due_score), record))
+
+            prices = await self._fetch_prices(tickers) if tickers else {}
+            max_delay = timedelta(hours=self.max_delay_hours).total_seconds()
+
+            pipe = client.pipeline(transaction=False)
+            for key, due_score, record in records:
+                lag_seconds = max(0.0, now.timestamp() - due_score)
+                if record is None or record.get("t1_updated"):
+                    pipe.zrem(ROI_SETTLEMENT_INDEX_KEY, key)
+                    summary["missing"] += 1
+                    continue
+                if self._settle_record(record, prices, now):
+                    pipe.set(key, self.redis.encode_value(record), ex=ROI_RECORD_TTL_SECONDS)
+                    pipe.zrem(ROI_SETTLEMENT_INDEX_KEY, key)
+                    summary["settled"] += 1
+                    self._metrics["settled_total"] += 1
+                    self._record_lag(lag_seconds)
+                elif lag_seconds > max_delay:
+                    record["t1_settlement_status"] = "expired"
+                    pipe.set(key, self.redis.encode_value(record), ex=ROI_RECORD_TTL_SECONDS)
+                    pipe.zrem(ROI_SETTLEMENT_INDEX_KEY, key)
+                    summary["expired"] += 1
+                else:
+                    summary["deferred"] += 1
+            await pipe.execute()
+
+        for status in ("settled", "expired", "missing"):
+            if summary[status]:
+                roi_settlements_total.labels(status=status).inc(summary[status])
+        self._metrics["expired_total"] += summary["expired"]
+        self._metrics["missing_total"] += summary["missing"]
+        await self._refresh_backlog_metrics(now)
+        self._metrics["runs"] += 1
+        self._metrics["last_run_at"] = now.isoformat()
+        self._metrics["last_batch_size"] = len(due)
+        if summary["settled"] or summary["expired"]:
+            log.info(
+                f"[roi_settlement] settled={summary['settled']} expired={summary['expired']} "
+                f"deferred={summary['deferred']} missing={summary['missing']}"
+            )
+        return summary
+
+    async def _refresh_backlog_metrics(self, now: datetime) -> None:
+        client = self.redis.redis
+        pending_due = await client.zcount(ROI_SETTLEMENT_INDEX_KEY, "-inf", now.timestamp())
+        pending_total = await client.zcard(ROI_SETTLEMENT_INDEX_KEY)
+        oldest = await client.zrange(ROI_SETTLEMENT_INDEX_KEY, 0, 0, withscores=True)
+        oldest_lag = None
+        if oldest and oldest[0][1] <= now.timestamp():
+            oldest_lag = now.timestamp() - float(oldest[0][1])
+        self._metrics["pending_due"] = int(pending_due)
+        self._metrics["pending_total"] = int(pending_total)
+        self._metrics["oldest_due_lag_seconds"] = oldest_lag
+        roi_settlement_pending.set(int(pending_due))
+
+    def get_metrics(self) -> dict[str, Any]:
+        return {
+            "worker_name": "roi_settlement",
+            "running": self._running,
+            "interval_seconds": int(self._worker.interval_seconds),
+            "max_delay_hours": self.max_delay_hours,
+            **self._metrics,
+        }
+
+    async def run_loop(self, is_running: Callable[[], bool]) -> None:
+        await self._worker.run_loop(is_running=is_running)
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self.run_loop(is_running=lambda: self._running))
+        log.info(f"ROI settlement worker started interval={self._worker.interval_seconds}s")
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        log.info("ROI settlement worker stopped")
+
+
+# Global settlement worker instance
+roi_settlement_worker = ROISettlementWorker()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable
 
+from core.telemetry.tracing import tracer
 
 TaskExecutor = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
 TaskEnabledFn = Callable[[dict[str, Any]], bool]
@@ -106,7 +107,8 @@ class TaskFlowHub:
                 continue
 
             try:
-                results[task_id] = await spec.executor(context)
+                with tracer.span(f"task.{task_id}", pipeline=self.pipeline, trigger_type=trigger_type):
+                    results[task_id] = await spec.executor(context)
             except Exception as exc:
                 results[task_id] = {"status": "failed", "task_id": task_id, "error": str(exc)}
 
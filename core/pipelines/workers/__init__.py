@@ -3,12 +3,14 @@
 from .interval import IntervalWorker
 from .conditional import ConditionalCallbackWorker
 from .feed_threshold import FeedCacheThresholdWorker
+from .feed_store import FeedCacheStore
 from .hybrid import HybridWorker
 
 __all__ = [
     "IntervalWorker",
     "ConditionalCallbackWorker",
     "FeedCacheThresholdWorker",
+    "FeedCacheStore",
     "HybridWorker",
 ]
 
@@ -0,0 +1,229 @@
+"""Log-structured on-disk store for feed cache entries.
+
+Layout:
+- ``<path>``      compact JSON snapshot ``{"updated_at", "count", "last_seq", "markets"}``
+- ``<path>.log``  append-only JSON lines ``{"seq", "ts", "op": "put"|"del", "id", "entry"?}``
+
+Saves append only the entries that changed. Once the log grows past the
+compaction threshold the full state is rewritten to a temp file and atomically
+renamed over the snapshot. Log records carry a sequence number and replay
+skips anything already covered by the snapshot, so a crash at any point
+(including a torn final log line) never yields a truncated or regressed cache.
+All disk I/O runs on a single background thread to keep writes ordered and
+off the event loop.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from core.logging import log
+
+
+class FeedCacheStore:
+    """Append-only feed cache persistence with atomic snapshot compaction."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        compact_min_records: int = 1000,
+        compact_ratio: float = 2.0,
+        fsync: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self.compact_min_records = int(compact_min_records)
+        self.compact_ratio = float(compact_ratio)
+        self.fsync = fsync
+        self._seq = 0
+        self._log_records = 0
+        self._live_count = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: Future | None = None
+        self._stats = {"appends": 0, "records_written": 0, "compactions": 0, "bytes_written": 0}
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read_snapshot(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        data = json.loads(self.path.read_bytes() or b"{}")
+        return data if isinstance(data, dict) else {}
+
+    def read(self) -> dict[str, Any]:
+        """Rebuild the current state from the snapshot plus the log tail."""
+        snapshot = self._read_snapshot()
+        markets: dict[str, Any] = dict(snapshot.get("markets") or {})
+        snapshot_seq = int(snapshot.get("last_seq") or 0)
+        last_seq = snapshot_seq
+        updated_at = snapshot.get("updated_at")
+        records = 0
+        valid_bytes = 0
+        torn = False
+        if self.log_path.exists():
+            with self.log_path.open("rb") as handle:
+                for line in handle:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated record")
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn write from a crash; nothing after it is trusted
+                        torn = True
+                        break
+                    valid_bytes += len(line)
+                    records += 1
+                    seq = int(record.get("seq") or 0)
+                    last_seq = max(last_seq, seq)
+                    if seq <= snapshot_seq:
+                        continue
+                    key = str(record.get("id"))
+                    if record.get("op") == "del":
+                        markets.pop(key, None)
+                    else:
+                        markets[key] = record.get("entry")
+                    updated_at = record.get("ts") or updated_at
+        return {
+            "updated_at": updated_at,
+            "count": len(markets),
+            "markets": markets,
+            "last_seq": last_seq,
+            "log_records": records,
+            "log_valid_bytes": valid_bytes if torn else None,
+        }
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Load entries and reset the write cursor to the persisted sequence."""
+        state = self.read()
+        if state["log_valid_bytes"] is not None:
+            log.warning(f"[FEED STORE] Truncating torn log tail in {self.log_path}")
+            with self.log_path.open("r+b") as handle:
+                handle.truncate(state["log_valid_bytes"])
+        with self._lock:
+            self._seq = int(state["last_seq"])
+            self._log_records = int(state["log_records"])
+            self._live_count = len(state["markets"])
+        return state["markets"]
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _needs_compaction(self) -> bool:
+        threshold = max(self.compact_min_records, int(self._live_count * self.compact_ratio))
+        return self._log_records > threshold
+
+    def _write_atomic(self, payload: bytes) -> None:
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _append(self, lines: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.log_path.open("ab") as handle:
+            handle.write(lines)
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+        self._stats["bytes_written"] += len(lines)
+
+    def _compact(self, snapshot: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(snapshot)
+        # Safe to drop: replay skips records covered by the snapshot's last_seq
+        with self.log_path.open("wb"):
+            pass
+        self._stats["compactions"] += 1
+        self._stats["bytes_written"] += len(snapshot)
+
+    def _encode_snapshot(self, cache: dict[str, dict[str, Any]], last_seq: int, now: str) -> bytes:
+        payload = {"updated_at": now, "count": len(cache), "last_seq": last_seq, "markets": cache}
+        return json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+
+    def save(
+        self,
+        cache: dict[str, dict[str, Any]],
+        changed: dict[str, dict[str, Any]],
+        removed: set[str] | list[str],
+    ) -> Future | None:
+        """Queue changed entries for append (and compaction when due).
+
+        Serialization happens on the caller's thread so later mutations of
+        ``cache`` cannot race with the background write.
+        """
+        if not changed and not removed and not self._needs_compaction():
+            return None
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            parts: list[bytes] = []
+            for key in removed:
+                self._seq += 1
+                parts.append(json.dumps({"seq": self._seq, "ts": now, "op": "del", "id": key}).encode("utf-8"))
+            for key, entry in changed.items():
+                self._seq += 1
+                record = {"seq": self._seq, "ts": now, "op": "put", "id": key, "entry": entry}
+                parts.append(json.dumps(record, separators=(",", ":"), default=str).encode("utf-8"))
+            lines = b"\n".join(parts) + b"\n" if parts else b""
+            self._log_records += len(parts)
+            self._live_count = len(cache)
+            snapshot = None
+            if self._needs_compaction():
+                snapshot = self._encode_snapshot(cache, self._seq, now)
+                self._log_records = 0
+            self._stats["appends"] += 1
+            self._stats["records_written"] += len(parts)
+
+        def _write() -> None:
+            try:
+                if lines:
+                    self._append(lines)
+                if snapshot is not None:
+                    self._compact(snapshot)
+            except Exception as exc:
+                log.warning(f"[FEED STORE] Failed to persist feed cache: {exc}")
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feed-store")
+        self._pending = self._executor.submit(_write)
+        return self._pending
+
+    def compact(self, cache: dict[str, dict[str, Any]]) -> Future:
+        """Force a snapshot rewrite of ``cache``."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            snapshot = self._encode_snapshot(cache, self._seq, now)
+            self._log_records = 0
+            self._live_count = len(cache)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feed-store")
+        self._pending = self._executor.submit(self._compact, snapshot)
+        return self._pending
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until queued writes have reached disk."""
+        pending = self._pending
+        if pending is not None:
+            pending.result(timeout=timeout)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "log_path": str(self.log_path),
+            "log_records": self._log_records,
+            "last_seq": self._seq,
+            **self._stats,
+        }
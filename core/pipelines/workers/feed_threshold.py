@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 from datetime import datetime, timezone
 from typing import Any, Callable
 
 
 class FeedCacheThresholdWorker:
-    """Maintain a bounded cache of feed items and apply threshold gating."""
+    """Maintain a bounded cache of feed items and apply threshold gating.
+
+    Entries are tracked in a min-heap keyed by ``last_seen`` so eviction of the
+    oldest items only touches what is evicted, instead of re-sorting the whole
+    cache on every update. Heap entries are invalidated lazily.
+    """
 
     def __init__(
         self,
@@ -24,13 +31,62 @@ class FeedCacheThresholdWorker:
         self.max_cache = int(max_cache)
         self.threshold = int(threshold)
         self.cache: dict[str, dict[str, Any]] = {}
+        self._heap: list[tuple[str, int, str]] = []
+        self._versions: dict[str, int] = {}
+        self._seq = itertools.count()
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
 
     @staticmethod
     def _now_iso() -> str:
         return datetime.now(timezone.utc).isoformat()
 
+    def _track(self, key: str, entry: dict[str, Any]) -> None:
+        version = next(self._seq)
+        self._versions[key] = version
+        heapq.heappush(self._heap, (str(entry.get("last_seen", "")), version, key))
+        self._dirty.add(key)
+        self._removed.discard(key)
+
+    def _discard(self, key: str) -> None:
+        if self.cache.pop(key, None) is not None:
+            self._removed.add(key)
+        self._dirty.discard(key)
+        self._versions.pop(key, None)
+
+    def _rebuild_heap(self) -> None:
+        self._versions = {}
+        self._heap = []
+        for key, entry in self.cache.items():
+            version = next(self._seq)
+            self._versions[key] = version
+            self._heap.append((str(entry.get("last_seen", "")), version, key))
+        heapq.heapify(self._heap)
+
+    def _evict_overflow(self) -> None:
+        while len(self.cache) > self.max_cache and self._heap:
+            _, version, key = heapq.heappop(self._heap)
+            if self._versions.get(key) == version:
+                self._discard(key)
+        # Compact once stale heap entries dominate
+        if len(self._heap) > 2 * len(self.cache) + 64:
+            self._rebuild_heap()
+
     def load(self, cache: dict[str, dict[str, Any]]) -> None:
-        self.cache = dict(cache or {})
+        loaded = dict(cache or {})
+        self.cache = {k: v for k, v in loaded.items() if self.is_entry_active(v)}
+        self._dirty.clear()
+        self._removed = set(loaded) - set(self.cache)
+        self._rebuild_heap()
+        self._evict_overflow()
+
+    def drain_changes(self) -> tuple[dict[str, dict[str, Any]], set[str]]:
+        """Return entries changed and keys removed since the last drain."""
+        changed = {key: self.cache[key] for key in self._dirty if key in self.cache}
+        removed = set(self._removed)
+        self._dirty.clear()
+        self._removed.clear()
+        return changed, removed
 
     def update(self, items: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
         now = self._now_iso()
@@ -38,14 +94,13 @@ class FeedCacheThresholdWorker:
             key = self.key_fn(item)
             if not key:
                 continue
-            existing = self.cache.get(key)
-            self.cache[key] = self.entry_builder(item, existing, now)
-
-        self.cache = {k: v for k, v in self.cache.items() if self.is_entry_active(v)}
-        if len(self.cache) > self.max_cache:
-            ordered = sorted(self.cache.values(), key=lambda item: str(item.get("last_seen", "")))
-            keep = ordered[-self.max_cache :]
-            self.cache = {str(item.get("id")): item for item in keep if item.get("id")}
+            entry = self.entry_builder(item, self.cache.get(key), now)
+            if not self.is_entry_active(entry):
+                self._discard(key)
+                continue
+            self.cache[key] = entry
+            self._track(key, entry)
+        self._evict_overflow()
         return self.cache
 
     def pending_items(self) -> list[dict[str, Any]]:
@@ -57,9 +112,11 @@ class FeedCacheThresholdWorker:
     def mark_processed(self, items: list[dict[str, Any]], *, exhausted_field: str = "exhausted") -> None:
         for item in items:
             key = item.get("id")
-            if not key:
+            if not key or key not in self.cache:
                 continue
-            if key in self.cache:
-                self.cache[key][exhausted_field] = True
-        self.update([])
-
+            self.cache[key][exhausted_field] = True
+            if self.is_entry_active(self.cache[key]):
+                self._dirty.add(key)
+            else:
+                self._discard(key)
+        self._evict_overflow()
@@ -88,6 +88,49 @@ V3_QUOTER_ABI: list[dict[str, Any]] = [
         "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
         "stateMutability": "view",
         "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "bytes", "name": "path", "type": "bytes"},
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+        ],
+        "name": "quoteExactInput",
+        "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI: list[dict[str, Any]] = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
     }
 ]
 
@@ -115,6 +158,11 @@ class Settings(BaseSettings):
     redis_host: str = Field(default="localhost", validation_alias="REDIS_HOST")
     redis_port: int = Field(default=6379, validation_alias="REDIS_PORT")
     redis_db: int = Field(default=0, validation_alias="REDIS_DB")
+    # Value codec for get_json/set_json: json | orjson | msgpack
+    redis_codec: str = Field(default="orjson", validation_alias="REDIS_CODEC")
+    # legacy: write plain JSON, read both formats; codec: write enveloped values;
+    # migrate: like codec, and rewrite legacy values as they are read
+    redis_codec_mode: Literal["legacy", "codec", "migrate"] = Field(default="legacy", validation_alias="REDIS_CODEC_MODE")
     
     # PostgreSQL Configuration
     postgres_host: str = Field(default="localhost", validation_alias="POSTGRES_HOST")
@@ -155,7 +203,12 @@ class Settings(BaseSettings):
         default="https://mcp.blockscout.com/mcp",
         validation_alias="BLOCKSCOUT_MCP_URL"
     )
-    
+    blockscout_cache_max_entries: int = Field(default=1024, validation_alias="BLOCKSCOUT_CACHE_MAX_ENTRIES")
+    wallet_activity_db_path: str = Field(default="logs/wallet_activity.db", validation_alias="WALLET_ACTIVITY_DB_PATH")
+    wallet_activity_page_size: int = Field(default=50, validation_alias="WALLET_ACTIVITY_PAGE_SIZE")
+    wallet_activity_max_pages: int = Field(default=20, validation_alias="WALLET_ACTIVITY_MAX_PAGES")
+    wallet_activity_sync_concurrency: int = Field(default=4, validation_alias="WALLET_ACTIVITY_SYNC_CONCURRENCY")
+
     # Yahoo Finance MCP Configuration
     yahoo_finance_mcp_command: str = Field(
         default="uvx",
@@ -215,6 +268,14 @@ class Settings(BaseSettings):
     camel_primary_model: str = Field(default="openai/gpt-5-mini", validation_alias="CAMEL_PRIMARY_MODEL")  
     camel_fallback_model: str = Field(default="openai/gpt-5-mini", validation_alias="CAMEL_FALLBACK_MODEL")  
     camel_prefer_gemini: bool = Field(default=False, validation_alias="CAMEL_PREFER_GEMINI")
+
+    # Single-turn completions (CamelLLMClient): agent reuse, response cache, admission limits
+    llm_agent_pool_size: int = Field(default=4, validation_alias="LLM_AGENT_POOL_SIZE")
+    llm_response_cache_max_entries: int = Field(default=512, validation_alias="LLM_RESPONSE_CACHE_MAX_ENTRIES")
+    llm_response_cache_ttl_seconds: int = Field(default=900, validation_alias="LLM_RESPONSE_CACHE_TTL_SECONDS")
+    llm_response_cache_redis_enabled: bool = Field(default=True, validation_alias="LLM_RESPONSE_CACHE_REDIS_ENABLED")
+    llm_max_concurrency: int = Field(default=8, validation_alias="LLM_MAX_CONCURRENCY")
+    llm_tokens_per_minute: int = Field(default=0, validation_alias="LLM_TOKENS_PER_MINUTE")
     
     # Qdrant Configuration
     qdrant_host: str = Field(default="localhost", validation_alias="QDRANT_HOST")
@@ -260,6 +321,31 @@ class Settings(BaseSettings):
         default="https://www.polywhaler.com/api/market-data",
         validation_alias="POLYWHALER_MARKET_DATA_URL",
     )
+    # AsyncWeb3 UviSwap stack: per-request timeout and pooled connections per RPC session
+    uviswap_rpc_timeout_seconds: float = Field(default=10.0, validation_alias="UVISWAP_RPC_TIMEOUT_SECONDS")
+    uviswap_rpc_pool_size: int = Field(default=20, validation_alias="UVISWAP_RPC_POOL_SIZE")
+    # Off-chain V3 quotes from cached pool state (route search falls back to the quoter)
+    uviswap_local_quotes_enabled: bool = Field(default=True, validation_alias="UVISWAP_LOCAL_QUOTES_ENABLED")
+    uviswap_pool_state_max_age_seconds: float = Field(default=12.0, validation_alias="UVISWAP_POOL_STATE_MAX_AGE_SECONDS")
+    uviswap_pool_state_word_radius: int = Field(default=2, validation_alias="UVISWAP_POOL_STATE_WORD_RADIUS")
+    # PoolSpy catalog: background delta refresh, Redis TTL and negative caching of missing pairs
+    uviswap_pool_refresh_seconds: float = Field(default=300.0, validation_alias="UVISWAP_POOL_REFRESH_SECONDS")
+    uviswap_pool_index_ttl_seconds: int = Field(default=86_400, validation_alias="UVISWAP_POOL_INDEX_TTL_SECONDS")
+    uviswap_pool_missing_ttl_seconds: int = Field(default=900, validation_alias="UVISWAP_POOL_MISSING_TTL_SECONDS")
+    polymarket_catalog_refresh_seconds: int = Field(default=300, validation_alias="POLYMARKET_CATALOG_REFRESH_SECONDS")
+    polymarket_catalog_page_size: int = Field(default=100, validation_alias="POLYMARKET_CATALOG_PAGE_SIZE")
+    polymarket_catalog_max_pages: int = Field(default=20, validation_alias="POLYMARKET_CATALOG_MAX_PAGES")
+    polymarket_catalog_full_refresh_seconds: int = Field(default=3600, validation_alias="POLYMARKET_CATALOG_FULL_REFRESH_SECONDS")
+    polymarket_market_event_poll_seconds: int = Field(default=60, validation_alias="POLYMARKET_MARKET_EVENT_POLL_SECONDS")
+    polymarket_decision_db_path: str = Field(default="logs/polymarket_decisions.db", validation_alias="POLYMARKET_DECISION_DB_PATH")
+    polymarket_decision_max_records: int = Field(default=50000, validation_alias="POLYMARKET_DECISION_MAX_RECORDS")
+    # Shared on-disk cache for transcripts and research/news feed bodies
+    content_cache_db_path: str = Field(default="logs/content_cache.db", validation_alias="CONTENT_CACHE_DB_PATH")
+    content_cache_max_mb: int = Field(default=256, validation_alias="CONTENT_CACHE_MAX_MB")
+    research_feed_ttl_seconds: int = Field(default=900, validation_alias="RESEARCH_FEED_TTL_SECONDS")
+    # Local full-text index over fetched transcripts, news and research items
+    content_index_db_path: str = Field(default="logs/content_index.db", validation_alias="CONTENT_INDEX_DB_PATH")
+    content_index_max_documents: int = Field(default=200_000, validation_alias="CONTENT_INDEX_MAX_DOCUMENTS")
     watchlist_enabled: bool = Field(default=True, validation_alias="WATCHLIST_ENABLED")
     watchlist_scan_seconds: int = Field(default=60, validation_alias="WATCHLIST_SCAN_SECONDS")
     watchlist_trigger_pct: float = Field(default=0.05, validation_alias="WATCHLIST_TRIGGER_PCT")
@@ -272,7 +358,24 @@ class Settings(BaseSettings):
     dex_simulator_fallback_enabled: bool = Field(default=True, validation_alias="DEX_SIMULATOR_FALLBACK_ENABLED")
     dex_wallet_review_cache_seconds: int = Field(default=3600, validation_alias="DEX_WALLET_REVIEW_CACHE_SECONDS")
     dex_strategy_hint_interval_hours: int = Field(default=6, validation_alias="DEX_STRATEGY_HINT_INTERVAL_HOURS")
+    dex_context_token_budget: int = Field(default=4000, validation_alias="DEX_CONTEXT_TOKEN_BUDGET")
     auto_enhancement_enabled: bool = Field(default=True, validation_alias="AUTO_ENHANCEMENT_ENABLED")
+    roi_settlement_enabled: bool = Field(default=True, validation_alias="ROI_SETTLEMENT_ENABLED")
+    roi_settlement_interval_seconds: int = Field(default=300, validation_alias="ROI_SETTLEMENT_INTERVAL_SECONDS")
+    roi_settlement_max_delay_hours: int = Field(default=48, validation_alias="ROI_SETTLEMENT_MAX_DELAY_HOURS")
+    telemetry_metrics_enabled: bool = Field(default=True, validation_alias="TELEMETRY_METRICS_ENABLED")
+    telemetry_trace_sample_rate: float = Field(default=0.1, validation_alias="TELEMETRY_TRACE_SAMPLE_RATE")
+    telemetry_trace_buffer: int = Field(default=200, validation_alias="TELEMETRY_TRACE_BUFFER")
+    telemetry_profile_sample_rate: float = Field(default=0.0, validation_alias="TELEMETRY_PROFILE_SAMPLE_RATE")
+    telemetry_profile_interval_ms: int = Field(default=10, validation_alias="TELEMETRY_PROFILE_INTERVAL_MS")
+    redis_retention_enabled: bool = Field(default=False, validation_alias="REDIS_RETENTION_ENABLED")
+    redis_retention_interval_seconds: int = Field(default=3600, validation_alias="REDIS_RETENTION_INTERVAL_SECONDS")
+    redis_retention_max_keys_per_second: float = Field(default=500.0, validation_alias="REDIS_RETENTION_MAX_KEYS_PER_SECOND")
+    redis_retention_memory_sample_rate: float = Field(default=0.05, validation_alias="REDIS_RETENTION_MEMORY_SAMPLE_RATE")
+    redis_retention_policies: List[Dict[str, Any]] = Field(default_factory=list, validation_alias="REDIS_RETENTION_POLICIES")
+    live_events_max_pending: int = Field(default=256, validation_alias="LIVE_EVENTS_MAX_PENDING")
+    live_events_heartbeat_seconds: float = Field(default=15.0, validation_alias="LIVE_EVENTS_HEARTBEAT_SECONDS")
+    live_events_block_ms: int = Field(default=5000, validation_alias="LIVE_EVENTS_BLOCK_MS")
     
     # Trading Configuration
     initial_capital: float = Field(default=1000.0, validation_alias="INITIAL_CAPITAL")
@@ -1,9 +1,11 @@
 """
 Observability and monitoring utilities for the Agentic Trading System.
 """
+import re
 import time
 import asyncio
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
@@ -11,6 +13,7 @@ import logging
 
 from core.logging import log
 from core.settings.config import settings
+from core.telemetry.tracing import tracer
 
 # Prometheus metrics
 registry = CollectorRegistry()
@@ -115,6 +118,96 @@ forecasting_latency = Histogram(
     registry=registry
 )
 
+# ROI settlement metrics
+roi_settlement_lag = Histogram(
+    'trading_roi_settlement_lag_seconds',
+    'Delay between an ROI record becoming due and its T+1 settlement',
+    buckets=(60, 300, 900, 1800, 3600, 3 * 3600, 6 * 3600, 12 * 3600, 24 * 3600),
+    registry=registry
+)
+
+roi_settlement_pending = Gauge(
+    'trading_roi_settlement_pending',
+    'ROI records past their T+1 due time and awaiting settlement',
+    registry=registry
+)
+
+roi_settlements_total = Counter(
+    'trading_roi_settlements_total',
+    'ROI settlement outcomes',
+    ['status'],
+    registry=registry
+)
+
+# Outbound dependency metrics (HTTP APIs, web3 RPC)
+external_requests_total = Counter(
+    'trading_external_requests_total',
+    'Outbound requests to external services',
+    ['service', 'operation', 'status'],
+    registry=registry
+)
+
+external_request_duration = Histogram(
+    'trading_external_request_seconds',
+    'Outbound request latency to external services',
+    ['service', 'operation'],
+    registry=registry
+)
+
+content_cache_requests_total = Counter(
+    'trading_content_cache_requests_total',
+    'Content cache lookups by namespace and result (hit, miss, stale, revalidated)',
+    ['namespace', 'result'],
+    registry=registry
+)
+
+_ID_SEGMENT = re.compile(r"^(0x[0-9a-fA-F]+|\d+|[0-9a-fA-F-]{16,}|[A-Z0-9]+(?:[-_][A-Z0-9]+)*)$")
+
+
+def normalize_operation(path: str) -> str:
+    """Collapse ids/tickers/addresses in a URL path to keep label cardinality bounded."""
+    path = (path or "").split("?", 1)[0]
+    segments = [
+        "{id}" if segment and _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    ]
+    return "/".join(segments) or "/"
+
+
+def record_external_call(service: str, operation: str, status: str, duration: float) -> None:
+    """Record one outbound call, also feeding the service-specific legacy histograms."""
+    external_requests_total.labels(service=service, operation=operation, status=status).inc()
+    external_request_duration.labels(service=service, operation=operation).observe(duration)
+    if service == "forecasting":
+        forecasting_requests_total.labels(endpoint=operation, status=status).inc()
+        forecasting_latency.labels(endpoint=operation).observe(duration)
+    elif service in {"polymarket", "web3_rpc"}:
+        exchange_latency.labels(exchange_name=service, operation=operation).observe(duration)
+
+
+@contextmanager
+def track_external_call(service: str, operation: str) -> Iterator[Dict[str, Any]]:
+    """Time an outbound call and attach a tracing span when a trace is sampled.
+
+    The yielded dict may be updated with ``status`` by the caller; exceptions
+    are recorded as ``error``.
+    """
+    state: Dict[str, Any] = {"status": "ok"}
+    start = time.perf_counter()
+    with tracer.span(f"{service}:{operation}", service=service) as span:
+        try:
+            yield state
+        except BaseException:
+            if state["status"] == "ok":
+                state["status"] = "error"
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            if span is not None:
+                span["attributes"]["status"] = state["status"]
+            record_external_call(service, operation, str(state["status"]), duration)
+
+
 @dataclass
 class PerformanceMetrics:
     """Performance metrics data structure."""
@@ -0,0 +1,278 @@
+"""
+Wall-clock sampling profiler for asyncio executions.
+
+A profile is opened for one execution (a DEX cycle, a Polymarket batch) with
+``sampling_profiler.start(key)`` from inside the task that runs it, or by
+passing an already running task. While any profile is open a daemon thread
+wakes every ``interval`` seconds and records one stack per live task owned by
+each profile:
+
+- if the task is executing on the event loop, the loop thread's Python stack
+  (CPU time: prompt building, parsing, tool wrappers);
+- if it is suspended, its coroutine await chain ending in ``[await]`` (wall
+  time spent waiting on LLM calls, Redis, HTTP or worker threads).
+
+Tasks created by an owned task (``gather``-ed tool calls, ``create_task``)
+join its profile through a loop task factory that is only installed while a
+profile is open. Stacks aggregate into collapsed-stack lines
+(``frame;frame;frame count``) that flamegraph.pl and speedscope render as-is.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from core.settings.config import settings
+
+AWAIT_FRAME = "[await]"
+TRUNCATED_FRAME = "[truncated]"
+
+
+def _label(code: Any) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _is_loop_dispatch(code: Any) -> bool:
+    return code.co_name == "_run" and code.co_filename.endswith(os.path.join("asyncio", "events.py"))
+
+
+@dataclass
+class _Profile:
+    key: str
+    loop: asyncio.AbstractEventLoop
+    thread_id: int
+    started_at: str
+    started: float
+    tasks: "weakref.WeakSet[asyncio.Task]" = field(default_factory=weakref.WeakSet)
+    stacks: Counter = field(default_factory=Counter)
+    samples: int = 0
+
+
+class SamplingProfiler:
+    """Aggregate sampled task stacks per profile key."""
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        sample_rate: float = 0.0,
+        max_depth: int = 64,
+        max_stacks: int = 5000,
+        max_profiles: int = 50,
+    ) -> None:
+        self.interval = max(0.001, float(interval))
+        self.sample_rate = float(sample_rate)
+        self.max_depth = int(max_depth)
+        self.max_stacks = int(max_stacks)
+        self._active: Dict[str, _Profile] = {}
+        self._finished: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._max_profiles = int(max_profiles)
+        self._previous_factories: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stats = {"profiles": 0, "samples": 0, "sampler_errors": 0}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def should_sample(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def is_active(self, key: str) -> bool:
+        return key in self._active
+
+    def start(self, key: str, task: Optional[asyncio.Task] = None) -> bool:
+        """Open a profile for ``task`` (default: the current task). Must run on its loop."""
+        loop = asyncio.get_running_loop()
+        task = task or asyncio.current_task()
+        if task is None or key in self._active:
+            return False
+        profile = _Profile(
+            key=key,
+            loop=loop,
+            thread_id=threading.get_ident(),
+            started_at=datetime.now(timezone.utc).isoformat(),
+            started=time.perf_counter(),
+        )
+        profile.tasks.add(task)
+        with self._lock:
+            self._active[key] = profile
+            self._install_factory(loop)
+            if self._thread is None:
+                self._wake.clear()
+                self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self._thread.start()
+        self._stats["profiles"] += 1
+        return True
+
+    def stop(self, key: str) -> Optional[Dict[str, Any]]:
+        """Close the profile and return its aggregated result."""
+        with self._lock:
+            profile = self._active.pop(key, None)
+            if profile is None:
+                return None
+            if not any(other.loop is profile.loop for other in self._active.values()):
+                self._restore_factory(profile.loop)
+            if not self._active:
+                self._wake.set()
+        result = self._summarize(profile)
+        self._finished[key] = result
+        while len(self._finished) > self._max_profiles:
+            self._finished.popitem(last=False)
+        return result
+
+    def snapshot(self, key: str) -> Optional[Dict[str, Any]]:
+        """Result so far for an open profile, or the stored result of a closed one."""
+        profile = self._active.get(key)
+        if profile is not None:
+            return self._summarize(profile)
+        return self._finished.get(key)
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        items = list(self._finished.values())[-limit:][::-1] if limit > 0 else []
+        return [{k: v for k, v in item.items() if k != "collapsed"} for item in items]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "interval_ms": self.interval * 1000,
+            "sample_rate": self.sample_rate,
+            "active": len(self._active),
+            "buffered": len(self._finished),
+            **self._stats,
+        }
+
+    # ------------------------------------------------------------------
+    # Task ownership
+    # ------------------------------------------------------------------
+
+    def _install_factory(self, loop: asyncio.AbstractEventLoop) -> None:
+        if loop in self._previous_factories:
+            return
+        previous = loop.get_task_factory()
+        self._previous_factories[loop] = previous
+
+        def _factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task:
+            task = previous(loop, coro, **kwargs) if previous is not None else asyncio.Task(coro, loop=loop, **kwargs)
+            parent = asyncio.current_task(loop)
+            if parent is not None:
+                for profile in list(self._active.values()):
+                    if parent in profile.tasks:
+                        profile.tasks.add(task)
+            return task
+
+        loop.set_task_factory(_factory)
+
+    def _restore_factory(self, loop: asyncio.AbstractEventLoop) -> None:
+        if loop not in self._previous_factories:
+            return
+        loop.set_task_factory(self._previous_factories.pop(loop))
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def _running_stack(self, frame: Any) -> List[str]:
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        # Drop event loop machinery above the task's own frames
+        for index in range(len(codes) - 1, -1, -1):
+            if _is_loop_dispatch(codes[index]):
+                codes = codes[index + 1 :]
+                break
+        return [_label(code) for code in codes[: self.max_depth]]
+
+    def _await_stack(self, task: asyncio.Task) -> List[str]:
+        stack: List[str] = []
+        coro = task.get_coro()
+        while coro is not None and len(stack) < self.max_depth:
+            frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+            if frame is None:
+                break
+            stack.append(_label(frame.f_code))
+            coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+        stack.append(AWAIT_FRAME)
+        return stack
+
+    def _sample(self) -> None:
+        frames = sys._current_frames()
+        with self._lock:
+            profiles = list(self._active.values())
+        for profile in profiles:
+            current = asyncio.current_task(profile.loop)
+            for task in list(profile.tasks):
+                if task.done():
+                    continue
+                if task is current:
+                    stack = self._running_stack(frames.get(profile.thread_id)) or self._await_stack(task)
+                else:
+                    stack = self._await_stack(task)
+                line = ";".join(stack)
+                if line not in profile.stacks and len(profile.stacks) >= self.max_stacks:
+                    line = TRUNCATED_FRAME
+                profile.stacks[line] += 1
+            profile.samples += 1
+        self._stats["samples"] += 1
+
+    def _run(self) -> None:
+        while True:
+            if self._wake.wait(self.interval):
+                with self._lock:
+                    if not self._active:
+                        self._thread = None
+                        return
+                    self._wake.clear()
+                continue
+            try:
+                self._sample()
+            except Exception:
+                # Frames can disappear mid-walk; drop the sample
+                self._stats["sampler_errors"] += 1
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _summarize(self, profile: _Profile) -> Dict[str, Any]:
+        stacks = profile.stacks.most_common()
+        total = sum(count for _, count in stacks) or 1
+        leaves: Counter = Counter()
+        for stack, count in stacks:
+            frames = stack.split(";")
+            leaf = frames[-1]
+            if leaf == AWAIT_FRAME and len(frames) > 1:
+                leaf = f"{frames[-2]} {AWAIT_FRAME}"
+            leaves[leaf] += count
+        return {
+            "key": profile.key,
+            "started_at": profile.started_at,
+            "duration_s": round(time.perf_counter() - profile.started, 3),
+            "interval_ms": self.interval * 1000,
+            "samples": profile.samples,
+            "stacks": len(stacks),
+            "top": [
+                {"frame": frame, "samples": count, "pct": round(count / total * 100, 1)}
+                for frame, count in leaves.most_common(10)
+            ],
+            "collapsed": "\n".join(f"{stack} {count}" for stack, count in stacks),
+        }
+
+
+# Global profiler instance
+sampling_profiler = SamplingProfiler(
+    interval=settings.telemetry_profile_interval_ms / 1000,
+    sample_rate=settings.telemetry_profile_sample_rate,
+)
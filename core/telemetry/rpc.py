@@ -0,0 +1,30 @@
+"""Instrumented web3 HTTP providers recording per-method RPC latency."""
+from __future__ import annotations
+
+from typing import Any
+
+from web3 import AsyncHTTPProvider, Web3
+
+from core.telemetry.observability import track_external_call
+
+
+class InstrumentedHTTPProvider(Web3.HTTPProvider):
+    """`Web3.HTTPProvider` that records latency/status for every JSON-RPC call."""
+
+    def make_request(self, method: Any, params: Any) -> Any:
+        with track_external_call("web3_rpc", str(method)) as state:
+            response = super().make_request(method, params)
+            if isinstance(response, dict) and response.get("error"):
+                state["status"] = "rpc_error"
+            return response
+
+
+class InstrumentedAsyncHTTPProvider(AsyncHTTPProvider):
+    """`AsyncHTTPProvider` counterpart of :class:`InstrumentedHTTPProvider`."""
+
+    async def make_request(self, method: Any, params: Any) -> Any:
+        with track_external_call("web3_rpc", str(method)) as state:
+            response = await super().make_request(method, params)
+            if isinstance(response, dict) and response.get("error"):
+                state["status"] = "rpc_error"
+            return response
@@ -0,0 +1,157 @@
+"""
+Sampled in-process tracing spans.
+
+A trace is opened at the top of a trader cycle (trigger flow run) with
+`tracer.trace()`. Nested `tracer.span()` calls - task flows and instrumented
+outbound clients - attach to it through a context variable. Unsampled cycles
+cost one random draw, and spans outside a sampled trace are no-ops.
+Finished traces are kept in a bounded ring buffer for the API to expose.
+"""
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.settings.config import settings
+
+
+@dataclass
+class _Trace:
+    trace_id: str
+    name: str
+    started_at: str
+    attributes: Dict[str, Any]
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _ActiveSpan:
+    trace: _Trace
+    span_id: str
+
+
+_current_span: ContextVar[Optional[_ActiveSpan]] = ContextVar("trace_current_span", default=None)
+
+
+class Tracer:
+    """Minimal sampled tracer with a bounded buffer of finished traces."""
+
+    def __init__(self, sample_rate: float = 0.1, max_traces: int = 200, max_spans: int = 500) -> None:
+        self.sample_rate = float(sample_rate)
+        self.max_spans = int(max_spans)
+        self._finished: deque[Dict[str, Any]] = deque(maxlen=int(max_traces))
+        self._stats = {"started": 0, "sampled": 0}
+
+    @staticmethod
+    def _new_id() -> str:
+        return uuid.uuid4().hex[:16]
+
+    @contextmanager
+    def _run_span(self, parent: _ActiveSpan, name: str, attributes: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        span_id = self._new_id()
+        record: Dict[str, Any] = {
+            "span_id": span_id,
+            "parent_id": parent.span_id,
+            "name": name,
+            "start_offset_ms": None,
+            "duration_ms": None,
+            "status": "ok",
+            "attributes": dict(attributes),
+        }
+        token = _current_span.set(_ActiveSpan(trace=parent.trace, span_id=span_id))
+        start = time.perf_counter()
+        record["_start"] = start
+        try:
+            yield record
+        except BaseException as exc:
+            record["status"] = "error"
+            record["attributes"]["error"] = type(exc).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000.0, 3)
+            if len(parent.trace.spans) < self.max_spans:
+                parent.trace.spans.append(record)
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[Optional[Dict[str, Any]]]:
+        """Open a root trace (or a child span when one is already active)."""
+        parent = _current_span.get()
+        if parent is not None:
+            with self._run_span(parent, name, attributes) as record:
+                yield record
+            return
+
+        self._stats["started"] += 1
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            yield None
+            return
+        self._stats["sampled"] += 1
+
+        root = _Trace(
+            trace_id=uuid.uuid4().hex,
+            name=name,
+            started_at=datetime.now(timezone.utc).isoformat(),
+            attributes=dict(attributes),
+        )
+        root_span = _ActiveSpan(trace=root, span_id="root")
+        token = _current_span.set(root_span)
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield root.attributes
+        except BaseException as exc:
+            status = "error"
+            root.attributes["error"] = type(exc).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            for span in root.spans:
+                span["start_offset_ms"] = round((span.pop("_start") - start) * 1000.0, 3)
+            self._finished.append(
+                {
+                    "trace_id": root.trace_id,
+                    "name": root.name,
+                    "started_at": root.started_at,
+                    "duration_ms": round((time.perf_counter() - start) * 1000.0, 3),
+                    "status": status,
+                    "attributes": root.attributes,
+                    "spans": sorted(root.spans, key=lambda item: item["start_offset_ms"]),
+                }
+            )
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Dict[str, Any]]]:
+        """Record a child span when inside a sampled trace; no-op otherwise."""
+        parent = _current_span.get()
+        if parent is None:
+            yield None
+            return
+        with self._run_span(parent, name, attributes) as record:
+            yield record
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        if limit <= 0:
+            return []
+        return list(self._finished)[-limit:][::-1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "sample_rate": self.sample_rate,
+            "buffered": len(self._finished),
+            **self._stats,
+        }
+
+
+# Global tracer instance
+tracer = Tracer(
+    sample_rate=settings.telemetry_trace_sample_rate,
+    max_traces=settings.telemetry_trace_buffer,
+)
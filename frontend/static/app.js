@@ -739,6 +739,68 @@ async function loadDexDashboard() {
   }
 }
 
+// Live DEX updates over SSE; polling stays as a slow fallback for KPIs.
+let dexEventSource = null;
+let dexReloadTimer = null;
+
+function scheduleDexReload() {
+  if (dexReloadTimer) return;
+  dexReloadTimer = setTimeout(() => {
+    dexReloadTimer = null;
+    loadDexDashboard();
+  }, 1000);
+}
+
+function prependDexLine(elementId, line, maxLines = 120) {
+  const el = document.getElementById(elementId);
+  if (!el) return;
+  const current = el.textContent && !el.textContent.startsWith('No ') && el.textContent !== 'Loading...'
+    ? el.textContent.split('\n')
+    : [];
+  el.textContent = [line, ...current].slice(0, maxLines).join('\n');
+}
+
+// Execution deltas only carry changed fields, so merge them into the last known state.
+const dexExecutions = new Map();
+
+function applyDexExecution(delta, maxTracked = 50) {
+  if (!delta.execution_id) return;
+  const previous = dexExecutions.get(delta.execution_id) || {};
+  const state = { ...previous, ...delta };
+  dexExecutions.delete(delta.execution_id);
+  dexExecutions.set(delta.execution_id, state);
+  if (dexExecutions.size > maxTracked) dexExecutions.delete(dexExecutions.keys().next().value);
+  if (state.status === previous.status) return;
+  const suffix = state.error ? ` (${state.error})` : '';
+  prependDexLine('dex-task-stream', `${state.updated_at || ''} execution ${state.execution_id} ${state.status || '-'}${suffix}`);
+  const el = document.getElementById('dex-control-result');
+  if (el) el.textContent = `DEX execution ${state.execution_id}: ${state.status || '-'}${suffix}.`;
+}
+
+function subscribeDexLive() {
+  if (dexEventSource || typeof EventSource === 'undefined') return;
+  const topics = ['dex.trades', 'dex.tasks', 'dex.logs', 'dex.cycles', 'dex.executions'];
+  dexEventSource = new EventSource(`/api/events/stream?topics=${topics.join(',')}`);
+  dexEventSource.addEventListener('dex.trades', (evt) => {
+    const t = JSON.parse(evt.data);
+    prependDexLine('dex-trade-stream', `${t.timestamp || ''} ${t.side || ''} ${t.symbol || ''} qty=${t.quantity || ''}`);
+  });
+  dexEventSource.addEventListener('dex.tasks', (evt) => {
+    const t = JSON.parse(evt.data);
+    prependDexLine('dex-task-stream', `${t.timestamp} ${t.context?.task_type || '-'} ${t.message}`);
+  });
+  dexEventSource.addEventListener('dex.logs', (evt) => {
+    const l = JSON.parse(evt.data);
+    prependDexLine('dex-log-stream', `${l.timestamp} [${l.level}] ${l.message}`);
+  });
+  dexEventSource.addEventListener('dex.cycles', (evt) => {
+    const c = JSON.parse(evt.data);
+    prependDexLine('dex-task-stream', `${c.timestamp || ''} cycle ${c.mode || '-'} (${c.reason || '-'}) execution=${c.execution_id || '-'}`);
+  });
+  dexEventSource.addEventListener('dex.executions', (evt) => applyDexExecution(JSON.parse(evt.data)));
+  dexEventSource.addEventListener('resync', scheduleDexReload);
+}
+
 async function saveDexConfig() {
   const activeBot = document.getElementById('dex-active-bot')?.value || 'dex';
   await apiPost(`/api/dex/bot-mode?active_bot=${encodeURIComponent(activeBot)}`, {});
@@ -842,6 +904,7 @@ window.ui = {
   loadOpenOrders,
   loadTrades,
   loadDexDashboard,
+  subscribeDexLive,
   saveDexConfig,
   startDexTrader,
   stopDexTrader,
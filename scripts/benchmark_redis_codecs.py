@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the Redis value codecs on representative record shapes.
+
+Compares encode/decode time and stored size (envelope included) of every
+installed codec against the historical ``json.dumps(cls=DateTimeEncoder)``
+format for ROI records, watchlist positions, log entries, workspace memory
+entries and graph nodes.
+
+Usage:
+  uv run scripts/benchmark_redis_codecs.py
+  uv run scripts/benchmark_redis_codecs.py --iterations 20000 --json
+"""
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Callable, Dict, List
+
+from core.clients.redis_codec import DateTimeEncoder, available_codecs, get_codec, pack, unpack
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def sample_records() -> Dict[str, Any]:
+    """Record shapes mirroring what the toolkits store today."""
+    roi_record = {
+        "cycle_id": uuid.uuid4().hex,
+        "timestamp": _now(),
+        "strategy": "wallet_balancing",
+        "agent_weights": {f"agent_{i}": round(0.5 + i / 20, 3) for i in range(8)},
+        "tickers": {
+            ticker: {
+                "allocation_pct": 12.5,
+                "buy_price": 100.0 + i,
+                "t1_price": 101.5 + i,
+                "t1_roi": 0.015,
+                "action": "BUY",
+                "confidence": 0.71,
+            }
+            for i, ticker in enumerate(["BTC-USD", "ETH-USD", "SOL-USD", "AVAX-USD", "LINK-USD", "ARB-USD"])
+        },
+        "strategy_roi": 0.0132,
+        "advice": "Increase exposure to momentum names; trim low-confidence allocations.",
+        "t1_updated": True,
+    }
+    position = {
+        "position_id": str(uuid.uuid4()),
+        "token_symbol": "ETH",
+        "token_address": "0x" + "ab" * 20,
+        "quantity": 1.2345,
+        "entry_price": 2450.12,
+        "wallet_address": "0x" + "cd" * 20,
+        "stop_loss_pct": -0.07,
+        "take_profit_pct": 0.12,
+        "mode": "fast_decision",
+        "exit_to_symbol": "USDC",
+        "exit_plan": {"targets": [{"pct": 0.05, "size": 0.5}, {"pct": 0.12, "size": 0.5}]},
+        "status": "open",
+        "created_at": _now(),
+        "updated_at": _now(),
+    }
+    log_entry = {
+        "timestamp": _now(),
+        "level": "INFO",
+        "message": "DEX task completed",
+        "name": "core.pipelines.dex_manager",
+        "function": "_run_task",
+        "line": 512,
+        "extra": {"cluster": "default", "instance": "agent-1", "task_type": "decision_gateway"},
+    }
+    memory_entry = {
+        "id": uuid.uuid4().hex,
+        "role": "assistant",
+        "content": "Market breadth improved overnight; funding rates normalised across majors. " * 4,
+        "created_at": datetime.now(timezone.utc),
+        "metadata": {"source": "news", "tickers": ["BTC", "ETH"], "score": 0.82},
+    }
+    graph_node = {
+        "id": uuid.uuid4().hex,
+        "labels": ["Asset", "Signal"],
+        "properties": {
+            "symbol": "SOL",
+            "signal": "bullish",
+            "strength": 0.64,
+            "window": [round(100 + i * 0.37, 2) for i in range(48)],
+            "expires_at": datetime.now(timezone.utc) + timedelta(hours=6),
+        },
+    }
+    return {
+        "roi_record": roi_record,
+        "watchlist_position": position,
+        "log_entry": log_entry,
+        "workspace_memory": memory_entry,
+        "graph_node": graph_node,
+    }
+
+
+def _time_per_op(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_benchmark(iterations: int = 5000) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for shape, record in sample_records().items():
+        legacy = json.dumps(record, cls=DateTimeEncoder)
+        baseline = {
+            "encode_us": _time_per_op(partial(json.dumps, record, cls=DateTimeEncoder), iterations),
+            "decode_us": _time_per_op(partial(json.loads, legacy), iterations),
+            "bytes": len(legacy.encode("utf-8")),
+        }
+        results.append({"shape": shape, "codec": "legacy_json", **baseline})
+        for name in available_codecs():
+            codec = get_codec(name)
+            raw = pack(record, codec)
+            encode_us = _time_per_op(partial(pack, record, codec), iterations)
+            decode_us = _time_per_op(partial(unpack, raw), iterations)
+            results.append(
+                {
+                    "shape": shape,
+                    "codec": name,
+                    "encode_us": encode_us,
+                    "decode_us": decode_us,
+                    "bytes": len(raw),
+                    "encode_speedup": baseline["encode_us"] / encode_us if encode_us else None,
+                    "decode_speedup": baseline["decode_us"] / decode_us if decode_us else None,
+                    "size_ratio": len(raw) / baseline["bytes"],
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Redis value codecs.")
+    parser.add_argument("--iterations", type=int, default=5000, help="Encode/decode iterations per measurement.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"Codecs available: {', '.join(available_codecs())}")
+    print(f"{'shape':<20} {'codec':<12} {'enc µs':>8} {'dec µs':>8} {'bytes':>7} {'enc x':>6} {'dec x':>6} {'size':>6}")
+    for row in results:
+        print(
+            f"{row['shape']:<20} {row['codec']:<12} {row['encode_us']:>8.2f} {row['decode_us']:>8.2f} "
+            f"{row['bytes']:>7} {row.get('encode_speedup') or 1.0:>6.2f} {row.get('decode_speedup') or 1.0:>6.2f} "
+            f"{row.get('size_ratio') or 1.0:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,28 +3,37 @@
 Export agentic chat logs and decisions from Redis.
 
 This script is intended for pre-deployment audits. It:
-  - Scanne les historiques de chat `chat:history:*`
+  - Scanne les historiques de chat `chat:history:*` (SCAN, jamais KEYS)
   - Scanne les décisions agentiques `ai_decision:*`
-  - Écrit un fichier JSON unique avec:
-      {
-        "generated_at": "...",
-        "env": {...},
-        "chats": [...],
-        "decisions": [...]
-      }
+  - Écrit un fichier NDJSON en streaming (une ligne par enregistrement):
+      {"type": "meta", "generated_at": "...", "env": {...}}
+      {"type": "chat", "user_id": "...", "key": "...", "history": [...]}
+      {"type": "decision", "key": "...", "decision": {...}}
+      {"type": "stats", "chat_users": N, "decisions": M, ...}
+
+Keys are read with cursor-based SCAN and chunked MGET, so neither Redis nor
+this process ever holds the full keyspace. Output can be gzip/zstd
+compressed. Each SCAN batch is written as one self-contained chunk (a gzip
+member / zstd frame), fsynced, and then the cursor and the file offset after
+the chunk are saved to a checkpoint file. `--resume` truncates the output
+back to that offset, dropping any chunk cut short by a crash, and continues
+from the cursor.
 
 Usage:
   cd agentic_system_trading
-  uv run scripts/export_agentic_chat_logs.py --output exports/agentic_chat_export.json
+  uv run scripts/export_agentic_chat_logs.py --output exports/agentic_chat_export.ndjson.gz
+  uv run scripts/export_agentic_chat_logs.py --output exports/agentic_chat_export.ndjson.gz --resume
 """
 
 import asyncio
+import gzip
 import json
 import os
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from typing import Any, Dict, IO, List, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
@@ -33,88 +42,289 @@ os.chdir(str(ROOT))
 from core.logging import setup_logging, log  # type: ignore
 from core.clients.redis_client import RedisClient  # type: ignore
 
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+SECTIONS = (
+    # (section, SCAN pattern, record type)
+    ("chats", "chat:history:*", "chat"),
+    ("decisions", "ai_decision:*", "decision"),
+)
+
+
+def _resolve_compression(output_path: Path, compression: str) -> str:
+    if compression != "auto":
+        return compression
+    if output_path.suffix == ".gz":
+        return "gzip"
+    if output_path.suffix == ".zst":
+        return "zstd"
+    return "none"
+
+
+class _ChunkWriter:
+    """Buffers records and appends them as self-contained chunks.
+
+    ``commit()`` compresses the buffer into one gzip member / zstd frame
+    (concatenations of either stay readable), fsyncs it and returns the
+    file offset after it. Opening with ``offset`` truncates the file there,
+    so a chunk a crashed run left half-written never precedes new data.
+    """
+
+    def __init__(self, output_path: Path, compression: str, offset: Optional[int] = None) -> None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if compression == "gzip":
+            self._compress = lambda data: gzip.compress(data, compresslevel=6)
+        elif compression == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstd compression requested but the 'zstandard' package is not installed")
+            compressor = zstandard.ZstdCompressor(level=3)
+            self._compress = compressor.compress
+        else:
+            self._compress = lambda data: data
+        if offset is None:
+            self._raw: IO[bytes] = output_path.open("wb")
+        else:
+            if not output_path.exists():
+                raise RuntimeError(f"Cannot resume: {output_path} is missing")
+            self._raw = output_path.open("r+b")
+            self._raw.truncate(offset)
+            self._raw.seek(offset)
+        self._buffer: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self._buffer.append(data)
+
+    def commit(self) -> int:
+        if self._buffer:
+            self._raw.write(self._compress(b"".join(self._buffer)))
+            self._buffer = []
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        return self._raw.tell()
+
+    def close(self) -> None:
+        self._raw.close()
+
+    def __enter__(self) -> "_ChunkWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class _Checkpoint:
+    """Cursor checkpoint persisted atomically next to the output file."""
+
+    def __init__(self, path: Path, output_path: Path) -> None:
+        self.path = path
+        self.state: Dict[str, Any] = {
+            "output": str(output_path),
+            "offset": 0,
+            "sections": {name: {"cursor": 0, "done": False, "exported": 0, "scanned": 0} for name, _, _ in SECTIONS},
+        }
+
+    def load(self) -> bool:
+        if not self.path.exists():
+            return False
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if data.get("output") != self.state["output"]:
+            raise RuntimeError(f"Checkpoint {self.path} belongs to {data.get('output')}, not {self.state['output']}")
+        self.state = data
+        return True
+
+    def section(self, name: str) -> Dict[str, Any]:
+        return self.state["sections"][name]
+
+    def save(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self.state), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class _Throughput:
+    """Periodic progress/throughput logging."""
+
+    def __init__(self, interval_seconds: float = 5.0) -> None:
+        self.started = time.perf_counter()
+        self.last_report = self.started
+        self.interval_seconds = interval_seconds
+        self.scanned = 0
+        self.written = 0
+        self.bytes_out = 0
 
-async def export_chat_and_decisions(output_path: Path, max_users: int = 200, max_decisions: int = 500) -> None:
-    """Export chat histories and agentic decisions to a single JSON file."""
+    def maybe_report(self, section: str, force: bool = False) -> None:
+        now = time.perf_counter()
+        if not force and now - self.last_report < self.interval_seconds:
+            return
+        self.last_report = now
+        elapsed = max(now - self.started, 1e-6)
+        log.info(
+            f"[export] {section}: scanned={self.scanned} written={self.written} "
+            f"({self.written / elapsed:.0f} rec/s, {self.bytes_out / elapsed / 1024:.0f} KiB/s uncompressed)"
+        )
+
+
+def _build_record(record_type: str, key: str, raw: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not raw:
+        return None
+    if record_type == "chat":
+        try:
+            history: Any = json.loads(raw)
+        except Exception:
+            history = raw
+        return {"type": "chat", "user_id": key.split("chat:history:")[-1], "key": key, "history": history}
+    try:
+        data = json.loads(raw)
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("agentic") is not True:
+        return None
+    return {"type": "decision", "key": key, "decision": data}
+
+
+async def _export_section(
+    redis: RedisClient,
+    out: _ChunkWriter,
+    checkpoint: _Checkpoint,
+    throughput: _Throughput,
+    *,
+    section: str,
+    pattern: str,
+    record_type: str,
+    limit: int,
+    scan_count: int,
+    mget_chunk: int,
+) -> None:
+    state = checkpoint.section(section)
+    if state["done"]:
+        return
+    cursor = int(state["cursor"])
+    while True:
+        cursor, keys = await redis.redis.scan(cursor=cursor, match=pattern, count=scan_count)
+        throughput.scanned += len(keys)
+        state["scanned"] += len(keys)
+        for start in range(0, len(keys), mget_chunk):
+            if limit and state["exported"] >= limit:
+                break
+            chunk = keys[start : start + mget_chunk]
+            values = await redis.redis.mget(chunk)
+            lines: List[bytes] = []
+            for key, raw in zip(chunk, values):
+                if limit and state["exported"] >= limit:
+                    break
+                record = _build_record(record_type, str(key), raw)
+                if record is None:
+                    continue
+                lines.append(json.dumps(record, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+                state["exported"] += 1
+            if lines:
+                payload = b"".join(lines)
+                out.write(payload)
+                throughput.written += len(lines)
+                throughput.bytes_out += len(payload)
+
+        reached_limit = bool(limit) and state["exported"] >= limit
+        state["cursor"] = int(cursor)
+        state["done"] = int(cursor) == 0 or reached_limit
+        # The chunk must be on disk before the cursor and offset advance in the checkpoint
+        checkpoint.state["offset"] = out.commit()
+        checkpoint.save()
+        throughput.maybe_report(section)
+        if state["done"]:
+            break
+    throughput.maybe_report(section, force=True)
+
+
+async def export_chat_and_decisions(
+    output_path: Path,
+    max_users: int = 0,
+    max_decisions: int = 0,
+    *,
+    compression: str = "auto",
+    resume: bool = False,
+    scan_count: int = 1000,
+    mget_chunk: int = 200,
+) -> Dict[str, Any]:
+    """Stream chat histories and agentic decisions to an NDJSON file."""
     try:
         setup_logging()
     except Exception:
         pass
 
+    compression = _resolve_compression(output_path, compression)
+    checkpoint = _Checkpoint(output_path.with_name(output_path.name + ".checkpoint"), output_path)
+    resuming = resume and checkpoint.load()
+    if resume and not resuming:
+        log.info("No checkpoint found; starting a fresh export")
+
     redis = RedisClient()
     await redis.connect()
+    throughput = _Throughput()
 
     try:
-        log.info("🔍 Scanning Redis for chat histories and decisions")
+        log.info(f"🔍 Streaming chat histories and decisions from Redis (compression={compression})")
+        offset = None
+        if resuming:
+            # Checkpoints from before offsets were recorded resume at the end of the file
+            offset = checkpoint.state.get("offset")
+            offset = int(offset) if offset is not None else output_path.stat().st_size
+        with _ChunkWriter(output_path, compression, offset=offset) as out:
+            if not resuming:
+                meta = {
+                    "type": "meta",
+                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "env": {
+                        "ENVIRONMENT": os.getenv("ENVIRONMENT"),
+                        "AGENT_INSTANCE_ID": os.getenv("AGENT_INSTANCE_ID"),
+                    },
+                }
+                out.write(json.dumps(meta).encode("utf-8") + b"\n")
+                checkpoint.state["offset"] = out.commit()
+                checkpoint.save()
 
-        # 1) Export chat histories
-        chat_data: List[Dict[str, Any]] = []
-        try:
-            keys = await redis.redis.keys("chat:history:*")
-            keys = keys[:max_users]
-            log.info(f"Found {len(keys)} chat history keys")
-
-            for key in keys:
-                user_id = str(key).split("chat:history:")[-1]
-                raw = await redis.get(key)
-                if not raw:
-                    continue
+            limits = {"chats": max_users, "decisions": max_decisions}
+            for section, pattern, record_type in SECTIONS:
                 try:
-                    history = json.loads(raw)
-                except Exception:
-                    history = raw
-
-                chat_data.append(
-                    {
-                        "user_id": user_id,
-                        "key": key,
-                        "history": history,
-                    }
-                )
-        except Exception as e:
-            log.error(f"Failed to export chat histories: {e}", exc_info=True)
-
-        # 2) Export agentic decisions
-        decisions: List[Dict[str, Any]] = []
-        try:
-            decision_keys = await redis.redis.keys("ai_decision:*")
-            decision_keys = decision_keys[:max_decisions]
-            log.info(f"Found {len(decision_keys)} ai_decision keys")
-
-            for key in decision_keys:
-                data = await redis.get_json(key)
-                if not data or data.get("agentic") is not True:
-                    continue
-                decisions.append(
-                    {
-                        "key": key,
-                        "decision": data,
-                    }
-                )
-        except Exception as e:
-            log.error(f"Failed to export ai_decision entries: {e}", exc_info=True)
-
-        # 3) Build export payload
-        payload: Dict[str, Any] = {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "env": {
-                "ENVIRONMENT": os.getenv("ENVIRONMENT"),
-                "AGENT_INSTANCE_ID": os.getenv("AGENT_INSTANCE_ID"),
-            },
-            "stats": {
-                "chat_users": len(chat_data),
-                "decisions": len(decisions),
-            },
-            "chats": chat_data,
-            "decisions": decisions,
-        }
+                    await _export_section(
+                        redis,
+                        out,
+                        checkpoint,
+                        throughput,
+                        section=section,
+                        pattern=pattern,
+                        record_type=record_type,
+                        limit=int(limits[section] or 0),
+                        scan_count=scan_count,
+                        mget_chunk=mget_chunk,
+                    )
+                except Exception as e:
+                    log.error(f"Failed to export {section} (resume with --resume): {e}", exc_info=True)
+                    raise
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+            stats = {
+                "type": "stats",
+                "completed_at": datetime.now(timezone.utc).isoformat(),
+                "chat_users": checkpoint.section("chats")["exported"],
+                "decisions": checkpoint.section("decisions")["exported"],
+                "keys_scanned": sum(checkpoint.section(name)["scanned"] for name, _, _ in SECTIONS),
+                "elapsed_seconds": round(time.perf_counter() - throughput.started, 3),
+            }
+            out.write(json.dumps(stats).encode("utf-8") + b"\n")
+            out.commit()
 
-        log.info(f"✅ Export complete: {output_path} (users={len(chat_data)}, decisions={len(decisions)})")
+        checkpoint.clear()
+        log.info(
+            f"✅ Export complete: {output_path} (users={stats['chat_users']}, decisions={stats['decisions']}, "
+            f"{output_path.stat().st_size / 1024:.0f} KiB on disk)"
+        )
         print(f"Exported agentic chat logs to: {output_path}")
+        return stats
     finally:
         await redis.disconnect()
 
@@ -126,28 +336,45 @@ def main() -> None:
     parser.add_argument(
         "--output",
         type=str,
-        default="exports/agentic_chat_export.json",
-        help="Output JSON file path (relative to agentic_system_trading root).",
+        default="exports/agentic_chat_export.ndjson.gz",
+        help="Output NDJSON file path (relative to agentic_system_trading root).",
     )
     parser.add_argument(
         "--max-users",
         type=int,
-        default=200,
-        help="Maximum number of chat history users to export.",
+        default=0,
+        help="Maximum number of chat history users to export (0 = all).",
     )
     parser.add_argument(
         "--max-decisions",
         type=int,
-        default=500,
-        help="Maximum number of ai_decision entries to export.",
+        default=0,
+        help="Maximum number of agentic ai_decision entries to export (0 = all).",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["auto", "none", "gzip", "zstd"],
+        default="auto",
+        help="Output compression (auto = from file extension: .gz / .zst).",
     )
+    parser.add_argument("--resume", action="store_true", help="Resume from the checkpoint of a previous run.")
+    parser.add_argument("--scan-count", type=int, default=1000, help="SCAN COUNT hint per iteration.")
+    parser.add_argument("--mget-chunk", type=int, default=200, help="Keys per MGET round-trip.")
 
     args = parser.parse_args()
     output_path = (ROOT / args.output).resolve()
-    asyncio.run(export_chat_and_decisions(output_path, max_users=args.max_users, max_decisions=args.max_decisions))
+    asyncio.run(
+        export_chat_and_decisions(
+            output_path,
+            max_users=args.max_users,
+            max_decisions=args.max_decisions,
+            compression=args.compression,
+            resume=args.resume,
+            scan_count=args.scan_count,
+            mget_chunk=args.mget_chunk,
+        )
+    )
 
 
 if __name__ == "__main__":
     main()
-
-
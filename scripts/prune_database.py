@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root))
 from core.settings.config import settings
 from core.logging import log
 from core.clients.redis_client import get_redis_client
+from core.pipelines.redis_retention import RedisRetentionEngine, default_retention_policies
 
 
 async def prune_postgres_tables(days_to_keep: int = 30):
@@ -89,53 +90,21 @@ async def prune_postgres_tables(days_to_keep: int = 30):
 
 
 async def prune_redis_keys(days_to_keep: int = 30):
-    """Prune old Redis keys and lists."""
-    redis = await get_redis_client()
-    
+    """Apply the Redis retention policies once (SCAN + pipelined trims)."""
     try:
-        cutoff_timestamp = (datetime.utcnow() - timedelta(days=days_to_keep)).timestamp()
-        
-        # Prune old logs
-        log_keys = await redis.keys("logs:*")
-        pruned_logs = 0
-        for key in log_keys:
-            try:
-                # Check if key is a list (log entries)
-                key_type = await redis.type(key)
-                if key_type == "list":
-                    # Trim list to keep only recent entries
-                    await redis.ltrim(key, 0, 999)  # Keep last 1000 entries
-                    pruned_logs += 1
-            except Exception:
-                pass
-        
-        # Prune old signal history
-        signal_keys = [
-            "memory:signals",
-            "memory:news",
-            "memory:trades",
-        ]
-        for key in signal_keys:
-            try:
-                # Keep only last N entries (handled by prune pipeline)
-                await redis.ltrim(key, 0, settings.memory_prune_limit - 1)
-            except Exception:
-                pass
-        
-        # Prune old review history
-        await redis.ltrim("orchestrator:agent_weights_history", 0, 29)  # Keep last 30
-        
-        # Prune old security events
-        await redis.ltrim("security:events", 0, 999)  # Keep last 1000
-        await redis.ltrim("security:alerts", 0, 499)  # Keep last 500
-        
+        engine = RedisRetentionEngine(
+            await get_redis_client(),
+            policies=default_retention_policies(days_to_keep),
+            max_keys_per_second=settings.redis_retention_max_keys_per_second,
+            memory_sample_rate=settings.redis_retention_memory_sample_rate,
+        )
+        report = await engine.run_once()
         log.info(
-            "Redis pruning completed",
-            log_keys_pruned=pruned_logs,
-            days_kept=days_to_keep
+            f"Redis pruning completed: keys_trimmed={report['keys_trimmed']} "
+            f"entries_removed={report['entries_removed']} "
+            f"est_bytes_reclaimed={report['estimated_bytes_reclaimed']} days_kept={days_to_keep}"
         )
-        
-        return {"log_keys_pruned": pruned_logs}
+        return report
     except Exception as e:
         log.error(f"Error pruning Redis: {e}")
         return {}
@@ -277,7 +246,7 @@ async def main():
         for key, value in stats.items():
             print(f"  {key}: {value}")
     
-    await get_redis_client().disconnect()
+    await (await get_redis_client()).disconnect()
 
 
 if __name__ == "__main__":
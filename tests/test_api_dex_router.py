@@ -59,7 +59,7 @@ def test_dex_control_and_trigger(monkeypatch):
     async def _start(cycle_enabled: bool, watchlist_enabled: bool):
         return {"status": "ok", "cycle_enabled": cycle_enabled, "watchlist_enabled": watchlist_enabled}
 
-    async def _trigger(mode: str, reason: str):
+    async def _trigger(mode: str, reason: str, profile: bool = False):
         return {"status": "accepted", "execution_id": "exec-1"}
 
     monkeypatch.setattr(dex_monitoring_router.dex_trader_service, "start", _start)
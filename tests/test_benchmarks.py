@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from benchmarks import compare, load_benchmarks, run_suite
+
+
+def test_quick_suite_is_deterministic_and_offline():
+    load_benchmarks()
+    names = ["dqn_ranking", "forecasting_fanout_http", "pool_spy_index"]
+    first = run_suite(names, seed=7, quick=True)
+    second = run_suite(names, seed=7, quick=True)
+
+    assert sorted(first["benchmarks"]) == names
+    assert first["benchmarks"]["forecasting_fanout_http"]["summary"]["records"] == 24
+    assert first["benchmarks"]["pool_spy_index"]["summary"]["cold_matches_warm"] is True
+    for name in names:
+        assert first["benchmarks"][name]["summary"] == second["benchmarks"][name]["summary"]
+
+
+def test_compare_flags_regressions_past_threshold_and_noise_floor():
+    def result(**medians):
+        return {"benchmarks": {name: {"median_ms": ms, "threshold": 0.25, "summary": {}} for name, ms in medians.items()}}
+
+    rows = {
+        row["name"]: row
+        for row in compare(
+            result(slow=20.0, jitter=0.06, fast=5.0, added=1.0),
+            result(slow=10.0, jitter=0.02, fast=10.0, dropped=1.0),
+        )
+    }
+    assert rows["slow"]["status"] == "regression"
+    assert rows["jitter"]["status"] == "ok"
+    assert rows["fast"]["status"] == "improved"
+    assert rows["added"]["status"] == "new"
+    assert rows["dropped"]["status"] == "missing"
+    assert compare(result(slow=20.0), result(slow=10.0), threshold=1.5)[0]["status"] == "ok"
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from core.clients import blockscout_client as blockscout_module
+from core.clients.blockscout_client import BlockscoutMCPClient, BlockscoutMCPError
+
+WALLET_A = "0x00000000000000000000000000000000000000aa"
+WALLET_B = "0x00000000000000000000000000000000000000bb"
+
+
+def _client(handler, **config) -> BlockscoutMCPClient:
+    client = BlockscoutMCPClient({"base_url": "https://mcp.test", "retry_attempts": 1, **config})
+    client.client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_cached_by_body_and_coalesced():
+    calls: list[dict] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(body)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"result": {"balance": body["params"]["arguments"]["address"]}})
+
+    client = _client(handler)
+    results = await asyncio.gather(*[client.get_wallet_balance(WALLET_A) for _ in range(5)])
+    other = await client.get_wallet_balance(WALLET_B)
+    again = await client.get_wallet_balance(WALLET_A)
+
+    assert [result["balance"] for result in results] == [WALLET_A] * 5
+    assert other["balance"] == WALLET_B and again["balance"] == WALLET_A
+    assert len(calls) == 2
+    stats = client.get_cache_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"], stats["inflight"]) == (2, 4, 1, 0)
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_per_tool_ttls_and_lru_bound():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        calls.append(body["params"]["name"])
+        return httpx.Response(200, json={"result": {}})
+
+    client = _client(handler, cache_ttls={"get_balance": 0}, max_cache_entries=2)
+    assert client.cache_ttls["get_contract"] > client.cache_ttls["get_transactions"]
+
+    await client.get_wallet_balance(WALLET_A)
+    await client.get_wallet_balance(WALLET_A)
+    assert calls == ["get_balance", "get_balance"]
+
+    for address in (WALLET_A, WALLET_B, WALLET_A):
+        await client.get_contract_info(address)
+    await client.get_token_info(WALLET_A)  # evicts the least recently used entry (contract B)
+    await client.get_contract_info(WALLET_A)
+    assert calls[2:] == ["get_contract", "get_contract", "get_token"]
+    await client.get_contract_info(WALLET_B)
+    assert calls[5:] == ["get_contract"]
+    assert client.get_cache_stats()["entries"] == 2 and client.get_cache_stats()["evictions"] == 2
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_waiter_and_are_not_cached():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            return httpx.Response(404, text="not found")
+        return httpx.Response(200, json={"result": {"symbol": "PEPE"}})
+
+    client = _client(handler)
+    results = await asyncio.gather(*[client.get_token_info(WALLET_A) for _ in range(3)], return_exceptions=True)
+    assert calls == 1 and all(isinstance(result, BlockscoutMCPError) for result in results)
+
+    assert (await client.get_token_info(WALLET_A))["symbol"] == "PEPE"
+    assert calls == 2
+    await client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_error_bodies_are_cached_briefly(monkeypatch):
+    responses = [
+        {"jsonrpc": "2.0", "error": {"code": -32000, "message": "rate limited"}},
+        {"result": {"isError": True, "content": [{"type": "text", "text": "upstream timeout"}]}},
+        {"result": {"symbol": "PEPE"}},
+    ]
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json=responses[calls - 1])
+
+    now = [1_000.0]
+    monkeypatch.setattr(blockscout_module.time, "monotonic", lambda: now[0])
+    client = _client(handler, error_cache_ttl=5)
+
+    # Each error is served until the short TTL lapses; the good result keeps the tool TTL
+    for advance, expected_calls in ((0, 1), (4, 1), (2, 2), (6, 3), (60, 3)):
+        now[0] += advance
+        await client.get_token_info(WALLET_A)
+        assert calls == expected_calls
+    await client.disconnect()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from core.clients.redis_client import RedisClient
+from core.llm import camel_client
+from core.llm.rate_limiter import LLMRateLimiter
+from core.llm.response_cache import LLMResponseCache
+
+
+class FakeAgent:
+    created = 0
+
+    def __init__(self, system_message, delay: float = 0.0) -> None:
+        FakeAgent.created += 1
+        self.system = system_message.content
+        self.delay = delay
+        self.steps = 0
+        self.resets = 0
+
+    def step(self, message):
+        self.steps += 1
+        time.sleep(self.delay)
+        return SimpleNamespace(msgs=[SimpleNamespace(content=f"{self.system}:{message.content}")])
+
+    def reset(self) -> None:
+        self.resets += 1
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    monkeypatch.setattr(camel_client.CamelModelFactory, "create_model", lambda **kwargs: object())
+    FakeAgent.created = 0
+
+    def _make(delay: float = 0.0, **kwargs):
+        kwargs.setdefault("response_cache", LLMResponseCache(max_entries=16, ttl_seconds=60, redis_client=False))
+        kwargs.setdefault("rate_limiter", LLMRateLimiter(max_concurrency=4, tokens_per_minute=0, redis_client=False))
+        return camel_client.CamelLLMClient(
+            model_name="gpt-test",
+            agent_factory=lambda system_message: FakeAgent(system_message, delay),
+            **kwargs,
+        )
+
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_agents_are_pooled_per_system_prompt_and_responses_cached(make_client):
+    client = make_client()
+
+    first = await client.generate("summarise", "a")
+    second = await client.generate("summarise", "b")
+    cached = await client.generate("summarise", "a")
+    fresh = await client.generate("summarise", "a", use_cache=False)
+    await client.generate("format", "a")
+
+    assert first == cached == fresh == "summarise:a"
+    assert second == "summarise:b"
+    stats = client.get_stats()
+    assert FakeAgent.created == 2
+    assert stats["agent_pool"]["reused"] == 2
+    assert stats["cache"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrency_across_calls(make_client):
+    limiter = LLMRateLimiter(max_concurrency=2, tokens_per_minute=0, redis_client=False, poll_interval=0.005)
+    client = make_client(delay=0.05, rate_limiter=limiter)
+    peak = 0
+    lock = threading.Lock()
+
+    original_invoke = client._invoke
+
+    def tracked(system_prompt, user_prompt):
+        nonlocal peak
+        with lock:
+            peak = max(peak, limiter.get_stats()["active"])
+        return original_invoke(system_prompt, user_prompt)
+
+    client._invoke = tracked
+    results = await asyncio.gather(*(client.generate("s", f"u{i}", use_cache=False) for i in range(6)))
+
+    assert len(results) == 6
+    stats = limiter.get_stats()
+    assert peak <= 2
+    assert stats["acquired"] == 6
+    assert stats["max_waiting"] >= 3
+    assert stats["active"] == 0 and stats["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_window_blocks_until_budget_frees():
+    limiter = LLMRateLimiter(max_concurrency=0, tokens_per_minute=10, redis_client=False)
+    async with limiter.slot(8):
+        pass
+    waiter = asyncio.create_task(limiter._reserve_tokens(5))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    assert limiter.get_stats()["token_waits"] == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+@pytest.mark.asyncio
+async def test_response_cache_is_shared_through_redis():
+    redis = RedisClient()
+    redis.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    writer = LLMResponseCache(max_entries=4, ttl_seconds=60, redis_client=redis)
+    reader = LLMResponseCache(max_entries=4, ttl_seconds=60, redis_client=redis)
+
+    await writer.set("k", "answer")
+    assert await reader.get("k") == "answer"
+    assert reader.get_stats()["redis_hits"] == 1
+    assert await reader.get("missing") is None
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from core.clients import content_cache as content_cache_module
+from core.clients.content_cache import ContentCache, cached_get
+from core.clients.content_index import ContentIndex
+from core.clients.youtube_transcript_client import YouTubeTranscriptMCPClient
+
+
+def test_bodies_are_content_addressed_compressed_and_persisted(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    cache = ContentCache(db_path=db_path)
+    body = b"<rss>" + b"bitcoin " * 2000 + b"</rss>"
+    first = cache.put("feed:a", "https://a/rss", body, ttl_seconds=60)
+    second = cache.put("feed:b", "https://b/rss", body)
+    cache.close()
+
+    reopened = ContentCache(db_path=db_path)
+    stats = reopened.get_stats()
+    assert first == second
+    assert stats["entries"] == 2 and stats["blobs"] == 1
+    assert stats["stored_bytes"] < stats["bytes"] // 10
+    assert reopened.get("feed:b", "https://b/rss") == body
+    assert reopened.get("feed:a", "missing") is None
+    assert reopened.get_stats()["hit_rate"] == 0.5
+
+
+def test_oldest_entries_are_evicted_past_the_size_bound(tmp_path):
+    cache = ContentCache(db_path=str(tmp_path / "cache.db"), max_bytes=600)
+    for i in range(20):
+        cache.put("ns", f"k{i}", bytes(range(256)) + str(i).encode())
+
+    stats = cache.get_stats()
+    assert stats["stored_bytes"] <= 600 and stats["evicted"] > 0
+    assert cache.lookup("ns", "k19") is not None and cache.lookup("ns", "k0") is None
+
+
+@pytest.mark.asyncio
+async def test_expired_feeds_are_revalidated_with_conditional_get(tmp_path):
+    cache = ContentCache(db_path=str(tmp_path / "cache.db"))
+    seen: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<feed>v1</feed>", headers={"ETag": '"v1"'})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        url = "https://feeds.example/rss"
+        assert await cached_get(client, url, "feed:test", ttl_seconds=60, cache=cache) == "<feed>v1</feed>"
+        assert await cached_get(client, url, "feed:test", ttl_seconds=60, cache=cache) == "<feed>v1</feed>"
+        assert len(seen) == 1
+
+        cache.revalidate("feed:test", url, ttl_seconds=-1)  # force expiry
+        assert await cached_get(client, url, "feed:test", ttl_seconds=60, cache=cache) == "<feed>v1</feed>"
+
+    assert len(seen) == 2 and seen[1]["if-none-match"] == '"v1"'
+    assert cache.get_stats()["revalidated"] == 2 and cache.get_stats()["hit"] == 1
+
+
+@pytest.mark.asyncio
+async def test_transcripts_are_served_from_the_shared_cache_across_clients(tmp_path, monkeypatch):
+    cache = ContentCache(db_path=str(tmp_path / "cache.db"))
+    result = {"content": [{"text": "# Title\n\nhello bitcoin", "metadata": {"title": "Title"}}]}
+    writer = YouTubeTranscriptMCPClient({"cache": cache})
+    cache.put_json(writer.cache_namespace, 'get_transcripts:{"url": "vid1"}', result)
+
+    async def _no_spawn(*args, **kwargs):
+        raise AssertionError("MCP server should not be spawned for a cached transcript")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _no_spawn)
+    reader = YouTubeTranscriptMCPClient(
+        {"cache": ContentCache(db_path=str(tmp_path / "cache.db")), "index": ContentIndex(db_path=":memory:")}
+    )
+    transcript = await reader.get_transcript("vid1")
+
+    assert transcript["title"] == "Title" and transcript["transcript"] == "hello bitcoin"
+
+
+@pytest.mark.asyncio
+async def test_transcript_errors_expire_while_transcripts_are_kept(tmp_path, monkeypatch):
+    results = [
+        {"content": [{"type": "text", "text": "Transcript unavailable"}], "isError": True},
+        {"content": [{"type": "text", "text": "# Title\n\n"}]},
+        {"content": [{"type": "text", "text": "# Title\n\nhello bitcoin"}]},
+    ]
+    spawned: list[dict] = []
+
+    class _Process:
+        returncode = 0
+
+        async def communicate(self, input=None):
+            spawned.append(results[len(spawned)])
+            return (json.dumps({"jsonrpc": "2.0", "id": 3, "result": spawned[-1]}) + "\n").encode(), b""
+
+    async def _spawn(*args, **kwargs):
+        return _Process()
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _spawn)
+    monkeypatch.setattr(content_cache_module.time, "time", lambda: now[0])
+    client = YouTubeTranscriptMCPClient({"cache": ContentCache(db_path=str(tmp_path / "cache.db")), "error_cache_ttl": 60})
+
+    # Error and title-only results are re-fetched once the short TTL lapses
+    for advance, expected_spawns in ((0, 1), (30, 1), (31, 2), (61, 3), (10**9, 3)):
+        now[0] += advance
+        await client._invoke_mcp_tool("get_transcripts", {"url": "vid1"})
+        assert len(spawned) == expected_spawns
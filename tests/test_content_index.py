@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.camel_tools.content_search_toolkit import ContentSearchToolkit
+from core.clients.content_cache import ContentCache
+from core.clients.content_index import (
+    ContentIndex,
+    chunk_transcript,
+    extract_tickers,
+    match_expression,
+    normalize_timestamp,
+)
+from core.clients.youtube_transcript_client import YouTubeTranscriptMCPClient
+
+NEWS = [
+    {
+        "title": "Bitcoin ETF flows hit record",
+        "url": "https://news.example/1",
+        "description": "Spot ETF inflows pushed BTC higher as rate cut bets grew.",
+        "source": {"id": None, "name": "Example Wire"},
+        "publishedAt": "2025-03-02T10:00:00Z",
+    },
+    {
+        "title": "Ethereum upgrade scheduled",
+        "url": "https://news.example/2",
+        "description": "Developers confirmed the ETH upgrade; no talk of lower rates, just a cut in fees.",
+        "source": "Chain Daily",
+        "published": "2025-03-01T09:00:00Z",
+    },
+    {
+        "title": "Markets wait on the Fed",
+        "url": "https://news.example/3",
+        "description": "Traders price a rate cut in June.",
+        "source": "Macro Desk",
+        "published": "2025-02-01T09:00:00Z",
+    },
+]
+
+
+@pytest.fixture
+def index():
+    return ContentIndex(db_path=":memory:")
+
+
+def test_query_helpers():
+    assert match_expression('"rate cut" etf*') == '"rate cut" "etf"*'
+    assert match_expression('bad"quote (x)') == '"bad quote" "x"'
+    assert extract_tickers("Ethereum and $pepe vs SOL, not sol", known=["BTC", "SOL"]) == ["ETH", "PEPE", "SOL"]
+    chunks = chunk_transcript("", [{"start": 0, "text": "a b c"}, {"start": 5, "text": "d e"}], words=2)
+    assert chunks == [{"start": 0.0, "text": "a b"}, {"start": 0.0, "text": "c d"}, {"start": 5.0, "text": "e"}]
+
+
+def test_phrase_and_keyword_queries_are_ranked(index):
+    assert index.add_items("news", NEWS) == 3
+    assert index.add_items("news", NEWS[:1]) == 1  # upsert by URL
+    assert index.get_stats() == {"documents": 3, "by_kind": {"news": 3}}
+
+    phrase = index.search('"rate cut"')
+    assert [hit["url"] for hit in phrase] == ["https://news.example/3", "https://news.example/1"]
+    assert "[rate cut]" in phrase[0]["snippet"]
+
+    keyword = index.search("rate cut")
+    assert len(keyword) == 3
+    assert keyword[0]["source"] in {"Example Wire", "Macro Desk"}
+    assert index.search("etf", since="2025-03-02")[0]["title"] == "Bitcoin ETF flows hit record"
+    assert index.search("etf", kinds=["research"]) == []
+
+
+def test_publication_times_are_normalized_to_utc(index):
+    assert normalize_timestamp("Sun, 02 Mar 2025 12:00:00 +0200") == "2025-03-02T10:00:00+00:00"
+    assert normalize_timestamp("2025-03-02T10:00:00Z") == "2025-03-02T10:00:00+00:00"
+    assert normalize_timestamp("not a date") is None and normalize_timestamp("") is None
+
+    index.add_items("news", NEWS)
+    index.add_items(
+        "research",
+        [
+            # RFC 822 dates sort by weekday name as raw text ("Mon" < "Sat")
+            {"title": "Rate cut odds", "url": "https://rss.example/1", "pubDate": "Mon, 03 Mar 2025 08:00:00 GMT"},
+            {"title": "Rate cut history", "url": "https://rss.example/2", "pubDate": "Sat, 01 Feb 2025 08:00:00 GMT"},
+        ],
+    )
+
+    hits = index.search("rate cut", since="2025-03-01T00:00:00Z")
+    assert sorted(hit["url"] for hit in hits) == ["https://news.example/1", "https://news.example/2", "https://rss.example/1"]
+    assert sorted(hit["published_at"] for hit in hits) == [
+        "2025-03-01T09:00:00+00:00",
+        "2025-03-02T10:00:00+00:00",
+        "2025-03-03T08:00:00+00:00",
+    ]
+    with pytest.raises(ValueError):
+        index.search("rate", since="last week")
+
+
+def test_ticker_filter_and_ticker_only_listing(index):
+    index.add_items("news", NEWS)
+
+    assert [hit["url"] for hit in index.search("upgrade", tickers=["eth"])] == ["https://news.example/2"]
+    assert index.search("upgrade", tickers=["BTC"]) == []
+    newest = index.search("", tickers=["BTC", "ETH"])
+    assert [hit["url"] for hit in newest] == ["https://news.example/2", "https://news.example/1"]
+    assert newest[1]["tickers"] == ["BTC"]
+
+
+def test_oldest_documents_are_evicted_past_the_bound():
+    index = ContentIndex(db_path=":memory:", max_documents=2)
+    index.add_items("news", NEWS)
+
+    assert index.get_stats()["documents"] == 2
+    assert index.search("bitcoin") == []
+    assert len(index.search("cut")) == 2
+
+
+def test_upserts_keep_unchanged_rows_and_eviction_counts_rows():
+    index = ContentIndex(db_path=":memory:", max_documents=3)
+    index.add_items("news", NEWS)
+    assert index.add_items("news", NEWS[:1]) == 1
+    # The unchanged article keeps its original (oldest) position
+    assert [hit["url"] for hit in index.search("", tickers=["BTC", "ETH"])] == ["https://news.example/2", "https://news.example/1"]
+
+    for revision in range(2):
+        index.add_items("news", [{**NEWS[0], "description": f"Revision {revision} of the BTC story."}])
+    assert index.get_stats()["documents"] == 3
+    assert len(index.search("upgrade")) == 1
+
+
+@pytest.mark.asyncio
+async def test_transcript_search_uses_indexed_chunks(tmp_path, monkeypatch):
+    cache = ContentCache(db_path=str(tmp_path / "cache.db"))
+    index = ContentIndex(db_path=":memory:")
+    body = " ".join(["intro"] * 100) + " the halving cuts miner rewards " + " ".join(["outro"] * 100)
+    result = {"content": [{"text": f"# Halving explained\n\n{body}", "metadata": {"title": "Halving explained"}}]}
+    client = YouTubeTranscriptMCPClient({"cache": cache, "index": index})
+    cache.put_json(client.cache_namespace, 'get_transcripts:{"url": "vid1"}', result)
+
+    async def _no_spawn(*args, **kwargs):
+        raise AssertionError("MCP server should not be spawned for a cached transcript")
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _no_spawn)
+    matches = await client.search_transcript("vid1", '"miner rewards"')
+    assert await client.search_transcript("vid1", "nothing-here") == []
+
+    assert len(matches) == 1 and "[miner rewards]" in matches[0]["context"]
+    assert index.get_stats()["by_kind"] == {"transcript": 3}
+    assert index.search("halving", parent="other") == []
+    assert index.search("halving", kinds=["transcript"])[0]["title"] == "Halving explained"
+
+
+def test_search_toolkit_validates_arguments(index):
+    index.add_items("research", [{"title": "Bitcoin fee markets", "url": "https://arxiv.example/1", "summary": "Fees."}])
+    toolkit = ContentSearchToolkit(index=index)
+
+    assert toolkit.search(query="fee", kinds="research")["count"] == 1
+    assert toolkit.search(query="fee", kinds="tweets")["success"] is False
+    assert toolkit.search()["success"] is False
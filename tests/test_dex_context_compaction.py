@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+from core.pipelines.dex.context_compaction import ContextCompactor, compact_json
+
+
+def _count(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _trades(n: int) -> list[dict]:
+    return [{"id": i, "token": f"TOKEN{i}", "note": "x" * 200, "pnl": i * 0.5} for i in range(n)]
+
+
+def test_compose_keeps_small_payloads_verbatim():
+    compactor = ContextCompactor(budget_tokens=1000, count_tokens=_count)
+    content, report = compactor.compose("wallet_review", "Review.", [("wallet", {"balance": 1.5})])
+
+    assert content == 'Review.\n\n## wallet\n{"balance":1.5}'
+    assert report["over_budget"] is False
+    assert report["sections"]["wallet"]["level"] == 0
+    assert report["prompt_tokens"] == _count("Review.") + _count('## wallet\n{"balance":1.5}')
+
+
+def test_compose_shrinks_lowest_priority_first_and_never_omits_first_section():
+    compactor = ContextCompactor(budget_tokens=400, count_tokens=_count)
+    sections = [("decision", {"action": "buy", "reason": "r" * 400}), ("recent_trades", _trades(40))]
+    content, report = compactor.compose("strategy_hint", "Memo.", sections)
+
+    assert report["sections"]["recent_trades"]["level"] > report["sections"]["decision"]["level"]
+    assert report["prompt_tokens"] <= 400
+    assert "## decision" in content
+
+    tiny = ContextCompactor(budget_tokens=5, count_tokens=_count)
+    content, report = tiny.compose("strategy_hint", "Memo.", sections)
+    assert report["over_budget"] is True
+    assert report["sections"]["recent_trades"]["level"] == 4
+    assert "(omitted to fit the context budget)" in content
+    assert "omitted" not in content.split("## recent_trades")[0]
+
+
+def test_repeated_structures_are_referenced_and_reported_across_tasks():
+    wallet = {"address": "0xabc", "positions": _trades(3)}
+    compactor = ContextCompactor(budget_tokens=10_000, count_tokens=_count)
+
+    content, _ = compactor.compose("wallet_review", "Review.", [("feedback", {"wallet": wallet}), ("global_wallet", wallet)])
+    assert "<same as feedback.wallet>" in content
+    assert content.count("0xabc") == 1
+
+    _, report = compactor.compose("position_update_review", "Update.", [("global_wallet_state", wallet)])
+    assert report["shared_sections"] == ["global_wallet_state"]
+
+    compactor = ContextCompactor(budget_tokens=10_000, count_tokens=_count)
+    _, report = compactor.compose("position_update_review", "Update.", [("global_wallet_state", wallet)])
+    assert report["shared_sections"] == []
+    assert len(compactor.reports()) == 1
+
+
+def test_compact_json_stays_valid_within_limit():
+    payload = {"trades": _trades(50)}
+    text = compact_json(payload, 1500)
+
+    assert len(text) <= 1500
+    assert json.loads(text)["trades"][-1] == "…(+47 more)"
+    assert compact_json({"a": 1}, 1500) == '{"a": 1}'
@@ -38,3 +38,23 @@ async def test_execution_tracker_failure_state():
     assert state["status"] == "failed"
     assert "boom" in state.get("error", "")
 
+
+@pytest.mark.asyncio
+async def test_execution_tracker_reports_state_changes():
+    deltas: list[dict] = []
+    tracker = ExecutionTracker(lambda payload, _max_len: str(payload) * 100, on_change=deltas.append)
+
+    async def _run(_execution_id: str):
+        return {"success": True}
+
+    execution_id = tracker.launch(mode=ReviewMode.FAST_DECISION, reason="test", run_fn=_run)
+    await asyncio.sleep(0.02)
+
+    assert [(delta["execution_id"], delta["status"]) for delta in deltas] == [
+        (execution_id, "queued"),
+        (execution_id, "running"),
+        (execution_id, "completed"),
+    ]
+    # Updates carry only what changed; the result summary stays behind get_status()
+    assert deltas[0]["reason"] == "test" and "reason" not in deltas[2]
+    assert "result" not in deltas[2] and tracker.get_status(execution_id)["result"]
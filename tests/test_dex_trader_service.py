@@ -30,7 +30,7 @@ def test_dex_trader_service_trigger_cycle_returns_execution_id(monkeypatch):
     service._redis = None
 
     class _FakeTrader:
-        def launch_execution(self, mode, reason):
+        def launch_execution(self, mode, reason, profile=False):
             return "exec-123"
 
     async def _ensure_trader():
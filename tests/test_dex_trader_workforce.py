@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from core.pipelines.dex_manager import DexManager, ReviewMode
@@ -150,3 +152,36 @@ async def test_global_roi_notification_triggers_main_cycle(monkeypatch):
     )
 
     assert calls["reason"] == "watchlist_global_roi_trigger"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_executions_get_their_own_prompt_context():
+    worker = DexManager(
+        workforce=_FakeWorkforce(),
+        uviswap_toolkit=_FakeUviToolkit(),
+        watchlist_toolkit=_FakeWatchlist(),
+        wallet_toolkit=_FakeWallet(),
+        enhancement_toolkit=_FakeEnhancement(),
+    )
+    payload = {"wallet": "x" * 200}
+
+    async def _execution():
+        with worker._execution_context_scope() as compactor:
+            worker._compose_task_content("wallet_review", "Review.", [("wallet", payload)])
+            await asyncio.sleep(0.01)
+            worker._compose_task_content("decision", "Decide.", [("wallet", payload)])
+        # The scope restores the previous (empty) context on exit
+        worker._compose_task_content("decision", "Decide.", [("wallet", payload)])
+        return compactor
+
+    first, second = await asyncio.gather(_execution(), _execution())
+
+    assert first is not second
+    for compactor in (first, second):
+        assert [report["task_type"] for report in compactor.reports()] == ["wallet_review", "decision"]
+        assert compactor.reports()[1]["shared_sections"] == ["wallet"]
+
+    # Calls outside an execution memoise nothing and the status view stays bounded
+    for _ in range(30):
+        worker._compose_task_content("watchlist_review", "Review.", [("wallet", payload)])
+    assert len(worker._context_reports) == 20
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import time
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+import redis
+
+from core.clients import event_bus
+from core.clients.event_bus import EventBus
+
+
+def _bus() -> EventBus:
+    return EventBus(fakeredis.FakeRedis(decode_responses=True))
+
+
+def test_page_walks_history_newest_first_by_cursor():
+    bus = _bus()
+    for i in range(7):
+        bus.publish("dex.trades", {"n": i})
+
+    first, cursor = bus.page("dex.trades", limit=3)
+    second, cursor2 = bus.page("dex.trades", limit=3, before=cursor)
+    third, cursor3 = bus.page("dex.trades", limit=3, before=cursor2)
+
+    assert [item["n"] for item in first] == [6, 5, 4]
+    assert [item["n"] for item in second] == [3, 2, 1]
+    assert [item["n"] for item in third] == [0]
+    assert cursor3 is None
+    assert all("stream_id" in item for item in first)
+
+
+def test_reads_fall_back_to_legacy_list_until_stream_has_data():
+    bus = _bus()
+    bus.redis.lpush("dex:trade_history", json.dumps({"legacy": 1}), json.dumps({"legacy": 2}))
+    assert bus.latest("dex.trades", 10) == [{"legacy": 2}, {"legacy": 1}]
+
+    bus.publish("dex.trades", {"n": 1})
+    assert [item["n"] for item in bus.latest("dex.trades", 10)] == [1]
+
+
+def test_publish_through_pipeline_and_unknown_topic():
+    bus = _bus()
+    pipe = bus.redis.pipeline(transaction=False)
+    bus.publish("dex.logs", {"message": "queued"}, pipe=pipe)
+    assert bus.latest("dex.logs") == []
+    pipe.execute()
+    assert bus.latest("dex.logs")[0]["message"] == "queued"
+    with pytest.raises(ValueError):
+        bus.publish("nope", {})
+
+
+def test_consumer_group_redelivers_unacked_events():
+    bus = _bus()
+    bus.ensure_group("dex.trades", "settlement")
+    bus.ensure_group("dex.trades", "settlement")
+    for i in range(3):
+        bus.publish("dex.trades", {"n": i})
+
+    delivered = bus.consume("dex.trades", "settlement", "worker-a", count=10, claim_idle_ms=0)
+    assert [item["n"] for item in delivered] == [0, 1, 2]
+    bus.ack("dex.trades", "settlement", delivered[0]["stream_id"])
+
+    # worker-a died before acking the rest; worker-b reclaims them once idle
+    time.sleep(0.01)
+    redelivered = bus.consume("dex.trades", "settlement", "worker-b", count=10, claim_idle_ms=1)
+    assert [item["n"] for item in redelivered] == [1, 2]
+    assert bus.ack("dex.trades", "settlement", *[item["stream_id"] for item in redelivered]) == 2
+    assert bus.consume("dex.trades", "settlement", "worker-b", count=10, claim_idle_ms=1) == []
+
+
+def test_default_bus_retries_redis_with_backoff(monkeypatch):
+    now = [1000.0]
+    attempts = []
+
+    def connect(**kwargs):
+        attempts.append(now[0])
+        if len(attempts) < 3:
+            raise redis.exceptions.ConnectionError("connection refused")
+        return fakeredis.FakeRedis(decode_responses=True)
+
+    monkeypatch.setattr(redis, "Redis", connect)
+    monkeypatch.setattr(event_bus, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(event_bus, "_default_bus", None)
+    monkeypatch.setattr(event_bus, "_default_bus_retry_at", 0.0)
+    monkeypatch.setattr(event_bus, "_default_bus_backoff", 0.0)
+
+    assert event_bus.get_event_bus() is None
+    assert event_bus.get_event_bus() is None  # still backing off, no new attempt
+    now[0] += 5
+    assert event_bus.get_event_bus() is None
+    now[0] += 9
+    assert event_bus.get_event_bus() is None
+    now[0] += 1
+    bus = event_bus.get_event_bus()
+    assert bus is not None and event_bus.get_event_bus() is bus
+    assert attempts == [1000.0, 1005.0, 1015.0]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from core.clients.event_bus import EventBus
+from core.clients.event_hub import LiveEventHub, Subscription, merge_feed_delta
+
+
+@pytest.mark.asyncio
+async def test_subscription_coalesces_executions_and_flags_resync_on_overflow():
+    sub = Subscription(["dex.executions", "dex.trades"], max_pending=3)
+    sub.offer("dex.executions", {"execution_id": "e1", "status": "queued", "reason": "test"})
+    sub.offer("dex.executions", {"execution_id": "e1", "status": "running"})
+    assert (await sub.next_batch(timeout=0.1)) == [
+        ("dex.executions", {"execution_id": "e1", "status": "running", "reason": "test"})
+    ]
+    sub.offer("dex.executions", {"execution_id": "e1", "status": "completed"})
+    for i in range(3):
+        sub.offer("dex.trades", {"stream_id": f"{i}-0", "n": i})
+
+    batch = await sub.next_batch(timeout=0.1)
+
+    assert batch[0] == ("resync", {"dropped": 1})
+    assert [event.get("n") for topic, event in batch[1:]] == [0, 1, 2]
+    assert sub.stats["coalesced"] == 1
+    assert await sub.next_batch(timeout=0.01) == []
+
+
+def test_merge_feed_delta_keeps_latest_entries_and_removals():
+    older = {"count": 2, "markets": {"a": {"v": 1}, "b": {"v": 1}}, "removed": ["c"]}
+    newer = {"count": 2, "markets": {"a": {"v": 2}, "c": {"v": 1}}, "removed": ["b"]}
+    merged = merge_feed_delta(older, newer)
+    assert merged["markets"] == {"a": {"v": 2}, "c": {"v": 1}}
+    assert merged["removed"] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_hub_reads_streams_once_for_all_subscribers():
+    server = fakeredis.FakeServer()
+    bus = EventBus(fakeredis.FakeRedis(server=server, decode_responses=True))
+    bus.publish("dex.trades", {"n": 0})
+    hub = LiveEventHub(fakeredis.aioredis.FakeRedis(server=server, decode_responses=True), block_ms=50)
+
+    trades = await hub.subscribe(["dex.trades"])
+    everything = await hub.subscribe()
+    await asyncio.sleep(0.1)
+    bus.publish("dex.trades", {"n": 1})
+    bus.publish("dex.logs", {"message": "hi"})
+
+    trade_batch = await trades.next_batch(timeout=2)
+    all_batch = await everything.next_batch(timeout=2)
+    if len(all_batch) < 2:
+        all_batch += await everything.next_batch(timeout=2)
+
+    assert [event["n"] for _, event in trade_batch] == [1]
+    assert sorted(topic for topic, _ in all_batch) == ["dex.logs", "dex.trades"]
+    assert hub.get_stats()["subscribers"] == 2
+
+    await hub.unsubscribe(trades)
+    await hub.unsubscribe(everything)
+    assert hub.get_stats()["reader_running"] is False
+
+
+def test_stream_route_rejects_unknown_topics_and_formats_events():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from api.routers import live_events
+
+    app = FastAPI()
+    app.include_router(live_events.router, prefix="/api")
+    client = TestClient(app)
+
+    assert client.get("/api/events/stream?topics=nope").status_code == 400
+    assert "dex.trades" in client.get("/api/events/topics").json()["items"]
+    assert live_events.format_sse("dex.trades", {"n": 1, "stream_id": "5-0"}) == (
+        'event: dex.trades\nid: 5-0\ndata: {"n":1,"stream_id":"5-0"}\n\n'
+    )
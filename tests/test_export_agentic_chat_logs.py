@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+from pathlib import Path
+
+import fakeredis.aioredis
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "export_agentic_chat_logs.py"
+_spec = importlib.util.spec_from_file_location("export_agentic_chat_logs", _SCRIPT)
+export_script = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(export_script)
+
+
+class _FakeRedisClient:
+    """RedisClient stand-in whose MGET can fail once after N calls to simulate a crash."""
+
+    def __init__(self, server, fail_after: int | None = None):
+        self.redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        self._mget = self.redis.mget
+        self._calls = 0
+        self.fail_after = fail_after
+        self.redis.mget = self._failing_mget
+
+    async def _failing_mget(self, keys):
+        self._calls += 1
+        if self.fail_after is not None and self._calls > self.fail_after:
+            raise ConnectionError("redis went away")
+        return await self._mget(keys)
+
+    async def connect(self):
+        return None
+
+    async def disconnect(self):
+        return None
+
+
+async def _seed(server, chats: int) -> None:
+    client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    for i in range(chats):
+        await client.set(f"chat:history:user{i}", json.dumps([{"role": "user", "content": f"hi {i}"}]))
+    await client.set("ai_decision:1", json.dumps({"agentic": True, "action": "buy"}))
+
+
+def _records(path: Path) -> list[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_each_batch_is_a_committed_chunk(tmp_path):
+    output = tmp_path / "export.ndjson.gz"
+    with export_script._ChunkWriter(output, "gzip") as out:
+        out.write(b'{"n": 1}\n')
+        first = out.commit()
+        assert out.commit() == first  # nothing buffered, nothing written
+        out.write(b'{"n": 2}\n')
+        second = out.commit()
+
+    raw = output.read_bytes()
+    assert 0 < first < second == len(raw)
+    assert raw[first : first + 2] == b"\x1f\x8b"  # second batch starts a new gzip member
+    assert [record["n"] for record in _records(output)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_resume_truncates_partial_chunk_and_exports_every_key_once(tmp_path, monkeypatch):
+    server = fakeredis.FakeServer()
+    await _seed(server, chats=25)
+    output = tmp_path / "export.ndjson.gz"
+
+    monkeypatch.setattr(export_script, "RedisClient", lambda: _FakeRedisClient(server, fail_after=2))
+    with pytest.raises(ConnectionError):
+        await export_script.export_chat_and_decisions(output, scan_count=5, mget_chunk=5)
+    checkpoint = json.loads(output.with_name(output.name + ".checkpoint").read_text())
+    assert checkpoint["offset"] == output.stat().st_size and checkpoint["sections"]["chats"]["exported"] > 0
+
+    # A crash mid-write leaves the start of a gzip member behind
+    with output.open("ab") as handle:
+        handle.write(gzip.compress(b'{"type": "chat", "key": "partial"}\n')[:12])
+
+    monkeypatch.setattr(export_script, "RedisClient", lambda: _FakeRedisClient(server))
+    stats = await export_script.export_chat_and_decisions(output, resume=True, scan_count=5, mget_chunk=5)
+
+    records = _records(output)
+    chat_keys = [record["key"] for record in records if record["type"] == "chat"]
+    assert records[0]["type"] == "meta" and records[-1]["type"] == "stats"
+    assert sorted(chat_keys) == sorted(f"chat:history:user{i}" for i in range(25))
+    assert stats["chat_users"] == 25 and stats["decisions"] == 1
+    assert not output.with_name(output.name + ".checkpoint").exists()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+from core.pipelines.workers import FeedCacheStore
+
+
+def _entry(key: str, n: int = 0) -> dict:
+    return {"id": key, "last_seen": f"2026-01-01T00:00:{n:02d}", "exhausted": False}
+
+
+def test_feed_store_appends_only_changes_and_replays(tmp_path):
+    path = tmp_path / "feed.json"
+    store = FeedCacheStore(path, compact_min_records=100)
+    cache = {"a": _entry("a"), "b": _entry("b")}
+    store.save(cache, dict(cache), set())
+    cache["a"] = _entry("a", 5)
+    del cache["b"]
+    store.save(cache, {"a": cache["a"]}, {"b"})
+    store.flush()
+
+    assert not path.exists()
+    assert len(store.log_path.read_bytes().splitlines()) == 4
+    reloaded = FeedCacheStore(path).load()
+    assert reloaded == {"a": _entry("a", 5)}
+
+
+def test_feed_store_compacts_atomically_and_ignores_torn_tail(tmp_path):
+    path = tmp_path / "feed.json"
+    store = FeedCacheStore(path, compact_min_records=3, compact_ratio=1.0)
+    cache = {"m0": _entry("m0"), "m1": _entry("m1")}
+    store.save(cache, dict(cache), set())
+    for i in range(1, 4):
+        cache["m0"] = _entry("m0", i)
+        store.save(cache, {"m0": cache["m0"]}, set())
+    store.flush()
+
+    # 4 log records > max(3, 2 live entries) -> snapshot rewritten, log reset
+    snapshot = json.loads(path.read_text())
+    assert snapshot["count"] == 2 and snapshot["last_seq"] == 4
+    assert snapshot["markets"]["m0"]["last_seen"].endswith("02")
+    assert len(store.log_path.read_bytes().splitlines()) == 1
+
+    # Simulate a crash mid-append
+    with store.log_path.open("ab") as handle:
+        handle.write(b'{"seq": 6, "op": "put", "id": "m9", "ent')
+    restored = FeedCacheStore(path)
+    loaded = restored.load()
+    assert sorted(loaded) == ["m0", "m1"]
+    assert loaded["m0"]["last_seen"].endswith("03")
+    restored.save({"m5": _entry("m5")}, {"m5": _entry("m5")}, set())
+    restored.flush()
+    assert "m5" in FeedCacheStore(path).read()["markets"]
+
+
+def test_feed_store_reads_legacy_json_snapshot(tmp_path):
+    path = tmp_path / "feed.json"
+    path.write_text(json.dumps({"updated_at": "x", "count": 1, "markets": {"a": _entry("a")}}, indent=2))
+    assert FeedCacheStore(path).load() == {"a": _entry("a")}
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from api.routers.polymarket import decisions as decisions_router
+from api.services.polymarket.decision_service import DecisionService, asset_symbols
+
+
+def test_decisions_persist_and_page_newest_first(tmp_path):
+    db_path = str(tmp_path / "decisions.db")
+    service = DecisionService(db_path=db_path)
+    ids = [service.record_decision({"n": i, "market_id": "m1" if i % 2 else "m2"})["decision_id"] for i in range(5)]
+    service.close()
+
+    reopened = DecisionService(db_path=db_path)
+    first, cursor = reopened.page_decisions(limit=2)
+    second, cursor2 = reopened.page_decisions(limit=2, before=cursor)
+    third, cursor3 = reopened.page_decisions(limit=2, before=cursor2)
+
+    assert [d["n"] for d in first + second + third] == [4, 3, 2, 1, 0]
+    assert cursor3 is None
+    assert reopened.get_decision(ids[2])["n"] == 2
+    assert [d["n"] for d in reopened.page_decisions(limit=10, market_id="m1")[0]] == [3, 1]
+
+
+def test_asset_index_matches_asset_and_market_name_words(tmp_path):
+    service = DecisionService(db_path=str(tmp_path / "decisions.db"))
+    service.record_decision({"market_name": "Will ETH close above $4k?", "bet_id": "b1"})
+    service.record_decision({"asset": "btc", "market_name": "Crypto majors"})
+    service.record_decision({"market_name": "ETHENA listing"})
+
+    assert asset_symbols({"asset": "sol", "market_name": "SOL/USD > 200"}) == ["200", "SOL", "USD"]
+    assert service.latest_for_asset("eth")["bet_id"] == "b1"
+    assert service.latest_for_asset("BTC")["asset"] == "btc"
+    assert service.latest_for_asset("DOGE") is None
+    assert service.find_bet("b1")["market_name"].startswith("Will ETH")
+
+
+def test_oldest_decisions_are_evicted_past_capacity():
+    service = DecisionService(db_path=":memory:", max_records=3, max_proposals=2)
+    for i in range(5):
+        service.record_decision({"n": i, "asset": "ETH"})
+        service.create_proposal({"n": i})
+
+    assert service.count() == 3
+    assert [d["n"] for d in service.list_decisions(limit=10)] == [4, 3, 2]
+    assert [p["n"] for p in service.list_proposals()] == [3, 4]
+
+
+def test_since_filter_normalizes_offsets_and_bad_cursors_are_rejected(tmp_path, monkeypatch):
+    service = DecisionService(db_path=str(tmp_path / "decisions.db"))
+    service.record_decision({"n": 0, "timestamp": "2025-01-01T09:00:00Z"})
+    service.record_decision({"n": 1, "timestamp": "2025-01-01T12:30:00+02:00"})
+    service.record_decision({"n": 2, "timestamp": "2025-01-01T11:00:00.5+00:00"})
+
+    assert [d["n"] for d in service.page_decisions(since="2025-01-01T10:00:00Z")[0]] == [2, 1]
+    assert [d["n"] for d in service.page_decisions(since="2025-01-01T10:00:00+01:00")[0]] == [2, 1, 0]
+    with pytest.raises(ValueError):
+        service.page_decisions(before="abc")
+
+    monkeypatch.setattr(decisions_router, "decision_service", service)
+    for bad in ({"before": "abc"}, {"since": "yesterday"}):
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(decisions_router.list_decisions(**{"limit": 10, "before": None, "asset": None, "since": None, **bad}))
+        assert excinfo.value.status_code == 400
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from core.pipelines.polymarket.market_batch import select_top_markets
+
+
+def _market(market_id: str, *, volume=500, liquidity=50, spread=2.0, hours=5.0, **extra):
+    now = datetime.now(timezone.utc)
+    return {
+        "id": market_id,
+        "volume_24h": volume,
+        "liquidity_score": liquidity,
+        "bid_ask_spread": spread,
+        "close_time": (now + timedelta(hours=hours)).isoformat(),
+        **extra,
+    }
+
+
+def test_select_top_markets_applies_masks_and_drops_malformed_rows():
+    markets = [
+        _market("ok"),
+        _market("low_volume", volume=50),
+        _market("low_liquidity", liquidity=20),
+        _market("wide_spread", spread=10.0),
+        _market("closing_soon", hours=0.5),
+        _market("too_far", hours=500),
+        _market("no_close", close_time=None),
+        _market("bad_volume", volume="n/a"),
+        _market("naive_close", close_time="2099-01-01T00:00:00"),
+    ]
+    selected = select_top_markets(markets)
+    assert [m["id"] for m in selected] == ["ok"]
+    assert selected[0]["filter_score"] == 500 / 1000 + 50 / 10 - 2.0 / 2
+
+
+def test_select_top_markets_returns_top_k_sorted_with_stable_ties():
+    markets = [_market(f"m{i}", volume=100 + (i % 7) * 100) for i in range(100)]
+    selected = select_top_markets(markets, limit=5)
+    assert [m["volume_24h"] for m in selected] == [700] * 5
+    # Equal scores keep input order
+    assert [m["id"] for m in selected] == ["m6", "m13", "m20", "m27", "m34"]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.clients.polymarket_catalog import PolymarketMarketCatalog
+from core.pipelines.polymarket.market_batch import select_top_markets
+
+
+def _market(market_id: str, question: str, *, liquidity: float, volume: float, days: float = 5, updated: str = "2026-01-01T00:00:00Z", **extra):
+    end = datetime.now(timezone.utc) + timedelta(days=days)
+    return {
+        "id": market_id,
+        "slug": question.lower().replace(" ", "-"),
+        "question": question,
+        "active": True,
+        "closed": False,
+        "liquidityNum": liquidity,
+        "volumeNum": volume * 10,
+        "volume24hr": volume,
+        "endDate": end.isoformat(),
+        "updatedAt": updated,
+        **extra,
+    }
+
+
+class _FakeGammaClient:
+    def __init__(self, markets: list[dict]):
+        self.markets = markets
+        self.calls: list[int] = []
+        self.include_closed: list[bool] = []
+
+    async def fetch_markets_page(self, limit: int = 100, offset: int = 0, include_closed: bool = False, **_kwargs):
+        self.calls.append(offset)
+        self.include_closed.append(include_closed)
+        listed = [m for m in self.markets if include_closed or not m.get("closed")]
+        ordered = sorted(listed, key=lambda m: m["updatedAt"], reverse=True)
+        return ordered[offset : offset + limit]
+
+
+@pytest.mark.asyncio
+async def test_catalog_keyword_and_range_search():
+    client = _FakeGammaClient(
+        [
+            _market("1", "Will Bitcoin hit 100k in March", liquidity=50_000, volume=9_000),
+            _market("2", "Will Bitcoin ETF inflows exceed 1B", liquidity=5_000, volume=20_000),
+            _market("3", "Will Ethereum flip Bitcoin", liquidity=80_000, volume=1_000, days=40),
+            _market("4", "Fed rate cut in June", liquidity=90_000, volume=50_000),
+        ]
+    )
+    catalog = PolymarketMarketCatalog(page_size=2, max_pages=10)
+    result = await catalog.refresh(client, full=True)
+    assert sorted(result["added"]) == ["1", "2", "3", "4"]
+
+    assert [m["id"] for m in catalog.search("bitcoin", limit=10)] == ["2", "1", "3"]
+    assert [m["id"] for m in catalog.search("bitcoin ethereum")] == ["3"]
+    assert [m["id"] for m in catalog.search("bitcoin", min_liquidity=10_000)] == ["1", "3"]
+    soon = datetime.now(timezone.utc) + timedelta(days=10)
+    assert [m["id"] for m in catalog.search("bitcoin", min_liquidity=10_000, end_before=soon)] == ["1"]
+    assert [m["id"] for m in catalog.search(limit=2, sort_by="volume")] == ["4", "2"]
+    assert catalog.search("nonexistent") == []
+
+
+@pytest.mark.asyncio
+async def test_catalog_incremental_refresh_applies_deltas():
+    markets = [
+        _market(str(i), f"Market number {i}", liquidity=1_000, volume=100 + i, updated=f"2026-01-01T00:00:{i:02d}Z")
+        for i in range(6)
+    ]
+    client = _FakeGammaClient(markets)
+    catalog = PolymarketMarketCatalog(page_size=2, max_pages=10)
+    await catalog.refresh(client, full=True)
+    assert len(catalog) == 6
+
+    markets[0] = _market("0", "Market number zero renamed", liquidity=1_000, volume=500, updated="2026-01-02T00:00:00Z")
+    markets[1] = {**markets[1], "closed": True, "updatedAt": "2026-01-02T00:00:01Z"}
+    markets.append(_market("new", "Brand new market", liquidity=2_000, volume=10, updated="2026-01-02T00:00:02Z"))
+    client.calls.clear()
+    client.include_closed.clear()
+
+    delta = await catalog.refresh(client)
+    assert delta["added"] == ["new"]
+    assert delta["updated"] == ["0"]
+    assert delta["removed"] == ["1"]
+    # Incremental refresh stops at the first page that reaches the watermark
+    assert client.calls == [0, 2]
+    assert client.include_closed == [True, True]
+    assert [m["id"] for m in catalog.search("renamed")] == ["0"]
+    assert catalog.get("1") is None
+
+
+@pytest.mark.asyncio
+async def test_catalog_runs_periodic_full_resync():
+    markets = [_market(str(i), f"Market number {i}", liquidity=1_000, volume=100) for i in range(3)]
+    client = _FakeGammaClient(markets)
+    catalog = PolymarketMarketCatalog(page_size=10, max_pages=5, full_refresh_seconds=3600)
+    await catalog.refresh(client)
+    # Delisted without an updatedAt bump, so only a full resync can notice
+    del markets[2]
+
+    assert (await catalog.refresh(client))["removed"] == []
+    catalog._last_full_refresh_at -= 7200
+    resync = await catalog.refresh(client)
+    assert resync["full"] is True and resync["removed"] == ["2"]
+    assert client.include_closed[-1] is False
+
+
+@pytest.mark.asyncio
+async def test_catalog_records_pass_the_opportunity_filter():
+    client = _FakeGammaClient(
+        [
+            _market("deep", "Deep market", liquidity=50_000, volume=9_000, days=3, spread=0.01),
+            _market("thin", "Thin market", liquidity=20, volume=9_000, days=3, spread=0.01),
+            _market("wide", "Wide market", liquidity=50_000, volume=9_000, days=3, spread=0.2),
+            _market("late", "Late market", liquidity=50_000, volume=9_000, days=30),
+        ]
+    )
+    catalog = PolymarketMarketCatalog(page_size=10, max_pages=5)
+    await catalog.refresh(client, full=True)
+
+    assert [m["id"] for m in select_top_markets(catalog.search(limit=10, sort_by="volume"))] == ["deep"]
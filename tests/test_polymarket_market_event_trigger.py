@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+import core.pipelines.polymarket_manager as manager_module
+from core.clients.polymarket_catalog import PolymarketMarketCatalog
+from core.clients.polymarket_client import PolymarketClient
+from core.pipelines.polymarket_manager import PolymarketManager, RSSFluxConfig
+
+
+class _FakeGammaClient(PolymarketClient):
+    def __init__(self, markets: list[dict]):
+        self.markets = markets
+        self.calls = 0
+
+    async def fetch_markets_page(self, limit: int = 100, offset: int = 0, **_kwargs):
+        self.calls += 1
+        ordered = sorted(self.markets, key=lambda m: m["updatedAt"], reverse=True)
+        return ordered[offset : offset + limit]
+
+
+def _market(market_id: str, updated: str, liquidity: float = 1000) -> dict:
+    return {
+        "id": market_id,
+        "question": f"Market {market_id}",
+        "active": True,
+        "closed": False,
+        "volume24hr": 1000,
+        "liquidityNum": liquidity,
+        "endDate": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat(),
+        "updatedAt": updated,
+    }
+
+
+@pytest.mark.asyncio
+async def test_market_event_trigger_fires_batch_once_threshold_reached(monkeypatch, tmp_path):
+    monkeypatch.setattr(manager_module, "market_catalog", PolymarketMarketCatalog(page_size=10, max_pages=5))
+    client = _FakeGammaClient([_market("a", "2026-01-01T00:00:00Z"), _market("b", "2026-01-01T00:00:01Z")])
+    manager = PolymarketManager(
+        workforce=MagicMock(),
+        api_client=client,
+        config=RSSFluxConfig(review_threshold=3, trigger_type="market", cache_path=str(tmp_path / "feed.json")),
+    )
+    batches: list[list[str]] = []
+
+    async def _run_batch(markets, trigger_type, enforce_limits):
+        batches.append(sorted(m["id"] for m in markets))
+        return {"status": "completed"}
+
+    manager._run_batch_task = _run_batch
+
+    first = await manager.process_market_deltas()
+    assert first["pending_review"] == 2 and not batches
+
+    idle = await manager.process_market_deltas()
+    assert idle["status"] == "idle" and not batches
+
+    client.markets.append(_market("c", "2026-01-01T00:00:02Z"))
+    fired = await manager.process_market_deltas()
+    assert fired["opportunities_filtered"] == 3
+    assert batches == [["a", "b", "c"]]
+    assert manager._market_event_runtime.stats()["batches_fired"] == 1
+    assert manager._feed_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_market_event_trigger_clears_batches_that_fail_the_filter(monkeypatch, tmp_path):
+    monkeypatch.setattr(manager_module, "market_catalog", PolymarketMarketCatalog(page_size=10, max_pages=5))
+    client = _FakeGammaClient([_market(mid, f"2026-01-01T00:00:0{i}Z", liquidity=5) for i, mid in enumerate("ab")])
+    manager = PolymarketManager(
+        workforce=MagicMock(),
+        api_client=client,
+        config=RSSFluxConfig(review_threshold=2, trigger_type="market", cache_path=str(tmp_path / "feed.json")),
+    )
+    batches: list[list[dict]] = []
+
+    async def _run_batch(markets, trigger_type, enforce_limits):
+        batches.append(markets)
+        return {"status": "completed"}
+
+    manager._run_batch_task = _run_batch
+
+    rejected = await manager.process_market_deltas()
+    assert rejected["opportunities_filtered"] == 0 and not batches
+    assert manager._feed_cache == {}
+
+    idle = await manager.process_market_deltas()
+    assert idle["status"] == "idle" and idle["pending_review"] == 0
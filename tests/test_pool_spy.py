@@ -1,38 +1,50 @@
 from __future__ import annotations
 
+import fakeredis
+
 from core.clients.uviswap.pool_spy import PoolSpy
 from core.models.uviswap import PoolModel
 
 
-class _FakeRedis:
-    def __init__(self):
-        self.data = {}
+def _pool(pool_id: str, symbol0: str, symbol1: str, tvl: float, block: int = 123) -> PoolModel:
+    return PoolModel.model_validate(
+        {
+            "id": pool_id,
+            "createdAtTimestamp": 1700000000,
+            "createdAtBlockNumber": block,
+            "txCount": 5,
+            "volumeUSD": 1000.0,
+            "totalValueLockedUSD": tvl,
+            "token0": {"id": f"0x{symbol0.lower()}", "symbol": symbol0},
+            "token1": {"id": f"0x{symbol1.lower()}", "symbol": symbol1},
+        }
+    )
+
+
+class _Subgraph:
+    """Answers PoolSpy queries from a mutable pool list and records which ones ran."""
 
-    def set(self, key, value):
-        self.data[key] = value
+    def __init__(self, pools: list[PoolModel]):
+        self.pools = pools
+        self.queries: list[str] = []
 
-    def get(self, key):
-        return self.data.get(key)
+    def __call__(self, query, variables):
+        name = query.split("query ", 1)[1].split("(", 1)[0]
+        self.queries.append(name)
+        if name == "PoolsById":
+            return [pool for pool in self.pools if pool.id in variables["ids"]]
+        symbols = set(variables["symbols"])
+        pools = [pool for pool in self.pools if {pool.token0.symbol, pool.token1.symbol} <= symbols]
+        if name == "NewPools":
+            return [pool for pool in pools if pool.createdAtBlockNumber > int(variables["since"])]
+        return pools[: variables["first"]]
 
 
 def test_pool_spy_persists_and_resolves_from_redis():
-    fake_redis = _FakeRedis()
+    fake_redis = fakeredis.FakeRedis(decode_responses=True)
     pool_spy = PoolSpy(w3=object(), subgraph_url="http://unused", redis_client=fake_redis)
 
-    pools = [
-        PoolModel.model_validate(
-            {
-                "id": "0xpool",
-                "createdAtTimestamp": 1700000000,
-                "createdAtBlockNumber": 123,
-                "txCount": 5,
-                "volumeUSD": 1000.0,
-                "totalValueLockedUSD": 2000.0,
-                "token0": {"id": "0xaaa", "symbol": "ETH"},
-                "token1": {"id": "0xbbb", "symbol": "USDC"},
-            }
-        )
-    ]
+    pools = [_pool("0xpool", "ETH", "USDC", 2000.0)]
 
     pool_spy.build_pool_index(pools)
 
@@ -42,4 +54,41 @@ def test_pool_spy_persists_and_resolves_from_redis():
 
     assert resolved is not None
     assert resolved.pool_address == "0xpool"
-    assert any(k.startswith("uviswap:pools:pair:") for k in fake_redis.data)
+    assert fake_redis.keys("uviswap:pools:pair:*")
+    assert 0 < fake_redis.ttl("uviswap:pools:pair:ETH/USDC") <= pool_spy.index_ttl_seconds
+
+
+def test_discovery_is_incremental_and_refresh_applies_deltas():
+    subgraph = _Subgraph([_pool("0xa", "WETH", "USDC", 100.0, block=10), _pool("0xb", "WETH", "USDC", 50.0, block=11)])
+    spy = PoolSpy(w3=object(), subgraph_url="http://unused", refresh_seconds=3600)
+    spy._query_pools = subgraph
+
+    first = spy.discover_and_index_pools(["WETH", "USDC"])
+    again = spy.discover_and_index_pools(["usdc", "weth"])
+    assert subgraph.queries == ["PoolsBySymbols"]
+    assert first["pool_count"] == again["pool_count"] == 2
+    assert spy.resolve_best_pool("USDC", "WETH").pool_address == "0xa"
+
+    # A new pool appears and the second pool overtakes the first on TVL
+    subgraph.pools[1] = _pool("0xb", "WETH", "USDC", 500.0, block=11)
+    subgraph.pools.append(_pool("0xc", "USDC", "WETH", 80.0, block=12))
+    result = spy.refresh()
+    spy.stop_refresher()
+
+    assert subgraph.queries[1:] == ["NewPools", "PoolsById"]
+    assert result["new_pools"] == 1 and result["watermark"] == 12
+    assert [pool.pool_address for pool in spy.pair_pools("WETH", "USDC")] == ["0xb", "0xa", "0xc"]
+
+
+def test_missing_pairs_are_negatively_cached_across_instances():
+    fake_redis = fakeredis.FakeRedis(decode_responses=True)
+    spy = PoolSpy(w3=object(), redis_client=fake_redis, missing_ttl_seconds=60)
+
+    assert not spy.is_known_missing("DOGE", "USDC")
+    spy.mark_missing("DOGE", "USDC")
+    assert spy.is_known_missing("USDC", "DOGE")
+    assert PoolSpy(w3=object(), redis_client=fake_redis).is_known_missing("DOGE", "USDC")
+
+    spy.build_pool_index([_pool("0xd", "DOGE", "USDC", 10.0)])
+    assert not spy.is_known_missing("DOGE", "USDC")
+    assert not fake_redis.exists("uviswap:pools:missing:DOGE/USDC")
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from core.clients.redis_client import RedisClient, queue_capped_push
+
+
+def _redis() -> RedisClient:
+    client = RedisClient()
+    client.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_pipeline_executes_queued_commands_on_exit_and_discards_on_error():
+    client = _redis()
+    async with client.pipeline() as pipe:
+        pipe.set("a", "1")
+        pipe.incr("counter")
+        results = await pipe.execute()
+        pipe.set("b", "2")
+    assert results == [True, 1]
+    assert await client.redis.get("b") == "2"
+
+    with pytest.raises(RuntimeError):
+        async with client.transaction() as pipe:
+            pipe.set("c", "3")
+            raise RuntimeError("abort")
+    assert await client.redis.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_mget_and_mset_json_round_trip():
+    client = _redis()
+    await client.mset_json({"k1": {"v": 1}, "k2": [1, 2]})
+    await client.mset_json({"k3": {"v": 3}}, expire=60)
+    await client.redis.set("bad", "{not json")
+
+    assert await client.mget_json(["k1", "missing", "k2", "bad", "k3"]) == [{"v": 1}, None, [1, 2], None, {"v": 3}]
+    assert 0 < await client.redis.ttl("k3") <= 60
+    assert await client.mget_json([]) == []
+
+
+@pytest.mark.asyncio
+async def test_push_capped_keeps_newest_entries_on_either_end():
+    client = _redis()
+    for i in range(5):
+        await client.push_capped("head", str(i), max_length=3, expire=30)
+    await client.push_capped("tail", *[str(i) for i in range(5)], max_length=3, left=False)
+
+    assert await client.redis.lrange("head", 0, -1) == ["4", "3", "2"]
+    assert 0 < await client.redis.ttl("head") <= 30
+    assert await client.redis.lrange("tail", 0, -1) == ["2", "3", "4"]
+
+
+def test_queue_capped_push_on_sync_pipeline():
+    server = fakeredis.FakeRedis(decode_responses=True)
+    pipe = server.pipeline(transaction=True)
+    queue_capped_push(pipe, "events", ["a", "b", "c"], 2, expire=10)
+    pipe.execute()
+    assert server.lrange("events", 0, -1) == ["c", "b"]
+    assert 0 < server.ttl("events") <= 10
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import math
+from datetime import datetime, timezone
+
+import fakeredis.aioredis
+import pytest
+
+from core.clients.redis_client import RedisClient
+from core.clients.redis_codec import available_codecs, get_codec, is_envelope, pack, unpack
+
+
+def _redis(codec: str = "json", codec_mode: str = "legacy") -> RedisClient:
+    client = RedisClient(codec=codec, codec_mode=codec_mode)
+    client.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return client
+
+
+@pytest.mark.parametrize("name", available_codecs())
+def test_codecs_round_trip_through_envelope(name):
+    record = {"cycle_id": "c1", "tickers": {"BTC": {"t1_roi": 0.12}}, "ts": datetime(2025, 1, 1, tzinfo=timezone.utc)}
+    raw = pack(record, get_codec(name))
+    assert is_envelope(raw)
+    assert unpack(raw) == {**record, "ts": "2025-01-01T00:00:00+00:00"}
+
+
+def test_unpack_reads_legacy_json_and_rejects_unknown_envelopes():
+    assert unpack('{"a": 1}') == {"a": 1}
+    assert math.isnan(unpack(b'{"a": NaN}')["a"])
+    with pytest.raises(ValueError):
+        unpack(b"\xc1RC\x09\x01{}")
+    with pytest.raises(ValueError):
+        unpack("{not json")
+
+
+@pytest.mark.asyncio
+async def test_codec_mode_writes_envelopes_and_still_reads_legacy_values():
+    client = _redis(codec=available_codecs()[-1], codec_mode="codec")
+    await client.redis.set("legacy", json.dumps({"v": 1}))
+    await client.set_json("new", {"v": 2}, expire=60)
+
+    raw = await (await client._raw_client()).get("new")
+    assert is_envelope(raw)
+    assert await client.get_json("legacy") == {"v": 1}
+    assert await client.get_json("new") == {"v": 2}
+    assert client.codec_stats["legacy_reads"] == 1
+    assert client.codec_stats["envelope_reads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_legacy_mode_keeps_plain_json_on_the_wire():
+    client = _redis(codec="orjson" if "orjson" in available_codecs() else "json")
+    await client.set_json("k", {"v": 1})
+    assert json.loads(await client.redis.get("k")) == {"v": 1}
+    assert await client.get_json("k") == {"v": 1}
+    assert await client.mget_json(["k", "missing"]) == [{"v": 1}, None]
+    # No second, bytes-mode connection pool is opened for plain JSON
+    assert client._raw is None
+
+
+@pytest.mark.asyncio
+async def test_migrate_mode_rewrites_legacy_records_and_preserves_ttl():
+    client = _redis(codec="json", codec_mode="migrate")
+    await client.redis.set("roi:1", json.dumps({"v": 1}), ex=300)
+    await client.redis.set("counter", "7")
+
+    assert await client.mget_json(["roi:1", "counter"]) == [{"v": 1}, 7]
+
+    raw = await (await client._raw_client()).get("roi:1")
+    assert is_envelope(raw)
+    assert 0 < await client.redis.ttl("roi:1") <= 300
+    # Scalars are left alone so INCR-style keys keep working
+    assert await client.redis.get("counter") == "7"
+    assert client.codec_stats["migrated"] == 1
+    assert await client.get_json("roi:1") == {"v": 1}
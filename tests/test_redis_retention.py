@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import fakeredis.aioredis
+import pytest
+
+from core.clients.redis_client import RedisClient
+from core.pipelines.redis_retention import RedisRetentionEngine, RetentionPolicy
+
+
+def _redis() -> RedisClient:
+    client = RedisClient()
+    client.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return client
+
+
+def _entry(age_days: float) -> str:
+    ts = datetime.now(timezone.utc) - timedelta(days=age_days)
+    return json.dumps({"timestamp": ts.isoformat()})
+
+
+@pytest.mark.asyncio
+async def test_retention_caps_length_and_age_by_list_orientation():
+    client = _redis()
+    # RPUSH writer: oldest at the head
+    logs = [_entry(40 - i) for i in range(20)] + [_entry(1) for _ in range(30)]
+    await client.redis.rpush("logs:a", *logs)
+    # LPUSH writer: oldest at the tail
+    await client.redis.lpush("history", *[_entry(50) for _ in range(5)], *[_entry(1) for _ in range(10)])
+    await client.redis.rpush("logs:b", *[json.dumps({"timestamp": _entry(1)}) for _ in range(3)])
+    engine = RedisRetentionEngine(
+        client,
+        policies=[
+            RetentionPolicy("logs:*", max_length=25, max_age_seconds=30 * 86400, newest="tail"),
+            RetentionPolicy("history", max_age_seconds=30 * 86400),
+        ],
+        max_keys_per_second=0,
+        age_page_size=4,
+    )
+
+    report = await engine.run_once()
+
+    assert await client.redis.lrange("logs:a", 0, -1) == logs[-25:]
+    assert await client.redis.llen("history") == 10
+    assert await client.redis.llen("logs:b") == 3
+    assert report["entries_expired"] == 11 + 5
+    assert report["entries_removed"] == 25 + 5
+    assert report["keys_trimmed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retention_trims_zsets_and_sets_missing_ttls():
+    client = _redis()
+    now = datetime.now(timezone.utc).timestamp()
+    await client.redis.zadd("index:due", {"old": now - 7200, "new": now, "newer": now + 10})
+    await client.redis.set("cache:a", "1")
+    await client.redis.set("cache:b", "1", ex=50)
+    engine = RedisRetentionEngine(
+        client,
+        policies=[
+            RetentionPolicy("index:due", max_age_seconds=3600, max_length=1),
+            RetentionPolicy("cache:*", ttl_seconds=600),
+        ],
+        max_keys_per_second=0,
+        memory_sample_rate=1.0,
+    )
+
+    report = await engine.run_once()
+
+    assert await client.redis.zrange("index:due", 0, -1) == ["newer"]
+    assert 0 < await client.redis.ttl("cache:a") <= 600
+    assert await client.redis.ttl("cache:b") <= 50
+    assert report["ttls_set"] == 1
+    # fakeredis lacks MEMORY USAGE; sampling disables itself instead of failing
+    assert report["memory_usage_supported"] is False
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import fakeredis.aioredis
+import pytest
+
+from core.camel_tools.roi_analyzer_toolkit import ROI_SETTLEMENT_INDEX_KEY, schedule_roi_settlement
+from core.clients.redis_client import RedisClient
+from core.pipelines.roi_settlement import ROISettlementWorker
+
+
+class _FakeForecastingClient:
+    def __init__(self, prices: dict[str, float]):
+        self.prices = prices
+        self.calls: list[str] = []
+
+    async def get_action_recommendation(self, ticker: str, interval: str):
+        self.calls.append(ticker)
+        return {"current_price": self.prices.get(ticker)}
+
+    async def get_stock_forecast(self, ticker: str, interval: str):
+        return {}
+
+
+def _redis() -> RedisClient:
+    client = RedisClient()
+    client.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return client
+
+
+async def _register(client: RedisClient, cycle_id: str, registered_at: datetime, tickers: dict[str, float]):
+    key = f"roi:history:wallet_balancing:{cycle_id}"
+    record = {
+        "cycle_id": cycle_id,
+        "timestamp": registered_at.isoformat(),
+        "strategy": "wallet_balancing",
+        "tickers": {
+            ticker: {"allocation_pct": 50.0, "buy_price": price, "t1_price": None, "t1_roi": None}
+            for ticker, price in tickers.items()
+        },
+        "strategy_roi": 0.0,
+        "t1_updated": False,
+    }
+    await client.set_json(key, record)
+    await schedule_roi_settlement(client, key, record["timestamp"])
+    return key
+
+
+@pytest.mark.asyncio
+async def test_settlement_worker_settles_due_cycles_with_one_fetch_per_ticker():
+    client = _redis()
+    now = datetime.now(timezone.utc)
+    due_a = await _register(client, "a", now - timedelta(hours=26), {"BTC-USD": 100.0, "ETH-USD": 10.0})
+    due_b = await _register(client, "b", now - timedelta(hours=25), {"BTC-USD": 200.0})
+    pending = await _register(client, "c", now - timedelta(hours=2), {"SOL-USD": 5.0})
+
+    forecasting = _FakeForecastingClient({"BTC-USD": 110.0, "ETH-USD": 12.0, "SOL-USD": 6.0})
+    worker = ROISettlementWorker(redis_client=client, forecasting_client=forecasting)
+    summary = await worker.run_once()
+
+    assert summary["settled"] == 2
+    assert sorted(forecasting.calls) == ["BTC-USD", "ETH-USD"]
+
+    record_a = await client.get_json(due_a)
+    assert record_a["t1_updated"] is True
+    assert record_a["tickers"]["BTC-USD"]["t1_roi"] == pytest.approx(10.0)
+    assert record_a["strategy_roi"] == pytest.approx(15.0)
+    record_b = await client.get_json(due_b)
+    assert record_b["tickers"]["BTC-USD"]["t1_roi"] == pytest.approx(-45.0)
+
+    remaining = await client.redis.zrange(ROI_SETTLEMENT_INDEX_KEY, 0, -1)
+    assert remaining == [pending]
+
+    metrics = worker.get_metrics()
+    assert metrics["settled_total"] == 2
+    assert metrics["pending_due"] == 0
+    assert metrics["pending_total"] == 1
+    assert metrics["max_lag_seconds"] >= 2 * 3600
+
+
+@pytest.mark.asyncio
+async def test_settlement_worker_defers_then_expires_unpriced_cycles():
+    client = _redis()
+    now = datetime.now(timezone.utc)
+    recent = await _register(client, "recent", now - timedelta(hours=25), {"DOGE-USD": 1.0})
+    stale = await _register(client, "stale", now - timedelta(hours=80), {"DOGE-USD": 1.0})
+    await client.redis.zadd(ROI_SETTLEMENT_INDEX_KEY, {"roi:history:wallet_balancing:gone": 1.0})
+
+    worker = ROISettlementWorker(
+        redis_client=client,
+        forecasting_client=_FakeForecastingClient({}),
+        max_delay_hours=48,
+    )
+    summary = await worker.run_once()
+
+    assert summary == {"due": 3, "settled": 0, "deferred": 1, "expired": 1, "missing": 1}
+    assert await client.redis.zrange(ROI_SETTLEMENT_INDEX_KEY, 0, -1) == [recent]
+    stale_record = json.loads(await client.redis.get(stale))
+    assert stale_record["t1_settlement_status"] == "expired"
+    assert stale_record["t1_updated"] is False
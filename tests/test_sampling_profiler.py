@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from core.pipelines.dex.execution_tracker import ExecutionTracker
+from core.pipelines.dex.types import ReviewMode
+from core.telemetry.profiler import AWAIT_FRAME, SamplingProfiler
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def _fetch_quotes() -> None:
+    await asyncio.sleep(0.08)
+
+
+async def _cycle() -> None:
+    _busy(0.08)
+    await asyncio.gather(_fetch_quotes(), _fetch_quotes())
+
+
+async def _unrelated() -> None:
+    await asyncio.sleep(0.2)
+
+
+@pytest.mark.asyncio
+async def test_profile_attributes_cpu_and_await_time_to_owned_tasks():
+    profiler = SamplingProfiler(interval=0.002)
+    other = asyncio.create_task(_unrelated())
+
+    async def _run():
+        profiler.start("cycle-1")
+        try:
+            await _cycle()
+        finally:
+            result = profiler.stop("cycle-1")
+        return result
+
+    result = await _run()
+    other.cancel()
+
+    assert result["samples"] > 10
+    assert "_busy" in result["collapsed"]
+    assert "_fetch_quotes (test_sampling_profiler.py" in result["collapsed"]
+    assert AWAIT_FRAME in result["collapsed"]
+    assert "_unrelated" not in result["collapsed"]
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in result["collapsed"].splitlines())
+    assert profiler.recent()[0]["key"] == "cycle-1"
+    assert asyncio.get_running_loop().get_task_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_execution_tracker_profiles_on_request_and_while_running():
+    tracker = ExecutionTracker(lambda payload, _max_len: str(payload), profiler=SamplingProfiler(interval=0.002))
+
+    async def _run(_execution_id: str):
+        await _cycle()
+        return {"success": True}
+
+    profiled = tracker.launch(mode=ReviewMode.FAST_DECISION, reason="test", run_fn=_run, profile=True)
+    late = tracker.launch(mode=ReviewMode.FAST_DECISION, reason="test", run_fn=_run)
+    plain = tracker.launch(mode=ReviewMode.FAST_DECISION, reason="test", run_fn=_run)
+    await asyncio.sleep(0.01)
+    assert tracker.enable_profiling(late) is True
+    await asyncio.sleep(0.3)
+
+    assert tracker.get_status(profiled)["profile"]["samples"] > 0
+    assert "_fetch_quotes" in tracker.get_profile(profiled)["collapsed"]
+    assert tracker.get_profile(late) is not None
+    assert tracker.get_profile(plain) is None
+    assert tracker.enable_profiling(plain) is False
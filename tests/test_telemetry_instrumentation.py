@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.middleware.metrics import RequestMetricsMiddleware
+from core.pipelines.tasks import TaskFlowHub, TaskFlowSpec
+from core.telemetry.observability import registry, track_external_call
+from core.telemetry.tracing import tracer
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return registry.get_sample_value(name, labels) or 0.0
+
+
+def test_request_metrics_middleware_labels_by_route_template():
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def _item(item_id: str):
+        return {"id": item_id}
+
+    labels = {"method": "GET", "endpoint": "/items/{item_id}", "status_code": "200"}
+    before = _sample("api_requests_total", labels)
+    client = TestClient(app)
+    assert client.get("/items/a").status_code == 200
+    assert client.get("/items/b").status_code == 200
+    assert client.get("/nope").status_code == 404
+
+    assert _sample("api_requests_total", labels) == before + 2
+    assert _sample("api_requests_total", {"method": "GET", "endpoint": "unmatched", "status_code": "404"}) >= 1
+    assert _sample("api_request_duration_seconds_count", {"method": "GET", "endpoint": "/items/{item_id}"}) >= 2
+
+
+@pytest.mark.asyncio
+async def test_sampled_trace_collects_task_and_outbound_spans(monkeypatch):
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    hub = TaskFlowHub(pipeline="test", system_name="tracing")
+
+    async def _fetch(context):
+        with track_external_call("forecasting", "/api/json/action/{id}"):
+            await asyncio.sleep(0)
+        return {"status": "completed"}
+
+    hub.register_many([TaskFlowSpec(task_id="fetch", pipeline="test", system_name="tracing", executor=_fetch)])
+    with tracer.trace("test.cycle", trigger_id="cycle"):
+        await hub.run(trigger_type="manual", context={}, flags={})
+
+    trace = tracer.recent(limit=1)[0]
+    assert trace["name"] == "test.cycle"
+    names = [span["name"] for span in trace["spans"]]
+    assert names == ["task.fetch", "forecasting:/api/json/action/{id}"]
+    task_span, call_span = trace["spans"]
+    assert call_span["parent_id"] == task_span["span_id"]
+    assert _sample(
+        "trading_forecasting_requests_total",
+        {"endpoint": "/api/json/action/{id}", "status": "ok"},
+    ) >= 1
+
+
+def test_unsampled_trace_records_nothing(monkeypatch):
+    monkeypatch.setattr(tracer, "sample_rate", 0.0)
+    buffered = len(tracer.recent(limit=1000))
+    with tracer.trace("test.cycle") as attrs:
+        with tracer.span("child") as span:
+            assert attrs is None and span is None
+    assert len(tracer.recent(limit=1000)) == buffered
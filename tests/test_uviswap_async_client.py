@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from eth_abi import encode
+from web3 import AsyncHTTPProvider
+
+from core.clients.uviswap.async_client import AsyncUviSwapClient
+from core.clients.uviswap.pool_spy import PoolSpy
+from core.clients.uviswap.swap import SwapRequest
+
+PRIVATE_KEY = "0x" + "11" * 32
+QUOTER = "0x61fFE014bA17989E743c5F6cB21bF9697530B21e"
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+USDC = "0xA0b86991c6218b36c1D19D4a2e9Eb0cE3606eB48"
+
+
+class _Node:
+    """JSON-RPC answers with a fixed latency, tracking how many requests overlap."""
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.methods: list[str] = []
+
+    async def __call__(self, method, request_data):
+        request = json.loads(request_data)
+        self.methods.append(method)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            result = self.result(method, request["params"])
+            return json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}).encode()
+        finally:
+            self.in_flight -= 1
+
+    @staticmethod
+    def result(method, params):
+        if method == "web3_clientVersion":
+            return "fake/1.0"
+        if method == "eth_chainId":
+            return "0x1"
+        if method == "eth_getBlockByNumber":
+            return {"number": "0x10", "timestamp": hex(1_700_000_000), "baseFeePerGas": hex(10 * 10**9)}
+        if method == "eth_getTransactionCount":
+            return "0x7"
+        if method == "eth_maxPriorityFeePerGas":
+            return hex(10**9)
+        if method == "eth_getBalance":
+            return hex(10**18)
+        if method == "eth_call":
+            if params[0]["to"].lower() == QUOTER.lower():
+                return "0x" + encode(["uint256"], [2_000 * 10**6]).hex()
+            return "0x"
+        raise AssertionError(f"unexpected RPC method {method}")
+
+
+@pytest.mark.asyncio
+async def test_async_swap_plan_issues_independent_reads_concurrently(monkeypatch):
+    node = _Node()
+    monkeypatch.setattr(AsyncHTTPProvider, "_make_request", lambda _provider, method, data: node(method, data))
+
+    client = await AsyncUviSwapClient.create(
+        private_key=PRIVATE_KEY,
+        rpc_url="http://rpc.invalid",
+        chain="ethereum",
+        quoter_address=QUOTER,
+        pool_catalog=PoolSpy(w3=object()),
+    )
+    async with client:
+        node.methods.clear()
+        plan = await client.build_swap_plan(
+            SwapRequest(token_in=WETH, token_out=USDC, amount_in=10**18, slippage_bps=50),
+            commands=b"\x00",
+            inputs=[b"\x01"],
+        )
+        assert client.rpc._session is not None and not client.rpc._session.closed
+    assert client.rpc._session is None
+
+    assert plan.expected_out == 2_000 * 10**6
+    assert plan.min_out == 1_990 * 10**6
+    assert plan.nonce == 7 and plan.simulation_ok
+    assert plan.tx["chainId"] == 1 and plan.tx["maxFeePerGas"] == int(10 * 10**9 * 1.15) + int(10**9 * 1.15)
+    # quote, block, nonce, priority fee and balance in one round trip, then the simulation;
+    # the chain id is read once on connect and served from the provider cache afterwards
+    assert node.max_in_flight == 5
+    assert node.methods[-1] == "eth_call" and len(node.methods) == 6
+    assert "eth_chainId" not in node.methods
+
+
+@pytest.mark.asyncio
+async def test_async_client_resolves_pools_from_shared_catalog(monkeypatch):
+    node = _Node(latency=0)
+    monkeypatch.setattr(AsyncHTTPProvider, "_make_request", lambda _provider, method, data: node(method, data))
+    catalog = PoolSpy(w3=object())
+    catalog.mark_missing("DOGE", "USDC")
+
+    client = await AsyncUviSwapClient.create(
+        private_key=PRIVATE_KEY, rpc_url="http://rpc.invalid", chain="ethereum", pool_catalog=catalog
+    )
+    async with client:
+        result = await client.resolve_trade_pool("DOGE", "USDC")
+
+    assert result == {"success": False, "error": "No pool found for DOGE/USDC"}
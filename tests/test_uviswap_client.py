@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from types import SimpleNamespace
 
+import fakeredis
+import httpx
 import pytest
 
 from core.clients.uviswap.client import UviSwapClient
+from core.clients.uviswap.pool_spy import PoolSpy
 
 
 class _DummyRPC:
@@ -106,3 +109,38 @@ def test_client_trade_pool_context_uses_market_context(patched_client_deps, monk
     assert context["success"] is True
     assert context["token_in_context"]["symbol"] == "ETH"
     assert context["token_out_context"]["symbol"] == "USDC"
+
+
+def test_subgraph_outage_does_not_mark_the_pair_missing(patched_client_deps, monkeypatch):
+    status = {"code": 503}
+    pool = {
+        "id": "0xpool",
+        "createdAtTimestamp": 1700000000,
+        "createdAtBlockNumber": 123,
+        "txCount": 5,
+        "volumeUSD": 1000.0,
+        "totalValueLockedUSD": 2000.0,
+        "token0": {"id": "0xeth", "symbol": "ETH"},
+        "token1": {"id": "0xusdc", "symbol": "USDC"},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if status["code"] != 200:
+            return httpx.Response(status["code"], text="unavailable")
+        return httpx.Response(200, json={"data": {"pools": [pool]}})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(httpx, "Client", lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs))
+    private_key = "0x59c6995e998f97a5a004497e5f6f3f0f4f8eb59eac220d8d9f87f84d888fff44"
+    client = UviSwapClient(private_key=private_key, rpc_url="http://dummy")
+    client.pool_spy = PoolSpy(w3=object(), subgraph_url="http://subgraph", redis_client=fakeredis.FakeRedis(decode_responses=True))
+
+    failed = client.resolve_trade_pool("ETH", "USDC")
+    assert failed["success"] is False
+    assert client.discover_trade_pools(["ETH", "USDC"])["error"]
+    assert not client.pool_spy.is_known_missing("ETH", "USDC")
+
+    status["code"] = 200
+    resolved = client.resolve_trade_pool("ETH", "USDC")
+    client.pool_spy.stop_refresher()
+    assert resolved["success"] is True and resolved["pool"]["pool_address"] == "0xpool"
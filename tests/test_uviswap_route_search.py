@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from eth_abi import encode
+
+from core.clients.uviswap.pool_spy import PoolSpy
+from core.clients.uviswap.route_search import RouteFinder, RouteSearchError
+from core.clients.uviswap.v3_math import Q96, PoolState, PoolStateRangeError
+from core.models.uviswap import PoolModel
+
+TOKENS = {
+    "UNI": "0x1f9840a85d5af5bf1d1762f925bdaddc4201f984",
+    "WETH": "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+    "USDC": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+}
+# (symbol_in, symbol_out, fee) -> output per unit of input
+RATES = {
+    ("UNI", "USDC", 3000): 5.0,
+    ("UNI", "USDC", 10000): 4.9,
+    ("UNI", "WETH", 500): 0.0025,
+    ("WETH", "USDC", 500): 2100.0,
+}
+SYMBOL_BY_ADDRESS = {address.lower(): symbol for symbol, address in TOKENS.items()}
+
+
+def _pool(pool_id: str, a: str, b: str, fee: int) -> PoolModel:
+    return PoolModel.model_validate(
+        {
+            "id": pool_id,
+            "createdAtTimestamp": 1700000000,
+            "createdAtBlockNumber": 1,
+            "txCount": 10,
+            "volumeUSD": 1.0,
+            "totalValueLockedUSD": 1.0,
+            "feeTier": str(fee),
+            "token0": {"id": TOKENS[a], "symbol": a},
+            "token1": {"id": TOKENS[b], "symbol": b},
+        }
+    )
+
+
+def _rate(path: list[tuple[str, str, int]], amount: int) -> int | None:
+    for token_in, token_out, fee in path:
+        rate = RATES.get((SYMBOL_BY_ADDRESS[token_in.lower()], SYMBOL_BY_ADDRESS[token_out.lower()], fee))
+        if rate is None:
+            return None
+        amount = int(amount * rate)
+    return amount
+
+
+class FakeQuoter:
+    address = "0x0000000000000000000000000000000000000001"
+
+    def encode_abi(self, fn_name, args):
+        if fn_name == "quoteExactInputSingle":
+            legs = [(args[0], args[1], args[3])]
+        else:
+            raw = args[0]
+            legs = []
+            for offset in range(0, len(raw) - 20, 23):
+                legs.append(
+                    (
+                        "0x" + raw[offset : offset + 20].hex(),
+                        "0x" + raw[offset + 23 : offset + 43].hex(),
+                        int.from_bytes(raw[offset + 20 : offset + 23], "big"),
+                    )
+                )
+        return json.dumps({"legs": legs, "amount": args[2] if fn_name == "quoteExactInputSingle" else args[1]}).encode()
+
+
+class FakeMulticall:
+    def __init__(self):
+        self.batches: list[int] = []
+        self.functions = SimpleNamespace(aggregate3=self.aggregate3)
+
+    def aggregate3(self, calls):
+        self.batches.append(len(calls))
+
+        def call(block_identifier="latest"):
+            results = []
+            for _target, _allow, data in calls:
+                request = json.loads(data)
+                out = _rate(request["legs"], request["amount"])
+                results.append((out is not None, encode(["uint256"], [out]) if out is not None else b""))
+            return results
+
+        return SimpleNamespace(call=call)
+
+
+@pytest.fixture
+def finder():
+    spy = PoolSpy(w3=object())
+    spy.build_pool_index(
+        [
+            _pool("0xp1", "UNI", "USDC", 3000),
+            _pool("0xp2", "UNI", "USDC", 10000),
+            _pool("0xp3", "UNI", "WETH", 500),
+            _pool("0xp4", "WETH", "USDC", 500),
+        ]
+    )
+    multicall = FakeMulticall()
+    w3 = SimpleNamespace(eth=SimpleNamespace(contract=lambda **kwargs: multicall))
+    return RouteFinder(w3, FakeQuoter(), spy, batch_size=2), multicall
+
+
+def test_candidates_cover_indexed_fee_tiers_and_intermediates(finder):
+    route_finder, _ = finder
+    routes = route_finder.candidates("UNI", "USDC")
+
+    assert sorted(route.fees for route in routes if route.hops == 1) == [(3000,), (10000,)]
+    assert [route.symbols for route in routes if route.hops == 2] == [("UNI", "WETH", "USDC")]
+    assert routes[-1].encode_path().hex().startswith(TOKENS["UNI"][2:] + "0001f4")
+
+
+def test_best_route_picks_one_hop_when_it_quotes_higher(finder):
+    route_finder, multicall = finder
+    result = route_finder.find_best_route("UNI", "USDC", 1_000_000)
+
+    assert result["best"]["symbols"] == ["UNI", "WETH", "USDC"]
+    assert result["best"]["amount_out"] == 5_250_000
+    assert result["best"]["gas_estimate"] > result["alternatives"][0]["gas_estimate"]
+    assert result["alternatives"][0]["fees"] == [3000]
+    assert multicall.batches == [2, 1]
+
+
+def test_unknown_tokens_and_unquotable_pairs_raise(finder):
+    route_finder, _ = finder
+    with pytest.raises(RouteSearchError):
+        route_finder.candidates("UNI", "DOGE")
+    with pytest.raises(RouteSearchError):
+        route_finder.find_best_route("USDC", "UNI", 1_000)
+
+
+def test_indexed_pools_with_cached_state_are_quoted_locally(finder):
+    route_finder, multicall = finder
+    state = PoolState(
+        address="0xp1",
+        token0=TOKENS["UNI"],
+        token1=TOKENS["USDC"],
+        fee=3000,
+        tick_spacing=60,
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=10**24,
+        word_range=(-1, 0),
+    )
+
+    class _States:
+        def get(self, pool_address):
+            if pool_address != "0xp1":
+                raise PoolStateRangeError("not cached")
+            return state
+
+    route_finder.pool_states = _States()
+    quotes = route_finder.quote_routes(route_finder.candidates("UNI", "USDC"), 1_000_000)
+
+    assert [quote.source for quote in quotes] == ["local", "quoter", "quoter"]
+    assert quotes[0].amount_out == state.quote_exact_in(TOKENS["UNI"], 1_000_000).amount_out
+    assert multicall.batches == [2]
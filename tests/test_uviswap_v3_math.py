@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import os
+from math import isqrt
+from types import SimpleNamespace
+
+import pytest
+from eth_abi import encode
+
+from core.clients.uviswap.pool_state import V3PoolStateCache, V3PoolStateLoader
+from core.clients.uviswap.v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    PoolState,
+    PoolStateRangeError,
+    TickInfo,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+)
+
+TOKEN0 = "0x0000000000000000000000000000000000000a00"
+TOKEN1 = "0x0000000000000000000000000000000000000b00"
+E18 = 10**18
+
+
+def _encode_price_sqrt(reserve1: int, reserve0: int) -> int:
+    return isqrt(reserve1 * 2**192 // reserve0)
+
+
+def _pool(liquidity: int = 10 * E18) -> PoolState:
+    # Two positions: a wide one over [-600, 600] and a narrow one over [-60, 60]
+    narrow = liquidity // 2
+    return PoolState(
+        address="0x00000000000000000000000000000000000000f0",
+        token0=TOKEN0,
+        token1=TOKEN1,
+        fee=3000,
+        tick_spacing=60,
+        sqrt_price_x96=Q96,
+        tick=0,
+        liquidity=liquidity + narrow,
+        ticks={
+            -600: TickInfo(liquidity, liquidity),
+            -60: TickInfo(narrow, narrow),
+            60: TickInfo(narrow, -narrow),
+            600: TickInfo(liquidity, -liquidity),
+        },
+        word_range=(-1, 0),
+    )
+
+
+def test_tick_math_matches_contract_bounds():
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+    for tick in (-50_000, -1, 1, 12_345):
+        ratio = get_sqrt_ratio_at_tick(tick)
+        assert get_tick_at_sqrt_ratio(ratio) == tick
+        assert get_tick_at_sqrt_ratio(ratio - 1) == tick - 1
+
+
+@pytest.mark.parametrize(
+    ("price", "target", "liquidity", "amount", "fee", "expected"),
+    [
+        # Vectors from the Uniswap v3-core SwapMath tests
+        (
+            _encode_price_sqrt(1, 1), _encode_price_sqrt(101, 100), 2 * E18, E18, 600,
+            (None, 9975124224178055, 9925619580021728, 5988667735148),
+        ),
+        (
+            _encode_price_sqrt(1, 1), _encode_price_sqrt(1000, 100), 2 * E18, E18, 600,
+            (None, 999400000000000000, 666399946655997866, 600000000000000),
+        ),
+        (
+            417332158212080721273783715441582, 1452870262520218020823638996, 159344665391607089467575320103, -1, 1,
+            (417332158212080721273783715441581, 1, 1, 1),
+        ),
+        (
+            2413, 79887613182836312, 1985041575832132834610021537970, 10, 1872,
+            (2413, 0, 0, 10),
+        ),
+    ],
+)
+def test_compute_swap_step_matches_reference_vectors(price, target, liquidity, amount, fee, expected):
+    sqrt_next, amount_in, amount_out, fee_amount = compute_swap_step(price, target, liquidity, amount, fee)
+    if expected[0] is not None:
+        assert sqrt_next == expected[0]
+    assert (amount_in, amount_out, fee_amount) == expected[1:]
+
+
+def test_swap_crosses_ticks_and_round_trips_exact_output():
+    state = _pool()
+    small = state.quote_exact_in(TOKEN0, E18 // 100)
+    large = state.quote_exact_in(TOKEN0, 3 * E18 // 10)
+
+    assert small.ticks_crossed == 0 and small.amount_in == E18 // 100
+    assert large.ticks_crossed == 1 and large.tick_after < -60
+    assert large.price_impact > small.price_impact > 0.003
+
+    reverse = state.quote_exact_out(TOKEN0, large.amount_out)
+    assert reverse.amount_out == large.amount_out
+    assert large.amount_in - 2 <= reverse.amount_in <= large.amount_in
+
+    one_for_zero = state.quote_exact_in(TOKEN1, E18 // 100)
+    assert one_for_zero.amount_out == small.amount_out
+    assert one_for_zero.sqrt_price_x96_after > state.sqrt_price_x96
+
+
+def test_swap_outside_loaded_words_raises_and_impact_sizing_stays_in_range():
+    state = _pool()
+    with pytest.raises(PoolStateRangeError):
+        state.quote_exact_in(TOKEN0, 100 * E18)
+
+    size = state.max_amount_in_for_impact(TOKEN0, max_impact_bps=100, upper_bound=10 * E18)
+    assert state.quote_exact_in(TOKEN0, size).price_impact <= 0.01 < state.quote_exact_in(TOKEN0, size + E18 // 1000).price_impact
+
+
+def test_liquidity_events_update_active_liquidity_and_ticks():
+    state = _pool()
+    before = state.liquidity
+    state.apply_liquidity(-120, 120, E18)
+    assert state.liquidity == before + E18
+    assert state.ticks[120] == TickInfo(E18, -E18)
+
+    state.apply_liquidity(-120, 120, -E18)
+    assert state.liquidity == before and 120 not in state.ticks
+
+    state.apply_swap(get_sqrt_ratio_at_tick(-30), before, -30)
+    assert state.tick == -30 and state.quote_exact_in(TOKEN1, E18 // 100).amount_out > 0
+
+
+class _FakeContract:
+    def __init__(self, address):
+        self.address = address
+
+    def encode_abi(self, fn_name, args):
+        return json.dumps({"fn": fn_name, "args": args}).encode()
+
+
+class _FakeMulticall:
+    """Answers pool reads from a ``PoolState`` as the on-chain pool would."""
+
+    def __init__(self, source: PoolState):
+        self.source = source
+        self.calls = 0
+        self.functions = SimpleNamespace(aggregate3=self.aggregate3)
+
+    def _answer(self, fn, args):
+        state = self.source
+        if fn == "slot0":
+            return encode(["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"], [state.sqrt_price_x96, state.tick, 0, 1, 1, 0, True])
+        if fn in ("liquidity", "fee", "tickSpacing"):
+            value = {"liquidity": state.liquidity, "fee": state.fee, "tickSpacing": state.tick_spacing}[fn]
+            return encode(["int256"], [value])
+        if fn in ("token0", "token1"):
+            return encode(["address"], [getattr(state, fn)])
+        if fn == "tickBitmap":
+            bitmap = sum(1 << ((t // state.tick_spacing) & 255) for t in state.ticks if (t // state.tick_spacing) >> 8 == args[0])
+            return encode(["uint256"], [bitmap])
+        info = state.ticks[args[0]]
+        return encode(["uint128", "int128", "uint256", "uint256", "int56", "uint160", "uint32", "bool"], [info.liquidity_gross, info.liquidity_net, 0, 0, 0, 0, 0, True])
+
+    def aggregate3(self, payload):
+        self.calls += 1
+
+        def call(block_identifier="latest"):
+            return [(True, self._answer(**json.loads(data))) for _target, _allow, data in payload]
+
+        return SimpleNamespace(call=call)
+
+
+def test_loader_reads_state_in_batches_and_cache_reuses_it():
+    source = _pool()
+    multicall = _FakeMulticall(source)
+
+    def contract(address, abi):
+        return multicall if any(item.get("name") == "aggregate3" for item in abi) else _FakeContract(address)
+
+    w3 = SimpleNamespace(eth=SimpleNamespace(contract=contract, block_number=100))
+    cache = V3PoolStateCache(V3PoolStateLoader(w3, word_radius=1), max_age_seconds=60)
+
+    loaded = cache.get(source.address)
+    assert cache.get(source.address) is loaded
+    assert multicall.calls == 3
+    assert loaded.ticks == source.ticks and loaded.word_range == (-1, 1) and loaded.block == 100
+    assert loaded.quote_exact_in(TOKEN0, E18 // 10) == source.quote_exact_in(TOKEN0, E18 // 10)
+    assert cache.get_stats()["hits"] == 1
+
+
+QUOTER_V1 = "0xb27308f9F90D607463bb33eA1BeBb41C27CE5AB6"
+USDC_WETH_500 = "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
+QUOTER_V1_ABI = [
+    {
+        "inputs": [
+            {"name": "tokenIn", "type": "address"},
+            {"name": "tokenOut", "type": "address"},
+            {"name": "fee", "type": "uint24"},
+            {"name": "amountIn", "type": "uint256"},
+            {"name": "sqrtPriceLimitX96", "type": "uint160"},
+        ],
+        "name": "quoteExactInputSingle",
+        "outputs": [{"name": "amountOut", "type": "uint256"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    }
+]
+
+
+@pytest.mark.skipif(not os.getenv("UVISWAP_FORK_RPC_URL"), reason="UVISWAP_FORK_RPC_URL (mainnet fork) is not set")
+def test_local_quotes_match_onchain_quoter_on_fork():
+    from web3 import Web3
+
+    w3 = Web3(Web3.HTTPProvider(os.environ["UVISWAP_FORK_RPC_URL"]))
+    block = w3.eth.block_number
+    state = V3PoolStateLoader(w3).load(USDC_WETH_500, block=block)
+    quoter = w3.eth.contract(address=QUOTER_V1, abi=QUOTER_V1_ABI)
+
+    for token_in, token_out, amount in (
+        (state.token0, state.token1, 50_000 * 10**6),
+        (state.token1, state.token0, 25 * E18),
+    ):
+        expected = quoter.functions.quoteExactInputSingle(token_in, token_out, state.fee, amount, 0).call(
+            block_identifier=block
+        )
+        assert state.quote_exact_in(token_in, amount).amount_out == expected
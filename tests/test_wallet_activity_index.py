@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.clients.wallet_activity_index import WalletActivityIndex, WalletActivityIndexer, normalize_transfer
+
+WHALE = "0x00000000000000000000000000000000000000aa"
+OTHER = "0x00000000000000000000000000000000000000bb"
+POOL = "0x00000000000000000000000000000000000000cc"
+
+
+def _transfer(block: int, sender: str, recipient: str, amount: int, symbol: str = "PEPE", usd: float = 10.0) -> dict:
+    return {
+        "hash": f"0x{block:064x}",
+        "block_number": block,
+        "timestamp": 1_700_000_000 + block,
+        "from": {"hash": sender},
+        "to": recipient,
+        "token": {"symbol": symbol, "decimals": "18"},
+        "total": {"value": str(amount * 10**18), "decimals": "18"},
+        "value_usd": usd,
+    }
+
+
+class FakeBlockscout:
+    """Serves a newest-first history with limit/offset like the MCP tool."""
+
+    def __init__(self):
+        self.history: dict[str, list[dict]] = {}
+        self.calls: list[tuple[str, int, int | None, int | None]] = []
+
+    async def get_transaction_history(
+        self, address, chain="ethereum", limit=50, offset=0, start_block=None, end_block=None
+    ):
+        self.calls.append((address, offset, start_block, end_block))
+        txs = [
+            tx
+            for tx in self.history.get(address, [])
+            if (start_block is None or tx["block_number"] >= start_block)
+            and (end_block is None or tx["block_number"] <= end_block)
+        ]
+        txs.sort(key=lambda tx: tx["block_number"], reverse=True)
+        return txs[offset : offset + limit]
+
+
+@pytest.fixture
+def index():
+    return WalletActivityIndex(db_path=":memory:")
+
+
+def test_normalize_transfer_signs_flows_for_the_wallet():
+    incoming = normalize_transfer(WHALE, _transfer(5, POOL, WHALE, 3))
+    outgoing = normalize_transfer(WHALE, {"hash": "0x1", "block": "6", "from": WHALE.upper(), "to": POOL, "value": str(10**18)})
+
+    assert incoming["direction"] == 1 and incoming["amount"] == 3.0 and incoming["counterparty"] == POOL
+    assert outgoing["direction"] == -1 and outgoing["token"] == "ETH" and outgoing["amount"] == 1.0
+    assert normalize_transfer(WHALE, _transfer(7, POOL, OTHER, 1)) is None
+    # A contract call with no native value moves nothing
+    assert normalize_transfer(WHALE, {"hash": "0x2", "block": "8", "from": WHALE, "to": POOL, "value": "0"}) is None
+    own = normalize_transfer(WHALE, _transfer(9, WHALE, WHALE, 2))
+    assert own["direction"] == 0 and own["counterparty"] == WHALE
+
+
+def test_self_transfers_are_not_counted_as_flows(index):
+    index.ingest(WHALE, "ethereum", [_transfer(1, POOL, WHALE, 5, usd=50.0), _transfer(2, WHALE, WHALE, 5, usd=50.0)])
+
+    (flow,) = index.flows(WHALE)
+    assert (flow["inflow"], flow["outflow"], flow["net"], flow["transfers"]) == (5.0, 0.0, 5.0, 2)
+    (ranked,) = index.top_wallets(since=0)
+    assert (ranked["net_usd"], ranked["volume_usd"]) == (50.0, 50.0)
+
+
+@pytest.mark.asyncio
+async def test_syncs_fetch_only_blocks_past_the_watermark(index):
+    client = FakeBlockscout()
+    client.history[WHALE] = [_transfer(block, POOL, WHALE, 1) for block in range(1, 8)]
+    indexer = WalletActivityIndexer(client, index=index, page_size=3, max_pages=10)
+    index.watch(WHALE, label="whale")
+
+    first = await indexer.sync_wallet(WHALE)
+    assert (first["pages"], first["new_transfers"], first["last_block"]) == (3, 7, 7)
+
+    client.calls.clear()
+    client.history[WHALE] += [_transfer(8, WHALE, POOL, 2), _transfer(9, POOL, WHALE, 4)]
+    second = await indexer.sync_wallet(WHALE)
+    assert second["new_transfers"] == 2 and second["last_block"] == 9
+    assert client.calls == [(WHALE, 0, 8, None)]
+
+    (flow,) = index.flows(WHALE)
+    assert (flow["inflow"], flow["outflow"], flow["net"], flow["transfers"]) == (11.0, 2.0, 9.0, 9)
+    assert index.ingest(WHALE, "ethereum", client.history[WHALE]) == 0  # re-ingest is a no-op
+    assert index.flows(WHALE)[0]["transfers"] == 9
+    assert [row["block"] for row in index.transfers(WHALE, limit=2)] == [9, 8]
+
+
+@pytest.mark.asyncio
+async def test_incomplete_sync_backfills_the_skipped_range_later(index):
+    client = FakeBlockscout()
+    client.history[WHALE] = [_transfer(block, POOL, WHALE, 1) for block in range(1, 4)]
+    indexer = WalletActivityIndexer(client, index=index, page_size=3, max_pages=2)
+    await indexer.sync_wallet(WHALE)
+
+    # Eight new blocks but only six fit in the page budget
+    client.history[WHALE] += [_transfer(block, POOL, WHALE, 1) for block in range(4, 12)]
+    partial = await indexer.sync_wallet(WHALE)
+    assert (partial["new_transfers"], partial["last_block"], partial["backfill_range"]) == (6, 11, [3, 6])
+
+    client.calls.clear()
+    client.history[WHALE].append(_transfer(12, POOL, WHALE, 1))
+    indexer.max_pages = 3
+    resumed = await indexer.sync_wallet(WHALE)
+    assert resumed["new_transfers"] == 3 and resumed["backfill_range"] is None
+    assert client.calls == [(WHALE, 0, 12, None), (WHALE, 0, 4, 6), (WHALE, 3, 4, 6)]
+    assert sorted(row["block"] for row in index.transfers(WHALE, limit=20)) == list(range(1, 13))
+    assert index.flows(WHALE)[0]["transfers"] == 12
+
+
+@pytest.mark.asyncio
+async def test_whale_scan_ranks_watched_wallets_locally(index):
+    client = FakeBlockscout()
+    client.history[WHALE] = [_transfer(1, POOL, WHALE, 100, usd=1_000.0), _transfer(50, WHALE, POOL, 10, usd=100.0)]
+    client.history[OTHER] = [_transfer(2, POOL, OTHER, 5, usd=50.0), _transfer(60, OTHER, POOL, 5, symbol="USDC", usd=5.0)]
+    indexer = WalletActivityIndexer(client, index=index, page_size=10)
+    index.watch(WHALE, label="whale")
+    index.watch(OTHER)
+
+    summary = await indexer.sync_watchlist()
+    assert summary["new_transfers"] == 4 and summary["errors"] == []
+
+    top = index.top_wallets(token="pepe")
+    assert [(row["address"], row["net_usd"], row["label"]) for row in top] == [(WHALE, 900.0, "whale"), (OTHER, 50.0, None)]
+    recent = index.top_wallets(since=1_700_000_000 + 40, ascending=True)
+    assert [(row["address"], row["net_usd"]) for row in recent] == [(WHALE, -100.0), (OTHER, -5.0)]
+    with pytest.raises(ValueError):
+        index.top_wallets(order_by="pnl")
+
+    assert index.unwatch(OTHER) and index.get_stats() == {"wallets": 1, "transfers": 2, "tokens": 1}
+
+
+@pytest.mark.asyncio
+async def test_sync_wallets_runs_concurrently_and_collects_failures(index):
+    in_flight = {"now": 0, "peak": 0}
+
+    class SlowBlockscout(FakeBlockscout):
+        async def get_transaction_history(self, address, *args, **kwargs):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if address == OTHER:
+                raise RuntimeError("rate limited")
+            return await super().get_transaction_history(address, *args, **kwargs)
+
+    client = SlowBlockscout()
+    client.history[WHALE] = [_transfer(1, POOL, WHALE, 1)]
+    client.history[POOL] = [_transfer(2, WHALE, POOL, 1)]
+    indexer = WalletActivityIndexer(client, index=index, concurrency=2)
+
+    summary = await indexer.sync_wallets([{"address": a, "chain": "ethereum"} for a in (WHALE, OTHER, POOL)])
+    assert in_flight["peak"] == 2
+    assert summary["new_transfers"] == 2
+    assert [error["address"] for error in summary["errors"]] == [OTHER]
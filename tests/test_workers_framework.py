@@ -63,6 +63,32 @@ def test_feed_cache_threshold_worker_threshold_and_mark_processed():
     assert len(worker.pending_items()) == 1
 
 
+def test_feed_cache_threshold_worker_evicts_oldest_by_last_seen():
+    clock = iter(f"2026-01-01T00:00:{i:02d}" for i in range(60))
+    worker = FeedCacheThresholdWorker(
+        key_fn=lambda item: str(item.get("id", "")),
+        entry_builder=lambda item, existing, now: {
+            "id": item["id"],
+            "last_seen": now,
+            "exhausted": False,
+        },
+        is_entry_active=lambda entry: not entry.get("exhausted", False),
+        max_cache=3,
+        threshold=1,
+    )
+    worker._now_iso = lambda: next(clock)
+    worker.update([{"id": "a"}])
+    worker.update([{"id": "b"}])
+    worker.update([{"id": "c"}])
+    worker.update([{"id": "a"}])  # refresh a so b becomes the oldest
+    worker.update([{"id": "d"}])
+    assert sorted(worker.cache) == ["a", "c", "d"]
+    for _ in range(40):
+        worker.update([{"id": "a"}])
+    assert sorted(worker.cache) == ["a", "c", "d"]
+    assert len(worker._heap) <= 2 * len(worker.cache) + 64
+
+
 @pytest.mark.asyncio
 async def test_hybrid_worker_start_stop():
     running = {"a": True, "b": True}
@@ -88,4 +114,3 @@ async def test_hybrid_worker_start_stop():
     await hybrid.stop()
     assert ticks["a"] > 0
     assert ticks["b"] > 0
-